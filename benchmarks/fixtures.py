@@ -0,0 +1,312 @@
+"""
+This file hosts the functions that build the synthetic GRIB2 fixtures used by the WxData benchmark suite.
+
+The fixtures are written with ecCodes so the benchmarks never touch the NOMADS or ECMWF dataservers.
+Each fixture is laid out in the same directory branch the WxData downloaders use, so the post-processors
+read the fixtures exactly as they would read real model data.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import os
+import json
+import eccodes
+import numpy as np
+
+# The seed of the random number generator so every run of the benchmark suite uses identical data
+seed = 42
+
+# The grids used by the fixtures
+# The global grids are regular latitude/longitude grids and the Hawaii grid is the 1-D Mercator grid
+# used by the Hawaii RTMA and the Hawaii NDFD grids
+grids = {
+
+    'global':{
+        'gridType':'regular_ll',
+        'Ni':360,
+        'Nj':181,
+        'latitudeOfFirstGridPointInDegrees':90,
+        'longitudeOfFirstGridPointInDegrees':0,
+        'latitudeOfLastGridPointInDegrees':-90,
+        'longitudeOfLastGridPointInDegrees':359,
+        'iDirectionIncrementInDegrees':1,
+        'jDirectionIncrementInDegrees':1
+    },
+
+    'hawaii':{
+        'gridDefinitionTemplateNumber':10,
+        'Ni':321,
+        'Nj':225,
+        'latitudeOfFirstGridPointInDegrees':18.073,
+        'longitudeOfFirstGridPointInDegrees':198.475,
+        'LaDInDegrees':20,
+        'latitudeOfLastGridPointInDegrees':23.088,
+        'longitudeOfLastGridPointInDegrees':206.131,
+        'Di':2500000,
+        'Dj':2500000,
+        'orientationOfTheGridInDegrees':0
+    }
+}
+
+# The GRIB2 messages in each fixture as (typeOfLevel, level, shortName)
+gfs_messages = [
+    ('meanSea', 0, 'prmsl'),
+    ('surface', 0, 'sp'),
+    ('surface', 0, 'orog'),
+    ('surface', 0, 't'),
+    ('heightAboveGround', 2, '2t'),
+    ('heightAboveGround', 2, '2r'),
+    ('heightAboveGround', 10, '10u'),
+    ('heightAboveGround', 10, '10v'),
+    ('isobaricInhPa', 850, 'gh'),
+    ('isobaricInhPa', 850, 't'),
+    ('isobaricInhPa', 850, 'u'),
+    ('isobaricInhPa', 850, 'v'),
+    ('isobaricInhPa', 500, 'gh'),
+    ('isobaricInhPa', 500, 't'),
+    ('isobaricInhPa', 500, 'u'),
+    ('isobaricInhPa', 500, 'v'),
+]
+
+gefs_messages = [
+    ('surface', 0, 'sp'),
+    ('surface', 0, 'orog'),
+    ('meanSea', 0, 'prmsl'),
+    ('heightAboveGround', 2, '2t'),
+    ('heightAboveGround', 2, '2r'),
+    ('heightAboveGround', 10, '10u'),
+    ('heightAboveGround', 10, '10v'),
+    ('isobaricInhPa', 850, 'gh'),
+    ('isobaricInhPa', 850, 't'),
+    ('isobaricInhPa', 850, 'u'),
+    ('isobaricInhPa', 850, 'v'),
+    ('isobaricInhPa', 500, 'gh'),
+    ('isobaricInhPa', 500, 't'),
+    ('isobaricInhPa', 500, 'u'),
+    ('isobaricInhPa', 500, 'v'),
+]
+
+ecmwf_messages = [
+    ('meanSea', 0, 'msl'),
+    ('surface', 0, 'sp'),
+    ('heightAboveGround', 2, '2t'),
+    ('heightAboveGround', 2, '2d'),
+    ('heightAboveGround', 10, '10u'),
+    ('heightAboveGround', 10, '10v'),
+    ('isobaricInhPa', 850, 'gh'),
+    ('isobaricInhPa', 850, 't'),
+    ('isobaricInhPa', 500, 'gh'),
+    ('isobaricInhPa', 500, 't'),
+]
+
+rtma_messages = [
+    ('surface', 0, 'orog'),
+    ('surface', 0, 'sp'),
+    ('heightAboveGround', 2, '2t'),
+    ('heightAboveGround', 2, '2d'),
+    ('heightAboveGround', 2, '2sh'),
+    ('surface', 0, 'vis'),
+    ('cloudCeiling', 0, 'ceil'),
+    ('atmosphere', 0, 'tcc'),
+    ('heightAboveGround', 10, '10u'),
+    ('heightAboveGround', 10, '10v'),
+    ('heightAboveGround', 10, '10wdir'),
+    ('heightAboveGround', 10, '10si'),
+    ('heightAboveGround', 10, 'i10fg'),
+]
+
+ndfd_messages = [
+    ('heightAboveGround', 2, '2t'),
+]
+
+# The names wgrib2 uses for the variables and levels in the NOMADS .idx files
+nomads_names = {
+    'prmsl':'PRMSL',
+    'msl':'MSLET',
+    'sp':'PRES',
+    'orog':'HGT',
+    't':'TMP',
+    '2t':'TMP',
+    '2d':'DPT',
+    '2r':'RH',
+    '10u':'UGRD',
+    '10v':'VGRD',
+    'gh':'HGT',
+    'u':'UGRD',
+    'v':'VGRD'
+}
+
+nomads_levels = {
+    'meanSea':'mean sea level',
+    'surface':'surface'
+}
+
+def write_grib_file(filename,
+                    messages,
+                    steps,
+                    grid='global',
+                    centre='kwbc'):
+
+    """
+    This function writes a synthetic GRIB2 file.
+
+    Required Arguments:
+
+    1) filename (String) - The path of the GRIB2 file.
+
+    2) messages (List) - A list of (typeOfLevel, level, shortName) tuples. One message is written per tuple and step.
+
+    3) steps (Integer List) - The forecast steps in hours.
+
+    Optional Arguments:
+
+    1) grid (String) - Default='global'. The grid of the messages ('global' or 'hawaii').
+
+    2) centre (String) - Default='kwbc'. The originating centre. 'kwbc' for NCEP and 'ecmf' for ECMWF.
+
+    Returns
+    -------
+
+    A list of dictionaries with the keys typeOfLevel, level, shortName, step, offset and length
+    describing each message in the file.
+    """
+
+    rng = np.random.default_rng(seed)
+    npoints = grids[grid]['Ni'] * grids[grid]['Nj']
+
+    inventory = []
+    with open(filename, 'wb') as f:
+        for step in steps:
+            for typeOfLevel, level, shortName in messages:
+                gid = eccodes.codes_grib_new_from_samples('GRIB2')
+                try:
+                    eccodes.codes_set(gid, 'centre', centre)
+                    for key, value in grids[grid].items():
+                        eccodes.codes_set(gid, key, value)
+                    eccodes.codes_set(gid, 'typeOfLevel', typeOfLevel)
+                    eccodes.codes_set(gid, 'level', level)
+                    eccodes.codes_set(gid, 'shortName', shortName)
+                    eccodes.codes_set(gid, 'step', step)
+                    eccodes.codes_set_values(gid, 250 + 50 * rng.random(npoints))
+                    offset = f.tell()
+                    eccodes.codes_write(gid, f)
+                    inventory.append({
+                        'typeOfLevel':typeOfLevel,
+                        'level':level,
+                        'shortName':shortName,
+                        'step':step,
+                        'offset':offset,
+                        'length':f.tell() - offset
+                    })
+                finally:
+                    eccodes.codes_release(gid)
+
+    return inventory
+
+
+def write_index_files(filename,
+                      inventory):
+
+    """
+    This function writes the NOMADS .idx and ECMWF .index files that are published next to each GRIB2 file.
+
+    Required Arguments:
+
+    1) filename (String) - The path of the GRIB2 file.
+
+    2) inventory (List) - The inventory returned by write_grib_file().
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    None
+    """
+
+    with open(f"{filename}.idx", 'w') as f:
+        for i, message in enumerate(inventory):
+            if message['typeOfLevel'] == 'isobaricInhPa':
+                level = f"{message['level']} mb"
+            elif message['typeOfLevel'] == 'heightAboveGround':
+                level = f"{message['level']} m above ground"
+            else:
+                level = nomads_levels.get(message['typeOfLevel'], message['typeOfLevel'])
+            name = nomads_names.get(message['shortName'], message['shortName'].upper())
+            f.write(f"{i + 1}:{message['offset']}:d=2025010100:{name}:{level}:{message['step']} hour fcst:\n")
+
+    with open(f"{filename[:-6]}.index", 'w') as f:
+        for message in inventory:
+            if message['typeOfLevel'] == 'isobaricInhPa':
+                levtype = 'pl'
+            else:
+                levtype = 'sfc'
+            entry = {
+                'param':message['shortName'],
+                'levtype':levtype,
+                'step':str(message['step']),
+                '_offset':message['offset'],
+                '_length':message['length']
+            }
+            if levtype == 'pl':
+                entry['levelist'] = str(message['level'])
+            else:
+                pass
+            f.write(f"{json.dumps(entry)}\n")
+
+
+def build_fixtures(directory,
+                   steps=[0, 3, 6, 9],
+                   members=[1, 2, 3]):
+
+    """
+    This function builds every fixture used by the benchmark suite.
+
+    Required Arguments:
+
+    1) directory (String) - The working directory of the benchmarks. The fixtures are written to the same
+       directory branch the WxData downloaders use (i.e. f:GFS0P25/, f:GEFS0P50/MEMBERS/1/).
+
+    Optional Arguments:
+
+    1) steps (Integer List) - Default=[0, 3, 6, 9]. The forecast steps of the model fixtures.
+
+    2) members (Integer List) - Default=[1, 2, 3]. The GEFS ensemble members.
+
+    Returns
+    -------
+
+    A dictionary of the fixture paths.
+    """
+
+    paths = {
+        'gfs':f"{directory}/GFS0P25",
+        'gefs_mean':f"{directory}/GEFS0P50/MEAN",
+        'gefs_members':f"{directory}/GEFS0P50/MEMBERS",
+        'ecmwf':f"{directory}/ECMWF/IFS",
+        'rtma':f"{directory}/HI RTMA",
+        'ndfd':f"{directory}/NWS Data",
+        'server':f"{directory}/server"
+    }
+
+    for path in paths.values():
+        os.makedirs(path, exist_ok=True)
+
+    for step in steps:
+        write_grib_file(f"{paths['gfs']}/gfs.t00z.pgrb2.0p25.f{step:03d}.grib2", gfs_messages, [step])
+        write_grib_file(f"{paths['gefs_mean']}/geavg.t00z.pgrb2a.0p50.f{step:03d}.grib2", gefs_messages, [step])
+        write_grib_file(f"{paths['ecmwf']}/ifs.t00z.f{step:03d}.grib2", ecmwf_messages, [step], centre='ecmf')
+
+        for member in members:
+            os.makedirs(f"{paths['gefs_members']}/{member}", exist_ok=True)
+            write_grib_file(f"{paths['gefs_members']}/{member}/gep{member:02d}.t00z.pgrb2a.0p50.f{step:03d}.grib2", gefs_messages, [step])
+
+        inventory = write_grib_file(f"{paths['server']}/gfs.t00z.pgrb2.0p25.f{step:03d}.grib2", gfs_messages, [step])
+        write_index_files(f"{paths['server']}/gfs.t00z.pgrb2.0p25.f{step:03d}.grib2", inventory)
+
+    write_grib_file(f"{paths['rtma']}/hi.rtma.t00z.2dvaranl_ndfd.grb2", rtma_messages, [0], grid='hawaii')
+
+    write_grib_file(f"{paths['ndfd']}/ds.temp.bin", ndfd_messages, steps, grid='hawaii')
+    write_grib_file(f"{paths['ndfd']}/ds.temp.extended.bin", ndfd_messages, steps, grid='hawaii')
+
+    return paths
@@ -0,0 +1,438 @@
+"""
+This file runs the WxData benchmark suite and saves the results to a JSON file.
+
+The benchmarks time the download, index and post-processing stages of WxData against synthetic GRIB2 fixtures
+and a local HTTP server that stands in for the NOMADS and ECMWF dataservers, so the results only depend on the
+WxData version and the machine. Comparing the JSON files of two WxData versions shows any throughput or memory regressions.
+
+Each benchmark runs in its own Python process so the peak memory of one benchmark does not carry over into the next.
+
+Usage
+-----
+
+python benchmarks/run_benchmarks.py
+python benchmarks/run_benchmarks.py --repeats 5 --output results.json
+python benchmarks/run_benchmarks.py --only gfs_post_processing rtma_post_processing
+
+(C) Eric J. Drewitz 2025
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import tracemalloc
+import subprocess
+import statistics
+
+from datetime import datetime, timezone
+
+try:
+    import resource
+except Exception as e:
+    # The resource module is not available on Windows
+    resource = None
+
+# The forecast steps and GEFS ensemble members in the fixtures
+steps = [0, 3, 6, 9]
+members = [1, 2, 3]
+
+def setup_download_full(directory, base_url):
+
+    import wxdata
+    from wxdata.client import client
+
+    urls = [f"{base_url}gfs.t00z.pgrb2.0p25.f{step:03d}.grib2" for step in steps]
+    filenames = [f"gfs.f{step:03d}.grib2" for step in steps]
+    path = f"{directory}/downloads/full"
+    os.makedirs(path, exist_ok=True)
+
+    def run():
+        client.get_gridded_data_batch(urls,
+                                      path,
+                                      filenames,
+                                      notifications='off',
+                                      clear_recycle_bin=False)
+
+    return run
+
+
+def setup_download_ranges(directory, base_url):
+
+    import wxdata
+    from wxdata.client import client
+
+    urls = [f"{base_url}gfs.t00z.pgrb2.0p25.f{step:03d}.grib2" for step in steps]
+    filenames = [f"gfs.f{step:03d}.grib2" for step in steps]
+    path = f"{directory}/downloads/ranges"
+    os.makedirs(path, exist_ok=True)
+
+    def run():
+        client.get_gridded_data_batch(urls,
+                                      path,
+                                      filenames,
+                                      notifications='off',
+                                      clear_recycle_bin=False,
+                                      index_format='nomads',
+                                      variables=['TMP', 'HGT'],
+                                      levels=[850, 500])
+
+    return run
+
+
+def setup_index_ranges(directory, base_url):
+
+    from wxdata.utils.byte_ranges import message_ranges
+
+    urls = [f"{base_url}gfs.t00z.pgrb2.0p25.f{step:03d}.grib2" for step in steps]
+
+    def run():
+        for url in urls:
+            message_ranges(url, 'nomads', variables=['TMP', 'HGT'], levels=[850, 500])
+            message_ranges(url, 'ecmwf', variables=['t', 'gh'], levels=[850, 500])
+
+    return run
+
+
+def setup_gfs_post_processing(directory, base_url):
+
+    from wxdata.post_processors.gfs_post_processing import primary_gfs_post_processing
+    from wxdata.utils.index_cache import clear_index_cache
+
+    def run():
+        clear_index_cache()
+        ds = primary_gfs_post_processing(f"{directory}/GFS0P25")
+        ds.load()
+
+    return run
+
+
+def setup_gfs_pipeline(directory, base_url):
+
+    from wxdata.post_processors.gfs_post_processing import primary_gfs_post_processing
+    from wxdata.utils.index_cache import clear_index_cache
+    from wxdata.utils.pipeline import download_and_process
+
+    urls = [f"{base_url}gfs.t00z.pgrb2.0p25.f{step:03d}.grib2" for step in steps]
+    filenames = [f"gfs.f{step:03d}.grib2" for step in steps]
+    path = f"{directory}/downloads/pipeline"
+    os.makedirs(path, exist_ok=True)
+
+    def process(files):
+        return primary_gfs_post_processing(path,
+                                           files=files)
+
+    def run():
+        clear_index_cache()
+        for ds in download_and_process(urls,
+                                       path,
+                                       filenames,
+                                       process):
+            pass
+
+    return run
+
+
+def setup_gefs_mean(directory, base_url):
+
+    from wxdata.gefs.process import process_gefs_data
+    from wxdata.utils.index_cache import clear_index_cache
+
+    def run():
+        clear_index_cache()
+        ds = process_gefs_data('GEFS0P50', 'mean', members)
+        ds.load()
+
+    return run
+
+
+def setup_gefs_members(directory, base_url):
+
+    from wxdata.gefs.process import process_gefs_data
+    from wxdata.utils.index_cache import clear_index_cache
+
+    def run():
+        clear_index_cache()
+        ds = process_gefs_data('GEFS0P50', 'members', members)
+        ds.load()
+
+    return run
+
+
+def setup_ecmwf_ifs_post_processing(directory, base_url):
+
+    from wxdata.post_processors.ecmwf_post_processing import ecmwf_ifs_post_processing
+    from wxdata.utils.index_cache import clear_index_cache
+
+    def run():
+        clear_index_cache()
+        ds = ecmwf_ifs_post_processing(f"{directory}/ECMWF/IFS", -180, 180, 90, -90)
+        ds.load()
+
+    return run
+
+
+def setup_rtma_post_processing(directory, base_url):
+
+    from wxdata.post_processors.rtma_post_processing import process_rtma_data
+    from wxdata.utils.index_cache import clear_index_cache
+
+    def run():
+        clear_index_cache()
+        ds = process_rtma_data('hi.rtma.t00z.2dvaranl_ndfd.grb2', 'hi rtma', f"{directory}/HI RTMA")
+        ds.load()
+
+    return run
+
+
+def setup_ndfd_fix_1d(directory, base_url):
+
+    import xarray as xr
+    from wxdata.noaa.nws import FIX_1D_GRIB_DATA
+
+    def open_grids(fname):
+        ds = xr.open_dataset(f"NWS Data/{fname}", engine='cfgrib')
+        ds['temperature'] = ds['t2m']
+        return ds.drop_vars('t2m')
+
+    def run():
+        ds_short = open_grids('ds.temp.bin')
+        ds_extended = open_grids('ds.temp.extended.bin')
+        FIX_1D_GRIB_DATA(ds_short, ds_extended, 'temperature', 'ds.temp.bin', 'ds.temp.extended.bin')
+
+    return run
+
+
+# The benchmarks as name: (stage, setup function)
+# Each setup function imports what it needs and returns the function that is timed
+benchmarks = {
+    'download_full':('download', setup_download_full),
+    'download_ranges':('download', setup_download_ranges),
+    'index_ranges':('index', setup_index_ranges),
+    'gfs_post_processing':('post-processing', setup_gfs_post_processing),
+    'gfs_pipeline':('pipeline', setup_gfs_pipeline),
+    'gefs_mean':('post-processing', setup_gefs_mean),
+    'gefs_members':('post-processing', setup_gefs_members),
+    'ecmwf_ifs_post_processing':('post-processing', setup_ecmwf_ifs_post_processing),
+    'rtma_post_processing':('post-processing', setup_rtma_post_processing),
+    'ndfd_fix_1d':('post-processing', setup_ndfd_fix_1d),
+}
+
+def peak_rss_mb():
+
+    """
+    This function returns the peak resident memory of the current process in MB.
+
+    Required Arguments: None
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The peak resident memory in MB or None if it cannot be measured on this platform.
+    """
+
+    if resource == None:
+        return None
+    else:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+        if sys.platform == 'darwin':
+            return peak / (1024 * 1024)
+        else:
+            return peak / 1024
+
+
+def run_child(name,
+              directory,
+              base_url,
+              repeats):
+
+    """
+    This function runs a single benchmark in the current process and prints the result as JSON.
+
+    The benchmark is run once to warm up, then timed {repeats} times. A final run is traced with tracemalloc
+    to record the peak memory allocated by Python and NumPy during the benchmark.
+
+    Required Arguments:
+
+    1) name (String) - The name of the benchmark.
+
+    2) directory (String) - The working directory holding the fixtures.
+
+    3) base_url (String) - The URL of the local HTTP server.
+
+    4) repeats (Integer) - The number of timed runs.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    None
+    """
+
+    stage, setup = benchmarks[name]
+    run = setup(directory, base_url)
+
+    run()
+    baseline_rss = peak_rss_mb()
+
+    times = []
+    for i in range(0, repeats, 1):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    peak_rss = peak_rss_mb()
+
+    tracemalloc.start()
+    run()
+    traced_peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    tracemalloc.stop()
+
+    print(json.dumps({
+        'name':name,
+        'stage':stage,
+        'status':'ok',
+        'repeats':repeats,
+        'seconds_min':min(times),
+        'seconds_median':statistics.median(times),
+        'seconds_mean':statistics.mean(times),
+        'seconds':times,
+        'peak_rss_mb':round(peak_rss, 1) if peak_rss != None else None,
+        'warmup_rss_mb':round(baseline_rss, 1) if baseline_rss != None else None,
+        'peak_traced_mb':round(traced_peak, 1)
+    }))
+
+
+def run_benchmarks(names=None,
+                   repeats=3,
+                   output='benchmark_results.json',
+                   directory=None):
+
+    """
+    This function builds the fixtures, starts the local HTTP server and runs each benchmark in its own process.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) names (String List or None) - Default=None. The benchmarks to run. When None, every benchmark is run.
+
+    2) repeats (Integer) - Default=3. The number of timed runs of each benchmark.
+
+    3) output (String) - Default='benchmark_results.json'. The JSON file the results are saved to.
+
+    4) directory (String or None) - Default=None. The working directory for the fixtures.
+       When None, a temporary directory is used and deleted afterwards.
+
+    Returns
+    -------
+
+    A dictionary of the benchmark results. The results are also saved to {output}.
+    """
+
+    from importlib.metadata import version
+    from fixtures import build_fixtures
+    from server import start_server
+
+    if names == None:
+        names = list(benchmarks.keys())
+    else:
+        pass
+
+    if directory == None:
+        workdir = tempfile.mkdtemp(prefix='wxdata-benchmarks-')
+    else:
+        workdir = os.path.abspath(directory)
+        os.makedirs(workdir, exist_ok=True)
+
+    try:
+        paths = build_fixtures(workdir, steps=steps, members=members)
+        server, base_url = start_server(paths['server'])
+
+        # The index cache is kept inside the working directory so the user's own cache is never touched
+        env = dict(os.environ)
+        env['WXDATA_INDEX_CACHE'] = f"{workdir}/index_cache"
+
+        results = []
+        for name in names:
+            process = subprocess.run([sys.executable,
+                                      os.path.abspath(__file__),
+                                      '--child', name,
+                                      '--directory', workdir,
+                                      '--base-url', base_url,
+                                      '--repeats', str(repeats)],
+                                     cwd=workdir,
+                                     env=env,
+                                     capture_output=True,
+                                     text=True)
+            try:
+                result = json.loads(process.stdout.strip().splitlines()[-1])
+            except Exception as e:
+                result = {
+                    'name':name,
+                    'stage':benchmarks[name][0],
+                    'status':'error',
+                    'error':process.stderr.strip()[-2000:]
+                }
+            results.append(result)
+
+            if result['status'] == 'ok':
+                print(f"{name}: {result['seconds_median']:.3f} s (median of {repeats}), peak RSS {result['peak_rss_mb']} MB")
+            else:
+                print(f"{name}: FAILED")
+
+        server.shutdown()
+    finally:
+        if directory == None:
+            shutil.rmtree(workdir, ignore_errors=True)
+        else:
+            pass
+
+    try:
+        wxdata_version = version('wxdata')
+    except Exception as e:
+        wxdata_version = None
+
+    report = {
+        'wxdata_version':wxdata_version,
+        'python_version':platform.python_version(),
+        'platform':platform.platform(),
+        'processor':platform.processor(),
+        'cpu_count':os.cpu_count(),
+        'timestamp':datetime.now(timezone.utc).isoformat(),
+        'repeats':repeats,
+        'results':results
+    }
+
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    return report
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Runs the WxData benchmark suite.')
+    parser.add_argument('--only', nargs='+', choices=list(benchmarks.keys()), default=None, help='The benchmarks to run.')
+    parser.add_argument('--repeats', type=int, default=3, help='The number of timed runs of each benchmark.')
+    parser.add_argument('--output', default='benchmark_results.json', help='The JSON file the results are saved to.')
+    parser.add_argument('--directory', default=None, help='The working directory for the fixtures.')
+    parser.add_argument('--child', default=None, help=argparse.SUPPRESS)
+    parser.add_argument('--base-url', default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child != None:
+        run_child(args.child, args.directory, args.base_url, args.repeats)
+    else:
+        run_benchmarks(names=args.only,
+                       repeats=args.repeats,
+                       output=os.path.abspath(args.output),
+                       directory=args.directory)
@@ -0,0 +1,125 @@
+"""
+This file hosts the local HTTP server that stands in for the NOMADS and ECMWF dataservers during the benchmarks.
+
+The server supports HEAD requests and single HTTP Range requests (206 Partial Content) so the
+full-file downloads, the index (.idx/.index) downloads and the byte-range downloads in the WxData clients
+can all be benchmarked without touching the real dataservers.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import os
+import re
+import threading
+
+from http.server import(
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer
+)
+
+def make_handler(directory):
+
+    """
+    This function returns the request handler class that serves the files in a directory.
+
+    Required Arguments:
+
+    1) directory (String) - The directory the files are served from.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A BaseHTTPRequestHandler subclass.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass
+
+        def send_file(self, body=True):
+            path = os.path.join(directory, self.path.split('?')[0].lstrip('/'))
+            if os.path.isfile(path) == False:
+                self.send_response(404)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+
+            size = os.path.getsize(path)
+            start = 0
+            end = size - 1
+
+            match = re.match(r'bytes=(\d+)-(\d*)$', self.headers.get('Range', ''))
+            if match != None:
+                start = int(match.group(1))
+                if match.group(2) != '':
+                    end = min(int(match.group(2)), size - 1)
+                else:
+                    pass
+                self.send_response(206)
+                self.send_header('Content-Range', f"bytes {start}-{end}/{size}")
+            else:
+                self.send_response(200)
+
+            self.send_header('Content-Length', str(end - start + 1))
+            self.send_header('Accept-Ranges', 'bytes')
+            self.end_headers()
+
+            if body == True:
+                with open(path, 'rb') as f:
+                    f.seek(start)
+                    remaining = end - start + 1
+                    while remaining > 0:
+                        chunk = f.read(min(remaining, 1024 * 1024))
+                        if not chunk:
+                            break
+                        self.wfile.write(chunk)
+                        remaining = remaining - len(chunk)
+            else:
+                pass
+
+        def do_GET(self):
+            self.send_file(body=True)
+
+        def do_HEAD(self):
+            self.send_file(body=False)
+
+    return Handler
+
+
+def start_server(directory,
+                 host='127.0.0.1',
+                 port=0):
+
+    """
+    This function starts the local HTTP server on a background thread.
+
+    Required Arguments:
+
+    1) directory (String) - The directory the files are served from.
+
+    Optional Arguments:
+
+    1) host (String) - Default='127.0.0.1'. The host the server listens on.
+
+    2) port (Integer) - Default=0. The port the server listens on. When 0, a free port is chosen.
+
+    Returns
+    -------
+
+    The server and the base URL of the server (i.e. http://127.0.0.1:8000/).
+    Call server.shutdown() to stop the server.
+    """
+
+    server = ThreadingHTTPServer((host, port), make_handler(directory))
+    server.daemon_threads = True
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    return server, f"http://{host}:{server.server_address[1]}/"
@@ -21,8 +21,8 @@ These functions do the following:
 3) Downloads the data.
     - Users can define their VPN/PROXY IP Address as a (dict) in their script and pass their
       VPN/PROXY IP address into the function to avoid SSL Certificate errors when requesting data.
-    - Algorithm allows for up to 5 retries with a 30 second break between each retry to resolve connection
-      interruptions while not overburdening the data servers. 
+    - Connection interruptions are retried with exponential backoff, per-server circuit breaking and an optional deadline
+      (see configure_retry()) while not overburdening the data servers. 
 
 4) Pre-processes the data via filename formatting and correctly filing in the wxdata directory. 
 
@@ -39,135 +39,185 @@ These functions do the following:
      - When clear_recycle_bin=True, the user's recycle bin is also cleared. 
 """
 
-# Global Forecast System (GFS)
-from wxdata.gfs.gfs import(
-    gfs_0p25,
-    gfs_0p25_secondary_parameters,
-    gfs_0p50
-)
-
-# AI Global Forecast System (AIGFS)
-from wxdata.aigfs.aigfs import aigfs
-
-# Global Ensemble Forecast System (GEFS)
-from wxdata.gefs.gefs import(
-    gefs_0p50,
-    gefs_0p50_secondary_parameters,
-    gefs_0p25
-)
-
-# AI Global Ensemble Forecast System (AIGEFS)
-from wxdata.aigefs.aigefs import(
-    aigefs_pressure_members,
-    aigefs_surface_members,
-    aigefs_single
-)
-
-# European Centre for Medium-Range Weather Forecasts (ECMWF)
-from wxdata.ecmwf.ecmwf import(
-    ecmwf_ifs,
-    ecmwf_aifs,
-    ecmwf_ifs_high_res,
-    ecmwf_ifs_wave
-)
-
-# FEMS RAWS Network
-from wxdata.fems.fems import(
-    get_single_station_data,
-    get_raws_sig_data,
-    get_nfdrs_forecast_data
-)
-
-# Real-Time Mesoscale Analysis (RTMA)
-from wxdata.rtma.rtma import(
-    rtma, 
-    rtma_comparison
-)
-
-# NOAA 
-# Storm Prediction Center Outlooks
-# National Weather Service Forecasts
-from wxdata.noaa.nws import get_ndfd_grids
-
-# Observed Upper-Air Soundings
-# (University of Wyoming Database)
-from wxdata.soundings.wyoming_soundings import get_observed_sounding_data
-
-# METAR Observational Data (From NOAA)
-from wxdata.metars.metar_obs import download_metar_data
-
-"""
-This section hosts all the functions and modules that involve post-processing the data.
-These are the functions and modules that:
-
-1) Re-map the GRIB2 Variable Keys into Plain Language Keys
-2) Build the xarray.array of the various datasets. 
-
-"""
-
-
-# Global Forecast System (GFS)
-import wxdata.post_processors.gfs_post_processing as gfs_post_processing
-
-# AI Global Forecast System (AIGFS)
-import wxdata.post_processors.aigfs_post_processing as aigfs_post_processing
-
-# Global Ensemble Forecast System (GEFS)
-import wxdata.post_processors.gefs_post_processing as gefs_post_processing
-
-# AI Global Ensemble Forecast System (AIGEFS)
-import wxdata.post_processors.aigefs_post_processing as aigefs_post_processing
-
-# European Centre for Medium-Range Weather Forecasts (ECMWF)
-import wxdata.post_processors.ecmwf_post_processing as ecmwf_post_processing
-
-# Real-Time Mesoscale Analysis (RTMA)
-from wxdata.post_processors.rtma_post_processing import process_rtma_data
-
-
-"""
-This section hosts the utility functions accessable to the user. 
-
-These functions provide helpful utilities when analyzing weather data. 
-
-Utility functions are geared towards the following types of users:
-
-1) Users who want to use their own scripts to download the data however, they
-   would like to use the wxdata post-processing capabilities. 
-   
-2) Users who want to make hemispheric graphics or any graphics where cyclic points
-   resolve missing data along the prime meridian or international dateline. 
-"""
-# WxData function using cartopy to make cyclic points
-# This is for users who wish to make graphics that cross the -180/180 degree longitude line
-# This is commonly used for Hemispheric graphics
-# Function that converts the longitude dimension in an xarray.array 
-# From 0 to 360 to -180 to 180
-from wxdata.utils.coords import(
-    cyclic_point,
-    shift_longitude
-)
-
-# Functions to pixel query and query pixels along a line between points A and B
-from wxdata.utils.tools import(
-    pixel_query,
-    line_query
-)
-
-"""
-This section hosts the various data clients that retrieve various types of data.
-
-These clients can be easily configured to work on VPN/PROXY connections.
-"""
-
-# These are the wxdata HTTPS Clients with full VPN/PROXY Support
-# Client List:
-#  - get_gridded_data()
-#  - get_csv_data()
-#  - get_xmacis_data()
-import wxdata.client.client as client
-
-# This function executes a list of Python scripts in the order the user lists them
-from wxdata.utils.scripts import run_external_scripts
-
+# Every function and module below is imported the first time it is used.
+# This keeps "import wxdata" fast and the heavy scientific libraries (metpy, cartopy, xarray, dask and cfgrib)
+# are only imported when a function that needs them is called.
+from wxdata.utils.lazy_imports import lazy_loader
 
+__getattr__, __dir__, __all__ = lazy_loader(__name__, {
+    
+    # Global Forecast System (GFS)
+    'wxdata.gfs.gfs':[
+        'gfs_0p25',
+        'gfs_0p25_secondary_parameters',
+        'gfs_0p50'
+    ],
+    
+    # AI Global Forecast System (AIGFS)
+    'wxdata.aigfs.aigfs':[
+        'aigfs'
+    ],
+    
+    # Global Ensemble Forecast System (GEFS)
+    'wxdata.gefs.gefs':[
+        'gefs_0p50',
+        'gefs_0p50_secondary_parameters',
+        'gefs_0p25'
+    ],
+    
+    # AI Global Ensemble Forecast System (AIGEFS)
+    'wxdata.aigefs.aigefs':[
+        'aigefs_pressure_members',
+        'aigefs_surface_members',
+        'aigefs_single'
+    ],
+    
+    # European Centre for Medium-Range Weather Forecasts (ECMWF)
+    'wxdata.ecmwf.ecmwf':[
+        'ecmwf_ifs',
+        'ecmwf_aifs',
+        'ecmwf_ifs_high_res',
+        'ecmwf_ifs_wave'
+    ],
+    
+    # FEMS RAWS Network
+    'wxdata.fems.fems':[
+        'get_single_station_data',
+        'get_raws_sig_data',
+        'get_nfdrs_forecast_data'
+    ],
+    
+    # Real-Time Mesoscale Analysis (RTMA)
+    'wxdata.rtma.rtma':[
+        'rtma', 
+        'rtma_comparison',
+        'rtma_time_series'
+    ],
+    
+    # NOAA 
+    # Storm Prediction Center Outlooks
+    # National Weather Service Forecasts
+    'wxdata.noaa.nws':[
+        'get_ndfd_grids'
+    ],
+    
+    # Observed Upper-Air Soundings
+    # (University of Wyoming Database)
+    'wxdata.soundings.wyoming_soundings':[
+        'get_observed_sounding_data'
+    ],
+    
+    # METAR Observational Data (From NOAA)
+    'wxdata.metars.metar_obs':[
+        'download_metar_data'
+    ],
+    
+    # Long-running watcher that ingests the GFS and GEFS forecast hours as NOMADS publishes them
+    'wxdata.utils.watcher':[
+        'watch',
+        'iter_watch'
+    ],
+    
+    # This section hosts all the functions and modules that involve post-processing the data.
+    # These are the functions and modules that:
+    #
+    # 1) Re-map the GRIB2 Variable Keys into Plain Language Keys
+    # 2) Build the xarray.array of the various datasets.
+    
+    # Real-Time Mesoscale Analysis (RTMA)
+    'wxdata.post_processors.rtma_post_processing':[
+        'process_rtma_data'
+    ],
+    
+    # This section hosts the utility functions accessable to the user.
+    #
+    # These functions provide helpful utilities when analyzing weather data.
+    #
+    # Utility functions are geared towards the following types of users:
+    #
+    # 1) Users who want to use their own scripts to download the data however, they
+    #    would like to use the wxdata post-processing capabilities.
+    #
+    # 2) Users who want to make hemispheric graphics or any graphics where cyclic points
+    #    resolve missing data along the prime meridian or international dateline.
+    
+    # WxData function using cartopy to make cyclic points
+    # This is for users who wish to make graphics that cross the -180/180 degree longitude line
+    # This is commonly used for Hemispheric graphics
+    # Function that converts the longitude dimension in an xarray.array 
+    # From 0 to 360 to -180 to 180
+    'wxdata.utils.coords':[
+        'cyclic_point',
+        'shift_longitude'
+    ],
+    
+    # Functions to pixel query, query many points at once and query pixels along a line between points A and B
+    'wxdata.utils.tools':[
+        'pixel_query',
+        'line_query',
+        'points_query'
+    ],
+    
+    # Function that calculates the ensemble mean, spread, quantiles and exceedance probabilities
+    # one ensemble member at a time (GEFS and AIGEFS members)
+    'wxdata.calc.ensemble':[
+        'ensemble_statistics',
+        'iter_ensemble_members'
+    ],
+    
+    # Function that calculates the running changes and extremes of a time series of analyses (i.e. RTMA)
+    'wxdata.calc.time_series':[
+        'time_series_statistics'
+    ],
+    
+    # Function that smooths many variables with a Gaussian filter in a single pass
+    'wxdata.calc.smoothing':[
+        'smooth_gaussian_fields'
+    ],
+    
+    # This section hosts the various data clients that retrieve various types of data.
+    #
+    # These clients can be easily configured to work on VPN/PROXY connections.
+    
+    # This function configures the shared HTTP session (connection pooling and VPN/PROXY settings) used by every client
+    'wxdata.client.session':[
+        'configure_session'
+    ],
+    
+    # This function configures the retry policy (backoff, circuit breaking and deadline) used by every network request
+    # The exceptions are raised when a request cannot be completed or no recent data is available
+    'wxdata.client.retry':[
+        'configure_retry',
+        'WxDataError',
+        'DownloadError',
+        'CircuitOpenError',
+        'DeadlineExceededError',
+        'NoDataAvailableError'
+    ],
+    
+    # This function executes a list of Python scripts in the order the user lists them
+    'wxdata.utils.scripts':[
+        'run_external_scripts'
+    ]
+}, 
+    
+    modules={
+        
+        # Post-processing modules
+        'gfs_post_processing':'wxdata.post_processors.gfs_post_processing',
+        'aigfs_post_processing':'wxdata.post_processors.aigfs_post_processing',
+        'gefs_post_processing':'wxdata.post_processors.gefs_post_processing',
+        'aigefs_post_processing':'wxdata.post_processors.aigefs_post_processing',
+        'ecmwf_post_processing':'wxdata.post_processors.ecmwf_post_processing',
+        
+        # These are the wxdata HTTPS Clients with full VPN/PROXY Support
+        # Client List:
+        #  - get_gridded_data()
+        #  - get_gridded_data_batch()
+        #  - get_csv_data()
+        #  - get_xmacis_data()
+        'client':'wxdata.client'
+    })
+
+# lazy_loader is not part of the public API of the package
+del lazy_loader
@@ -27,7 +27,8 @@ from wxdata.utils.file_funcs import(
 )
 
 from wxdata.calc.unit_conversion import convert_temperature_units
-from wxdata.utils.file_scanner import local_file_scanner
+from wxdata.utils.file_scanner import manifest_file_scanner
+from wxdata.utils.manifest import record_files
 from wxdata.utils.recycle_bin import *
 
 def aigefs_pressure_members(final_forecast_hour=384, 
@@ -45,7 +46,10 @@ def aigefs_pressure_members(final_forecast_hour=384,
             convert_to='celsius',
             custom_directory=None,
             chunk_size=8192,
-            notifications='off'):
+            notifications='off',
+            max_workers=8,
+            variables=None,
+            levels=None):
     
     """
     This function downloads, pre-processes and post-processes the latest pressure parameter dataset of the AIGEFS and bins the files to specific folders based on ensemble number.
@@ -102,6 +106,16 @@ def aigefs_pressure_members(final_forecast_hour=384,
     
     16) notifications (String) - Default='off'. Notification when a file is downloaded and saved to {path}
     
+    17) max_workers (Integer) - Default=8. The maximum number of files downloaded at the same time.
+       Set max_workers=1 to download the files one at a time.
+    
+    18) variables (List or None) - Default=None. A list of variables to download in plain language (i.e. ['temperature', 'geopotential height'])
+       or as GRIB keys (i.e. ['TMP', 'HGT']). When set, only the GRIB2 messages of these variables are downloaded using the
+       byte ranges in the NOMADS .idx files. When None, every variable is downloaded.
+    
+    19) levels (List or None) - Default=None. A list of levels to download. Pressure levels are in hPa (i.e. [850, 500])
+       and other levels use the NOMADS .idx level names (i.e. ['2 m above ground', 'mean sea level']).
+       When None, every level is downloaded.
     
     Returns
     -------
@@ -135,50 +149,46 @@ def aigefs_pressure_members(final_forecast_hour=384,
                             proxies,
                             members)
     
-    download = local_file_scanner(paths[-1], 
-                                    file,
-                                    'nomads',
-                                    run,
-                                    model='aigefs')  
-    
-    if download == True:
+    if run < 10:
+        run = f"0{run}"
+    else:
+        run = f"{run}"        
+    stop = final_forecast_hour + 6
+    fnames = []
+    member_urls = []
+    member_paths = []
+    for path, url in zip(paths, urls):
+        for i in range(0, stop, 6):
+            fname = f"aigefs.t{run}z.pres.f{i:03d}.grib2"
+            fnames.append(fname)
+            member_urls.append(f"{url}/{fname}")
+            member_paths.append(path)
+    
+    missing = manifest_file_scanner(member_paths, 
+                                    member_urls,
+                                    fnames,
+                                    variables=variables,
+                                    levels=levels)  
+    
+    if len(missing) > 0:
         print(f"Downloading AIGEFS Pressure Parameter Files...")
-        
-        try:
-            for path in paths:
-                for file in os.listdir(f"{path}"):
-                    os.remove(f"{path}/{file}")
-        except Exception as e:
-            pass
-         
-        if run < 10:
-            run = f"0{run}"
-        else:
-            run = f"{run}"        
-        stop = final_forecast_hour + 6
-        for path, url in zip(paths, urls):
-            for i in range(0, stop, 6):
-                if i < 10:
-                    client.get_gridded_data(f"{url}/aigefs.t{run}z.pres.f00{i}.grib2",
-                                path,
-                                f"aigefs.t{run}z.pres.f00{i}.grib2",
-                                proxies=proxies,
-                                chunk_size=chunk_size,
-                                notifications=notifications)  
-                elif i >= 10 and i < 100:
-                    client.get_gridded_data(f"{url}/aigefs.t{run}z.pres.f0{i}.grib2",
-                                path,
-                                f"aigefs.t{run}z.pres.f0{i}.grib2",
-                                proxies=proxies,
-                                chunk_size=chunk_size,
-                                notifications=notifications)  
-                else:
-                    client.get_gridded_data(f"{url}/aigefs.t{run}z.pres.f{i}.grib2",
-                                path,
-                                f"aigefs.t{run}z.pres.f{i}.grib2",
-                                proxies=proxies,
-                                chunk_size=chunk_size,
-                                notifications=notifications)     
+                
+        client.get_gridded_data_batch([member_urls[i] for i in missing],
+                    [member_paths[i] for i in missing],
+                    [fnames[i] for i in missing],
+                    proxies=proxies,
+                    chunk_size=chunk_size,
+                    notifications=notifications,
+                    max_workers=max_workers,
+                    index_format='nomads',
+                    variables=variables,
+                    levels=levels)
+        
+        record_files([member_paths[i] for i in missing],
+                     [member_urls[i] for i in missing],
+                     [fnames[i] for i in missing],
+                     variables=variables,
+                     levels=levels)
     else:
         print(f"User has latest AIGEFS Pressure Parameter Files\nSkipping Download...")  
         
@@ -219,7 +229,10 @@ def aigefs_surface_members(final_forecast_hour=384,
             convert_to='celsius',
             custom_directory=None,
             chunk_size=8192,
-            notifications='off'):
+            notifications='off',
+            max_workers=8,
+            variables=None,
+            levels=None):
     
     """
     This function downloads, pre-processes and post-processes the latest surface parameter dataset of the AIGEFS and bins the files to specific folders based on ensemble number.
@@ -276,6 +289,16 @@ def aigefs_surface_members(final_forecast_hour=384,
     
     16) notifications (String) - Default='off'. Notification when a file is downloaded and saved to {path}
     
+    17) max_workers (Integer) - Default=8. The maximum number of files downloaded at the same time.
+       Set max_workers=1 to download the files one at a time.
+    
+    18) variables (List or None) - Default=None. A list of variables to download in plain language (i.e. ['temperature', 'geopotential height'])
+       or as GRIB keys (i.e. ['TMP', 'HGT']). When set, only the GRIB2 messages of these variables are downloaded using the
+       byte ranges in the NOMADS .idx files. When None, every variable is downloaded.
+    
+    19) levels (List or None) - Default=None. A list of levels to download. Pressure levels are in hPa (i.e. [850, 500])
+       and other levels use the NOMADS .idx level names (i.e. ['2 m above ground', 'mean sea level']).
+       When None, every level is downloaded.
     
     Returns
     -------
@@ -307,50 +330,46 @@ def aigefs_surface_members(final_forecast_hour=384,
                             proxies,
                             members)
     
-    download = local_file_scanner(paths[-1], 
-                                    file,
-                                    'nomads',
-                                    run,
-                                    model='aigefs')  
-    
-    if download == True:
+    if run < 10:
+        run = f"0{run}"
+    else:
+        run = f"{run}"        
+    stop = final_forecast_hour + 6
+    fnames = []
+    member_urls = []
+    member_paths = []
+    for path, url in zip(paths, urls):
+        for i in range(0, stop, 6):
+            fname = f"aigefs.t{run}z.sfc.f{i:03d}.grib2"
+            fnames.append(fname)
+            member_urls.append(f"{url}/{fname}")
+            member_paths.append(path)
+    
+    missing = manifest_file_scanner(member_paths, 
+                                    member_urls,
+                                    fnames,
+                                    variables=variables,
+                                    levels=levels)  
+    
+    if len(missing) > 0:
         print(f"Downloading AIGEFS Surface Parameter Files...")
-        
-        try:
-            for path in paths:
-                for file in os.listdir(f"{path}"):
-                    os.remove(f"{path}/{file}")
-        except Exception as e:
-            pass
-         
-        if run < 10:
-            run = f"0{run}"
-        else:
-            run = f"{run}"        
-        stop = final_forecast_hour + 6
-        for path, url in zip(paths, urls):
-            for i in range(0, stop, 6):
-                if i < 10:
-                    client.get_gridded_data(f"{url}/aigefs.t{run}z.sfc.f00{i}.grib2",
-                                path,
-                                f"aigefs.t{run}z.sfc.f00{i}.grib2",
-                                proxies=proxies,
-                                chunk_size=chunk_size,
-                                notifications=notifications)  
-                elif i >= 10 and i < 100:
-                    client.get_gridded_data(f"{url}/aigefs.t{run}z.sfc.f0{i}.grib2",
-                                path,
-                                f"aigefs.t{run}z.sfc.f0{i}.grib2",
-                                proxies=proxies,
-                                chunk_size=chunk_size,
-                                notifications=notifications)  
-                else:
-                    client.get_gridded_data(f"{url}/aigefs.t{run}z.sfc.f{i}.grib2",
-                                path,
-                                f"aigefs.t{run}z.sfc.f{i}.grib2",
-                                proxies=proxies,
-                                chunk_size=chunk_size,
-                                notifications=notifications)    
+                
+        client.get_gridded_data_batch([member_urls[i] for i in missing],
+                    [member_paths[i] for i in missing],
+                    [fnames[i] for i in missing],
+                    proxies=proxies,
+                    chunk_size=chunk_size,
+                    notifications=notifications,
+                    max_workers=max_workers,
+                    index_format='nomads',
+                    variables=variables,
+                    levels=levels)
+        
+        record_files([member_paths[i] for i in missing],
+                     [member_urls[i] for i in missing],
+                     [fnames[i] for i in missing],
+                     variables=variables,
+                     levels=levels)
                     
     else:
         print(f"User has latest AIGEFS Surface Parameter Files\nSkipping Download...")  
@@ -390,7 +409,10 @@ def aigefs_single(final_forecast_hour=384,
                     chunk_size=8192,
                     notifications='off',
                     cat='mean',
-                    type_of_level='pressure'):                   
+                    type_of_level='pressure',
+                    max_workers=8,
+                    variables=None,
+                    levels=None):                   
     
     """
     This function downloads, pre-processes and post-processes the latest AIGEFS Ensemble Mean or Ensemble Spread for either the Pressure or Surface Parameters. 
@@ -461,6 +483,16 @@ def aigefs_single(final_forecast_hour=384,
         1) pressure
         2) surface
     
+    18) max_workers (Integer) - Default=8. The maximum number of files downloaded at the same time.
+       Set max_workers=1 to download the files one at a time.
+    
+    19) variables (List or None) - Default=None. A list of variables to download in plain language (i.e. ['temperature', 'geopotential height'])
+       or as GRIB keys (i.e. ['TMP', 'HGT']). When set, only the GRIB2 messages of these variables are downloaded using the
+       byte ranges in the NOMADS .idx files. When None, every variable is downloaded.
+    
+    20) levels (List or None) - Default=None. A list of levels to download. Pressure levels are in hPa (i.e. [850, 500])
+       and other levels use the NOMADS .idx level names (i.e. ['2 m above ground', 'mean sea level']).
+       When None, every level is downloaded.
     
     Returns
     -------
@@ -516,49 +548,40 @@ def aigefs_single(final_forecast_hour=384,
                                                         cat,
                                                         type_of_level)
     
-    download = local_file_scanner(path, 
-                                    file,
-                                    'nomads',
-                                    run,
-                                    model='aigefs')  
+    if run < 10:
+        run = f"0{run}"
+    else:
+        run = f"{run}"        
+    stop = final_forecast_hour + 6
     
-    if download == True:
+    fnames = [f"aigefs.t{run}z.{level}.{cat}.f{i:03d}.grib2" for i in range(0, stop, 6)]
+    urls = [f"{url}{fname}" for fname in fnames]
+    
+    missing = manifest_file_scanner(path, 
+                                    urls,
+                                    fnames,
+                                    variables=variables,
+                                    levels=levels)  
+    
+    if len(missing) > 0:
         print(f"Downloading AIGEFS {type_of_level.upper()} {cat.upper()} Files...")
         
-        try:
-            for file in os.listdir(f"{path}"):
-                os.remove(f"{path}/{file}")
-        except Exception as e:
-            pass
-        
-        if run < 10:
-            run = f"0{run}"
-        else:
-            run = f"{run}"        
-        stop = final_forecast_hour + 6
-        
-        for i in range(0, stop, 6):
-            if i < 10:
-                client.get_gridded_data(f"{url}aigefs.t{run}z.{level}.{cat}.f00{i}.grib2",
-                            path,
-                            f"aigefs.t{run}z.{level}.{cat}.f00{i}.grib2",
-                            proxies=proxies,
-                            chunk_size=chunk_size,
-                            notifications=notifications)  
-            elif i >= 10 and i < 100:
-                client.get_gridded_data(f"{url}aigefs.t{run}z.{level}.{cat}.f0{i}.grib2",
-                            path,
-                            f"aigefs.t{run}z.{level}.{cat}.f0{i}.grib2",
-                            proxies=proxies,
-                            chunk_size=chunk_size,
-                            notifications=notifications)  
-            else:
-                client.get_gridded_data(f"{url}aigefs.t{run}z.{level}.{cat}.f{i}.grib2",
-                            path,
-                            f"aigefs.t{run}z.{level}.{cat}.f{i}.grib2",
-                            proxies=proxies,
-                            chunk_size=chunk_size,
-                            notifications=notifications)    
+        client.get_gridded_data_batch([urls[i] for i in missing],
+                    path,
+                    [fnames[i] for i in missing],
+                    proxies=proxies,
+                    chunk_size=chunk_size,
+                    notifications=notifications,
+                    max_workers=max_workers,
+                    index_format='nomads',
+                    variables=variables,
+                    levels=levels)
+        
+        record_files(path,
+                     [urls[i] for i in missing],
+                     [fnames[i] for i in missing],
+                     variables=variables,
+                     levels=levels)
                     
     else:
         print(f"User has latest AIGEFS {type_of_level.upper()} {cat.upper()} Files\nSkipping Download...")  
@@ -14,7 +14,9 @@ from wxdata.aigfs.url_scanners import aigfs_url_scanner
 from wxdata.aigfs.paths import build_aigfs_directory
 from wxdata.utils.file_funcs import custom_branch
 from wxdata.calc.unit_conversion import convert_temperature_units
-from wxdata.utils.file_scanner import local_file_scanner
+from wxdata.utils.file_scanner import manifest_file_scanner
+from wxdata.utils.manifest import record_files
+from wxdata.utils.pipeline import download_and_process
 from wxdata.utils.recycle_bin import *
 
 
@@ -31,7 +33,11 @@ def aigfs(final_forecast_hour=384,
             custom_directory=None,
             chunk_size=8192,
             notifications='off',
-            type_of_level='pressure'):
+            type_of_level='pressure',
+            max_workers=8,
+            variables=None,
+            levels=None,
+            pipeline=False):
     
     """
     This function downloads, pre-processes and post-processes the latest AIGFS Data. 
@@ -94,11 +100,26 @@ def aigfs(final_forecast_hour=384,
         1) pressure
         2) surface
     
+    17) max_workers (Integer) - Default=8. The maximum number of files downloaded at the same time.
+       Set max_workers=1 to download the files one at a time.
+    
+    18) variables (List or None) - Default=None. A list of variables to download in plain language (i.e. ['temperature', 'geopotential height'])
+       or as GRIB keys (i.e. ['TMP', 'HGT']). When set, only the GRIB2 messages of these variables are downloaded using the
+       byte ranges in the NOMADS .idx files. When None, every variable is downloaded.
+    
+    19) levels (List or None) - Default=None. A list of levels to download. Pressure levels are in hPa (i.e. [850, 500])
+       and other levels use the NOMADS .idx level names (i.e. ['2 m above ground', 'mean sea level']).
+       When None, every level is downloaded.
+       
+    20) pipeline (Boolean) - Default=False. When set to True (and process_data=True), each forecast hour is post-processed
+        as soon as it is downloaded while the later forecast hours are still downloading. A generator is returned that yields
+        each forecast hour as its own xarray.array in forecast hour order. Use xarray.concat(list(ds), dim='step') to combine them. 
     
     Returns
     -------
     
     An xarray data array of the AIGEFS data specified to the coordinate boundaries and variable list the user specifies. 
+    When pipeline=True, a generator of an xarray.array for each forecast hour.
     
     Pressure-Level Plain Language Variable Keys
     -------------------------------------------
@@ -142,55 +163,79 @@ def aigfs(final_forecast_hour=384,
                                                         proxies,
                                                         type_of_level)
     
-    download = local_file_scanner(path, 
-                                    file,
-                                    'nomads',
-                                    run,
-                                    model='aigfs')  
+    if run < 10:
+        run = f"0{run}"
+    else:
+        run = f"{run}"        
+    stop = final_forecast_hour + 6
     
+    fnames = [f"aigfs.t{run}z.{level}.f{i:03d}.grib2" for i in range(0, stop, 6)]
+    urls = [f"{url}{fname}" for fname in fnames]
     
-    if download == True:
+    missing = manifest_file_scanner(path, 
+                                    urls,
+                                    fnames,
+                                    variables=variables,
+                                    levels=levels)
+    
+    if len(missing) > 0:
         print(f"Downloading AIGFS {type_of_level.upper()} Files...")
         
-        try:
-            for file in os.listdir(f"{path}"):
-                os.remove(f"{path}/{file}")
-        except Exception as e:
+        if pipeline == True and process_data == True:
             pass
-        
-        if run < 10:
-            run = f"0{run}"
         else:
-            run = f"{run}"        
-        stop = final_forecast_hour + 6
-        
-        for i in range(0, stop, 6):
-            if i < 10:
-                client.get_gridded_data(f"{url}aigfs.t{run}z.{level}.f00{i}.grib2",
-                            path,
-                            f"aigfs.t{run}z.{level}.f00{i}.grib2",
-                            proxies=proxies,
-                            chunk_size=chunk_size,
-                            notifications=notifications)  
-            elif i >= 10 and i < 100:
-                client.get_gridded_data(f"{url}aigfs.t{run}z.{level}.f0{i}.grib2",
-                            path,
-                            f"aigfs.t{run}z.{level}.f0{i}.grib2",
-                            proxies=proxies,
-                            chunk_size=chunk_size,
-                            notifications=notifications)  
-            else:
-                client.get_gridded_data(f"{url}aigfs.t{run}z.{level}.f{i}.grib2",
-                            path,
-                            f"aigfs.t{run}z.{level}.f{i}.grib2",
-                            proxies=proxies,
-                            chunk_size=chunk_size,
-                            notifications=notifications)    
+            client.get_gridded_data_batch([urls[i] for i in missing],
+                        path,
+                        [fnames[i] for i in missing],
+                        proxies=proxies,
+                        chunk_size=chunk_size,
+                        notifications=notifications,
+                        max_workers=max_workers,
+                        index_format='nomads',
+                        variables=variables,
+                        levels=levels)
+            
+            record_files(path,
+                         [urls[i] for i in missing],
+                         [fnames[i] for i in missing],
+                         variables=variables,
+                         levels=levels)
                     
     else:
         print(f"User has latest AIGFS {type_of_level.upper()} Files\nSkipping Download...")  
     
-    if process_data == True:
+    if process_data == True and pipeline == True:
+        print(f"AIGFS {type_of_level.upper()} Data Processing (Pipelined)...")
+        
+        def process(files):
+            ds = aigfs_post_processing.aigfs_post_processing(path,
+                                                            western_bound,
+                                                            eastern_bound,
+                                                            northern_bound,
+                                                            southern_bound,
+                                                            files=files)
+            if convert_temperature == True:
+                ds = convert_temperature_units(ds, 
+                                               convert_to, 
+                                               cat='mean')
+            else:
+                pass
+            return ds
+        
+        return download_and_process(urls,
+                                    path,
+                                    fnames,
+                                    process,
+                                    missing=missing,
+                                    proxies=proxies,
+                                    chunk_size=chunk_size,
+                                    notifications=notifications,
+                                    max_workers=max_workers,
+                                    index_format='nomads',
+                                    variables=variables,
+                                    levels=levels)
+    
+    elif process_data == True:
         print(f"AIGFS {type_of_level.upper()} Data Processing...")    
         
         ds = aigfs_post_processing.aigfs_post_processing(path,
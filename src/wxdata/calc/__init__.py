@@ -1,3 +1,38 @@
-from wxdata.calc.kinematics import *
-from wxdata.calc.thermodynamics import *
-from wxdata.calc.unit_conversion import *
\ No newline at end of file
+# The calculation functions are imported the first time they are used
+from wxdata.utils.lazy_imports import lazy_loader
+
+__getattr__, __dir__, __all__ = lazy_loader(__name__, {
+    
+    'wxdata.calc.kinematics':[
+        'get_u_and_v'
+    ],
+    
+    'wxdata.calc.thermodynamics':[
+        'relative_humidity',
+        'saturation_vapor_pressure'
+    ],
+    
+    'wxdata.calc.unit_conversion':[
+        'convert_temperature_units'
+    ],
+    
+    'wxdata.calc.ensemble':[
+        'add_member',
+        'ensemble_statistics',
+        'finalize_ensemble_statistics',
+        'iter_ensemble_members',
+        'new_ensemble_statistics',
+        'sample_quantiles'
+    ],
+    
+    'wxdata.calc.time_series':[
+        'time_series_statistics'
+    ],
+    
+    'wxdata.calc.smoothing':[
+        'smooth_gaussian_fields'
+    ]
+})
+
+# lazy_loader is not part of the public API of the package
+del lazy_loader
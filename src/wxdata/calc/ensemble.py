@@ -0,0 +1,414 @@
+"""
+This file hosts the functions that calculate ensemble statistics one ensemble member at a time.
+
+Rather than loading every ensemble member into memory to calculate the mean, spread, quantiles and probabilities,
+each member is opened and loaded on its own (i.e. from iter_ensemble_members()) and folded into running statistics:
+
+1) Mean and spread (standard deviation) - Welford's running mean and variance.
+2) Quantiles - A reservoir sample of the members. The quantiles are exact when the ensemble has no more members than the reservoir.
+3) Exceedance probabilities - A running count of the members greater than each threshold.
+
+Peak memory scales with a single member (plus the reservoir when quantiles are requested) rather than the whole ensemble
+as long as the members are passed in lazily (i.e. a generator of members or an xarray.array that has not been loaded).
+
+(C) Eric J. Drewitz 2025
+"""
+
+import numpy as np
+import xarray as xr
+
+def sample_quantiles(sample,
+                     quantiles):
+
+    """
+    This function calculates the quantiles of a sample of ensemble members at every grid point.
+
+    The quantiles are linearly interpolated between the sorted members (the same method as numpy.quantile).
+    Missing values (NaN) are skipped. Every grid point is calculated at once rather than one grid point at a time.
+
+    Required Arguments:
+
+    1) sample (Numpy Array) - The ensemble members stacked along the first axis.
+
+    2) quantiles (Float List) - The quantiles to calculate (i.e. [0.1, 0.5, 0.9]).
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A Numpy Array of the quantiles stacked along the first axis.
+    """
+
+    # NaN values are sorted to the end of each grid point
+    sample = np.sort(sample, axis=0)
+    count = np.sum(np.isfinite(sample), axis=0)
+    last = np.maximum(count - 1, 0)
+
+    result = np.full((len(quantiles),) + sample.shape[1:], np.nan, dtype=np.float64)
+    for i, q in enumerate(quantiles):
+        position = q * last
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, last)
+        weight = position - lower
+        low = np.take_along_axis(sample, lower[np.newaxis], axis=0)[0]
+        high = np.take_along_axis(sample, upper[np.newaxis], axis=0)[0]
+        result[i] = np.where(count > 0, low + weight * (high - low), np.nan)
+
+    return result
+
+
+def iter_ensemble_members(paths,
+                          post_processor,
+                          files=None,
+                          **kwargs):
+
+    """
+    This function opens and post-processes the ensemble members one member at a time.
+
+    Each member directory is post-processed on its own when the next member is requested so only
+    the member that is being folded into the ensemble statistics is ever open.
+
+    Required Arguments:
+
+    1) paths (String List) - The paths to the directories of the ensemble members (i.e. f:GEFS0P50/MEMBERS/1).
+
+    2) post_processor (Function) - The post-processor of the members that accepts a list of paths
+       (i.e. wxdata.gefs_post_processing.primary_gefs_post_processing).
+
+    Optional Arguments:
+
+    1) files (List or None) - Default=None. A list of the files of each member in the same order as paths (i.e. a single forecast hour).
+       Each member is post-processed with its own list of files. When None, every file of each member is post-processed.
+
+    Any other keyword argument is passed to post_processor (i.e. the bounds of aigefs_members_post_processing).
+
+    Returns
+    -------
+
+    A generator of the post-processed xarray.arrays of each member.
+    """
+
+    for i, path in enumerate(paths):
+        if files == None:
+            ds = post_processor([path], **kwargs)
+        else:
+            ds = post_processor([path], files=files[i], **kwargs)
+
+        yield ds
+
+
+def new_ensemble_statistics(variables=None,
+                            quantiles=None,
+                            thresholds=None,
+                            reservoir_size=31,
+                            seed=None):
+
+    """
+    This function returns an empty set of running ensemble statistics.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) variables (String List or None) - Default=None. The variables to calculate statistics for.
+       When None, every variable in the first member is used.
+
+    2) quantiles (Float List or None) - Default=None. The quantiles to calculate (i.e. [0.1, 0.5, 0.9]).
+       When None, quantiles are not calculated and no reservoir is kept.
+
+    3) thresholds (dict or None) - Default=None. The thresholds of the exceedance probabilities for each variable
+       (i.e. {'2m_temperature':[273.15], 'total_precipitation':[2.54, 25.4]}).
+
+    4) reservoir_size (Integer) - Default=31. The number of members kept to calculate the quantiles.
+       The quantiles are exact when the ensemble has no more members than reservoir_size.
+       Otherwise the quantiles are calculated from a uniform random sample of reservoir_size members.
+
+    5) seed (Integer or None) - Default=None. The seed of the random number generator of the reservoir.
+
+    Returns
+    -------
+
+    A dictionary of the running ensemble statistics.
+    """
+
+    if thresholds == None:
+        thresholds = {}
+    else:
+        pass
+
+    return {
+        'variables':variables,
+        'quantiles':quantiles,
+        'thresholds':thresholds,
+        'reservoir_size':reservoir_size,
+        'rng':np.random.default_rng(seed),
+        'members':0,
+        'template':None,
+        'dims':None,
+        'count':{},
+        'mean':{},
+        'm2':{},
+        'exceedances':{},
+        'reservoir':{},
+        'reservoir_members':0
+    }
+
+
+def add_member(stats,
+               member):
+
+    """
+    This function folds a single ensemble member into the running ensemble statistics.
+
+    Required Arguments:
+
+    1) stats (dict) - The running ensemble statistics returned by new_ensemble_statistics().
+
+    2) member (xarray.array) - A single ensemble member. The member is loaded into memory.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The running ensemble statistics.
+    """
+
+    if stats['variables'] == None:
+        stats['variables'] = list(member.data_vars)
+    else:
+        pass
+
+    if stats['template'] == None:
+        stats['template'] = {var:member[var].drop_vars('number', errors='ignore').coords for var in stats['variables']}
+        stats['dims'] = {var:member[var].dims for var in stats['variables']}
+    else:
+        pass
+
+    # Each member either fills an empty slot of the reservoir or replaces a random slot (Algorithm R)
+    # The same slot is used for every variable so the reservoir holds whole members
+    slot = None
+    if stats['quantiles'] != None:
+        if stats['members'] < stats['reservoir_size']:
+            slot = stats['members']
+            stats['reservoir_members'] = stats['reservoir_members'] + 1
+        else:
+            j = int(stats['rng'].integers(0, stats['members'] + 1))
+            if j < stats['reservoir_size']:
+                slot = j
+            else:
+                pass
+    else:
+        pass
+
+    for var in stats['variables']:
+        values = np.asarray(member[var].values, dtype=np.float64)
+
+        if var not in stats['mean']:
+            stats['count'][var] = np.zeros(values.shape, dtype=np.int32)
+            stats['mean'][var] = np.zeros(values.shape, dtype=np.float64)
+            stats['m2'][var] = np.zeros(values.shape, dtype=np.float64)
+        else:
+            pass
+
+        # Welford's running mean and variance
+        # Missing values (NaN) are skipped so each grid point keeps its own member count
+        valid = np.isfinite(values)
+        stats['count'][var] += valid
+        delta = np.where(valid, values - stats['mean'][var], 0)
+        stats['mean'][var] += np.where(valid, delta / np.maximum(stats['count'][var], 1), 0)
+        stats['m2'][var] += np.where(valid, delta * (values - stats['mean'][var]), 0)
+
+        if var in stats['thresholds']:
+            if var not in stats['exceedances']:
+                stats['exceedances'][var] = np.zeros((len(stats['thresholds'][var]),) + values.shape, dtype=np.int32)
+            else:
+                pass
+            for i, threshold in enumerate(stats['thresholds'][var]):
+                stats['exceedances'][var][i] += values > threshold
+        else:
+            pass
+
+        if slot != None:
+            if var not in stats['reservoir']:
+                # The reservoir is always floating point so the empty slots can hold NaN (i.e. an integer or boolean member)
+                # 32-bit float members keep a 32-bit reservoir to save memory
+                dtype = np.result_type(np.float32, member[var].dtype)
+                if np.issubdtype(dtype, np.floating) == False:
+                    dtype = np.float64
+                else:
+                    pass
+                stats['reservoir'][var] = np.full((stats['reservoir_size'],) + values.shape, np.nan, dtype=dtype)
+            else:
+                pass
+            stats['reservoir'][var][slot] = values
+        else:
+            pass
+
+    stats['members'] = stats['members'] + 1
+
+    return stats
+
+
+def finalize_ensemble_statistics(stats,
+                                 ddof=0):
+
+    """
+    This function returns the ensemble statistics as an xarray.array.
+
+    Required Arguments:
+
+    1) stats (dict) - The running ensemble statistics returned by new_ensemble_statistics().
+
+    Optional Arguments:
+
+    1) ddof (Integer) - Default=0. The delta degrees of freedom of the spread. The spread is divided by (N - ddof).
+
+    Returns
+    -------
+
+    An xarray.array of the ensemble statistics.
+
+    Variable Keys
+    -------------
+
+    '{variable}_mean' - The ensemble mean.
+    '{variable}_spread' - The ensemble spread (standard deviation).
+    '{variable}_quantiles' - The quantiles of the ensemble along the 'quantile' dimension (when quantiles are requested).
+    '{variable}_exceedance_probability' - The fraction of members greater than each threshold along the '{variable}_threshold' dimension (when thresholds are requested).
+    """
+
+    if stats['members'] == 0:
+        raise ValueError("No ensemble members were added to the ensemble statistics.")
+    else:
+        pass
+
+    ds = xr.Dataset()
+    for var in stats['variables']:
+        coords = stats['template'][var]
+        dims = stats['dims'][var]
+        count = stats['count'][var]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, stats['mean'][var], np.nan)
+            spread = np.sqrt(np.where(count - ddof > 0, stats['m2'][var] / (count - ddof), np.nan))
+
+        ds[f"{var}_mean"] = xr.DataArray(mean.astype(np.float32), coords=coords, dims=dims)
+        ds[f"{var}_spread"] = xr.DataArray(spread.astype(np.float32), coords=coords, dims=dims)
+
+        if var in stats['reservoir']:
+            sample = stats['reservoir'][var][0:stats['reservoir_members']]
+            ds[f"{var}_quantiles"] = xr.DataArray(sample_quantiles(sample, stats['quantiles']).astype(np.float32),
+                                                  coords=dict(coords, quantile=stats['quantiles']),
+                                                  dims=('quantile',) + dims)
+        else:
+            pass
+
+        if var in stats['exceedances']:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                probability = np.where(count > 0, stats['exceedances'][var] / np.maximum(count, 1), np.nan)
+            ds[f"{var}_exceedance_probability"] = xr.DataArray(probability.astype(np.float32),
+                                                               coords=dict(coords, **{f"{var}_threshold":stats['thresholds'][var]}),
+                                                               dims=(f"{var}_threshold",) + dims)
+        else:
+            pass
+
+    ds.attrs['number_of_members'] = stats['members']
+
+    return ds
+
+
+def ensemble_statistics(ds,
+                        variables=None,
+                        quantiles=None,
+                        thresholds=None,
+                        reservoir_size=31,
+                        ddof=0,
+                        dim='number',
+                        seed=None):
+
+    """
+    This function calculates the ensemble mean, spread, quantiles and exceedance probabilities one member at a time.
+
+    This works on the ensemble members returned by the GEFS (cat='members') and AIGEFS member functions.
+    The members are loaded one at a time so peak memory scales with a single member rather than the whole ensemble
+    when the members are lazy. A dataset that has already been loaded (i.e. opened with worker processes) is held in memory in full,
+    so pass a generator of members (iter_ensemble_members()) to open each member only when it is needed.
+
+    Required Arguments:
+
+    1) ds (xarray.array or List) - The ensemble members. Either an xarray.array with a member dimension
+       or a list (or generator) of xarray.arrays of one or more members (i.e. iter_ensemble_members()).
+
+    Optional Arguments:
+
+    1) variables (String List or None) - Default=None. The variables to calculate statistics for (i.e. ['2m_temperature']).
+       When None, every variable is used.
+
+    2) quantiles (Float List or None) - Default=None. The quantiles to calculate (i.e. [0.1, 0.5, 0.9]).
+
+    3) thresholds (dict or None) - Default=None. The thresholds of the exceedance probabilities for each variable
+       (i.e. {'2m_temperature':[273.15], 'total_precipitation':[2.54, 25.4]}).
+
+    4) reservoir_size (Integer) - Default=31. The number of members kept to calculate the quantiles.
+       The quantiles are exact when the ensemble has no more members than reservoir_size. Lower this value to
+       reduce memory use when quantiles are requested.
+
+    5) ddof (Integer) - Default=0. The delta degrees of freedom of the spread. The spread is divided by (N - ddof).
+
+    6) dim (String) - Default='number'. The member dimension.
+
+    7) seed (Integer or None) - Default=None. The seed of the random number generator of the reservoir.
+
+    Returns
+    -------
+
+    An xarray.array of the ensemble statistics.
+
+    Variable Keys
+    -------------
+
+    '{variable}_mean' - The ensemble mean.
+    '{variable}_spread' - The ensemble spread (standard deviation).
+    '{variable}_quantiles' - The quantiles of the ensemble along the 'quantile' dimension (when quantiles are requested).
+    '{variable}_exceedance_probability' - The fraction of members greater than each threshold along the '{variable}_threshold' dimension (when thresholds are requested).
+    """
+
+    stats = new_ensemble_statistics(variables=variables,
+                                    quantiles=quantiles,
+                                    thresholds=thresholds,
+                                    reservoir_size=reservoir_size,
+                                    seed=seed)
+
+    if isinstance(ds, xr.Dataset):
+        if dim not in ds.dims:
+            raise ValueError(f"The dataset does not have a {dim} dimension.")
+        else:
+            pass
+        if variables == None:
+            stats['variables'] = [var for var in ds.data_vars if dim in ds[var].dims]
+        else:
+            pass
+        for i in range(0, ds.sizes[dim], 1):
+            member = ds[stats['variables']].isel({dim:i}).load()
+            add_member(stats, member)
+            del member
+    else:
+        for members in ds:
+            # A post-processed member keeps a member dimension of length 1
+            if dim in members.dims:
+                for i in range(0, members.sizes[dim], 1):
+                    member = members.isel({dim:i})
+                    if stats['variables'] != None:
+                        member = member[stats['variables']]
+                    else:
+                        member = member[[var for var in member.data_vars if dim in members[var].dims]]
+                    add_member(stats, member.load())
+                    del member
+            else:
+                add_member(stats, members)
+            del members
+
+    return finalize_ensemble_statistics(stats,
+                                        ddof=ddof)
@@ -0,0 +1,149 @@
+"""
+This file hosts the function that smooths many variables with a Gaussian filter in a single pass.
+
+Calling metpy.calc.smooth_gaussian() on one variable at a time wraps and unwraps the units of each variable and
+runs the filter once per variable on a single core. Instead, the selected 2-D fields are stacked into one array and the separable
+Gaussian kernel is applied across the whole stack on a pool of worker threads, without any units. The kernel matches the kernel of
+metpy.calc.smooth_gaussian() (sigma = n / 2 pi, truncated at 2 sqrt(2) standard deviations).
+
+(C) Eric J. Drewitz 2025
+"""
+
+import os
+import numpy as np
+import xarray as xr
+
+from concurrent.futures import ThreadPoolExecutor
+from scipy.ndimage import gaussian_filter
+
+def gaussian_sigma(n):
+
+    """
+    This function returns the standard deviation of the Gaussian kernel in grid points in the same manner as GEMPAK and MetPy.
+
+    Required Arguments:
+
+    1) n (Integer) - The number of grid points of the wavelength (n delta x) that is reduced to about 1/e of its amplitude.
+       If n <= 1, n = 2 is used.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The standard deviation of the Gaussian kernel in grid points.
+    """
+
+    n = max(int(round(n)), 2)
+
+    return n / (2 * np.pi)
+
+
+def smooth_gaussian_fields(ds,
+                           n=8,
+                           variables=None,
+                           float32=False,
+                           max_workers=None):
+
+    """
+    This function smooths the variables of a dataset with a Gaussian filter in a single pass.
+
+    Variables with the same dimensions are stacked into one array and the Gaussian filter is applied across the stack
+    along the last two (horizontal) dimensions. The 2-D fields of the stack are filtered on a pool of worker threads
+    (the filter releases the GIL). When the data is lazy (dask), the smoothing stays lazy.
+
+    Required Arguments:
+
+    1) ds (xarray.array) - The dataset.
+
+    Optional Arguments:
+
+    1) n (Integer) - Default=8. The number of grid points of the wavelength (n delta x) that is reduced to about 1/e of its amplitude.
+       This is the same as n in metpy.calc.smooth_gaussian().
+
+    2) variables (String List or None) - Default=None. The variables to smooth (i.e. ['2m_temperature', '2m_dew_point']).
+       When None, every variable with at least 2 dimensions is smoothed.
+
+    3) float32 (Boolean) - Default=False. When set to True, the smoothed variables are returned as 32-bit floats
+       (half the memory of 64-bit floats). When False, the variables keep their data type as in metpy.calc.smooth_gaussian().
+
+    4) max_workers (Integer or None) - Default=None. The maximum number of worker threads. When None, one thread is used per CPU.
+
+    Returns
+    -------
+
+    An xarray.array with the selected variables smoothed.
+    """
+
+    if variables == None:
+        variables = [var for var in ds.data_vars if ds[var].ndim >= 2]
+    else:
+        pass
+
+    if max_workers == None:
+        max_workers = os.cpu_count() or 1
+    else:
+        pass
+
+    sigma = gaussian_sigma(n)
+    truncate = 2 * np.sqrt(2)
+
+    # Variables with the same dimensions and data type are smoothed together
+    groups = {}
+    for var in variables:
+        key = (ds[var].dims, ds[var].shape, ds[var].dtype)
+        if key not in groups:
+            groups[key] = []
+        else:
+            pass
+        groups[key].append(var)
+
+    ds = ds.copy()
+    for (dims, shape, var_dtype), names in groups.items():
+
+        if float32 == True:
+            dtype = np.float32
+        else:
+            dtype = np.result_type(np.float32, var_dtype)
+
+        if any(hasattr(ds[var].data, 'dask') for var in names):
+            import dask.array as da
+
+            stack = da.stack([da.asarray(ds[var].data) for var in names]).astype(dtype)
+
+            # Each chunk is padded by the radius of the kernel so the chunks match the filter over the whole grid
+            radius = int(truncate * sigma + 0.5)
+            depth = {stack.ndim - 2:radius, stack.ndim - 1:radius}
+            smoothed = stack.map_overlap(gaussian_filter,
+                                         depth=depth,
+                                         boundary='reflect',
+                                         dtype=dtype,
+                                         sigma=[0] * (stack.ndim - 2) + [sigma, sigma],
+                                         truncate=truncate,
+                                         mode='reflect')
+        else:
+            smoothed = np.empty((len(names),) + shape, dtype=dtype)
+            fields = smoothed.reshape((-1,) + shape[-2:])
+            sources = [np.asarray(ds[var].values).reshape((-1,) + shape[-2:]) for var in names]
+            per_var = fields.shape[0] // len(names)
+
+            def smooth(i):
+                gaussian_filter(sources[i // per_var][i % per_var],
+                                sigma=sigma,
+                                truncate=truncate,
+                                output=fields[i])
+
+            if max_workers > 1 and fields.shape[0] > 1:
+                with ThreadPoolExecutor(max_workers=min(max_workers, fields.shape[0])) as executor:
+                    list(executor.map(smooth, range(0, fields.shape[0], 1)))
+            else:
+                for i in range(0, fields.shape[0], 1):
+                    smooth(i)
+
+        for i, var in enumerate(names):
+            ds[var] = xr.DataArray(smoothed[i],
+                                   dims=dims,
+                                   coords=ds[var].coords,
+                                   attrs=ds[var].attrs)
+
+    return ds
@@ -0,0 +1,78 @@
+"""
+This file hosts the function that calculates the running changes and extremes of a time series of analyses (i.e. RTMA).
+
+The analyses are stacked along the time dimension so each statistic is a single operation along that dimension
+rather than a loop over each pair of analyses. When the analyses are lazy (dask), the statistics stay lazy until they are used.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import xarray as xr
+
+def time_series_statistics(ds,
+                           variables=None,
+                           window=None,
+                           dim='time'):
+
+    """
+    This function calculates the running changes and the running maximum and minimum of a time series of analyses.
+
+    Required Arguments:
+
+    1) ds (xarray.array) - The analyses stacked along the time dimension (i.e. the dataset returned by rtma_time_series()).
+
+    Optional Arguments:
+
+    1) variables (String List or None) - Default=None. The variables to calculate statistics for (i.e. ['2m_temperature', '2m_relative_humidity']).
+       When None, every variable with a time dimension is used.
+
+    2) window (Integer or None) - Default=None. The number of analyses in the running maximum and minimum (i.e. window=24 for hourly analyses
+       over 24 hours). When None, the maximum and minimum are taken from the first analysis up to each analysis.
+
+    3) dim (String) - Default='time'. The time dimension.
+
+    Returns
+    -------
+
+    An xarray.array of the time series statistics.
+
+    Variable Keys
+    -------------
+
+    '{variable}_change' - The change since the previous analysis (the first analysis is NaN).
+    '{variable}_total_change' - The change since the first analysis.
+    '{variable}_running_max' - The running maximum.
+    '{variable}_running_min' - The running minimum.
+    """
+
+    if dim not in ds.dims:
+        raise ValueError(f"The dataset does not have a {dim} dimension.")
+    else:
+        pass
+
+    if variables == None:
+        variables = [var for var in ds.data_vars if dim in ds[var].dims]
+    else:
+        pass
+
+    if window == None:
+        window = ds.sizes[dim]
+    else:
+        pass
+
+    data = ds[variables]
+
+    change = data - data.shift({dim:1})
+    total_change = data - data.isel({dim:0})
+    rolling = data.rolling({dim:window}, min_periods=1)
+    running_max = rolling.max()
+    running_min = rolling.min()
+
+    stats = xr.Dataset(coords=ds.coords)
+    for var in variables:
+        stats[f"{var}_change"] = change[var]
+        stats[f"{var}_total_change"] = total_change[var]
+        stats[f"{var}_running_max"] = running_max[var]
+        stats[f"{var}_running_min"] = running_min[var]
+
+    return stats
@@ -1 +1,23 @@
-import wxdata.client.client
\ No newline at end of file
+import importlib
+
+# The submodules of the client package
+submodules = ['client', 'retry', 'scanner', 'session']
+
+def __getattr__(name):
+    
+    """
+    wxdata.client used to be the client module itself (i.e. wxdata.client.get_xmacis_data()).
+    The client module is now imported the first time one of its functions is used.
+    """
+    
+    if name.startswith('__'):
+        raise AttributeError(f"module 'wxdata.client' has no attribute '{name}'")
+    elif name in submodules:
+        return importlib.import_module(f"wxdata.client.{name}")
+    else:
+        pass
+    
+    try:
+        return getattr(importlib.import_module('wxdata.client.client'), name)
+    except AttributeError as e:
+        raise AttributeError(f"module 'wxdata.client' has no attribute '{name}'") from None
@@ -1,16 +1,23 @@
 import requests
-import time
-import sys
 import os
 import json
 import urllib
+import urllib.parse
+import threading
 import numpy as np
 import pandas as pd
 
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from wxdata.utils.xmacis2_cleanup import clean_pandas_dataframe
 from wxdata.utils.recycle_bin import *
+from wxdata.client import session
+from wxdata.client.retry import call_with_retries
+from wxdata.utils.byte_ranges import(
+    message_ranges,
+    range_header
+)
 
 # Getting yesterday's date for the default end date for the xmACIS2 client
 
@@ -26,6 +33,194 @@ if day >= 10:
 else:
     yesterday = f"{year}-{month}-0{day}"
 
+class IncompleteDownloadError(requests.exceptions.RequestException):
+
+    """
+    This exception is raised when a downloaded file is shorter than the Content-Length sent by the server
+    or a GRIB2 file does not end with the 7777 end marker. 
+    
+    It is a requests.exceptions.RequestException so the download is retried like any other network error. 
+    """
+
+
+def grib_complete(file):
+    
+    """
+    This function checks that a GRIB2 file ends with the 7777 end marker of its last message. 
+    
+    Required Arguments:
+    
+    1) file (String) - The complete path to the file. 
+    
+    Optional Arguments: None
+    
+    Returns
+    -------
+    
+    True when the file is not a GRIB2 file or the file ends with 7777. Otherwise False.     
+    """
+    
+    size = os.path.getsize(file)
+    if size < 8:
+        return True
+    else:
+        pass
+    
+    with open(file, 'rb') as f:
+        if f.read(4) != b'GRIB':
+            return True
+        else:
+            pass
+        f.seek(size - 4)
+        return f.read(4) == b'7777'
+
+
+def expected_size(r,
+                  offset=0):
+    
+    """
+    This function returns the complete size of a file from the headers of the server response. 
+    
+    Required Arguments:
+    
+    1) r (requests.Response) - The response of the GET request. 
+    
+    Optional Arguments:
+    
+    1) offset (Integer) - Default=0. The byte the response starts at (i.e. a resumed download).
+    
+    Returns
+    -------
+    
+    The size of the complete file in bytes or None when the server does not send it 
+    (or the response is compressed in transit).     
+    """
+    
+    if r.headers.get('Content-Encoding', 'identity') != 'identity':
+        return None
+    else:
+        pass
+    
+    content_range = r.headers.get('Content-Range', '')
+    if r.status_code == 206 and '/' in content_range and content_range.split('/')[-1] != '*':
+        return int(content_range.split('/')[-1])
+    elif r.headers.get('Content-Length') != None:
+        return offset + int(r.headers['Content-Length'])
+    else:
+        return None
+
+
+def resume_download(url,
+                    file,
+                    proxies=None,
+                    chunk_size=8192,
+                    validator=None):
+    
+    """
+    This function downloads a file to a temporary file ({file}.part) and renames it to {file} once it is complete. 
+    
+    If {file}.part already exists (i.e. a dropped connection), the download resumes from the last byte saved
+    with an HTTP Range request. If the server does not support Range requests, the download starts over. 
+    
+    The download is complete when the size of the file matches the Content-Length sent by the server and 
+    a GRIB2 file ends with the 7777 end marker. A GRIB2 file that is the right size but does not end with 7777 is 
+    removed so the next attempt starts over. 
+    
+    Required Arguments:
+    
+    1) url (String) - The download URL to the file. 
+    
+    2) file (String) - The complete path the file is saved to. 
+    
+    Optional Arguments:
+    
+    1) proxies (dict or None) - Default=None. If the user is using proxy server(s), the user must change the following:
+
+       proxies=None ---> proxies={
+                           'http':'http://url',
+                           'https':'https://url'
+                        } 
+                        
+    2) chunk_size (Integer) - Default=8192. The size of the chunks when writing the GRIB/NETCDF data to a file.
+    
+    3) validator (dict or None) - Default=None. A dictionary kept between the attempts of a single download. 
+       The ETag (or Last-Modified date) of the file is saved to it and sent with the next attempt as an If-Range header, 
+       so a file that changed on the server between attempts is downloaded again from the start rather than resumed. 
+       When None, a partial file is resumed without an If-Range header. 
+    
+    Returns
+    -------
+    
+    The file saved to {file}. Raises IncompleteDownloadError (a requests.exceptions.RequestException) when the file is incomplete.    
+    """
+    
+    part = f"{file}.part"
+    if os.path.exists(part):
+        offset = os.path.getsize(part)
+    else:
+        offset = 0
+    
+    if validator == None:
+        validator = {}
+    else:
+        pass
+    
+    if offset > 0:
+        headers = range_header(offset, None)
+        if 'If-Range' in validator:
+            headers['If-Range'] = validator['If-Range']
+        else:
+            pass
+    else:
+        headers = {}
+    
+    with session.get(url, stream=True, proxies=proxies, headers=headers, retry=False) as r:
+        if r.status_code == 416:
+            # The saved bytes do not match the file on the server so the download starts over
+            os.remove(part)
+            raise IncompleteDownloadError(f"{os.path.basename(file)} changed on the server. Starting the download over.")
+        else:
+            pass
+        r.raise_for_status()
+        
+        if offset > 0 and r.status_code != 206:
+            offset = 0
+        else:
+            pass
+        
+        if r.headers.get('ETag') != None and r.headers['ETag'].startswith('W/') == False:
+            validator['If-Range'] = r.headers['ETag']
+        elif r.headers.get('Last-Modified') != None:
+            validator['If-Range'] = r.headers['Last-Modified']
+        else:
+            pass
+        
+        size = expected_size(r, 
+                             offset=offset)
+        
+        if offset > 0:
+            mode = 'ab'
+        else:
+            mode = 'wb'
+        
+        with open(part, mode) as f:
+            for chunk in r.iter_content(chunk_size=chunk_size):
+                f.write(chunk)
+    
+    if size != None and os.path.getsize(part) != size:
+        raise IncompleteDownloadError(f"{os.path.basename(file)} is incomplete ({os.path.getsize(part)} of {size} bytes).")
+    else:
+        pass
+    
+    if grib_complete(part) == False:
+        os.remove(part)
+        raise IncompleteDownloadError(f"{os.path.basename(file)} does not end with the GRIB2 7777 end marker.")
+    else:
+        pass
+    
+    os.replace(part, file)
+
+
 def get_gridded_data(url,
              path,
              filename,
@@ -80,85 +275,386 @@ def get_gridded_data(url,
     except Exception as e:
         pass
 
-    if proxies == None:
-        try:
-            with requests.get(url, stream=True) as r:
-                r.raise_for_status() 
-                with open(f"{path}/{filename}", 'wb') as f:
+    file = f"{path}/{filename}"
+    
+    # A partial file left by an earlier run may be from a different version of the file so it is not resumed
+    try:
+        os.remove(f"{file}.part")
+    except Exception as e:
+        pass
+    
+    # Each attempt resumes from the last byte saved to {file}.part
+    validator = {}
+    call_with_retries(resume_download,
+                      url,
+                      url,
+                      file,
+                      proxies=proxies,
+                      chunk_size=chunk_size,
+                      validator=validator)
+    
+    if notifications == 'on':
+        print(f"Successfully saved {filename} to f:{path}")
+    else:
+        pass
+
+
+def get_gridded_data_ranges(url,
+             path,
+             filename,
+             ranges,
+             proxies=None,
+             chunk_size=8192,
+             notifications='on',
+             clear_recycle_bin=True):
+
+    """
+    This function is the client that retrieves a subset of the GRIB2 messages in a file with HTTP Range requests.
+    This client supports VPN/PROXY connections.
+
+    The byte ranges are written one after the other so the saved file is a valid GRIB2 file containing only the
+    requested messages. If the server does not support Range requests, the full file is downloaded.
+
+    Required Arguments:
+
+    1) url (String) - The download URL to the file.
+
+    2) path (String) - The directory where the file is saved to.
+
+    3) filename (String) - The name the user wishes to save the file as.
+
+    4) ranges (List) - The (start, end) byte ranges of the messages (i.e. from wxdata.utils.byte_ranges.message_ranges()).
+
+    Optional Arguments:
+
+    1) proxies (dict or None) - Default=None. If the user is using proxy server(s), the user must change the following:
+
+       proxies=None ---> proxies={
+                           'http':'http://url',
+                           'https':'https://url'
+                        }
+
+    2) chunk_size (Integer) - Default=8192. The size of the chunks when writing the GRIB2 data to a file.
+
+    3) notifications (String) - Default='on'. Notification when a file is downloaded and saved to {path}
+
+    4) clear_recycle_bin (Boolean) - Default=True. When set to True, the contents in your recycle/trash bin will be deleted with each run
+        of the program you are calling WxData. This setting is to help preserve memory on the machine.
+
+    Returns
+    -------
+
+    A GRIB2 file of the requested messages saved to {path}
+    """
+
+    if clear_recycle_bin == True:
+        clear_recycle_bin_windows()
+        clear_trash_bin_mac()
+        clear_trash_bin_linux()
+    else:
+        pass
+
+    try:
+        os.makedirs(f"{path}")
+    except Exception as e:
+        pass
+
+    if len(ranges) == 0:
+        print(f"Alert: None of the requested variables are in {filename}. Skipping download...")
+        return
+
+    part = f"{path}/{filename}.part"
+    try:
+        os.remove(part)
+    except Exception as e:
+        pass
+
+    # Each attempt skips the byte ranges already saved to {part} and resumes the range that was cut off
+    def save_ranges():
+        if os.path.exists(part):
+            written = os.path.getsize(part)
+        else:
+            written = 0
+        position = 0
+        with open(part, 'ab') as f:
+            for start, end in ranges:
+                if end != None and written >= position + (end - start + 1):
+                    position = position + (end - start + 1)
+                    continue
+                else:
+                    pass
+                skip = written - position
+                with session.get(url, stream=True, proxies=proxies, headers=range_header(start + skip, end), retry=False) as r:
+                    if r.status_code == 416 and end == None and skip > 0:
+                        # The last range already runs to the end of the file
+                        break
+                    else:
+                        pass
+                    r.raise_for_status()
+                    if r.status_code != 206:
+                        # The server does not support Range requests
+                        return False
+                    else:
+                        pass
+                    if r.headers.get('Content-Length') != None and r.headers.get('Content-Encoding', 'identity') == 'identity':
+                        length = int(r.headers['Content-Length'])
+                    else:
+                        length = None
+                    received = 0
                     for chunk in r.iter_content(chunk_size=chunk_size):
                         f.write(chunk)
-            if notifications == 'on':
-                print(f"Successfully saved {filename} to f:{path}")
-            else:
-                pass
-        except requests.exceptions.RequestException as e:
-            for i in range(0, 6, 1):
-                if i < 3:
-                    print(f"Alert: Network connection unstable.\nWaiting 30 seconds then automatically trying again.\nAttempts remaining: {5 - i}")
-                    time.sleep(30)
+                        received = received + len(chunk)
+                    written = written + received
+                if length != None and received != length:
+                    raise IncompleteDownloadError(f"{filename} is incomplete ({received} of {length} bytes of a byte range).")
                 else:
-                    print(f"Alert: Network connection unstable.\nWaiting 60 seconds then automatically trying again.\nAttempts remaining: {5 - i}")
-                    time.sleep(60)  
-                    
-                try:
-                    with requests.get(url, stream=True) as r:
-                        r.raise_for_status() 
-                        with open(f"{path}/{filename}", 'wb') as f:
-                            for chunk in r.iter_content(chunk_size=chunk_size):
-                                f.write(chunk)
-                    if notifications == 'on':
-                        print(f"Successfully saved {filename} to f:{path}")  
-                    break
-                except requests.exceptions.RequestException as e:
-                    i = i 
-                    if i >= 5:
-                        print(f"Error - File Cannot Be Downloaded.\nError Code: {e}")    
-                        sys.exit(1)      
+                    pass
+                position = written
+        if grib_complete(part) == False:
+            os.remove(part)
+            raise IncompleteDownloadError(f"{filename} does not end with the GRIB2 7777 end marker.")
+        else:
+            pass
+        os.replace(part, f"{path}/{filename}")
+        return True
+
+    if call_with_retries(save_ranges, url) == False:
+        os.remove(part)
+        get_gridded_data(url,
+                         path,
+                         filename,
+                         proxies=proxies,
+                         chunk_size=chunk_size,
+                         notifications=notifications,
+                         clear_recycle_bin=False)
+        return
+    else:
+        pass
+
+    if notifications == 'on':
+        print(f"Successfully saved {filename} to f:{path}")
+    else:
+        pass
+
+
+def iter_gridded_data_batch(urls,
+             path,
+             filenames,
+             proxies=None,
+             chunk_size=8192,
+             notifications='on',
+             clear_recycle_bin=True,
+             max_workers=8,
+             max_workers_per_host=4,
+             index_format=None,
+             variables=None,
+             levels=None):
+    
+    """
+    This function is the client that retrieves a batch of gridded weather/climate data (GRIB2 and NETCDF) files concurrently
+    and yields each file as soon as it is saved. This client supports VPN/PROXY connections. 
+    
+    The files are downloaded on a pool of worker threads in the background. The caller can work on each file
+    (i.e. decode the GRIB2 data) while the remaining files are still downloading. 
+    
+    Required Arguments:
+    
+    1) urls (String List) - The download URLs to the files. 
+    
+    2) path (String or String List) - The directory where the files are saved to. 
+       If a list is passed in, each file is saved to the path at the same position in the list (i.e. ensemble members).
+    
+    3) filenames (String List) - The names the user wishes to save the files as. 
+    
+    Optional Arguments:
+    
+    1) proxies (dict or None) - Default=None. If the user is using proxy server(s), the user must change the following:
+
+       proxies=None ---> proxies={
+                           'http':'http://url',
+                           'https':'https://url'
+                        } 
                         
-        finally:
-            if r:
-                r.close() # Ensure the connection is closed.
-            
+    2) chunk_size (Integer) - Default=8192. The size of the chunks when writing the GRIB/NETCDF data to a file.
+    
+    3) notifications (String) - Default='on'. Notification when a file is downloaded and saved to {path}
+    
+    4) clear_recycle_bin (Boolean) - Default=True. When set to True, the contents in your recycle/trash bin will be deleted with each run
+        of the program you are calling WxData. This setting is to help preserve memory on the machine. 
+        
+    5) max_workers (Integer) - Default=8. The maximum number of files downloaded at the same time. 
+       Set max_workers=1 to download the files one at a time.
+       
+    6) max_workers_per_host (Integer) - Default=4. The maximum number of files downloaded at the same time from a single server.
+       This prevents excessive requests on the data servers (i.e. NOMADS). 
+       
+    7) index_format (String or None) - Default=None. The format of the index files published next to the GRIB2 files (i.e. 'ecmwf').
+       When set along with variables and/or levels, only the byte ranges of the requested messages are downloaded.
+       
+    8) variables (List or None) - Default=None. The variables to download when index_format is set. 
+    
+    9) levels (List or None) - Default=None. The levels to download when index_format is set. 
+    
+    Returns
+    -------
+    
+    A generator of the position of each file in urls, yielded in the order the downloads finish.
+    If a download fails or the generator is closed early, the downloads that have not started are cancelled.    
+    """
+    
+    if clear_recycle_bin == True:
+        clear_recycle_bin_windows()
+        clear_trash_bin_mac()
+        clear_trash_bin_linux()
     else:
-        try:
-            with requests.get(url, stream=True, proxies=proxies) as r:
-                r.raise_for_status() 
-                with open(f"{path}/{filename}", 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=chunk_size):
-                        f.write(chunk)
-            if notifications == 'on':
-                print(f"Successfully saved {filename} to f:{path}")
+        pass
+    
+    if type(path) == type('String'):
+        paths = [path] * len(urls)
+    else:
+        paths = path
+    
+    hosts = {}
+    for url in urls:
+        host = urllib.parse.urlparse(url).netloc
+        if host not in hosts:
+            hosts[host] = threading.Semaphore(max(1, max_workers_per_host))
+        else:
+            pass
+    
+    def download(url, path, filename):
+        with hosts[urllib.parse.urlparse(url).netloc]:
+            if index_format != None and (variables != None or levels != None):
+                # If the index file cannot be read, the full file is downloaded
+                try:
+                    ranges = message_ranges(url,
+                                            index_format,
+                                            variables=variables,
+                                            levels=levels,
+                                            proxies=proxies)
+                except Exception as e:
+                    ranges = None
+                    
+                if ranges != None:
+                    get_gridded_data_ranges(url,
+                                     path,
+                                     filename,
+                                     ranges,
+                                     proxies=proxies,
+                                     chunk_size=chunk_size,
+                                     notifications=notifications,
+                                     clear_recycle_bin=False)
+                    return
+                else:
+                    pass
             else:
                 pass
-        except requests.exceptions.RequestException as e:
-            for i in range(0, 6, 1):
-                if i < 3:
-                    print(f"Alert: Network connection unstable.\nWaiting 30 seconds then automatically trying again.\nAttempts remaining: {5 - i}")
-                    time.sleep(30)
-                else:
-                    print(f"Alert: Network connection unstable.\nWaiting 60 seconds then automatically trying again.\nAttempts remaining: {5 - i}")
-                    time.sleep(60)  
-                    
-                try:
-                    with requests.get(url, stream=True, proxies=proxies) as r:
-                        r.raise_for_status() 
-                        with open(f"{path}/{filename}", 'wb') as f:
-                            for chunk in r.iter_content(chunk_size=chunk_size):
-                                f.write(chunk)
-                    if notifications == 'on':
-                        print(f"Successfully saved {filename} to f:{path}")  
-                    break
-                except requests.exceptions.RequestException as e:
-                    i = i 
-                    if i >= 5:
-                        print(f"Error - File Cannot Be Downloaded.\nError Code: {e}")    
-                        sys.exit(1)    
+            get_gridded_data(url,
+                             path,
+                             filename,
+                             proxies=proxies,
+                             chunk_size=chunk_size,
+                             notifications=notifications,
+                             clear_recycle_bin=False)
+    
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    stopped = False
+    try:
+        futures = {executor.submit(download, url, p, filename):i for i, (url, p, filename) in enumerate(zip(urls, paths, filenames))}
+        for future in as_completed(futures):
+            future.result()
+            yield futures[future]
+    except BaseException:
+        # A failed download (or closing the generator early) cancels the downloads that have not started
+        # so the error is raised as soon as the downloads in progress finish
+        stopped = True
+        raise
+    finally:
+        executor.shutdown(wait=True, 
+                          cancel_futures=stopped)
                         
-        finally:
-            if r:
-                r.close() # Ensure the connection is closed.
                         
+
+
+def get_gridded_data_batch(urls,
+             path,
+             filenames,
+             proxies=None,
+             chunk_size=8192,
+             notifications='on',
+             clear_recycle_bin=True,
+             max_workers=8,
+             max_workers_per_host=4,
+             index_format=None,
+             variables=None,
+             levels=None):
+    
+    """
+    This function is the client that retrieves a batch of gridded weather/climate data (GRIB2 and NETCDF) files concurrently. 
+    This client supports VPN/PROXY connections. 
+    
+    Each file is downloaded with get_gridded_data() on a pool of worker threads so the total download time
+    scales with the bandwidth of the connection rather than the latency of each request. 
+    
+    Required Arguments:
+    
+    1) urls (String List) - The download URLs to the files. 
+    
+    2) path (String or String List) - The directory where the files are saved to. 
+       If a list is passed in, each file is saved to the path at the same position in the list (i.e. ensemble members).
+    
+    3) filenames (String List) - The names the user wishes to save the files as. 
+    
+    Optional Arguments:
+    
+    1) proxies (dict or None) - Default=None. If the user is using proxy server(s), the user must change the following:
+
+       proxies=None ---> proxies={
+                           'http':'http://url',
+                           'https':'https://url'
+                        } 
                         
+    2) chunk_size (Integer) - Default=8192. The size of the chunks when writing the GRIB/NETCDF data to a file.
+    
+    3) notifications (String) - Default='on'. Notification when a file is downloaded and saved to {path}
+    
+    4) clear_recycle_bin (Boolean) - Default=True. When set to True, the contents in your recycle/trash bin will be deleted with each run
+        of the program you are calling WxData. This setting is to help preserve memory on the machine. 
+        
+    5) max_workers (Integer) - Default=8. The maximum number of files downloaded at the same time. 
+       Set max_workers=1 to download the files one at a time.
+       
+    6) max_workers_per_host (Integer) - Default=4. The maximum number of files downloaded at the same time from a single server.
+       This prevents excessive requests on the data servers (i.e. NOMADS). 
+       
+    7) index_format (String or None) - Default=None. The format of the index files published next to the GRIB2 files (i.e. 'ecmwf').
+       When set along with variables and/or levels, only the byte ranges of the requested messages are downloaded.
+       
+    8) variables (List or None) - Default=None. The variables to download when index_format is set. 
+    
+    9) levels (List or None) - Default=None. The levels to download when index_format is set. 
+    
+    Returns
+    -------
+    
+    Gridded weather/climate data files (GRIB2 or NETCDF) saved to {path}    
+    """
+    
+    for i in iter_gridded_data_batch(urls,
+                                     path,
+                                     filenames,
+                                     proxies=proxies,
+                                     chunk_size=chunk_size,
+                                     notifications=notifications,
+                                     clear_recycle_bin=clear_recycle_bin,
+                                     max_workers=max_workers,
+                                     max_workers_per_host=max_workers_per_host,
+                                     index_format=index_format,
+                                     variables=variables,
+                                     levels=levels):
+        pass
+        
+
 def get_csv_data(url,
                  path,
                  filename,
@@ -217,52 +713,9 @@ def get_csv_data(url,
     except Exception as e:
         pass
     
-    if proxies==None:
-        try:
-            response = requests.get(url)
-        except Exception as e:
-            for i in range(0, 6, 1):
-                if i < 3:
-                    print(f"Alert: Network connection unstable.\nWaiting 30 seconds then automatically trying again.\nAttempts remaining: {5 - i}")
-                    time.sleep(30)
-                else:
-                    print(f"Alert: Network connection unstable.\nWaiting 60 seconds then automatically trying again.\nAttempts remaining: {5 - i}")
-                    time.sleep(60)  
-                    
-                try:
-                    response = requests.get(url)
-                    break
-                except Exception as e:
-                    i = i                    
-                    if i >= 5:
-                        print(f"Error - File Cannot Be Downloaded.\nError Code: {e}")    
-                        sys.exit(1)    
-        finally:
-            if response:
-                response.close() # Ensure the connection is closed.
-                        
-    else:
-        try:
-            response = requests.get(url, proxies=proxies)
-        except Exception as e:
-            for i in range(0, 6, 1):
-                if i < 3:
-                    print(f"Alert: Network connection unstable.\nWaiting 30 seconds then automatically trying again.\nAttempts remaining: {5 - i}")
-                    time.sleep(30)
-                else:
-                    print(f"Alert: Network connection unstable.\nWaiting 60 seconds then automatically trying again.\nAttempts remaining: {5 - i}")
-                    time.sleep(60)  
-                    
-                try:
-                    response = requests.get(url, proxies=proxies)
-                    break
-                except Exception as e:
-                    i = i                    
-                    if i >= 5:
-                        print(f"Error - File Cannot Be Downloaded.\nError Code: {e}")    
-                        sys.exit(1) 
-
-                
+    # Connection errors are retried under the retry policy of the shared session
+    response = session.get(url, proxies=proxies)
+    response.raise_for_status()
                    
     data_stream = BytesIO(response.content)
     if response:
@@ -431,10 +884,10 @@ def get_xmacis_data(station,
     output_cols = ['Date', 'Maximum Temperature', 'Minimum Temperature', 'Average Temperature', 'Average Temperature Departure', 'Heating Degree Days', 'Cooling Degree Days', 'Precipitation', 'Snowfall', 'Snow Depth', 'Growing Degree Days']
         
     if proxies == None:
-        response = requests.post('http://data.rcc-acis.org/StnData', 
+        response = session.post('http://data.rcc-acis.org/StnData', 
                                  json=input_dict)
     else:
-        response = requests.post('http://data.rcc-acis.org/StnData', 
+        response = session.post('http://data.rcc-acis.org/StnData', 
                                  json=input_dict,
                                  proxies=proxies)
         
@@ -0,0 +1,504 @@
+"""
+This file hosts the retry policy shared by every network request in WxData.
+
+Rather than each client and URL scanner retrying on its own with fixed 30 and 60 second waits and exiting the
+program when a server cannot be reached, every request goes through one retry policy:
+
+1) Exponential backoff with full jitter - The wait before each retry is a random time between 0 and
+   base_delay * 2^attempt seconds (capped at max_delay). A Retry-After header sent by the server is honored.
+2) Per-host circuit breaking - After failure_threshold failures in a row to the same host, requests to that
+   host fail right away for reset_timeout seconds. A single request is then let through to test the host.
+3) A total deadline - When set, the retries stop once the deadline (in seconds from the first attempt) would be exceeded.
+   Each HTTP request sent through the shared session also has a timeout (the policy timeout capped by the time left before the deadline)
+   so a connection that hangs can never block the program forever.
+4) Typed exceptions - When a request cannot be completed, a WxDataError is raised rather than exiting the program,
+   so programs running WxData in a pool of workers can handle the error.
+
+Users may change the policy with configure_retry().
+
+(C) Eric J. Drewitz 2025
+"""
+
+import time
+import random
+import threading
+import requests
+import urllib3
+import urllib.parse
+
+# The default retry policy
+policy = {
+    'max_attempts':7,
+    'base_delay':1.0,
+    'max_delay':60.0,
+    'deadline':None,
+    'timeout':60.0,
+    'failure_threshold':10,
+    'reset_timeout':60.0,
+    'retry_statuses':[429, 500, 502, 503, 504]
+}
+
+# The state of the circuit breaker of each host
+_circuits = {}
+_lock = threading.Lock()
+
+class WxDataError(Exception):
+
+    """
+    The base class of the exceptions raised by WxData.
+    """
+
+
+class DownloadError(WxDataError, requests.exceptions.RequestException):
+
+    """
+    This exception is raised when a request still fails after every retry or fails with an error that is not retried (i.e. 404).
+    It is also a requests.exceptions.RequestException.
+    """
+
+
+class CircuitOpenError(DownloadError):
+
+    """
+    This exception is raised when the circuit breaker of a host is open after too many failures in a row.
+    """
+
+
+class DeadlineExceededError(DownloadError):
+
+    """
+    This exception is raised when the total deadline of a request runs out before the request succeeds.
+    """
+
+
+class NoDataAvailableError(WxDataError):
+
+    """
+    This exception is raised when the latest data on a server is too old or cannot be found (i.e. no model run in the past 24 hours).
+    """
+
+
+def configure_retry(max_attempts=None,
+                    base_delay=None,
+                    max_delay=None,
+                    deadline=None,
+                    failure_threshold=None,
+                    reset_timeout=None,
+                    retry_statuses=None,
+                    timeout=None):
+
+    """
+    This function configures the retry policy used by every network request in WxData.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) max_attempts (Integer or None) - Default=None. The maximum number of attempts of each request (the first attempt plus the retries).
+
+    2) base_delay (Float or None) - Default=None. The base of the exponential backoff in seconds.
+
+    3) max_delay (Float or None) - Default=None. The longest wait between two attempts in seconds.
+
+    4) deadline (Float or None) - Default=None. The total time in seconds a request may take across all of its attempts.
+       Pass 0 to remove the deadline.
+
+    5) failure_threshold (Integer or None) - Default=None. The number of failures in a row to a host that opens its circuit breaker.
+       Pass 0 to turn the circuit breaker off.
+
+    6) reset_timeout (Float or None) - Default=None. The number of seconds a circuit breaker stays open.
+
+    7) retry_statuses (Integer List or None) - Default=None. The HTTP status codes that are retried (i.e. [429, 500, 502, 503, 504]).
+
+    8) timeout (Float or None) - Default=None. The timeout of each HTTP request in seconds (the time to connect and the longest wait for data from the server).
+       Pass 0 to remove the timeout.
+
+    When an argument is None, the current setting is kept.
+
+    Returns
+    -------
+
+    A dictionary of the retry policy.
+    """
+
+    settings = {
+        'max_attempts':max_attempts,
+        'base_delay':base_delay,
+        'max_delay':max_delay,
+        'failure_threshold':failure_threshold,
+        'reset_timeout':reset_timeout,
+        'retry_statuses':retry_statuses
+    }
+
+    for key, value in settings.items():
+        if value != None:
+            policy[key] = value
+        else:
+            pass
+
+    if deadline != None:
+        if deadline == 0:
+            policy['deadline'] = None
+        else:
+            policy['deadline'] = deadline
+    else:
+        pass
+
+    if timeout != None:
+        if timeout == 0:
+            policy['timeout'] = None
+        else:
+            policy['timeout'] = timeout
+    else:
+        pass
+
+    return dict(policy)
+
+
+def reset_circuits():
+
+    """
+    This function closes the circuit breaker of every host.
+
+    Required Arguments: None
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    Every host is allowed to receive requests again.
+    """
+
+    with _lock:
+        _circuits.clear()
+
+
+def host_of(url):
+
+    """
+    This function returns the host of a URL (i.e. nomads.ncep.noaa.gov).
+
+    Required Arguments:
+
+    1) url (String) - The URL.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The host of the URL.
+    """
+
+    return urllib.parse.urlparse(url).netloc
+
+
+def check_circuit(host):
+
+    """
+    This function raises a CircuitOpenError if the circuit breaker of a host is open.
+
+    Once reset_timeout seconds have passed, a single request is let through to test the host (half-open).
+
+    Required Arguments:
+
+    1) host (String) - The host.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    Raises a CircuitOpenError when requests to the host are blocked.
+    """
+
+    if policy['failure_threshold'] == None or policy['failure_threshold'] <= 0:
+        return
+    else:
+        pass
+
+    with _lock:
+        circuit = _circuits.get(host)
+        if circuit == None or circuit['opened'] == None:
+            return
+        elif time.monotonic() - circuit['opened'] >= policy['reset_timeout'] and circuit['testing'] == False:
+            circuit['testing'] = True
+            return
+        else:
+            raise CircuitOpenError(f"Too many failed requests to {host}. Requests to {host} are paused for {policy['reset_timeout']} seconds.")
+
+
+def record_success(host):
+
+    """
+    This function closes the circuit breaker of a host after a successful request.
+
+    Required Arguments:
+
+    1) host (String) - The host.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The failure count of the host is reset.
+    """
+
+    with _lock:
+        _circuits.pop(host, None)
+
+
+def record_failure(host):
+
+    """
+    This function counts a failed request to a host and opens its circuit breaker once the failure threshold is reached.
+
+    Required Arguments:
+
+    1) host (String) - The host.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The failure is counted.
+    """
+
+    with _lock:
+        circuit = _circuits.setdefault(host, {'failures':0, 'opened':None, 'testing':False})
+        circuit['failures'] = circuit['failures'] + 1
+        threshold = policy['failure_threshold']
+        if threshold != None and threshold > 0 and (circuit['failures'] >= threshold or circuit['testing'] == True):
+            circuit['opened'] = time.monotonic()
+            circuit['testing'] = False
+        else:
+            pass
+
+
+def backoff_delay(attempt,
+                  retry_after=None):
+
+    """
+    This function returns the wait in seconds before the next attempt (exponential backoff with full jitter).
+
+    Required Arguments:
+
+    1) attempt (Integer) - The number of the attempt that failed (starting at 0).
+
+    Optional Arguments:
+
+    1) retry_after (String or None) - Default=None. The Retry-After header sent by the server (in seconds).
+       When set, the wait is at least the Retry-After time.
+
+    Returns
+    -------
+
+    The wait in seconds.
+    """
+
+    delay = random.uniform(0, min(policy['max_delay'], policy['base_delay'] * (2 ** attempt)))
+
+    try:
+        delay = max(delay, min(float(retry_after), policy['max_delay']))
+    except Exception as e:
+        pass
+
+    return delay
+
+
+def retryable(e):
+
+    """
+    This function checks whether a failed request should be retried.
+
+    Connection errors, timeouts, interrupted downloads (including streams that were cut off) and the HTTP status codes in retry_statuses are retried.
+    Other HTTP errors (i.e. 404 Not Found) are not retried.
+
+    Required Arguments:
+
+    1) e (Exception) - The exception raised by the request.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A boolean value whether the request should be retried.
+    """
+
+    if isinstance(e, WxDataError):
+        return False
+    elif isinstance(e, requests.exceptions.HTTPError) and e.response != None:
+        return e.response.status_code in policy['retry_statuses']
+    elif isinstance(e, requests.exceptions.RequestException):
+        return True
+    elif isinstance(e, (urllib3.exceptions.HTTPError, EOFError)):
+        # A stream read straight from the connection that was cut off (i.e. a truncated gzip file)
+        return True
+    else:
+        return False
+
+
+def request_timeout(start=None,
+                    deadline=None):
+
+    """
+    This function returns the timeout of a single HTTP request.
+
+    The timeout is the policy timeout capped by the time left before the deadline.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) start (Float or None) - Default=None. The time.monotonic() time of the first attempt.
+
+    2) deadline (Float or None) - Default=None. The total time in seconds the attempts may take. When None, the policy setting is used.
+
+    Returns
+    -------
+
+    The timeout in seconds (None when there is no timeout or deadline).
+
+    Raises a DeadlineExceededError when the deadline has already run out.
+    """
+
+    if deadline == None:
+        deadline = policy['deadline']
+    else:
+        pass
+
+    timeout = policy['timeout']
+
+    if deadline != None and start != None:
+        remaining = deadline - (time.monotonic() - start)
+        if remaining <= 0:
+            raise DeadlineExceededError(f"The {deadline} second deadline ran out before the request was sent.")
+        elif timeout == None or remaining < timeout:
+            timeout = remaining
+        else:
+            pass
+    else:
+        pass
+
+    return timeout
+
+
+def call_with_retries(function,
+                      url,
+                      *args,
+                      max_attempts=None,
+                      deadline=None,
+                      notifications=True,
+                      set_timeout=False,
+                      **kwargs):
+
+    """
+    This function calls a function that makes a request to a URL and retries it under the retry policy.
+
+    This is used for requests that are more than a single HTTP request (i.e. a streamed download that resumes where it left off).
+    A requests.Response with a status code in retry_statuses is also retried. If the status code is still in retry_statuses
+    after the last attempt, a DownloadError is raised with the last response (DownloadError.response) so the status code can be read.
+
+    Required Arguments:
+
+    1) function (Function) - The function that makes the request.
+
+    2) url (String) - The URL of the request. The host of the URL is used for the circuit breaker.
+
+    Any other positional or keyword argument is passed into function.
+
+    Optional Arguments:
+
+    1) max_attempts (Integer or None) - Default=None. The maximum number of attempts. When None, the policy setting is used.
+
+    2) deadline (Float or None) - Default=None. The total time in seconds the attempts may take. When None, the policy setting is used.
+
+    3) notifications (Boolean) - Default=True. When set to True, an alert is printed before each retry.
+
+    4) set_timeout (Boolean) - Default=False. When set to True, the timeout keyword argument of function (i.e. requests.Session.get)
+       is set before each attempt from the policy timeout and the time left before the deadline. A timeout passed in by the caller is kept.
+
+    Returns
+    -------
+
+    The value returned by function.
+
+    Raises a DownloadError when the request fails (or returns a status code in retry_statuses) after every attempt or fails with an error that is not retried,
+    a CircuitOpenError when the host is blocked by its circuit breaker and a DeadlineExceededError when the deadline runs out.
+    """
+
+    if max_attempts == None:
+        max_attempts = policy['max_attempts']
+    else:
+        pass
+
+    if deadline == None:
+        deadline = policy['deadline']
+    else:
+        pass
+
+    host = host_of(url)
+    start = time.monotonic()
+
+    for attempt in range(0, max(1, max_attempts), 1):
+        check_circuit(host)
+
+        retry_after = None
+        response = None
+        try:
+            if set_timeout == True:
+                attempt_kwargs = dict(kwargs)
+                attempt_kwargs.setdefault('timeout', request_timeout(start=start,
+                                                                     deadline=deadline))
+            else:
+                attempt_kwargs = kwargs
+            result = function(*args, **attempt_kwargs)
+            if isinstance(result, requests.Response) and result.status_code in policy['retry_statuses']:
+                retry_after = result.headers.get('Retry-After')
+                error = requests.exceptions.HTTPError(f"{result.status_code} Server Error for url: {url}", response=result)
+                response = result
+                result.close()
+            else:
+                record_success(host)
+                return result
+        except Exception as e:
+            if retryable(e) == False:
+                if isinstance(e, WxDataError):
+                    raise
+                elif isinstance(e, requests.exceptions.RequestException):
+                    raise DownloadError(f"Request to {url} failed: {e}") from e
+                else:
+                    raise
+            else:
+                pass
+            error = e
+            if isinstance(e, requests.exceptions.HTTPError) and e.response != None:
+                retry_after = e.response.headers.get('Retry-After')
+            else:
+                pass
+
+        record_failure(host)
+
+        if attempt >= max_attempts - 1:
+            raise DownloadError(f"Request to {url} failed after {max_attempts} attempts: {error}", response=response) from error
+        else:
+            pass
+
+        delay = backoff_delay(attempt,
+                              retry_after=retry_after)
+
+        if deadline != None and time.monotonic() - start + delay > deadline:
+            raise DeadlineExceededError(f"Request to {url} did not succeed within the {deadline} second deadline: {error}") from error
+        else:
+            pass
+
+        if notifications == True:
+            print(f"Alert: Network connection unstable.\nWaiting {round(delay, 1)} seconds then automatically trying again.\nAttempts remaining: {max_attempts - attempt - 1}")
+        else:
+            pass
+
+        time.sleep(delay)
@@ -0,0 +1,284 @@
+"""
+This file hosts the scanner engine shared by all of the WxData URL scanners.
+
+The URL scanners check a list of candidate model runs (i.e. today's 18z, 12z, 06z, 00z and yesterday's runs)
+to find the latest run available on the dataserver. The candidate runs are built one time from a URL template
+(i.e. ".../gfs.{date}/{hour}/atmos/gfs.t{hour}z.pgrb2full.0p50.f384") rather than being written out by hand in each URL scanner.
+Rather than sending a request to each candidate one after the other, the scanner engine probes every candidate at the
+same time with HEAD requests and returns the date and hour of the newest available run as soon as it is confirmed.
+
+(C) Eric J. Drewitz 2025
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from wxdata.client import session
+from wxdata.client.retry import(
+    call_with_retries,
+    NoDataAvailableError
+)
+
+# Exception handling for Python >= 3.13 and Python < 3.13
+try:
+    from datetime import datetime, timedelta, UTC
+except Exception as e:
+    from datetime import datetime, timedelta
+
+def scan_times():
+
+    """
+    This function returns the current times the URL scanners build the candidate model runs from.
+
+    The times are read every time a URL scanner runs rather than one time when WxData is imported,
+    so a long-running program always scans the latest model runs.
+
+    Required Arguments: None
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The current time in UTC, the current local time and yesterday's date (UTC).
+    """
+
+    # Gets current time in UTC
+    try:
+        now = datetime.now(UTC)
+    except Exception as e:
+        now = datetime.utcnow()
+
+    # Gets local time
+    local = datetime.now()
+
+    # Gets yesterday's date
+    yd = now - timedelta(days=1)
+
+    return now, local, yd
+
+
+
+def probe_url(url,
+              proxies=None,
+              timeout=30,
+              retries=5):
+
+    """
+    This function probes a URL and returns the HTTP status code.
+
+    A HEAD request is sent so only the headers are returned. If the server does not allow HEAD requests,
+    a streamed GET request is sent and closed before the body is downloaded.
+
+    Required Arguments:
+
+    1) url (String) - The URL to probe.
+
+    Optional Arguments:
+
+    1) proxies (dict or None) - Default=None. If the user is using proxy server(s), the user must change the following:
+
+       proxies=None ---> proxies={
+                           'http':'http://url',
+                           'https':'https://url'
+                        }
+
+    2) timeout (Integer) - Default=30. The timeout of each request in seconds.
+
+    3) retries (Integer) - Default=5. The number of times a request is retried if the connection fails.
+
+    Returns
+    -------
+
+    The HTTP status code (Integer) or None if the server could not be reached.
+    A retried status code (i.e. 503) is returned when it is still returned after every retry.
+    """
+
+    def probe():
+        response = session.head(url, proxies=proxies, retry=False, timeout=timeout, allow_redirects=True)
+        response.close()
+        if response.status_code == 405 or response.status_code == 501:
+            response = session.get(url, proxies=proxies, retry=False, timeout=timeout, stream=True)
+            response.close()
+        else:
+            pass
+        return response
+
+    try:
+        response = call_with_retries(probe,
+                                     url,
+                                     max_attempts=retries + 1,
+                                     notifications=False)
+        return response.status_code
+    except Exception as e:
+        # The server still returned a retried status code (i.e. 503) after every attempt
+        if getattr(e, 'response', None) != None:
+            return e.response.status_code
+        else:
+            return None
+
+
+def candidate_runs(hours=[18, 12, 6, 0],
+                   days=2):
+
+    """
+    This function returns the candidate model runs the URL scanners probe, newest run first.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) hours (Integer List) - Default=[18, 12, 6, 0]. The hours (UTC) of the model runs.
+
+    2) days (Integer) - Default=2. The number of days of model runs (i.e. days=2 is today's and yesterday's runs).
+
+    Returns
+    -------
+
+    A list of (date, hour) tuples, newest run first. The date is a datetime of the day of the run (UTC).
+    """
+
+    now, local, yd = scan_times()
+
+    runs = []
+    for day in range(0, days, 1):
+        date = now - timedelta(days=day)
+        for hour in sorted(hours, reverse=True):
+            runs.append((date, hour))
+
+    return runs
+
+
+def run_url(template,
+            date,
+            hour):
+
+    """
+    This function fills in the date and hour of a model run in a URL template.
+
+    Required Arguments:
+
+    1) template (String) - The URL template. {date} is replaced with the date of the run (YYYYMMDD)
+       and {hour} is replaced with the hour of the run (HH) (i.e. ".../gfs.{date}/{hour}/atmos/gfs.t{hour}z.pgrb2full.0p50.f000").
+
+    2) date (datetime) - The date of the run.
+
+    3) hour (Integer) - The hour of the run (UTC).
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The URL of the model run.
+    """
+
+    return template.format(date=date.strftime('%Y%m%d'),
+                           hour=f"{hour:02d}")
+
+
+def probe_runs(template,
+               hours=[18, 12, 6, 0],
+               days=2,
+               proxies=None,
+               timeout=30,
+               retries=5):
+
+    """
+    This function probes the candidate model runs of a URL template at the same time and returns the latest available run.
+
+    Required Arguments:
+
+    1) template (String) - The URL template of the file that is checked for each run. {date} is replaced with the date
+       of the run (YYYYMMDD) and {hour} is replaced with the hour of the run (HH).
+
+    Optional Arguments:
+
+    1) hours (Integer List) - Default=[18, 12, 6, 0]. The hours (UTC) of the model runs.
+
+    2) days (Integer) - Default=2. The number of days of model runs that are checked (i.e. days=2 is today's and yesterday's runs).
+
+    3) proxies (dict or None) - Default=None. If the user is using proxy server(s), the user must change the following:
+
+       proxies=None ---> proxies={
+                           'http':'http://url',
+                           'https':'https://url'
+                        }
+
+    4) timeout (Integer) - Default=30. The timeout of each request in seconds.
+
+    5) retries (Integer) - Default=5. The number of times a request is retried if the connection fails.
+
+    Returns
+    -------
+
+    The date (datetime) and hour (Integer) of the latest available model run.
+    Raises a NoDataAvailableError when none of the candidate runs are available.
+    """
+
+    runs = candidate_runs(hours=hours,
+                          days=days)
+
+    statuses = probe_urls([run_url(template, date, hour) for date, hour in runs],
+                          proxies=proxies,
+                          timeout=timeout,
+                          retries=retries)
+
+    for status, (date, hour) in zip(statuses, runs):
+        if status == 200:
+            return date, hour
+        else:
+            pass
+
+    raise NoDataAvailableError(f"Latest forecast data is over {24 * (days - 1)} hours old.")
+
+
+def probe_urls(urls,
+               proxies=None,
+               timeout=30,
+               retries=5):
+
+    """
+    This function probes a list of candidate URLs at the same time (i.e. the RTMA analyses of the past few hours).
+
+    The candidates must be listed newest run first. The function returns as soon as every candidate newer than
+    the first available run has been ruled out, so the older candidates are never waited on.
+
+    Required Arguments:
+
+    1) urls (String List) - The URLs of the candidate runs, newest run first.
+
+    Optional Arguments:
+
+    1) proxies (dict or None) - Default=None. If the user is using proxy server(s), the user must change the following:
+
+       proxies=None ---> proxies={
+                           'http':'http://url',
+                           'https':'https://url'
+                        }
+
+    2) timeout (Integer) - Default=30. The timeout of each request in seconds.
+
+    3) retries (Integer) - Default=5. The number of times a request is retried if the connection fails.
+
+    Returns
+    -------
+
+    A list of HTTP status codes in the same order as urls.
+    Candidates older than the first available run are not waited on and have a status code of None.
+    """
+
+    statuses = [None] * len(urls)
+
+    executor = ThreadPoolExecutor(max_workers=max(len(urls), 1))
+    futures = [executor.submit(probe_url, url, proxies, timeout, retries) for url in urls]
+
+    try:
+        for i, future in enumerate(futures):
+            statuses[i] = future.result()
+            if statuses[i] == 200:
+                break
+            else:
+                pass
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return statuses
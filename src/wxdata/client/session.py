@@ -0,0 +1,396 @@
+"""
+This file hosts the shared HTTP session that every WxData client and URL scanner sends its requests through.
+
+A single requests.Session keeps a pool of open connections for each host (i.e. nomads.ncep.noaa.gov or data.ecmwf.int)
+so repeated requests to the same server reuse the connection rather than doing a new TCP and TLS handshake each time.
+
+Every request is sent under the shared retry policy (exponential backoff with jitter, per-host circuit breaking and a deadline)
+in wxdata.client.retry. Every request has a timeout (the policy timeout capped by the time left before the deadline) unless the caller passes its own.
+
+The VPN/PROXY configuration is also stored here one time. Users who set their proxies with configure_session(proxies=...)
+no longer need to pass proxies into every function. Passing proxies into a function still works and takes priority.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import requests
+import threading
+
+from contextlib import contextmanager
+from requests.adapters import HTTPAdapter
+from wxdata.client.retry import(
+    call_with_retries,
+    request_timeout
+)
+from wxdata.utils.file_funcs import(
+    open_decompressed,
+    decompress_to_file
+)
+
+_session = None
+_proxies = None
+_lock = threading.Lock()
+
+# Default connection pool settings
+# pool_maxsize is larger than the default number of download workers so concurrent downloads never wait on the pool
+pool_connections = 10
+pool_maxsize = 16
+
+def configure_session(proxies=None,
+                      pool_connections=10,
+                      pool_maxsize=16,
+                      headers=None):
+
+    """
+    This function configures the shared HTTP session used by all of the WxData clients.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) proxies (dict or None) - Default=None. If the user is using proxy server(s), the user must change the following:
+
+       proxies=None ---> proxies={
+                           'http':'http://url',
+                           'https':'https://url'
+                        }
+
+    2) pool_connections (Integer) - Default=10. The number of hosts to keep connection pools for.
+
+    3) pool_maxsize (Integer) - Default=16. The maximum number of open connections kept for each host.
+
+    4) headers (dict or None) - Default=None. Headers sent with every request.
+
+    Returns
+    -------
+
+    The configured requests.Session
+    """
+
+    global _session
+    global _proxies
+
+    with _lock:
+        if _session != None:
+            _session.close()
+        else:
+            pass
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        if headers != None:
+            session.headers.update(headers)
+        else:
+            pass
+
+        _session = session
+        _proxies = proxies
+
+    return _session
+
+
+def get_session():
+
+    """
+    This function returns the shared HTTP session and builds it with the default settings if it does not exist yet.
+
+    Required Arguments: None
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The shared requests.Session
+    """
+
+    if _session == None:
+        configure_session(pool_connections=pool_connections,
+                          pool_maxsize=pool_maxsize)
+    else:
+        pass
+
+    return _session
+
+
+def get_proxies(proxies=None):
+
+    """
+    This function returns the proxies for a request.
+
+    Proxies passed into a function take priority over the proxies configured for the session.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) proxies (dict or None) - Default=None. The proxies passed into the calling function.
+
+    Returns
+    -------
+
+    The proxies (dict or None) for the request.
+    """
+
+    if proxies != None:
+        return proxies
+    else:
+        return _proxies
+
+
+def get(url,
+        proxies=None,
+        retry=True,
+        **kwargs):
+
+    """
+    This function sends a GET request through the shared HTTP session.
+
+    Required Arguments:
+
+    1) url (String) - The URL.
+
+    Optional Arguments:
+
+    1) proxies (dict or None) - Default=None. When None, the proxies configured for the session are used.
+
+    2) retry (Boolean) - Default=True. When set to True, connection errors and the retried status codes (i.e. 503)
+       are retried under the retry policy. Set retry=False when the caller retries the request itself.
+
+    Any other keyword argument accepted by requests.get(). When timeout is not passed in, the timeout of the retry policy is used
+    (capped by the time left before the deadline).
+
+    Returns
+    -------
+
+    A requests.Response
+
+    Raises a wxdata.client.retry.DownloadError when the server cannot be reached (or keeps returning a retried status code)
+    after every retry.
+    """
+
+    if retry == True:
+        return call_with_retries(get_session().get,
+                                 url,
+                                 url,
+                                 proxies=get_proxies(proxies),
+                                 notifications=False,
+                                 set_timeout=True,
+                                 **kwargs)
+    else:
+        kwargs.setdefault('timeout', request_timeout())
+        return get_session().get(url, proxies=get_proxies(proxies), **kwargs)
+
+
+def head(url,
+         proxies=None,
+         retry=True,
+         **kwargs):
+
+    """
+    This function sends a HEAD request through the shared HTTP session.
+
+    Required Arguments:
+
+    1) url (String) - The URL.
+
+    Optional Arguments:
+
+    1) proxies (dict or None) - Default=None. When None, the proxies configured for the session are used.
+
+    2) retry (Boolean) - Default=True. When set to True, connection errors and the retried status codes (i.e. 503)
+       are retried under the retry policy. Set retry=False when the caller retries the request itself.
+
+    Any other keyword argument accepted by requests.head(). When timeout is not passed in, the timeout of the retry policy is used
+    (capped by the time left before the deadline).
+
+    Returns
+    -------
+
+    A requests.Response
+
+    Raises a wxdata.client.retry.DownloadError when the server cannot be reached (or keeps returning a retried status code)
+    after every retry.
+    """
+
+    if retry == True:
+        return call_with_retries(get_session().head,
+                                 url,
+                                 url,
+                                 proxies=get_proxies(proxies),
+                                 notifications=False,
+                                 set_timeout=True,
+                                 **kwargs)
+    else:
+        kwargs.setdefault('timeout', request_timeout())
+        return get_session().head(url, proxies=get_proxies(proxies), **kwargs)
+
+
+def post(url,
+         proxies=None,
+         retry=True,
+         **kwargs):
+
+    """
+    This function sends a POST request through the shared HTTP session.
+
+    Required Arguments:
+
+    1) url (String) - The URL.
+
+    Optional Arguments:
+
+    1) proxies (dict or None) - Default=None. When None, the proxies configured for the session are used.
+
+    2) retry (Boolean) - Default=True. When set to True, connection errors and the retried status codes (i.e. 503)
+       are retried under the retry policy. Set retry=False when the caller retries the request itself.
+
+    Any other keyword argument accepted by requests.post(). When timeout is not passed in, the timeout of the retry policy is used
+    (capped by the time left before the deadline).
+
+    Returns
+    -------
+
+    A requests.Response
+
+    Raises a wxdata.client.retry.DownloadError when the server cannot be reached (or keeps returning a retried status code)
+    after every retry.
+    """
+
+    if retry == True:
+        return call_with_retries(get_session().post,
+                                 url,
+                                 url,
+                                 proxies=get_proxies(proxies),
+                                 notifications=False,
+                                 set_timeout=True,
+                                 **kwargs)
+    else:
+        kwargs.setdefault('timeout', request_timeout())
+        return get_session().post(url, proxies=get_proxies(proxies), **kwargs)
+
+
+def download_file(url,
+                  filename,
+                  proxies=None,
+                  chunk_size=8192):
+
+    """
+    This function downloads a file through the shared HTTP session.
+    This replaces urllib.request.urlretrieve() so the download uses the pooled connections and proxies.
+
+    Required Arguments:
+
+    1) url (String) - The URL to the file.
+
+    2) filename (String) - The path the file is saved to.
+
+    Optional Arguments:
+
+    1) proxies (dict or None) - Default=None. When None, the proxies configured for the session are used.
+
+    2) chunk_size (Integer) - Default=8192. The size of the chunks when writing the file.
+
+    Returns
+    -------
+
+    The file saved to {filename}
+    """
+
+    with get(url, proxies=proxies, stream=True) as r:
+        r.raise_for_status()
+        with open(filename, 'wb') as f:
+            for chunk in r.iter_content(chunk_size=chunk_size):
+                f.write(chunk)
+
+
+@contextmanager
+def open_decompressed_url(url,
+                          compression='auto',
+                          proxies=None,
+                          retry=True):
+
+    """
+    This function streams a compressed file (gzip or bz2) from the web and decompresses it as it is read.
+
+    Nothing is written to disk. The decompressed stream can be passed straight into a parser (i.e. pandas.read_csv()).
+
+    Usage:
+
+    with open_decompressed_url(url) as f:
+        df = pd.read_csv(f)
+
+    Required Arguments:
+
+    1) url (String) - The URL to the file.
+
+    Optional Arguments:
+
+    1) compression (String or None) - Default='auto'. 'auto', 'gzip', 'bz2' or None.
+       When 'auto', the compression is detected from the first bytes of the file.
+
+    2) proxies (dict or None) - Default=None. When None, the proxies configured for the session are used.
+
+    3) retry (Boolean) - Default=True. When set to True, the request is retried under the retry policy.
+       Set retry=False when the caller retries the whole download itself.
+
+    Returns
+    -------
+
+    A binary file object of the decompressed data.
+    """
+
+    with get(url, proxies=proxies, retry=retry, stream=True) as r:
+        r.raise_for_status()
+        # Any Content-Encoding applied by the server is removed so only the compression of the file itself remains
+        # The raw stream is kept open at the end of the data so the buffered decompressor can finish reading it
+        r.raw.decode_content = True
+        r.raw.auto_close = False
+        with open_decompressed(r.raw, compression=compression) as f:
+            yield f
+
+
+def download_decompressed_file(url,
+                               filename,
+                               compression='auto',
+                               proxies=None,
+                               retry=True):
+
+    """
+    This function downloads a compressed file (gzip or bz2) and decompresses it to disk in a single pass.
+
+    The compressed file is never saved and the decompressed data is never held in memory all at once.
+
+    Required Arguments:
+
+    1) url (String) - The URL to the file.
+
+    2) filename (String) - The path the decompressed file is saved to.
+
+    Optional Arguments:
+
+    1) compression (String or None) - Default='auto'. 'auto', 'gzip', 'bz2' or None.
+       When 'auto', the compression is detected from the first bytes of the file.
+
+    2) proxies (dict or None) - Default=None. When None, the proxies configured for the session are used.
+
+    3) retry (Boolean) - Default=True. When set to True, the request is retried under the retry policy.
+       Set retry=False when the caller retries the whole download itself.
+
+    Returns
+    -------
+
+    The decompressed file saved to {filename}
+    """
+
+    with get(url, proxies=proxies, retry=retry, stream=True) as r:
+        r.raise_for_status()
+        r.raw.decode_content = True
+        r.raw.auto_close = False
+        decompress_to_file(r.raw,
+                           filename,
+                           compression=compression)
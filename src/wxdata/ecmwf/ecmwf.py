@@ -19,13 +19,14 @@ from wxdata.ecmwf.url_scanners import(
 from wxdata.ecmwf.file_funcs import(
     build_directory,
     clear_idx_files,
-    clear_old_data,
     parse_filename
 )
 
 
 from wxdata.calc.unit_conversion import convert_temperature_units
-from wxdata.utils.file_scanner import local_file_scanner
+from wxdata.utils.file_scanner import manifest_file_scanner
+from wxdata.utils.manifest import record_files
+from wxdata.utils.pipeline import download_and_process
 from wxdata.ecmwf.paths import ecmwf_branch_paths
 from wxdata.utils.file_funcs import(
     custom_branch,
@@ -47,7 +48,10 @@ def ecmwf_ifs(final_forecast_hour=360,
               convert_to='celsius',
               custom_directory=None,
               chunk_size=8192,
-              notifications='off'):
+              notifications='off',
+              max_workers=8,
+              variables=None,
+              pipeline=False):
     
     """
     This function scans for the latest ECMWF IFS dataset. If the dataset on the computer is old, the old data will be deleted
@@ -92,11 +96,24 @@ def ecmwf_ifs(final_forecast_hour=360,
     13) chunk_size (Integer) - Default=8192. The size of the chunks when writing the GRIB/NETCDF data to a file.
     
     14) notifications (String) - Default='off'. Notification when a file is downloaded and saved to {path}
-        
+    
+    15) max_workers (Integer) - Default=8. The maximum number of files downloaded at the same time.
+       Set max_workers=1 to download the files one at a time.
+    
+    16) variables (List or None) - Default=None. A list of ECMWF parameter short names (i.e. ['2t', '10u', '10v', 'msl', 'tp']).
+       When set, only the GRIB2 messages of these variables are downloaded using the byte ranges in the ECMWF .index files.
+       This greatly reduces the size of the download when only a handful of variables are needed.
+       When None, the full files are downloaded.
+       
+    17) pipeline (Boolean) - Default=False. When set to True (and process_data=True), each forecast hour is post-processed
+        as soon as it is downloaded while the later forecast hours are still downloading. A generator is returned that yields
+        each forecast hour as its own xarray.array in forecast hour order. Use xarray.concat(list(ds), dim='step') to combine them. 
+    
     Returns
     -------
     
     An xarray data array with post-processed GRIB2 Variable Keys into Plain Language Variable Keys
+    When pipeline=True, a generator of an xarray.array for each forecast hour.
     
     Plain Language ECMWF IFS Variable Keys (After Post-Processing)
     --------------------------------------------------------------
@@ -171,52 +188,79 @@ def ecmwf_ifs(final_forecast_hour=360,
     url, filename, run = ecmwf_ifs_url_scanner(final_forecast_hour,
                           proxies)
 
-    download = local_file_scanner(path, 
-                                  filename,
-                                  'ecmwf',
-                                  run,
-                                  model='operational ifs')
-    
-
     date = parse_filename(filename)
     
-    if download == True:
+    if final_forecast_hour <= 144:
+        hours = list(range(0, final_forecast_hour + step, step))
+    else:
+        hours = list(range(0, 144 + step, step)) + list(range(150, final_forecast_hour + 6, 6))
+    
+    fnames = [f"{date.strftime('%Y%m%d%H')}0000-{i}h-oper-fc.grib2" for i in hours]
+    urls = [f"{url}/{fname}" for fname in fnames]
+    
+    missing = manifest_file_scanner(path, 
+                                    urls,
+                                    fnames,
+                                    variables=variables)
+    
+    if len(missing) > 0:
         print(f"Downloading ECMWF IFS...")
-        clear_old_data(path)
-        if final_forecast_hour <= 144:
-            for i in range(0, final_forecast_hour + step, step):
-                client.get_gridded_data(f"{url}/{date.strftime('%Y%m%d%H')}0000-{i}h-oper-fc.grib2", 
-                            path,
-                            f"{date.strftime('%Y%m%d%H')}0000-{i}h-oper-fc.grib2",
-                            proxies=proxies,
-                            chunk_size=chunk_size,
-                            notifications=notifications)
-                                              
+        
+        if pipeline == True and process_data == True:
+            pass
         else:
-            for i in range(0, 144 + step, step):
-                client.get_gridded_data(f"{url}/{date.strftime('%Y%m%d%H')}0000-{i}h-oper-fc.grib2", 
-                            path,
-                            f"{date.strftime('%Y%m%d%H')}0000-{i}h-oper-fc.grib2",
-                            proxies=proxies,
-                            chunk_size=chunk_size,
-                            notifications=notifications)
+            client.get_gridded_data_batch([urls[i] for i in missing],
+                        path,
+                        [fnames[i] for i in missing],
+                        proxies=proxies,
+                        chunk_size=chunk_size,
+                        notifications=notifications,
+                        max_workers=max_workers,
+                        index_format='ecmwf',
+                        variables=variables)
             
-            for i in range(144, final_forecast_hour + 6, 6):
-                client.get_gridded_data(f"{url}/{date.strftime('%Y%m%d%H')}0000-{i}h-oper-fc.grib2", 
-                            path,
-                            f"{date.strftime('%Y%m%d%H')}0000-{i}h-oper-fc.grib2",
-                            proxies=proxies,
-                            chunk_size=chunk_size,
-                            notifications=notifications)
-
-        
-        print(f"ECMWF IFS Download Complete.")    
+            record_files(path,
+                         [urls[i] for i in missing],
+                         [fnames[i] for i in missing],
+                         variables=variables)
+    
+            
+            print(f"ECMWF IFS Download Complete.")    
         
     else:
         print(f"ECMWF IFS Data is up to date. Skipping download...")    
         
         
-    if process_data == True:
+    if process_data == True and pipeline == True:
+        print(f"ECMWF IFS Data Processing (Pipelined)...")
+        
+        def process(files):
+            ds = ecmwf_post_processing.ecmwf_ifs_post_processing(path,
+                                                                western_bound, 
+                                                                eastern_bound, 
+                                                                northern_bound, 
+                                                                southern_bound,
+                                                                files=files)
+            if convert_temperature == True:
+                ds = convert_temperature_units(ds, 
+                                               convert_to)
+            else:
+                pass
+            return ds
+        
+        return download_and_process(urls,
+                                    path,
+                                    fnames,
+                                    process,
+                                    missing=missing,
+                                    proxies=proxies,
+                                    chunk_size=chunk_size,
+                                    notifications=notifications,
+                                    max_workers=max_workers,
+                                    index_format='ecmwf',
+                                    variables=variables)
+        
+    elif process_data == True:
         print(f"ECMWF IFS Data Processing...")
         
         ds = ecmwf_post_processing.ecmwf_ifs_post_processing(path,
@@ -253,7 +297,9 @@ def ecmwf_aifs(final_forecast_hour=360,
               convert_to='celsius',
               custom_directory=None,
               chunk_size=8192,
-              notifications='off'):
+              notifications='off',
+              max_workers=8,
+              variables=None):
     
     """
     This function scans for the latest ECMWF AIFS dataset. If the dataset on the computer is old, the old data will be deleted
@@ -297,6 +343,14 @@ def ecmwf_aifs(final_forecast_hour=360,
     
     13) notifications (String) - Default='off'. Notification when a file is downloaded and saved to {path}
     
+    14) max_workers (Integer) - Default=8. The maximum number of files downloaded at the same time.
+       Set max_workers=1 to download the files one at a time.
+    
+    15) variables (List or None) - Default=None. A list of ECMWF parameter short names (i.e. ['2t', '10u', '10v', 'msl', 'tp']).
+       When set, only the GRIB2 messages of these variables are downloaded using the byte ranges in the ECMWF .index files.
+       This greatly reduces the size of the download when only a handful of variables are needed.
+       When None, the full files are downloaded.
+    
     Returns
     -------
     
@@ -364,42 +418,37 @@ def ecmwf_aifs(final_forecast_hour=360,
     url, filename, run = ecmwf_aifs_url_scanner(final_forecast_hour,
                           proxies)
 
-    download = local_file_scanner(path, 
-                                  filename,
-                                  'ecmwf',
-                                  run)
-    
-
     date = parse_filename(filename)
     
-    if download == True:
+    if final_forecast_hour <= 144:
+        hours = list(range(0, final_forecast_hour + 6, 6))
+    else:
+        hours = list(range(0, 144 + 6, 6)) + list(range(150, final_forecast_hour + 6, 6))
+    
+    fnames = [f"{date.strftime('%Y%m%d%H')}0000-{i}h-oper-fc.grib2" for i in hours]
+    urls = [f"{url}/{fname}" for fname in fnames]
+    
+    missing = manifest_file_scanner(path, 
+                                    urls,
+                                    fnames,
+                                    variables=variables)
+    
+    if len(missing) > 0:
         print(f"Downloading ECMWF AIFS...")
-        clear_old_data(path)
-        if final_forecast_hour <= 144:
-            for i in range(0, final_forecast_hour + 6, 6):
-                client.get_gridded_data(f"{url}/{date.strftime('%Y%m%d%H')}0000-{i}h-oper-fc.grib2", 
-                            path,
-                            f"{date.strftime('%Y%m%d%H')}0000-{i}h-oper-fc.grib2",
-                            proxies=proxies,
-                            chunk_size=chunk_size,
-                            notifications=notifications)
-                                              
-        else:
-            for i in range(0, 144 + 6, 6):
-                client.get_gridded_data(f"{url}/{date.strftime('%Y%m%d%H')}0000-{i}h-oper-fc.grib2", 
-                            path,
-                            f"{date.strftime('%Y%m%d%H')}0000-{i}h-oper-fc.grib2",
-                            proxies=proxies,
-                            chunk_size=chunk_size,
-                            notifications=notifications)
-            
-            for i in range(144, final_forecast_hour + 6, 6):
-                client.get_gridded_data(f"{url}/{date.strftime('%Y%m%d%H')}0000-{i}h-oper-fc.grib2", 
-                            path,
-                            f"{date.strftime('%Y%m%d%H')}0000-{i}h-oper-fc.grib2",
-                            proxies=proxies,
-                            chunk_size=chunk_size,
-                            notifications=notifications)
+        client.get_gridded_data_batch([urls[i] for i in missing],
+                    path,
+                    [fnames[i] for i in missing],
+                    proxies=proxies,
+                    chunk_size=chunk_size,
+                    notifications=notifications,
+                    max_workers=max_workers,
+                    index_format='ecmwf',
+                    variables=variables)
+        
+        record_files(path,
+                     [urls[i] for i in missing],
+                     [fnames[i] for i in missing],
+                     variables=variables)
             
         print(f"ECMWF AIFS Download Complete.")
     else:
@@ -444,7 +493,9 @@ def ecmwf_ifs_high_res(final_forecast_hour=144,
               convert_to='celsius',
               custom_directory=None,
               chunk_size=8192,
-              notifications='off'):
+              notifications='off',
+              max_workers=8,
+              variables=None):
     
     """
     This function scans for the latest ECMWF High Resolution IFS dataset. If the dataset on the computer is old, the old data will be deleted
@@ -489,7 +540,15 @@ def ecmwf_ifs_high_res(final_forecast_hour=144,
     13) chunk_size (Integer) - Default=8192. The size of the chunks when writing the GRIB/NETCDF data to a file.
     
     14) notifications (String) - Default='off'. Notification when a file is downloaded and saved to {path}
-        
+    
+    15) max_workers (Integer) - Default=8. The maximum number of files downloaded at the same time.
+       Set max_workers=1 to download the files one at a time.
+    
+    16) variables (List or None) - Default=None. A list of ECMWF parameter short names (i.e. ['2t', '10u', '10v', 'msl', 'tp']).
+       When set, only the GRIB2 messages of these variables are downloaded using the byte ranges in the ECMWF .index files.
+       This greatly reduces the size of the download when only a handful of variables are needed.
+       When None, the full files are downloaded.
+    
     Returns
     -------
     
@@ -567,23 +626,34 @@ def ecmwf_ifs_high_res(final_forecast_hour=144,
     url, filename, run = ecmwf_ifs_high_res_url_scanner(final_forecast_hour,
                           proxies)
 
-    download = local_file_scanner(path, 
-                                  filename,
-                                  'ecmwf',
-                                  run)
-
     date = parse_filename(filename)
     
-    if download == True:
+    hours = list(range(0, final_forecast_hour + step, step))
+    
+    fnames = [f"{date.strftime('%Y%m%d%H')}0000-{i}h-scda-fc.grib2" for i in hours]
+    urls = [f"{url}/{fname}" for fname in fnames]
+    
+    missing = manifest_file_scanner(path, 
+                                    urls,
+                                    fnames,
+                                    variables=variables)
+    
+    if len(missing) > 0:
         print(f"Downloading ECMWF High Resolution IFS...")
-        clear_old_data(path)
-        for i in range(0, final_forecast_hour + step, step):
-            client.get_gridded_data(f"{url}/{date.strftime('%Y%m%d%H')}0000-{i}h-scda-fc.grib2", 
-                        path,
-                        f"{date.strftime('%Y%m%d%H')}0000-{i}h-scda-fc.grib2",
-                        proxies=proxies,
-                        chunk_size=chunk_size,
-                        notifications=notifications)
+        client.get_gridded_data_batch([urls[i] for i in missing],
+                    path,
+                    [fnames[i] for i in missing],
+                    proxies=proxies,
+                    chunk_size=chunk_size,
+                    notifications=notifications,
+                    max_workers=max_workers,
+                    index_format='ecmwf',
+                    variables=variables)
+        
+        record_files(path,
+                     [urls[i] for i in missing],
+                     [fnames[i] for i in missing],
+                     variables=variables)
                             
         print(f"ECMWF High Resolution IFS Download Complete")
     else:
@@ -626,7 +696,9 @@ def ecmwf_ifs_wave(final_forecast_hour=144,
               clear_recycle_bin=True,
               custom_directory=None,
               chunk_size=8192,
-              notifications='off'):
+              notifications='off',
+              max_workers=8,
+              variables=None):
     
     """
     This function scans for the latest ECMWF IFS Wave dataset. If the dataset on the computer is old, the old data will be deleted
@@ -665,7 +737,15 @@ def ecmwf_ifs_wave(final_forecast_hour=144,
     11) chunk_size (Integer) - Default=8192. The size of the chunks when writing the GRIB/NETCDF data to a file.
     
     12) notifications (String) - Default='off'. Notification when a file is downloaded and saved to {path}
-        
+    
+    13) max_workers (Integer) - Default=8. The maximum number of files downloaded at the same time.
+       Set max_workers=1 to download the files one at a time.
+    
+    14) variables (List or None) - Default=None. A list of ECMWF parameter short names (i.e. ['swh', 'mwd', 'mwp']).
+       When set, only the GRIB2 messages of these variables are downloaded using the byte ranges in the ECMWF .index files.
+       This greatly reduces the size of the download when only a handful of variables are needed.
+       When None, the full files are downloaded.
+    
     Returns
     -------
     
@@ -703,24 +783,34 @@ def ecmwf_ifs_wave(final_forecast_hour=144,
     url, filename, run = ecmwf_ifs_wave_url_scanner(final_forecast_hour,
                           proxies)
 
-    download = local_file_scanner(path, 
-                                  filename,
-                                  'ecmwf',
-                                  run)
-    
-
     date = parse_filename(filename)
     
-    if download == True:
+    hours = list(range(0, final_forecast_hour + step, step))
+    
+    fnames = [f"{date.strftime('%Y%m%d%H')}0000-{i}h-scwv-fc.grib2" for i in hours]
+    urls = [f"{url}/{fname}" for fname in fnames]
+    
+    missing = manifest_file_scanner(path, 
+                                    urls,
+                                    fnames,
+                                    variables=variables)
+    
+    if len(missing) > 0:
         print(f"Downloading ECMWF IFS Wave...")
-        clear_old_data(path)
-        for i in range(0, final_forecast_hour + step, step):
-            client.get_gridded_data(f"{url}/{date.strftime('%Y%m%d%H')}0000-{i}h-scwv-fc.grib2", 
-                        path,
-                        f"{date.strftime('%Y%m%d%H')}0000-{i}h-scwv-fc.grib2",
-                        proxies=proxies,
-                        chunk_size=chunk_size,
-                        notifications=notifications)
+        client.get_gridded_data_batch([urls[i] for i in missing],
+                    path,
+                    [fnames[i] for i in missing],
+                    proxies=proxies,
+                    chunk_size=chunk_size,
+                    notifications=notifications,
+                    max_workers=max_workers,
+                    index_format='ecmwf',
+                    variables=variables)
+        
+        record_files(path,
+                     [urls[i] for i in missing],
+                     [fnames[i] for i in missing],
+                     variables=variables)
         
         print(f"ECMWF IFS Wave Download Complete.")
     else:
@@ -8,7 +8,6 @@ If not, the function in this file will build the directory to host the CSVs and
 
 """
 # Imports
-import urllib.request
 import os
 import pandas as pd
 import numpy as np
@@ -19,6 +18,7 @@ try:
 except Exception as e:
     from datetime import datetime, timedelta
 from calendar import isleap
+from wxdata.client import session
 
 def get_number_of_psas_by_gacc(gacc_region):
     
@@ -139,55 +139,55 @@ def get_raws_sig_info():
     if os.path.exists(f"RAWS SIGs/OSCC/OSCC_StationList.csv"):
         pass
     else:
-        urllib.request.urlretrieve(f"https://raw.githubusercontent.com/edrewitz/firewxpy/refs/heads/main/RAWS%20SIGs/OSCC_StationList.csv", f"OSCC_StationList.csv")
+        session.download_file(f"https://raw.githubusercontent.com/edrewitz/firewxpy/refs/heads/main/RAWS%20SIGs/OSCC_StationList.csv", f"OSCC_StationList.csv")
         os.replace(f"OSCC_StationList.csv", f"RAWS SIGs/OSCC/OSCC_StationList.csv")
 
     if os.path.exists(f"RAWS SIGs/ONCC/ONCC_StationList.csv"):
         pass
     else:
-        urllib.request.urlretrieve(f"https://raw.githubusercontent.com/edrewitz/firewxpy/refs/heads/main/RAWS%20SIGs/ONCC_StationList.csv", f"ONCC_StationList.csv")
+        session.download_file(f"https://raw.githubusercontent.com/edrewitz/firewxpy/refs/heads/main/RAWS%20SIGs/ONCC_StationList.csv", f"ONCC_StationList.csv")
         os.replace(f"ONCC_StationList.csv", f"RAWS SIGs/ONCC/ONCC_StationList.csv")
 
     if os.path.exists(f"RAWS SIGs/SACC/SACC_StationList.csv"):
         pass
     else:
-        urllib.request.urlretrieve(f"https://raw.githubusercontent.com/edrewitz/firewxpy/refs/heads/main/RAWS%20SIGs/SACC_StationList.csv", f"SACC_StationList.csv")
+        session.download_file(f"https://raw.githubusercontent.com/edrewitz/firewxpy/refs/heads/main/RAWS%20SIGs/SACC_StationList.csv", f"SACC_StationList.csv")
         os.replace(f"SACC_StationList.csv", f"RAWS SIGs/SACC/SACC_StationList.csv")
 
     if os.path.exists(f"RAWS SIGs/EACC/EACC_StationList.csv"):
         pass
     else:
-        urllib.request.urlretrieve(f"https://raw.githubusercontent.com/edrewitz/firewxpy/refs/heads/main/RAWS%20SIGs/EACC_StationList.csv", f"EACC_StationList.csv")
+        session.download_file(f"https://raw.githubusercontent.com/edrewitz/firewxpy/refs/heads/main/RAWS%20SIGs/EACC_StationList.csv", f"EACC_StationList.csv")
         os.replace(f"EACC_StationList.csv", f"RAWS SIGs/EACC/EACC_StationList.csv")
 
     if os.path.exists(f"RAWS SIGs/GBCC/GBCC_StationList.csv"):
         pass
     else:
-        urllib.request.urlretrieve(f"https://raw.githubusercontent.com/edrewitz/firewxpy/refs/heads/main/RAWS%20SIGs/GBCC_StationList.csv", f"GBCC_StationList.csv")
+        session.download_file(f"https://raw.githubusercontent.com/edrewitz/firewxpy/refs/heads/main/RAWS%20SIGs/GBCC_StationList.csv", f"GBCC_StationList.csv")
         os.replace(f"GBCC_StationList.csv", f"RAWS SIGs/GBCC/GBCC_StationList.csv")
 
     if os.path.exists(f"RAWS SIGs/NRCC/NRCC_StationList.csv"):
         pass
     else:
-        urllib.request.urlretrieve(f"https://raw.githubusercontent.com/edrewitz/firewxpy/refs/heads/main/RAWS%20SIGs/NRCC_StationList.csv", f"NRCC_StationList.csv")
+        session.download_file(f"https://raw.githubusercontent.com/edrewitz/firewxpy/refs/heads/main/RAWS%20SIGs/NRCC_StationList.csv", f"NRCC_StationList.csv")
         os.replace(f"NRCC_StationList.csv", f"RAWS SIGs/NRCC/NRCC_StationList.csv")
 
     if os.path.exists(f"RAWS SIGs/NWCC/NWCC_StationList.csv"):
         pass
     else:
-        urllib.request.urlretrieve(f"https://raw.githubusercontent.com/edrewitz/firewxpy/refs/heads/main/RAWS%20SIGs/NWCC_StationList.csv", f"NWCC_StationList.csv")
+        session.download_file(f"https://raw.githubusercontent.com/edrewitz/firewxpy/refs/heads/main/RAWS%20SIGs/NWCC_StationList.csv", f"NWCC_StationList.csv")
         os.replace(f"NWCC_StationList.csv", f"RAWS SIGs/NWCC/NWCC_StationList.csv")
 
     if os.path.exists(f"RAWS SIGs/RMCC/RMCC_StationList.csv"):
         pass
     else:
-        urllib.request.urlretrieve(f"https://raw.githubusercontent.com/edrewitz/firewxpy/refs/heads/main/RAWS%20SIGs/RMCC_StationList.csv", f"RMCC_StationList.csv")
+        session.download_file(f"https://raw.githubusercontent.com/edrewitz/firewxpy/refs/heads/main/RAWS%20SIGs/RMCC_StationList.csv", f"RMCC_StationList.csv")
         os.replace(f"RMCC_StationList.csv", f"RAWS SIGs/RMCC/RMCC_StationList.csv")
 
     if os.path.exists(f"RAWS SIGs/SWCC/SWCC_StationList.csv"):
         pass
     else:
-        urllib.request.urlretrieve(f"https://raw.githubusercontent.com/edrewitz/firewxpy/refs/heads/main/RAWS%20SIGs/SWCC_StationList.csv", f"SWCC_StationList.csv")
+        session.download_file(f"https://raw.githubusercontent.com/edrewitz/firewxpy/refs/heads/main/RAWS%20SIGs/SWCC_StationList.csv", f"SWCC_StationList.csv")
         os.replace(f"SWCC_StationList.csv", f"RAWS SIGs/SWCC/SWCC_StationList.csv")
 
 def get_sigs(gacc_region):
@@ -38,7 +38,13 @@ from wxdata.utils.file_funcs import(
 )
 
 from wxdata.calc.unit_conversion import convert_temperature_units
-from wxdata.utils.file_scanner import local_file_scanner
+from wxdata.utils.file_scanner import manifest_file_scanner
+from wxdata.utils.manifest import(
+    record_files,
+    reuse_cached_bbox
+)
+from wxdata.utils.coords import subset_to_bbox
+from wxdata.utils.pipeline import download_and_process
 from wxdata.utils.recycle_bin import *
 
 def gefs_0p50(cat='mean', 
@@ -88,7 +94,10 @@ def gefs_0p50(cat='mean',
             convert_to='celsius',
             custom_directory=None,
             chunk_size=8192,
-            notifications='off'):
+            notifications='off',
+            max_workers=8,
+            levels=None,
+            process_workers=1):
     
     """
     This function downloads the latest GEFS0P50 data for a region specified by the user
@@ -192,6 +201,16 @@ def gefs_0p50(cat='mean',
     
     19) notifications (String) - Default='off'. Notification when a file is downloaded and saved to {path}
     
+    20) max_workers (Integer) - Default=8. The maximum number of files downloaded at the same time.
+       Set max_workers=1 to download the files one at a time.
+    
+    21) levels (String List or None) - Default=None. The levels the user wishes to query in plain language
+        (i.e. ['500 mb', '2 m above ground', 'surface']). Only these levels are downloaded from the NOMADS GRIB filter.
+        When None, every level is downloaded.
+    
+    22) process_workers (Integer) - Default=1. The number of worker processes that decode the ensemble members when cat='members'.
+        When 1, the members are opened lazily in this process. With more than one worker, each member is decoded in its own process
+        and every member is held in memory. Scripts that set process_workers > 1 must guard their entry point with if __name__ == '__main__':
     
     Returns
     -------
@@ -287,54 +306,49 @@ def gefs_0p50(cat='mean',
                                             proxies, 
                                             step, 
                                             members,
-                                            variables)
+                                            variables,
+                                            levels=levels)
+    
+    if type(paths) == type('String'):
+        paths = [paths]
+    else:
+        pass
     
-    try:
-        download = local_file_scanner(paths[-1], 
-                                        filenames[-1],
-                                        'nomads',
-                                        run)
-    except Exception as e:
-        download = local_file_scanner(paths, 
-                                        filenames,
-                                        'nomads',
-                                        run)       
-    
-    if download == True:
+    # Each file is saved to the directory of its ensemble member
+    if cat != 'members':
+        file_paths = [paths[0]] * len(filenames)
+    else:
+        increment = int(len(filenames)/len(members))
+        file_paths = []
+        for path in paths:
+            file_paths = file_paths + [path] * increment
+    
+    fnames = [f"{filename}.grib2" for filename in filenames]
+    
+    missing = manifest_file_scanner(file_paths, 
+                                    urls,
+                                    fnames)
+    
+    # Files already downloaded for a larger bounding box of the same cycle are reused and subset to the requested bounding box
+    urls, bbox = reuse_cached_bbox(file_paths,
+                                   urls,
+                                   fnames,
+                                   missing)
+    
+    if len(missing) > 0:
         print(f"Downloading GEFS0P50 {cat.upper()}...")
         
-        try:
-            for path in paths:
-                for file in os.listdir(f"{path}"):
-                    os.remove(f"{path}/{file}")
-        except Exception as e:
-            pass
+        client.get_gridded_data_batch([urls[i] for i in missing],
+                    [file_paths[i] for i in missing],
+                    [fnames[i] for i in missing],
+                    proxies=proxies,
+                    chunk_size=chunk_size,
+                    notifications=notifications,
+                    max_workers=max_workers)
         
-        if cat != 'members':
-            for path in paths:
-                for url, filename in zip(urls, filenames):
-                    client.get_gridded_data(f"{url}",
-                                path,
-                                f"{filename}.grib2",
-                                proxies=proxies,
-                                chunk_size=chunk_size,
-                                notifications=notifications)                                                                 
-                            
-        else:
-            start = 0
-            increment = int(len(filenames)/len(members))
-            stop = increment
-            for path in paths:
-                for u, f in zip(range(start, stop, 1), range(start, stop, 1)):
-                    client.get_gridded_data(f"{urls[u]}",
-                                path,
-                                f"{filenames[f]}.grib2",
-                                proxies=proxies,
-                                chunk_size=chunk_size,
-                                notifications=notifications)  
-                                
-                start = start + increment
-                stop = stop + increment     
+        record_files([file_paths[i] for i in missing],
+                     [urls[i] for i in missing],
+                     [fnames[i] for i in missing])
                         
         print(f"GEFS0P50 {cat.upper()} Download Complete.")        
     else:
@@ -347,7 +361,8 @@ def gefs_0p50(cat='mean',
         if custom_directory == None:
             ds = process_gefs_data('gefs0p50', 
                                         cat,
-                                        members)
+                                        members,
+                                        max_workers=process_workers)
                     
             clear_idx_files('gefs0p50', 
                         cat, 
@@ -358,6 +373,9 @@ def gefs_0p50(cat='mean',
             
             gefs_post_processing.clear_gefs_idx_files(paths)
             
+        ds = subset_to_bbox(ds,
+                            bbox)
+
         if convert_temperature == True:
             ds = convert_temperature_units(ds, 
                                             convert_to,
@@ -459,7 +477,9 @@ def gefs_0p50_secondary_parameters(cat='mean',
              convert_to='celsius',
             custom_directory=None,
             chunk_size=8192,
-            notifications='off'):
+            notifications='off',
+            max_workers=8,
+            process_workers=1):
                         
     
     """
@@ -605,6 +625,12 @@ def gefs_0p50_secondary_parameters(cat='mean',
     
     19) notifications (String) - Default='off'. Notification when a file is downloaded and saved to {path}
     
+    20) max_workers (Integer) - Default=8. The maximum number of files downloaded at the same time.
+       Set max_workers=1 to download the files one at a time.
+    
+    21) process_workers (Integer) - Default=1. The number of worker processes that decode the ensemble members when cat='members'.
+        When 1, the members are opened lazily in this process. With more than one worker, each member is decoded in its own process
+        and every member is held in memory. Scripts that set process_workers > 1 must guard their entry point with if __name__ == '__main__':
     
     Returns
     -------
@@ -765,51 +791,47 @@ def gefs_0p50_secondary_parameters(cat='mean',
                                             members, 
                                             variables)
     
-    try:
-        download = local_file_scanner(paths[-1], 
-                                        filenames[-1],
-                                        'nomads',
-                                        run)
-    except Exception as e:
-        download = local_file_scanner(paths, 
-                                        filenames,
-                                        'nomads',
-                                        run)       
-    
-    if download == True:
+    if type(paths) == type('String'):
+        paths = [paths]
+    else:
+        pass
+    
+    # Each file is saved to the directory of its ensemble member
+    if cat != 'members' and cat != 'mean' and cat != 'spread':
+        file_paths = [paths[0]] * len(filenames)
+    else:
+        increment = int(len(filenames)/len(members))
+        file_paths = []
+        for path in paths:
+            file_paths = file_paths + [path] * increment
+    
+    fnames = [f"{filename}.grib2" for filename in filenames]
+    
+    missing = manifest_file_scanner(file_paths, 
+                                    urls,
+                                    fnames)
+    
+    # Files already downloaded for a larger bounding box of the same cycle are reused and subset to the requested bounding box
+    urls, bbox = reuse_cached_bbox(file_paths,
+                                   urls,
+                                   fnames,
+                                   missing)
+    
+    if len(missing) > 0:
         print(f"Downloading GEFS0P50 {cat.upper()} Secondary Parameters...")
-
-        try:
-            for path in paths:
-                for file in os.listdir(f"{path}"):
-                    os.remove(f"{path}/{file}")
-        except Exception as e:
-            pass        
-                    
-        if cat != 'members' and cat != 'mean' and cat != 'spread':
-            for path in paths:
-                for url, filename in zip(urls, filenames):
-                    client.get_gridded_data(f"{url}",
-                                path,
-                                f"{filename}.grib2",
-                                proxies=proxies,
-                                chunk_size=chunk_size,
-                                notifications=notifications)       
-        else:
-            start = 0
-            increment = int(len(filenames)/len(members))
-            stop = increment
-            for path in paths:
-                for u, f in zip(range(start, stop, 1), range(start, stop, 1)):
-                    client.get_gridded_data(f"{urls[u]}",
-                                path,
-                                f"{filenames[f]}.grib2",
-                                proxies=proxies,
-                                chunk_size=chunk_size,
-                                notifications=notifications)    
-                                
-                start = start + increment
-                stop = stop + increment            
+        
+        client.get_gridded_data_batch([urls[i] for i in missing],
+                    [file_paths[i] for i in missing],
+                    [fnames[i] for i in missing],
+                    proxies=proxies,
+                    chunk_size=chunk_size,
+                    notifications=notifications,
+                    max_workers=max_workers)
+        
+        record_files([file_paths[i] for i in missing],
+                     [urls[i] for i in missing],
+                     [fnames[i] for i in missing])
+                        
         print(f"GEFS0P50 {cat.upper()} Secondary Parameters Download Complete.")        
     else:
         print(f"GEFS0P50 {cat.upper()} Secondary Parameters Data is up to date. Skipping download...") 
@@ -821,7 +843,8 @@ def gefs_0p50_secondary_parameters(cat='mean',
         
             ds = process_gefs_secondary_parameters_data('gefs0p50 secondary parameters', 
                                         cat,
-                                        members)
+                                        members,
+                                        max_workers=process_workers)
             
             clear_idx_files('gefs0p50 secondary parameters', 
                         cat, 
@@ -832,6 +855,9 @@ def gefs_0p50_secondary_parameters(cat='mean',
             
             gefs_post_processing.clear_gefs_idx_files(paths)
         
+        ds = subset_to_bbox(ds,
+                            bbox)
+
         if convert_temperature == True:
             ds = convert_temperature_units(ds, 
                                            convert_to, 
@@ -894,7 +920,11 @@ def gefs_0p25(cat='mean',
              convert_to='celsius',
              custom_directory=None,
              chunk_size=8192,
-             notifications='off'):
+             notifications='off',
+             max_workers=8,
+             pipeline=False,
+             levels=None,
+             process_workers=1):
     
     """
     This function downloads the latest GEFS0P25 data for a region specified by the user
@@ -1002,11 +1032,27 @@ def gefs_0p25(cat='mean',
     
     19) notifications (String) - Default='off'. Notification when a file is downloaded and saved to {path}
     
+    20) max_workers (Integer) - Default=8. The maximum number of files downloaded at the same time.
+       Set max_workers=1 to download the files one at a time.
+       
+    21) pipeline (Boolean) - Default=False. When set to True (and process_data=True), each forecast hour is post-processed
+        as soon as it is downloaded (for every ensemble member when cat='members') while the later forecast hours are still downloading.
+        A generator is returned that yields each forecast hour as its own xarray.array in forecast hour order.
+        Use xarray.concat(list(ds), dim='step') to combine them. 
+    
+    22) levels (String List or None) - Default=None. The levels the user wishes to query in plain language
+        (i.e. ['500 mb', '2 m above ground', 'surface']). Only these levels are downloaded from the NOMADS GRIB filter.
+        When None, every level is downloaded.
+    
+    23) process_workers (Integer) - Default=1. The number of worker processes that decode the ensemble members when cat='members'.
+        When 1, the members are opened lazily in this process. With more than one worker, each member is decoded in its own process
+        and every member is held in memory. Scripts that set process_workers > 1 must guard their entry point with if __name__ == '__main__':
     
     Returns
     -------
     
-    An xarray data array of the GEFS0P25 data specified to the coordinate boundaries and variable list the user specifies. 
+    An xarray data array of the GEFS0P25 data specified to the coordinate boundaries and variable list the user specifies.
+    When pipeline=True, a generator of an xarray.array for each forecast hour. 
     
     GEFS0P25 files are saved to f:GEFS0P25/{cat} or in the case of ensemble members f:GEFS0P25/{cat}/{member}
     
@@ -1087,58 +1133,102 @@ def gefs_0p25(cat='mean',
                                             proxies, 
                                             step, 
                                             members,
-                                            variables)
+                                            variables,
+                                            levels=levels)
+    
+    if type(paths) == type('String'):
+        paths = [paths]
+    else:
+        pass
+    
+    # Each file is saved to the directory of its ensemble member
+    if cat != 'members':
+        file_paths = [paths[0]] * len(filenames)
+        number_of_members = 1
+    else:
+        increment = int(len(filenames)/len(members))
+        file_paths = []
+        for path in paths:
+            file_paths = file_paths + [path] * increment
+        number_of_members = len(members)
+    
+    fnames = [f"{filename}.grib2" for filename in filenames]
+    
+    missing = manifest_file_scanner(file_paths, 
+                                    urls,
+                                    fnames)
     
-    try:
-        download = local_file_scanner(paths[-1], 
-                                        filenames[-1],
-                                        'nomads',
-                                        run)
-    except Exception as e:
-        download = local_file_scanner(paths, 
-                                        filenames,
-                                        'nomads',
-                                        run)       
-    
-    if download == True:
+    # Files already downloaded for a larger bounding box of the same cycle are reused and subset to the requested bounding box
+    urls, bbox = reuse_cached_bbox(file_paths,
+                                   urls,
+                                   fnames,
+                                   missing)
+    
+    if len(missing) > 0:
         print(f"Downloading GEFS0P25 {cat.upper()}...")
-
-        try:
-            for path in paths:
-                for file in os.listdir(f"{path}"):
-                    os.remove(f"{path}/{file}")
-        except Exception as e:
-            pass
         
-        if cat != 'members':
-            for path in paths:
-                for url, filename in zip(urls, filenames):
-                    client.get_gridded_data(f"{url}",
-                                path,
-                                f"{filename}.grib2",
-                                proxies=proxies,
-                                chunk_size=chunk_size,
-                                notifications=notifications)    
+        if pipeline == True and process_data == True:
+            pass
         else:
-            start = 0
-            increment = int(len(filenames)/len(members))
-            stop = increment
-            for path in paths:
-                for u, f in zip(range(start, stop, 1), range(start, stop, 1)):
-                    client.get_gridded_data(f"{urls[u]}",
-                                path,
-                                f"{filenames[f]}.grib2",
-                                proxies=proxies,
-                                chunk_size=chunk_size,
-                                notifications=notifications)   
-                                
-                start = start + increment
-                stop = stop + increment            
-        print(f"GEFS0P25 {cat.upper()} Download Complete.")        
+            client.get_gridded_data_batch([urls[i] for i in missing],
+                        [file_paths[i] for i in missing],
+                        [fnames[i] for i in missing],
+                        proxies=proxies,
+                        chunk_size=chunk_size,
+                        notifications=notifications,
+                        max_workers=max_workers)
+            
+            record_files([file_paths[i] for i in missing],
+                         [urls[i] for i in missing],
+                         [fnames[i] for i in missing])
+            
+            print(f"GEFS0P25 {cat.upper()} Download Complete.")        
     else:
         print(f"GEFS0P25 {cat.upper()} Data is up to date. Skipping download...") 
         
-    if process_data == True:
+    if process_data == True and pipeline == True:
+        print(f"GEFS0P25 {cat.upper()} Data Processing (Pipelined)...")
+        
+        def process(files):
+            if custom_directory == None:
+                if cat == 'members':
+                    files = [[file] for file in files]
+                else:
+                    pass
+                ds = process_gefs_data('gefs0p25', 
+                                       cat,
+                                       members,
+                                       files=files)
+            elif cat == 'members' and len(paths) > 1:
+                ds = gefs_post_processing.primary_gefs_post_processing(paths,
+                                                                       files=[[file] for file in files])
+            else:
+                ds = gefs_post_processing.primary_gefs_post_processing(paths[0:1],
+                                                                       files=files)
+            
+            ds = subset_to_bbox(ds,
+                                bbox)
+
+            if convert_temperature == True:
+                ds = convert_temperature_units(ds, 
+                                               convert_to,
+                                               cat=cat)
+            else:
+                pass
+            return ds
+        
+        return download_and_process(urls,
+                                    file_paths,
+                                    fnames,
+                                    process,
+                                    missing=missing,
+                                    members=number_of_members,
+                                    proxies=proxies,
+                                    chunk_size=chunk_size,
+                                    notifications=notifications,
+                                    max_workers=max_workers)
+        
+    elif process_data == True:
         print(f"GEFS0P25 {cat.upper()} Data Processing...")
         
         clear_empty_files(paths)
@@ -1147,7 +1237,8 @@ def gefs_0p25(cat='mean',
         
             ds = process_gefs_data('gefs0p25', 
                                         cat,
-                                        members)
+                                        members,
+                                        max_workers=process_workers)
             
             clear_idx_files('gefs0p25', 
                         cat, 
@@ -1158,6 +1249,9 @@ def gefs_0p25(cat='mean',
             
             gefs_post_processing.clear_gefs_idx_files(paths)
         
+        ds = subset_to_bbox(ds,
+                            bbox)
+
         if convert_temperature == True:
             ds = convert_temperature_units(ds, 
                                            convert_to,
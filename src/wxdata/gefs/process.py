@@ -15,6 +15,8 @@ import metpy.calc as mpcalc
 warnings.filterwarnings('ignore')
 
 from wxdata.utils.coords import shift_longitude
+from wxdata.utils.index_cache import open_mfdataset
+from wxdata.utils.ensemble import open_ensemble_groups
 from wxdata.gefs.paths import(
     
     gefs_branch_path
@@ -25,7 +27,9 @@ logging.disable()
 
 def process_gefs_data(model,
                           cat,
-                          members):
+                          members,
+                          files=None,
+                          max_workers=1):
     
     """
     This function post-processes the GEFS (Primary) Parameters for GEFS0P50 and GEFS0P25. 
@@ -49,6 +53,17 @@ def process_gefs_data(model,
     members (List) - A list of the ensemble members the user wants to use. The GEFS has 30 ensemble members.
     IMPORTANT - The more members selected, the longer the processing time. 
     
+    Optional Arguments:
+    
+    1) files (List or None) - Default=None. The complete paths of the files to post-process (i.e. a single forecast hour).
+       For cat='members' this is a list of the files of each member in the same order as members.
+       When None, every file in the directory branch is post-processed.
+       
+    2) max_workers (Integer or None) - Default=1. The number of worker processes that decode the ensemble members when cat='members'.
+       When 1, the members are opened lazily in this process. With more than one worker, every member is decoded and held in memory
+       and the program must guard its entry point with if __name__ == '__main__': (see wxdata.utils.ensemble.open_ensemble_groups()).
+       A single forecast hour (files) is always opened in this process.
+    
     Returns
     -------
     
@@ -156,309 +171,87 @@ def process_gefs_data(model,
                                  members)
     if cat == 'members':
         
-        try:
-            ds_list_1 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds1 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'surface'})
-                ds1 = shift_longitude(ds1)
-                ds_list_1.append(ds1)
-        except Exception as e:
-            pass
-        try:
-            ds_list_2 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds2 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'meanSea'})
-                ds2 = shift_longitude(ds2)
-                ds_list_2.append(ds2)
-        except Exception as e:
-            pass                
-        try:
-            ds_list_3 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds3 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'depthBelowLandLayer'})
-                ds3 = shift_longitude(ds3)
-                ds_list_3.append(ds3)
-        except Exception as e:
-            pass                
-        try:
-            ds_list_4 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds4 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'heightAboveGround'})
-                ds4 = shift_longitude(ds4)
-                ds_list_4.append(ds4)
-        except Exception as e:
-            pass       
+        # A single forecast hour is opened while the later forecast hours are still downloading on other threads
+        # so worker processes are not started for each forecast hour
+        if files != None:
+            max_workers = 1
+        else:
+            pass
         
+        datasets = open_ensemble_groups(paths,
+                                        [{'typeOfLevel': 'surface'},
+                                         {'typeOfLevel': 'meanSea'},
+                                         {'typeOfLevel': 'depthBelowLandLayer'},
+                                         {'typeOfLevel': 'heightAboveGround'},
+                                         {'typeOfLevel': 'heightAboveGround', 'shortName':'10u'},
+                                         {'typeOfLevel': 'heightAboveGround', 'shortName':'10v'},
+                                         {'typeOfLevel': 'atmosphereSingleLayer'},
+                                         {'typeOfLevel': 'pressureFromGroundLayer'},
+                                         {'typeOfLevel': 'isobaricInhPa'},
+                                         {'typeOfLevel': 'isobaricInhPa', 'shortName':'t'},
+                                         {'typeOfLevel': 'isobaricInhPa', 'shortName':'r'},
+                                         {'typeOfLevel': 'isobaricInhPa', 'shortName':'u'},
+                                         {'typeOfLevel': 'isobaricInhPa', 'shortName':'v'},
+                                         {'typeOfLevel': 'heightAboveGroundLayer'}],
+                                        max_workers=max_workers,
+                                        files=files)
+
         try:
-            ds_list_5 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds5 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'10u'})
-                ds5 = shift_longitude(ds5)
-                ds_list_5.append(ds5)
-        except Exception as e:
-            pass  
-        
+            ds = datasets[0]
+        except Exception as e:
+            pass
         try:
-            ds_list_6 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds6 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'10v'})
-                ds6 = shift_longitude(ds6)
-                ds_list_6.append(ds6)
-        except Exception as e:
-            pass           
-
+            ds1 = datasets[1]
+        except Exception as e:
+            pass
         try:
-            ds_list_7 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds7 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'atmosphereSingleLayer'})
-                ds7 = shift_longitude(ds7)
-                ds_list_7.append(ds7)
+            ds2 = datasets[2]
         except Exception as e:
-            pass    
+            pass
         try:
-            ds_list_8 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds8 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer'})
-                ds8 = shift_longitude(ds8)
-                ds_list_8.append(ds8)
+            ds3 = datasets[3]
         except Exception as e:
-            pass    
+            pass
         try:
-            ds_list_9 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds9 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'isobaricInhPa'})
-                ds9 = shift_longitude(ds9)
-                ds_list_9.append(ds9)
+            ds4 = datasets[4]
         except Exception as e:
-            pass    
+            pass
         try:
-            ds_list_10 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds10 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'t'})
-                ds10 = shift_longitude(ds10)
-                ds_list_10.append(ds10)
+            ds5 = datasets[5]
         except Exception as e:
-            pass    
+            pass
         try:
-            ds_list_11 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds11 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'r'})
-                ds11 = shift_longitude(ds11)
-                ds_list_11.append(ds11)
+            ds6 = datasets[6]
         except Exception as e:
-            pass    
+            pass
         try:
-            ds_list_12 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds12 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'u'})
-                ds12 = shift_longitude(ds12)
-                ds_list_12.append(ds12)
+            ds7 = datasets[7]
         except Exception as e:
-            pass    
+            pass
         try:
-            ds_list_13 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds13 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'v'})
-                ds13 = shift_longitude(ds13)
-                ds_list_13.append(ds13)
-        except Exception as e:
-            pass   
-        
+            ds8 = datasets[8]
+        except Exception as e:
+            pass
         try:
-            ds_list_14 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds14 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer'})
-                ds14 = shift_longitude(ds14)
-                ds_list_14.append(ds14)
-        except Exception as e:
-            pass                       
-        
-
+            ds9 = datasets[9]
+        except Exception as e:
+            pass
         try:
-            ds = xr.concat(ds_list_1, 
-                           dim='number')
-        except Exception as e:
-            pass                
-        try:    
-            ds1 = xr.concat(ds_list_2, 
-                            dim='number')
-        except Exception as e:
-            pass                
-        try:            
-            ds2 = xr.concat(ds_list_3, 
-                            dim='number')
-        except Exception as e:
-            pass                
-        try:            
-            ds3 = xr.concat(ds_list_4, 
-                            dim='number')
-        except Exception as e:
-            pass                
-        try:            
-            ds4 = xr.concat(ds_list_5, 
-                            dim='number')
-        except Exception as e:
-            pass                
-        try:            
-            ds5 = xr.concat(ds_list_6, 
-                            dim='number')
-        except Exception as e:
-            pass                
-        try:            
-            ds6 = xr.concat(ds_list_7, 
-                            dim='number')
-        except Exception as e:
-            pass                
-        try:            
-            ds7 = xr.concat(ds_list_8, 
-                            dim='number')
-        except Exception as e:
-            pass                
-        try:            
-            ds8 = xr.concat(ds_list_9, 
-                            dim='number')
-        except Exception as e:
-            pass                
-        try:            
-            ds9 = xr.concat(ds_list_10, 
-                            dim='number')
-        except Exception as e:
-            pass                
-        try:            
-            ds10 = xr.concat(ds_list_11, 
-                             dim='number') 
+            ds10 = datasets[10]
         except Exception as e:
-            pass    
-        
-        try:            
-            ds11 = xr.concat(ds_list_12, 
-                             dim='number') 
+            pass
+        try:
+            ds11 = datasets[11]
         except Exception as e:
-            pass    
-        
-        try:            
-            ds12 = xr.concat(ds_list_13, 
-                             dim='number') 
+            pass
+        try:
+            ds12 = datasets[12]
         except Exception as e:
-            pass  
-        
-        try:            
-            ds13 = xr.concat(ds_list_14, 
-                             dim='number') 
+            pass
+        try:
+            ds13 = datasets[13]
         except Exception as e:
-            pass  
+            pass
         
         farther = False
         try:
@@ -514,178 +307,181 @@ def process_gefs_data(model,
 
         path = paths
         
-        file_pattern = f"{path}/*.grib2"
+        if files == None:
+            file_pattern = f"{path}/*.grib2"
+        else:
+            file_pattern = files
         
         try:
-            ds = xr.open_mfdataset(file_pattern, 
-                                   concat_dim='step', 
-                                   combine='nested', 
-                                   coords='minimal', 
-                                   engine='cfgrib', 
-                                   compat='override', 
-                                   decode_timedelta=False, 
-                                   filter_by_keys={'typeOfLevel': 'surface'})
+            ds = open_mfdataset(file_pattern, 
+                                concat_dim='step', 
+                                combine='nested', 
+                                coords='minimal', 
+                                engine='cfgrib', 
+                                compat='override', 
+                                decode_timedelta=False, 
+                                filter_by_keys={'typeOfLevel': 'surface'})
             ds = shift_longitude(ds)
         except Exception as e:
             pass
 
         try:        
-            ds1 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'meanSea'})
+            ds1 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'meanSea'})
             ds1 = shift_longitude(ds1)
         except Exception as e:
             pass
 
         try: 
-            ds2 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'depthBelowLandLayer'})
+            ds2 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'depthBelowLandLayer'})
             ds2 = shift_longitude(ds2)
         except Exception as e:
             pass
         try: 
-            ds3 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'heightAboveGround'})
+            ds3 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'heightAboveGround'})
             ds3 = shift_longitude(ds3)
         except Exception as e:
             pass
         try: 
-            ds4 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False,
-                                    filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'10u'})
+            ds4 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False,
+                                 filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'10u'})
             ds4 = shift_longitude(ds4)
         except Exception as e:
             pass
         
         try: 
-            ds5 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'10v'})
+            ds5 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'10v'})
             ds5 = shift_longitude(ds5)
         except Exception as e:
             pass
         
         try: 
-            ds6 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'atmosphereSingleLayer'})
+            ds6 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'atmosphereSingleLayer'})
             ds6 = shift_longitude(ds6)
         except Exception as e:
             pass            
         try: 
-            ds7 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested',
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer'})
+            ds7 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested',
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer'})
             ds7 = shift_longitude(ds7)
         except Exception as e:
             pass
         try: 
-            ds8 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'isobaricInhPa'})
+            ds8 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'isobaricInhPa'})
             ds8 = shift_longitude(ds8)
         except Exception as e:
             pass
         try: 
-            ds9 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'t'})
+            ds9 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'t'})
             ds9 = shift_longitude(ds9)
         except Exception as e:
             pass
         try: 
-            ds10 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'r'})
+            ds10 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'r'})
             ds10 = shift_longitude(ds10)
         except Exception as e:
             pass
         try: 
-            ds11 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'u'})
+            ds11 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'u'})
             ds11 = shift_longitude(ds11)
         except Exception as e:
             pass
         try: 
-            ds12 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'v'})
+            ds12 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'v'})
             ds12 = shift_longitude(ds12)
         except Exception as e:
             pass     
         
         try: 
-            ds13 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer'})
+            ds13 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer'})
             ds13 = shift_longitude(ds13)
         except Exception as e:
             pass       
@@ -915,7 +711,8 @@ def process_gefs_data(model,
 
 def process_gefs_secondary_parameters_data(model,
                           cat,
-                          members):
+                          members,
+                          max_workers=1):
     
     
     """
@@ -938,6 +735,12 @@ def process_gefs_secondary_parameters_data(model,
     members (List) - A list of the ensemble members the user wants to use. The GEFS has 30 ensemble members.
     IMPORTANT - The more members selected, the longer the processing time. 
     
+    Optional Arguments:
+    
+    1) max_workers (Integer or None) - Default=1. The number of worker processes that decode the ensemble members when cat='members'.
+       When 1, the members are opened lazily in this process. With more than one worker, every member is decoded and held in memory
+       and the program must guard its entry point with if __name__ == '__main__': (see wxdata.utils.ensemble.open_ensemble_groups()).
+    
     Returns
     -------
     
@@ -1069,1593 +872,826 @@ def process_gefs_secondary_parameters_data(model,
         file_pattern = f"{path}/*.grib2"
         
         try:
-            ds = xr.open_mfdataset(file_pattern, 
-                                   concat_dim='step', 
-                                   combine='nested', 
-                                   coords='minimal', 
-                                   engine='cfgrib', 
-                                   compat='override',
-                                   decode_timedelta=False,
-                                   filter_by_keys={'typeOfLevel': 'surface'})
+            ds = open_mfdataset(file_pattern, 
+                                concat_dim='step', 
+                                combine='nested', 
+                                coords='minimal', 
+                                engine='cfgrib', 
+                                compat='override',
+                                decode_timedelta=False,
+                                filter_by_keys={'typeOfLevel': 'surface'})
             ds = shift_longitude(ds)
         except Exception as e:
             pass    
         try:        
-            ds1 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False,
-                                    filter_by_keys={'typeOfLevel': 'meanSea'})
+            ds1 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False,
+                                 filter_by_keys={'typeOfLevel': 'meanSea'})
             ds1 = shift_longitude(ds1) 
         except Exception as e:
             pass        
         try:        
-            ds2 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal',
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'planetaryBoundaryLayer'})
+            ds2 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal',
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'planetaryBoundaryLayer'})
             ds2 = shift_longitude(ds2)
         except Exception as e:
             pass          
         try:        
-            ds3 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step',
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False,
-                                    filter_by_keys={'typeOfLevel': 'isobaricInhPa'})
+            ds3 = open_mfdataset(file_pattern, 
+                                 concat_dim='step',
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False,
+                                 filter_by_keys={'typeOfLevel': 'isobaricInhPa'})
             ds3 = shift_longitude(ds3)  
         except Exception as e:
             pass        
         try:        
-            ds4 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step',
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'t'})
+            ds4 = open_mfdataset(file_pattern, 
+                                 concat_dim='step',
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'t'})
             ds4 = shift_longitude(ds4)
         except Exception as e:
             pass                    
         try:        
-            ds5 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override',
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'w'})
+            ds5 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override',
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'w'})
             ds5 = shift_longitude(ds5)
         except Exception as e:
             pass        
         try:        
-            ds6 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested',
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'u'})
+            ds6 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested',
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'u'})
             ds6 = shift_longitude(ds6)
         except Exception as e:
             pass        
         try:        
-            ds7 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step',
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'v'})
+            ds7 = open_mfdataset(file_pattern, 
+                                 concat_dim='step',
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'v'})
             ds7 = shift_longitude(ds7)
         except Exception as e:
             pass        
         try:        
-            ds8 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override',
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'o3mr'})
+            ds8 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override',
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'o3mr'})
             ds8 = shift_longitude(ds8)
         except Exception as e:
             pass        
         try:        
-            ds9 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'absv'})
+            ds9 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'absv'})
             ds9 = shift_longitude(ds9)
         except Exception as e:
             pass        
         try:        
-            ds10 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal',
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'clwmr'})
+            ds10 = open_mfdataset(file_pattern,
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal',
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'clwmr'})
             ds10 = shift_longitude(ds10)
         except Exception as e:
             pass        
         try:        
-            ds12 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'ICSEV'})
+            ds12 = open_mfdataset(file_pattern,
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'ICSEV'})
             ds12 = shift_longitude(ds12)
         except Exception as e:
             pass        
         try:        
-            ds13 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal',
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'tcc'})
+            ds13 = open_mfdataset(file_pattern,
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal',
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'tcc'})
             ds13 = shift_longitude(ds13)
         except Exception as e:
             pass        
         try:        
-            ds14 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'r'})
+            ds14 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'r'})
             ds14 = shift_longitude(ds14) 
         except Exception as e:
             pass        
         try:        
-            ds15 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'depthBelowLandLayer'})
+            ds15 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'depthBelowLandLayer'})
             ds15 = shift_longitude(ds15)
         except Exception as e:
             pass        
         try:        
-            ds16 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'depthBelowLandLayer', 'shortName':'st'})
+            ds16 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'depthBelowLandLayer', 'shortName':'st'})
             ds16 = shift_longitude(ds16)
         except Exception as e:
             pass        
         try:        
-            ds17 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'depthBelowLandLayer', 'shortName':'soilw'})
+            ds17 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'depthBelowLandLayer', 'shortName':'soilw'})
             ds17 = shift_longitude(ds17)
         except Exception as e:
             pass        
         try:        
-            ds18 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib',
-                                     compat='override',
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'heightAboveGround'})
+            ds18 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib',
+                                  compat='override',
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'heightAboveGround'})
             ds18 = shift_longitude(ds18)
         except Exception as e:
             pass        
         try:        
-            ds19 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'q'})
+            ds19 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'q'})
             ds19 = shift_longitude(ds19)
         except Exception as e:
             pass        
         try:        
-            ds20 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'t'})
+            ds20 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'t'})
             ds20 = shift_longitude(ds20)
         except Exception as e:
             pass        
         try:        
-            ds21 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'pres'})
+            ds21 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'pres'})
             ds21 = shift_longitude(ds21)
         except Exception as e:
             pass        
         try:        
-            ds22 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'u'})
+            ds22 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'u'})
             ds22= shift_longitude(ds22)
         except Exception as e:
             pass        
         try:        
-            ds23 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'v'})
+            ds23 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'v'})
             ds23 = shift_longitude(ds23)
         except Exception as e:
             pass        
         try:        
-            ds24 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'atmosphereSingleLayer'})
+            ds24 = open_mfdataset(file_pattern,
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'atmosphereSingleLayer'})
             ds24 = shift_longitude(ds24)
         except Exception as e:
             pass        
         try:        
-            ds25 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'cloudCeiling'})
+            ds25 = open_mfdataset(file_pattern,
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'cloudCeiling'})
             ds25 = shift_longitude(ds25)
         except Exception as e:
             pass        
         try:        
-            ds26 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'nominalTop'})
+            ds26 = open_mfdataset(file_pattern,
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'nominalTop'})
             ds26 = shift_longitude(ds26)
         except Exception as e:
             pass        
         try:        
-            ds27 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib',
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer'})
+            ds27 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib',
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer'})
             ds27 = shift_longitude(ds27)
         except Exception as e:
             pass        
         try:        
-            ds28 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer', 'shortName':'ustm'})
+            ds28 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer', 'shortName':'ustm'})
             ds28 = shift_longitude(ds28)
         except Exception as e:
             pass        
         try:        
-            ds29 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal',
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer', 'shortName':'vstm'})
+            ds29 = open_mfdataset(file_pattern,
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal',
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer', 'shortName':'vstm'})
             ds29 = shift_longitude(ds29)
         except Exception as e:
             pass        
         try:        
-            ds30 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'tropopause'})
+            ds30 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'tropopause'})
             ds30 = shift_longitude(ds30)
         except Exception as e:
             pass        
         try:        
-            ds31 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'maxWind'})
+            ds31 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'maxWind'})
             ds31 = shift_longitude(ds31)
         except Exception as e:
             pass        
         try:        
-            ds32 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal',
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'isothermZero'})
+            ds32 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal',
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'isothermZero'})
             ds32 = shift_longitude(ds32)
         except Exception as e:
             pass        
         try:        
-            ds33 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override',
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'highestTroposphericFreezing'})
+            ds33 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override',
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'highestTroposphericFreezing'})
             ds33 = shift_longitude(ds33)
         except Exception as e:
             pass        
         try:        
-            ds34 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal',
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'sigmaLayer'})
+            ds34 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal',
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'sigmaLayer'})
             ds34 = shift_longitude(ds33)
         except Exception as e:
             pass        
         try:        
-            ds35 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'sigma'})
+            ds35 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'sigma'})
             ds35 = shift_longitude(ds35)
         except Exception as e:
             pass        
         try:        
-            ds36 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal',
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'theta'})
+            ds36 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal',
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'theta'})
             ds36 = shift_longitude(ds36)
         except Exception as e:
             pass        
         try:        
-            ds37 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step', 
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib',
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'theta', 'shortName':'u'})
+            ds37 = open_mfdataset(file_pattern,
+                                  concat_dim='step', 
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib',
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'theta', 'shortName':'u'})
             ds37 = shift_longitude(ds37)
         except Exception as e:
             pass        
         try:        
-            ds38 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'theta', 'shortName':'v'})
+            ds38 = open_mfdataset(file_pattern,
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'theta', 'shortName':'v'})
             ds38 = shift_longitude(ds38)
         except Exception as e:
             pass        
         try:        
-            ds39 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib',
-                                     compat='override',
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'theta', 'shortName':'t'})
+            ds39 = open_mfdataset(file_pattern,
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib',
+                                  compat='override',
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'theta', 'shortName':'t'})
             ds39 = shift_longitude(ds39)
         except Exception as e:
             pass        
         try:        
-            ds40 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'theta', 'shortName':'mont'})
+            ds40 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'theta', 'shortName':'mont'})
             ds40 = shift_longitude(ds40)
         except Exception as e:
             pass        
         try:        
-            ds41 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'potentialVorticity'})
+            ds41 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'potentialVorticity'})
             ds41 = shift_longitude(ds41)
         except Exception as e:
             pass        
         try:        
-            ds42 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override',
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer'})
+            ds42 = open_mfdataset(file_pattern,
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override',
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer'})
             ds42 = shift_longitude(ds42)
         except Exception as e:
             pass        
         try:        
-            ds43 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'dpt'})
+            ds43 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'dpt'})
             ds43 = shift_longitude(ds43)
         except Exception as e:
             pass        
         try:        
-            ds44 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'pwat'})
+            ds44 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'pwat'})
             ds44 = shift_longitude(ds44)
         except Exception as e:
             pass        
         try:        
-            ds45 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'pli'})
+            ds45 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'pli'})
             ds45 = shift_longitude(ds45)
         except Exception as e:
             pass        
         try:        
-            ds46 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'cape'})
+            ds46 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'cape'})
             ds46 = shift_longitude(ds46)
         except Exception as e:
             pass        
         try:        
-            ds47 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'cin'})
+            ds47 = open_mfdataset(file_pattern,
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'cin'})
             ds47 = shift_longitude(ds47)
         except Exception as e:
             pass        
         try:        
-            ds48 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib',
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'plpl'})
+            ds48 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib',
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'plpl'})
             ds48 = shift_longitude(ds48)
         except Exception as e:
             pass        
         
     else:
+        datasets = open_ensemble_groups(paths,
+                                        [{'typeOfLevel': 'surface'},
+                                         {'typeOfLevel': 'meanSea'},
+                                         {'typeOfLevel': 'planetaryBoundaryLayer'},
+                                         {'typeOfLevel': 'isobaricInhPa'},
+                                         {'typeOfLevel': 'isobaricInhPa', 'shortName':'t'},
+                                         {'typeOfLevel': 'isobaricInhPa', 'shortName':'w'},
+                                         {'typeOfLevel': 'isobaricInhPa', 'shortName':'u'},
+                                         {'typeOfLevel': 'isobaricInhPa', 'shortName':'v'},
+                                         {'typeOfLevel': 'isobaricInhPa', 'shortName':'o3mr'},
+                                         {'typeOfLevel': 'isobaricInhPa', 'shortName':'absv'},
+                                         {'typeOfLevel': 'isobaricInhPa', 'shortName':'clwmr'},
+                                         {'typeOfLevel': 'isobaricInhPa', 'shortName':'ICSEV'},
+                                         {'typeOfLevel': 'isobaricInhPa', 'shortName':'tcc'},
+                                         {'typeOfLevel': 'isobaricInhPa', 'shortName':'r'},
+                                         {'typeOfLevel': 'depthBelowLandLayer'},
+                                         {'typeOfLevel': 'depthBelowLandLayer', 'shortName':'st'},
+                                         {'typeOfLevel': 'depthBelowLandLayer', 'shortName':'soilw'},
+                                         {'typeOfLevel': 'heightAboveGround'},
+                                         {'typeOfLevel': 'heightAboveGround', 'shortName':'q'},
+                                         {'typeOfLevel': 'heightAboveGround', 'shortName':'t'},
+                                         {'typeOfLevel': 'heightAboveGround', 'shortName':'pres'},
+                                         {'typeOfLevel': 'heightAboveGround', 'shortName':'u'},
+                                         {'typeOfLevel': 'heightAboveGround', 'shortName':'v'},
+                                         {'typeOfLevel': 'atmosphereSingleLayer'},
+                                         {'typeOfLevel': 'cloudCeiling'},
+                                         {'typeOfLevel': 'nominalTop'},
+                                         {'typeOfLevel': 'heightAboveGroundLayer'},
+                                         {'typeOfLevel': 'heightAboveGroundLayer', 'shortName':'ustm'},
+                                         {'typeOfLevel': 'heightAboveGroundLayer', 'shortName':'vstm'},
+                                         {'typeOfLevel': 'tropopause'},
+                                         {'typeOfLevel': 'maxWind'},
+                                         {'typeOfLevel': 'isothermZero'},
+                                         {'typeOfLevel': 'highestTroposphericFreezing'},
+                                         {'typeOfLevel': 'sigmaLayer'},
+                                         {'typeOfLevel': 'sigma'},
+                                         {'typeOfLevel': 'theta'},
+                                         {'typeOfLevel': 'theta', 'shortName':'u'},
+                                         {'typeOfLevel': 'theta', 'shortName':'v'},
+                                         {'typeOfLevel': 'theta', 'shortName':'t'},
+                                         {'typeOfLevel': 'theta', 'shortName':'mont'},
+                                         {'typeOfLevel': 'potentialVorticity'},
+                                         {'typeOfLevel': 'pressureFromGroundLayer'},
+                                         {'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'dpt'},
+                                         {'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'pwat'},
+                                         {'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'pli'},
+                                         {'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'cape'},
+                                         {'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'cin'},
+                                         {'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'plpl'}],
+                                        max_workers=max_workers)
+
         try:
-            ds_list_1 = []      
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds = xr.open_mfdataset(file_pattern, 
-                                       concat_dim='step',
-                                       combine='nested',
-                                       coords='minimal', 
-                                       engine='cfgrib', 
-                                       compat='override', 
-                                       decode_timedelta=False,
-                                       filter_by_keys={'typeOfLevel': 'surface'})
-                ds = shift_longitude(ds)
-                ds_list_1.append(ds)
-        except Exception as e:
-            pass           
-        try:
-            ds_list_2 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds1 = xr.open_mfdataset(file_pattern,
-                                        concat_dim='step',
-                                        combine='nested',
-                                        coords='minimal',
-                                        engine='cfgrib', 
-                                        compat='override',
-                                        decode_timedelta=False,
-                                        filter_by_keys={'typeOfLevel': 'meanSea'})
-                ds1 = shift_longitude(ds1) 
-                ds_list_2.append(ds1)
-        except Exception as e:
-            pass                   
-        try:
-            ds_list_3 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds2 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step',
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False,
-                                        filter_by_keys={'typeOfLevel': 'planetaryBoundaryLayer'})
-                ds2 = shift_longitude(ds2)
-                ds_list_3.append(ds2)
-        except Exception as e:
-            pass           
-        try:
-            ds_list_4 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds3 = xr.open_mfdataset(file_pattern,
-                                        concat_dim='step',
-                                        combine='nested',
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override',
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'isobaricInhPa'})
-                ds3 = shift_longitude(ds3)
-                ds_list_4.append(ds3)  
-        except Exception as e:
-            pass           
-        try:
-            ds_list_5 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds4 = xr.open_mfdataset(file_pattern,
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False,
-                                        filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'t'})
-                ds4 = shift_longitude(ds4)
-                ds_list_5.append(ds4)
-        except Exception as e:
-            pass           
-        try:            
-            ds_list_6 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds5 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'w'})
-                ds5 = shift_longitude(ds5)
-                ds_list_6.append(ds5)
-        except Exception as e:
-            pass           
-        try:
-            ds_list_7 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds6 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step',
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'u'})
-                ds6 = shift_longitude(ds6)
-                ds_list_7.append(ds6)  
-        except Exception as e:
-            pass           
-        try:
-            ds_list_8 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds7 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step',
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False,
-                                        filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'v'})
-                ds7 = shift_longitude(ds7)
-                ds_list_8.append(ds7)
-        except Exception as e:
-            pass           
-        try:
-            ds_list_9 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds8 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step',
-                                        combine='nested', 
-                                        coords='minimal',
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False,
-                                        filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'o3mr'})
-                ds8 = shift_longitude(ds8)
-                ds_list_9.append(ds8) 
-        except Exception as e:
-            pass           
-        try:
-            ds_list_10 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds9 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step',
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False,
-                                        filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'absv'})
-                ds9 = shift_longitude(ds9)
-                ds_list_10.append(ds9)
-        except Exception as e:
-            pass           
-        try:
-            ds_list_11 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds10 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'clwmr'})
-                ds10 = shift_longitude(ds10)
-                ds_list_11.append(ds10)  
-        except Exception as e:
-            pass           
-        try:
-            ds_list_12 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds12 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'ICSEV'})
-                ds12 = shift_longitude(ds12)
-                ds_list_12.append(ds12) 
-        except Exception as e:
-            pass           
-        try:
-            ds_list_13 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds13 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib',
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'tcc'})
-                ds13 = shift_longitude(ds13)
-                ds_list_13.append(ds13)
-        except Exception as e:
-            pass           
-        try:
-            ds_list_14 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds14 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal',
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'r'})
-                ds14 = shift_longitude(ds14)
-                ds_list_14.append(ds14)
-        except Exception as e:
-            pass           
-        try:
-            ds_list_15 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds15 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal',
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'depthBelowLandLayer'})
-                ds15 = shift_longitude(ds15)
-                ds_list_15.append(ds15) 
-        except Exception as e:
-            pass           
-        try:
-            ds_list_16 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds16 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'depthBelowLandLayer', 'shortName':'st'})
-                ds16 = shift_longitude(ds16)
-                ds_list_16.append(ds16)
-        except Exception as e:
-            pass           
-        try:
-            ds_list_17 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds17 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'depthBelowLandLayer', 'shortName':'soilw'})
-                ds17 = shift_longitude(ds17)
-                ds_list_17.append(ds17)
-        except Exception as e:
-            pass           
-        try:
-            ds_list_18 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds18 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step', 
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGround'})
-                ds18 = shift_longitude(ds18)
-                ds_list_18.append(ds18)
-        except Exception as e:
-            pass           
-        try:
-            ds_list_19 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds19 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib',
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'q'})
-                ds19 = shift_longitude(ds19)
-                ds_list_19.append(ds19)                
-        except Exception as e:
-            pass           
-        try:
-            ds_list_20 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds20 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal',
-                                         engine='cfgrib',
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'t'})
-                ds20 = shift_longitude(ds20)
-                ds_list_20.append(ds20)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_21 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds21 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'pres'})
-                ds21 = shift_longitude(ds21) 
-                ds_list_21.append(ds21)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_22 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds22 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'u'})
-                ds22 = shift_longitude(ds22)
-                ds_list_22.append(ds22)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_23 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds23 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal',
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'v'})
-                ds23 = shift_longitude(ds23)
-                ds_list_23.append(ds23)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_24 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds24 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'atmosphereSingleLayer'})
-                ds24 = shift_longitude(ds24)
-                ds_list_24.append(ds24)
-        except Exception as e:
-            pass   
-        try:
-            ds_list_25= []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds25 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'cloudCeiling'})
-                ds25 = shift_longitude(ds25)
-                ds_list_25.append(ds25)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_26 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds26 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal',
-                                         engine='cfgrib',
-                                         compat='override',
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'nominalTop'})
-                ds26 = shift_longitude(ds26)
-                ds_list_26.append(ds26)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_27 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds27 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal',
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer'})
-                ds27 = shift_longitude(ds27)
-                ds_list_27.append(ds27)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_28 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds28 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal',
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer', 'shortName':'ustm'})
-                ds28 = shift_longitude(ds28)
-                ds_list_28.append(ds28)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_29 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds29 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer', 'shortName':'vstm'})
-                ds29 = shift_longitude(ds29) 
-                ds_list_29.append(ds29)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_30 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds30 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'tropopause'})
-                ds30 = shift_longitude(ds30)
-                ds_list_30.append(ds30)
-        except Exception as e:
-            pass   
-        try:
-            ds_list_31 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds31 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal',
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'maxWind'})
-                ds31 = shift_longitude(ds31)
-                ds_list_31.append(ds31)
-        except Exception as e:
-            pass           
-        try:
-            ds_list_32 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds32 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'isothermZero'})
-                ds32 = shift_longitude(ds32)
-                ds_list_32.append(ds32)
-        except Exception as e:
-            pass   
-        try:
-            ds_list_33 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds33 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'highestTroposphericFreezing'})
-                ds33 = shift_longitude(ds33)
-                ds_list_33.append(ds33)  
-        except Exception as e:
-            pass           
-        try:
-            ds_list_34 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds34 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib',
-                                         compat='override', 
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'sigmaLayer'})
-                ds34 = shift_longitude(ds33)
-                ds_list_34.append(ds34)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_35 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds35 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'sigma'})
-                ds35 = shift_longitude(ds35)
-                ds_list_35.append(ds35)
-        except Exception as e:
-            pass           
-        try:
-            ds_list_36 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds36 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'theta'})
-                ds36 = shift_longitude(ds36)
-                ds_list_36.append(ds36)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_37 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds37 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'theta', 'shortName':'u'})
-                ds37 = shift_longitude(ds37)
-                ds_list_37.append(ds37)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_38 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds38 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib',
-                                         compat='override',
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'theta', 'shortName':'v'})
-                ds38 = shift_longitude(ds38)
-                ds_list_38.append(ds38)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_39 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds39 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'theta', 'shortName':'t'})
-                ds39 = shift_longitude(ds39)
-                ds_list_39.append(ds39)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_40 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds40 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'theta', 'shortName':'mont'})
-                ds40 = shift_longitude(ds40)
-                ds_list_40.append(ds40)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_41 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds41 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'potentialVorticity'})
-                ds41 = shift_longitude(ds41)
-                ds_list_41.append(ds41)
-        except Exception as e:
-            pass           
-        try:
-            ds_list_42 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds42 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer'})
-                ds42 = shift_longitude(ds42)
-                ds_list_42.append(ds42)
-        except Exception as e:
-            pass           
-        try:
-            ds_list_43 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds43 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal',
-                                         engine='cfgrib',
-                                         compat='override',
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'dpt'})
-                ds43 = shift_longitude(ds43)
-                ds_list_43.append(ds43)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_44 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds44 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'pwat'})
-                ds44 = shift_longitude(ds44)
-                ds_list_44.append(ds44)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_45 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds45 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'pli'})
-                ds45 = shift_longitude(ds45)
-                ds_list_45.append(ds45)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_46 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds46 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal',
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'cape'})
-                ds46 = shift_longitude(ds46)
-                ds_list_46.append(ds46)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_47 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds47 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'cin'})
-                ds47 = shift_longitude(ds47)
-                ds_list_47.append(ds47)            
-        except Exception as e:
-            pass           
-        try:
-            ds_list_48 = []
-            for path in paths:
-                file_pattern = f"{path}/*.grib2"
-                ds48 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'plpl'})
-                ds48 = shift_longitude(ds48)
-                ds_list_48.append(ds48) 
-        except Exception as e:
-            pass           
-    
-        try:    
-            ds = xr.concat(ds_list_1,
-                           dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds1 = xr.concat(ds_list_2,
-                            dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds2 = xr.concat(ds_list_3,
-                            dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds3 = xr.concat(ds_list_4,
-                            dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds4 = xr.concat(ds_list_5,
-                            dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds5 = xr.concat(ds_list_6,
-                            dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds6 = xr.concat(ds_list_7,
-                            dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds7 = xr.concat(ds_list_8,
-                            dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds8 = xr.concat(ds_list_9,
-                            dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds9 = xr.concat(ds_list_10, 
-                            dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds10 = xr.concat(ds_list_11,
-                             dim='number')
-        except Exception as e:
-            pass           
-        try:        
-            ds12 = xr.concat(ds_list_12,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds13 = xr.concat(ds_list_13, 
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds14 = xr.concat(ds_list_14, 
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds15 = xr.concat(ds_list_15,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds16 = xr.concat(ds_list_16,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds17 = xr.concat(ds_list_17,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds18 = xr.concat(ds_list_18, 
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds19 = xr.concat(ds_list_19, 
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds20 = xr.concat(ds_list_20,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds21 = xr.concat(ds_list_21, 
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds22 = xr.concat(ds_list_22, 
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds23 = xr.concat(ds_list_23,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds24 = xr.concat(ds_list_24,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds25 = xr.concat(ds_list_25,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds26 = xr.concat(ds_list_26,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds27 = xr.concat(ds_list_27,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds28 = xr.concat(ds_list_28,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds29 = xr.concat(ds_list_29,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds30 = xr.concat(ds_list_30,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds31 = xr.concat(ds_list_31,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds32 = xr.concat(ds_list_32,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds33 = xr.concat(ds_list_33,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds34 = xr.concat(ds_list_34, 
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds35 = xr.concat(ds_list_35, 
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds36 = xr.concat(ds_list_36,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds37 = xr.concat(ds_list_37,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds38 = xr.concat(ds_list_38,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds39 = xr.concat(ds_list_39,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds40 = xr.concat(ds_list_40, 
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds41 = xr.concat(ds_list_41, 
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds42 = xr.concat(ds_list_42, 
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds43 = xr.concat(ds_list_43,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds44 = xr.concat(ds_list_44, 
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds45 = xr.concat(ds_list_45,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds46 = xr.concat(ds_list_46,
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:            
-            ds47 = xr.concat(ds_list_47, 
-                             dim='number')
-        except Exception as e:
-            pass               
-        try:
-            ds48 = xr.concat(ds_list_48,
-                             dim='number')
-        except Exception as e:
-            pass                           
-        
-        
+            ds = datasets[0]
+        except Exception as e:
+            pass
+        try:
+            ds1 = datasets[1]
+        except Exception as e:
+            pass
+        try:
+            ds2 = datasets[2]
+        except Exception as e:
+            pass
+        try:
+            ds3 = datasets[3]
+        except Exception as e:
+            pass
+        try:
+            ds4 = datasets[4]
+        except Exception as e:
+            pass
+        try:
+            ds5 = datasets[5]
+        except Exception as e:
+            pass
+        try:
+            ds6 = datasets[6]
+        except Exception as e:
+            pass
+        try:
+            ds7 = datasets[7]
+        except Exception as e:
+            pass
+        try:
+            ds8 = datasets[8]
+        except Exception as e:
+            pass
+        try:
+            ds9 = datasets[9]
+        except Exception as e:
+            pass
+        try:
+            ds10 = datasets[10]
+        except Exception as e:
+            pass
+        try:
+            ds12 = datasets[11]
+        except Exception as e:
+            pass
+        try:
+            ds13 = datasets[12]
+        except Exception as e:
+            pass
+        try:
+            ds14 = datasets[13]
+        except Exception as e:
+            pass
+        try:
+            ds15 = datasets[14]
+        except Exception as e:
+            pass
+        try:
+            ds16 = datasets[15]
+        except Exception as e:
+            pass
+        try:
+            ds17 = datasets[16]
+        except Exception as e:
+            pass
+        try:
+            ds18 = datasets[17]
+        except Exception as e:
+            pass
+        try:
+            ds19 = datasets[18]
+        except Exception as e:
+            pass
+        try:
+            ds20 = datasets[19]
+        except Exception as e:
+            pass
+        try:
+            ds21 = datasets[20]
+        except Exception as e:
+            pass
+        try:
+            ds22 = datasets[21]
+        except Exception as e:
+            pass
+        try:
+            ds23 = datasets[22]
+        except Exception as e:
+            pass
+        try:
+            ds24 = datasets[23]
+        except Exception as e:
+            pass
+        try:
+            ds25 = datasets[24]
+        except Exception as e:
+            pass
+        try:
+            ds26 = datasets[25]
+        except Exception as e:
+            pass
+        try:
+            ds27 = datasets[26]
+        except Exception as e:
+            pass
+        try:
+            ds28 = datasets[27]
+        except Exception as e:
+            pass
+        try:
+            ds29 = datasets[28]
+        except Exception as e:
+            pass
+        try:
+            ds30 = datasets[29]
+        except Exception as e:
+            pass
+        try:
+            ds31 = datasets[30]
+        except Exception as e:
+            pass
+        try:
+            ds32 = datasets[31]
+        except Exception as e:
+            pass
+        try:
+            ds33 = datasets[32]
+        except Exception as e:
+            pass
+        try:
+            ds34 = datasets[33]
+        except Exception as e:
+            pass
+        try:
+            ds35 = datasets[34]
+        except Exception as e:
+            pass
+        try:
+            ds36 = datasets[35]
+        except Exception as e:
+            pass
+        try:
+            ds37 = datasets[36]
+        except Exception as e:
+            pass
+        try:
+            ds38 = datasets[37]
+        except Exception as e:
+            pass
+        try:
+            ds39 = datasets[38]
+        except Exception as e:
+            pass
+        try:
+            ds40 = datasets[39]
+        except Exception as e:
+            pass
+        try:
+            ds41 = datasets[40]
+        except Exception as e:
+            pass
+        try:
+            ds42 = datasets[41]
+        except Exception as e:
+            pass
+        try:
+            ds43 = datasets[42]
+        except Exception as e:
+            pass
+        try:
+            ds44 = datasets[43]
+        except Exception as e:
+            pass
+        try:
+            ds45 = datasets[44]
+        except Exception as e:
+            pass
+        try:
+            ds46 = datasets[45]
+        except Exception as e:
+            pass
+        try:
+            ds47 = datasets[46]
+        except Exception as e:
+            pass
+        try:
+            ds48 = datasets[47]
+        except Exception as e:
+            pass
+
     try:
         ds['surface_temperature'] = ds['t']
         ds = ds.drop_vars('t')
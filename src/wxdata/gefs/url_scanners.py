@@ -6,12 +6,13 @@ These functions return the URL and filename for the latest available data on the
 (C) Eric J. Drewitz 2025
 """
 
-import requests
-import sys
 import numpy as np
 
 from urllib.parse import urlparse, parse_qs
 from wxdata.utils.coords import convert_lon
+from wxdata.client.scanner import(
+    probe_runs
+)
 from wxdata.gefs.exception_messages import(
     
     gefs0p50,
@@ -21,7 +22,8 @@ from wxdata.gefs.exception_messages import(
 from wxdata.utils.nomads_gribfilter import(
     
     result_string,
-    key_list
+    key_list,
+    level_string
 )
 
 # Exception handling for Python >= 3.13 and Python < 3.13
@@ -30,18 +32,6 @@ try:
 except Exception as e:
     from datetime import datetime, timedelta
 
-# Gets current time in UTC
-try:
-    now = datetime.now(UTC)
-except Exception as e:
-    now = datetime.utcnow()
-
-# Gets local time
-local = datetime.now()
-
-# Gets yesterday's date
-yd = now - timedelta(days=1)
-
 def gefs_0p50_url_scanner(cat, 
                           final_forecast_hour, 
                           western_bound, 
@@ -51,7 +41,8 @@ def gefs_0p50_url_scanner(cat,
                           proxies, 
                           step, 
                           members,
-                          variables):
+                          variables,
+                          levels=None):
     
     
     """
@@ -128,7 +119,10 @@ def gefs_0p50_url_scanner(cat,
             'vertical velocity'
             'water equivalent of accumulated snow depth'
     
-    Optional Arguments: None
+    Optional Arguments:
+    
+    1) levels (List or None) - Default=None. A list of the levels the user wants to download in plain language
+       (i.e. ['500 mb', '2 m above ground', 'surface']). When None, every level is downloaded.
     
     
     Returns
@@ -136,6 +130,7 @@ def gefs_0p50_url_scanner(cat,
     
     The model runtime, download URL and server response code.     
     """
+    
     # Makes the category all lower case for consistency
     cat = cat.lower()
     
@@ -188,188 +183,23 @@ def gefs_0p50_url_scanner(cat,
     else:
         final_forecast_hour = f"00{final_forecast_hour}"
            
-    # These are the different download URLs for the various runtimes in the past 24 hours
-    
-    # URLs to scan for the latest file
-    today_18z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{now.strftime('%Y%m%d')}/18/atmos/pgrb2ap5/")
-    today_12z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{now.strftime('%Y%m%d')}/12/atmos/pgrb2ap5/")
-    today_06z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{now.strftime('%Y%m%d')}/06/atmos/pgrb2ap5/")
-    today_00z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{now.strftime('%Y%m%d')}/00/atmos/pgrb2ap5/")
-    
-    yesterday_18z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{yd.strftime('%Y%m%d')}/18/atmos/pgrb2ap5/")
-    yesterday_12z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{yd.strftime('%Y%m%d')}/12/atmos/pgrb2ap5/")
-    yesterday_06z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{yd.strftime('%Y%m%d')}/06/atmos/pgrb2ap5/")
-    yesterday_00z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{yd.strftime('%Y%m%d')}/00/atmos/pgrb2ap5/")
+    # The file checked for each candidate run in the past 24 hours
+    # {date} and {hour} are filled in with the date and hour of each candidate run
+    scan_template = ("https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{date}/{hour}/atmos/pgrb2ap5/"
+                     f"ge{aa}.t{{hour}}z.pgrb2a.0p50.f{final_forecast_hour}")
     
     # Gets the variable list in a string format convered to GRIB filter keys
     
     keys = key_list(variables)
     params = result_string(keys)
-        
-    # Today's runs
-    today_18z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t18z.pgrb2a.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    today_12z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t12z.pgrb2a.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    today_06z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t06z.pgrb2a.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    today_00z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t00z.pgrb2a.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    # Yesterday's runs
-    yd_18z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t18z.pgrb2a.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    yd_12z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t12z.pgrb2a.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    yd_06z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t06z.pgrb2a.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    yd_00z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t00z.pgrb2a.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")    
     
+    # Gets the level list in a string format converted to GRIB filter keys
+    lev = level_string(levels)
 
-    # The filenames for the different run times
-    f_18z = f"ge{aa}.t18z.pgrb2a.0p50.f{final_forecast_hour}"
-    f_12z = f"ge{aa}.t12z.pgrb2a.0p50.f{final_forecast_hour}"
-    f_06z = f"ge{aa}.t06z.pgrb2a.0p50.f{final_forecast_hour}"
-    f_00z = f"ge{aa}.t00z.pgrb2a.0p50.f{final_forecast_hour}"
-    
-    # Tests the connection for each link. 
-    # The first link with a response of 200 will be the download link
-    
-    # This is if the user has proxy servers disabled
-    if proxies == None:
-        try:
-            t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True)
-            t_18.close()
-            t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True)
-            t_12.close()
-            t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True)
-            t_06.close()
-            t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True)
-            t_00.close()
-            y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True)
-            y_18.close()
-            y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True)
-            y_12.close()
-            y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True)
-            y_06.close()
-            y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True)
-            y_00.close()
-        except Exception as e:
-            for i in range(0, 5, 1):
-                try:
-                    t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True)
-                    t_18.close()
-                    t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True)
-                    t_12.close()
-                    t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True)
-                    t_06.close()
-                    t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True)
-                    t_00.close()
-                    y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True)
-                    y_18.close()
-                    y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True)
-                    y_12.close()
-                    y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True)
-                    y_06.close()
-                    y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True)
-                    y_00.close()   
-                    break
-                except Exception as e:
-                    i = i     
-    
-    # This is if the user has a VPN/Proxy Server connection enabled
-    else:
-        try:
-            t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True, proxies=proxies)
-            t_18.close()
-            t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True, proxies=proxies)
-            t_12.close()
-            t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True, proxies=proxies)
-            t_06.close()
-            t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True, proxies=proxies)
-            t_00.close()
-            y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True, proxies=proxies)
-            y_18.close()
-            y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True, proxies=proxies)
-            y_12.close()
-            y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True, proxies=proxies)
-            y_06.close()
-            y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True, proxies=proxies)
-            y_00.close()
-        except Exception as e:
-            for i in range(0, 5, 1):
-                try:
-                    t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True, proxies=proxies)
-                    t_18.close()
-                    t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True, proxies=proxies)
-                    t_12.close()
-                    t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True, proxies=proxies)
-                    t_06.close()
-                    t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True, proxies=proxies)
-                    t_00.close()
-                    y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True, proxies=proxies)
-                    y_18.close()
-                    y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True, proxies=proxies)
-                    y_12.close()
-                    y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True, proxies=proxies)
-                    y_06.close()
-                    y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True, proxies=proxies)
-                    y_00.close()   
-                    break
-                except Exception as e:
-                    i = i  
-        
-    # Creates a list of URLs and URL responses to loop through when checking
-    
-    urls = [
-        today_18z,
-        today_12z,
-        today_06z,
-        today_00z,
-        yd_18z,
-        yd_12z,
-        yd_06z,
-        yd_18z
-    ]
-    
-    responses = [
-        t_18,
-        t_12,
-        t_06,
-        t_00,
-        y_18,
-        y_12,
-        y_06,
-        y_00
-    ]
-    
-    # Testing the status code and then returning the first link with a status code of 200
-    for response, url in zip(responses, urls):
-        if response.status_code == 200:
-            url = url
-            run = int(f"{url[121]}{url[122]}")
-            break        
-    
-    try:
-        url = url
-    except Exception as e:
-        print(f"Latest forecast data is over 24 hours old. Aborting.....")
-        sys.exit(1)
+    # Probes every candidate run at the same time, newest run first
+    # The scan returns the date and hour of the latest available run as soon as it is confirmed
+    date, run = probe_runs(scan_template, 
+                           proxies=proxies)
     
     if step == 6:
         if int(final_forecast_hour) > 100:
@@ -396,487 +226,34 @@ def gefs_0p50_url_scanner(cat,
         else:
             step = 6
             stop = int(final_forecast_hour) + step
-        
-        
-    urls = []
+
     
-    if cat != 'members':
+    forecast_hours = [i for i in range(0, stop, step)]
+    if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
+        forecast_hours = forecast_hours + [i for i in range(start, int(final_forecast_hour) + step, step)]
+    else:
+        pass
     
-        if url == today_18z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t18z.pgrb2a.0p50.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t18z.pgrb2a.0p50.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t18z.pgrb2a.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                    
-            if int(final_forecast_hour) > 240:
-                for i in range(start, int(final_forecast_hour) + 6, 6):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t18z.pgrb2a.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        elif url == today_12z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t12z.pgrb2a.0p50.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t12z.pgrb2a.0p50.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t12z.pgrb2a.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                    
-            if int(final_forecast_hour) > 240:
-                for i in range(start, int(final_forecast_hour) + 6, 6):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t12z.pgrb2a.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        elif url == today_06z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t06z.pgrb2a.0p50.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t06z.pgrb2a.0p50.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t06z.pgrb2a.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                    
-            if int(final_forecast_hour) > 240:
-                for i in range(start, int(final_forecast_hour) + 6, 6):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t06z.pgrb2a.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        elif url == today_00z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t00z.pgrb2a.0p50.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t00z.pgrb2a.0p50.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t00z.pgrb2a.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                    
-            if int(final_forecast_hour) > 240:
-                for i in range(start, int(final_forecast_hour) + 6, 6):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t00z.pgrb2a.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        elif url == yd_18z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t18z.pgrb2a.0p50.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t18z.pgrb2a.0p50.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                    
-            if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t18z.pgrb2a.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                    
-            if int(final_forecast_hour) > 240:
-                for i in range(start, int(final_forecast_hour) + 6, 6):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t18z.pgrb2a.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        elif url == yd_12z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t12z.pgrb2a.0p50.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t12z.pgrb2a.0p50.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t12z.pgrb2a.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                    
-            if int(final_forecast_hour) > 240:
-                for i in range(start, int(final_forecast_hour) + 6, 6):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t12z.pgrb2a.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        elif url == yd_06z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t06z.pgrb2a.0p50.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t06z.pgrb2a.0p50.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t06z.pgrb2a.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                    
-            if int(final_forecast_hour) > 240:
-                for i in range(start, int(final_forecast_hour) + 6, 6):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t06z.pgrb2a.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        else:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t00z.pgrb2a.0p50.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t00z.pgrb2a.0p50.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t00z.pgrb2a.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                    
-            if int(final_forecast_hour) > 240:
-                for i in range(start, int(final_forecast_hour) + 6, 6):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t00z.pgrb2a.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
+    # The forecast hours after 240 are 6 hourly
+    if int(final_forecast_hour) > 240:
+        forecast_hours = forecast_hours + [i for i in range(start, int(final_forecast_hour) + 6, 6)]
+    else:
+        pass
         
+    # Each ensemble member is downloaded when the members are requested
+    if cat != 'members':
+        files = [aa]
     else:
-        if url == today_18z:
-            for aa in m:
-                for i in range(0, stop, step):
-                    if i < 10:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t18z.pgrb2a.0p50.f00{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    else:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t18z.pgrb2a.0p50.f0{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                    urls.append(url)  
-                if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t18z.pgrb2a.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-                if int(final_forecast_hour) > 240:
-                    for i in range(start, int(final_forecast_hour) + 6, 6):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t18z.pgrb2a.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-        elif url == today_12z:
-            for aa in m:
-                for i in range(0, stop, step):
-                    if i < 10:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t12z.pgrb2a.0p50.f00{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    else:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t12z.pgrb2a.0p50.f0{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                    urls.append(url)
-                    
-                if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t12z.pgrb2a.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-                if int(final_forecast_hour) > 240:
-                    for i in range(start, int(final_forecast_hour) + 6, 6):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t12z.pgrb2a.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-        elif url == today_06z:
-            for aa in m:
-                for i in range(0, stop, step):
-                    if i < 10:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t06z.pgrb2a.0p50.f00{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    else:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t06z.pgrb2a.0p50.f0{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                    urls.append(url)
-                    
-                if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t06z.pgrb2a.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-                if int(final_forecast_hour) > 240:
-                    for i in range(start, int(final_forecast_hour) + 6, 6):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t06z.pgrb2a.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-        elif url == today_00z:
-            for aa in m:
-                for i in range(0, stop, step):
-                    if i < 10:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t00z.pgrb2a.0p50.f00{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    else:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t00z.pgrb2a.0p50.f0{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                    urls.append(url)
-                    
-                if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t00z.pgrb2a.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-                if int(final_forecast_hour) > 240:
-                    for i in range(start, int(final_forecast_hour) + 6, 6):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t00z.pgrb2a.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-        elif url == yd_18z:
-            for aa in m:
-                for i in range(0, stop, step):
-                    if i < 10:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t18z.pgrb2a.0p50.f00{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    else:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t18z.pgrb2a.0p50.f0{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                    urls.append(url)
-                    
-                if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t18z.pgrb2a.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-                if int(final_forecast_hour) > 240:
-                    for i in range(start, int(final_forecast_hour) + 6, 6):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t18z.pgrb2a.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-        elif url == yd_12z:
-                for i in range(0, stop, step):
-                    for aa in m:
-                        if i < 10:
-                            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t12z.pgrb2a.0p50.f00{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        else:
-                            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t12z.pgrb2a.0p50.f0{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                            
-                        urls.append(url)
-                    
-                if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        for aa in m:
-                            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                    f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t12z.pgrb2a.0p50.f{i}{params}&"
-                                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                            
-                            urls.append(url)
-                            
-                if int(final_forecast_hour) > 240:
-                    for i in range(start, int(final_forecast_hour) + 6, 6):
-                        for aa in m:
-                            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                    f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t12z.pgrb2a.0p50.f{i}{params}&"
-                                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                            
-                            urls.append(url)
-                        
-        elif url == yd_06z:
-            for aa in m:
-                for i in range(0, stop, step):
-                        if i < 10:
-                            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t06z.pgrb2a.0p50.f00{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        else:
-                            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t06z.pgrb2a.0p50.f0{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                            
-                        urls.append(url)
-                    
-                if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t06z.pgrb2a.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-                if int(final_forecast_hour) > 240:
-                    for i in range(start, int(final_forecast_hour) + 6, 6):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t06z.pgrb2a.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-        else:
-            for aa in m:
-                for i in range(0, stop, step):
-                    if i < 10:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t00z.pgrb2a.0p50.f00{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    else:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t00z.pgrb2a.0p50.f0{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                    urls.append(url)
-                    
-                if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t00z.pgrb2a.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-                if int(final_forecast_hour) > 240:
-                    for i in range(start, int(final_forecast_hour) + 6, 6):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t00z.pgrb2a.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
+        files = m
+        
+    urls = []
+    for aa in files:
+        for i in forecast_hours:
+            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50a.pl"
+                f"?dir=%2Fgefs.{date.strftime('%Y%m%d')}%2F{run:02d}%2Fatmos%2Fpgrb2ap5&file=ge{aa}.t{run:02d}z.pgrb2a.0p50.f{i:03d}{params}&"
+                f"{lev}&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
+            
+            urls.append(url)
         
     # Extract the filename
     # Parse the URL
@@ -1036,6 +413,7 @@ def gefs_0p50_secondary_parameters_url_scanner(cat,
     
     The model runtime, download URL and server response code.        
     """
+    
     # Makes the category all lower case for consistency
     cat = cat.lower()
     
@@ -1082,189 +460,20 @@ def gefs_0p50_secondary_parameters_url_scanner(cat,
     else:
         final_forecast_hour = f"00{final_forecast_hour}"
            
-    # These are the different download URLs for the various runtimes in the past 24 hours
+    # The file checked for each candidate run in the past 24 hours
+    # {date} and {hour} are filled in with the date and hour of each candidate run
+    scan_template = ("https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{date}/{hour}/atmos/pgrb2bp5/"
+                     f"ge{aa}.t{{hour}}z.pgrb2b.0p50.f{final_forecast_hour}")
     
-    # URLs to scan for the latest file
-    
-    today_18z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{now.strftime('%Y%m%d')}/18/atmos/pgrb2bp5/")
-    today_12z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{now.strftime('%Y%m%d')}/12/atmos/pgrb2bp5/")
-    today_06z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{now.strftime('%Y%m%d')}/06/atmos/pgrb2bp5/")
-    today_00z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{now.strftime('%Y%m%d')}/00/atmos/pgrb2bp5/")
-    
-    yesterday_18z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{yd.strftime('%Y%m%d')}/18/atmos/pgrb2bp5/")
-    yesterday_12z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{yd.strftime('%Y%m%d')}/12/atmos/pgrb2bp5/")
-    yesterday_06z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{yd.strftime('%Y%m%d')}/06/atmos/pgrb2bp5/")
-    yesterday_00z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{yd.strftime('%Y%m%d')}/00/atmos/pgrb2bp5/")
-        
     # Gets the variable list in a string format convered to GRIB filter keys
     
     keys = key_list(variables)
-    params = result_string(keys)        
+    params = result_string(keys)
 
-    # Today's runs
-    today_18z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t18z.pgrb2b.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    today_12z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t12z.pgrb2b.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    today_06z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t06z.pgrb2b.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    today_00z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t00z.pgrb2b.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    # Yesterday's runs
-    yd_18z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t18z.pgrb2b.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    yd_12z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t12z.pgrb2b.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    yd_06z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t06z.pgrb2b.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    yd_00z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t00z.pgrb2b.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")    
-    
-
-    # The filenames for the different run times
-    f_18z = f"ge{aa}.t18z.pgrb2b.0p50.f{final_forecast_hour}"
-    f_12z = f"ge{aa}.t12z.pgrb2b.0p50.f{final_forecast_hour}"
-    f_06z = f"ge{aa}.t06z.pgrb2b.0p50.f{final_forecast_hour}"
-    f_00z = f"ge{aa}.t00z.pgrb2b.0p50.f{final_forecast_hour}"
-    
-    # Tests the connection for each link. 
-    # The first link with a response of 200 will be the download link
-    
-    # This is if the user has proxy servers disabled
-    if proxies == None:
-        try:
-            t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True)
-            t_18.close()
-            t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True)
-            t_12.close()
-            t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True)
-            t_06.close()
-            t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True)
-            t_00.close()
-            y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True)
-            y_18.close()
-            y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True)
-            y_12.close()
-            y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True)
-            y_06.close()
-            y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True)
-            y_00.close()
-        except Exception as e:
-            for i in range(0, 5, 1):
-                try:
-                    t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True)
-                    t_18.close()
-                    t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True)
-                    t_12.close()
-                    t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True)
-                    t_06.close()
-                    t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True)
-                    t_00.close()
-                    y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True)
-                    y_18.close()
-                    y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True)
-                    y_12.close()
-                    y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True)
-                    y_06.close()
-                    y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True)
-                    y_00.close()   
-                    break
-                except Exception as e:
-                    i = i     
-    
-    # This is if the user has a VPN/Proxy Server connection enabled
-    else:
-        try:
-            t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True, proxies=proxies)
-            t_18.close()
-            t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True, proxies=proxies)
-            t_12.close()
-            t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True, proxies=proxies)
-            t_06.close()
-            t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True, proxies=proxies)
-            t_00.close()
-            y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True, proxies=proxies)
-            y_18.close()
-            y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True, proxies=proxies)
-            y_12.close()
-            y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True, proxies=proxies)
-            y_06.close()
-            y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True, proxies=proxies)
-            y_00.close()
-        except Exception as e:
-            for i in range(0, 5, 1):
-                try:
-                    t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True, proxies=proxies)
-                    t_18.close()
-                    t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True, proxies=proxies)
-                    t_12.close()
-                    t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True, proxies=proxies)
-                    t_06.close()
-                    t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True, proxies=proxies)
-                    t_00.close()
-                    y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True, proxies=proxies)
-                    y_18.close()
-                    y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True, proxies=proxies)
-                    y_12.close()
-                    y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True, proxies=proxies)
-                    y_06.close()
-                    y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True, proxies=proxies)
-                    y_00.close()   
-                    break
-                except Exception as e:
-                    i = i         
-        
-    # Creates a list of URLs and URL responses to loop through when checking
-    
-    urls = [
-        today_18z,
-        today_12z,
-        today_06z,
-        today_00z,
-        yd_18z,
-        yd_12z,
-        yd_06z,
-        yd_18z
-    ]
-    
-    responses = [
-        t_18,
-        t_12,
-        t_06,
-        t_00,
-        y_18,
-        y_12,
-        y_06,
-        y_00
-    ]
-    
-    # Testing the status code and then returning the first link with a status code of 200
-    for response, url in zip(responses, urls):
-        if response.status_code == 200:
-            url = url
-            run = int(f"{url[121]}{url[122]}")
-            break      
-    
-    try:
-        url = url
-    except Exception as e:
-        print(f"Latest forecast data is over 24 hours old. Aborting.....")
-        sys.exit(1)
+    # Probes every candidate run at the same time, newest run first
+    # The scan returns the date and hour of the latest available run as soon as it is confirmed
+    date, run = probe_runs(scan_template, 
+                           proxies=proxies)
     
     if step == 6:
         if int(final_forecast_hour) > 100:
@@ -1291,487 +500,34 @@ def gefs_0p50_secondary_parameters_url_scanner(cat,
         else:
             step = 6
             stop = int(final_forecast_hour) + step
-        
-        
-    urls = []
+
     
-    if cat != 'members' and cat != 'mean' and cat != 'spread':
+    forecast_hours = [i for i in range(0, stop, step)]
+    if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
+        forecast_hours = forecast_hours + [i for i in range(start, int(final_forecast_hour) + step, step)]
+    else:
+        pass
     
-        if url == today_18z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t18z.pgrb2b.0p50.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t18z.pgrb2b.0p50.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t18z.pgrb2b.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                    
-            if int(final_forecast_hour) > 240:
-                for i in range(start, int(final_forecast_hour) + 6, 6):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t18z.pgrb2b.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        elif url == today_12z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t12z.pgrb2b.0p50.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t12z.pgrb2b.0p50.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t12z.pgrb2b.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                    
-            if int(final_forecast_hour) > 240:
-                for i in range(start, int(final_forecast_hour) + 6, 6):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t12z.pgrb2b.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        elif url == today_06z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t06z.pgrb2b.0p50.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t06z.pgrb2b.0p50.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t06z.pgrb2b.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                    
-            if int(final_forecast_hour) > 240:
-                for i in range(start, int(final_forecast_hour) + 6, 6):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t06z.pgrb2b.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        elif url == today_00z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t00z.pgrb2b.0p50.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t00z.pgrb2b.0p50.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t00z.pgrb2b.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                    
-            if int(final_forecast_hour) > 240:
-                for i in range(start, int(final_forecast_hour) + 6, 6):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t00z.pgrb2b.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        elif url == yd_18z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t18z.pgrb2b.0p50.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t18z.pgrb2b.0p50.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                    
-            if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t18z.pgrb2b.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                    
-            if int(final_forecast_hour) > 240:
-                for i in range(start, int(final_forecast_hour) + 6, 6):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t18z.pgrb2b.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        elif url == yd_12z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t12z.pgrb2b.0p50.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t12z.pgrb2b.0p50.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t12z.pgrb2b.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                    
-            if int(final_forecast_hour) > 240:
-                for i in range(start, int(final_forecast_hour) + 6, 6):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t12z.pgrb2b.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        elif url == yd_06z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t06z.pgrb2b.0p50.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t06z.pgrb2b.0p50.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t06z.pgrb2b.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                    
-            if int(final_forecast_hour) > 240:
-                for i in range(start, int(final_forecast_hour) + 6, 6):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t06z.pgrb2b.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        else:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t00z.pgrb2b.0p50.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t00z.pgrb2b.0p50.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t00z.pgrb2b.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                    
-            if int(final_forecast_hour) > 240:
-                for i in range(start, int(final_forecast_hour) + 6, 6):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t00z.pgrb2b.0p50.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
+    # The forecast hours after 240 are 6 hourly
+    if int(final_forecast_hour) > 240:
+        forecast_hours = forecast_hours + [i for i in range(start, int(final_forecast_hour) + 6, 6)]
+    else:
+        pass
         
+    # Each ensemble member is downloaded when the members are requested
+    if cat != 'members' and cat != 'mean' and cat != 'spread':
+        files = [aa]
     else:
-        if url == today_18z:
-            for aa in m:
-                for i in range(0, stop, step):
-                    if i < 10:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t18z.pgrb2b.0p50.f00{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    else:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t18z.pgrb2b.0p50.f0{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                    urls.append(url)  
-                if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t18z.pgrb2b.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-                if int(final_forecast_hour) > 240:
-                    for i in range(start, int(final_forecast_hour) + 6, 6):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t18z.pgrb2b.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-        elif url == today_12z:
-            for aa in m:
-                for i in range(0, stop, step):
-                    if i < 10:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t12z.pgrb2b.0p50.f00{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    else:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t12z.pgrb2b.0p50.f0{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                    urls.append(url)
-                    
-                if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t12z.pgrb2b.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-                if int(final_forecast_hour) > 240:
-                    for i in range(start, int(final_forecast_hour) + 6, 6):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t12z.pgrb2b.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-        elif url == today_06z:
-            for aa in m:
-                for i in range(0, stop, step):
-                    if i < 10:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t06z.pgrb2b.0p50.f00{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    else:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t06z.pgrb2b.0p50.f0{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                    urls.append(url)
-                    
-                if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t06z.pgrb2b.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-                if int(final_forecast_hour) > 240:
-                    for i in range(start, int(final_forecast_hour) + 6, 6):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t06z.pgrb2b.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-        elif url == today_00z:
-            for aa in m:
-                for i in range(0, stop, step):
-                    if i < 10:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t00z.pgrb2b.0p50.f00{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    else:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t00z.pgrb2b.0p50.f0{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                    urls.append(url)
-                    
-                if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t00z.pgrb2b.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-                if int(final_forecast_hour) > 240:
-                    for i in range(start, int(final_forecast_hour) + 6, 6):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t00z.pgrb2b.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-        elif url == yd_18z:
-            for aa in m:
-                for i in range(0, stop, step):
-                    if i < 10:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t18z.pgrb2b.0p50.f00{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    else:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t18z.pgrb2b.0p50.f0{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                    urls.append(url)
-                    
-                if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t18z.pgrb2b.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-                if int(final_forecast_hour) > 240:
-                    for i in range(start, int(final_forecast_hour) + 6, 6):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t18z.pgrb2b.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-        elif url == yd_12z:
-                for i in range(0, stop, step):
-                    for aa in m:
-                        if i < 10:
-                            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t12z.pgrb2b.0p50.f00{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        else:
-                            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t12z.pgrb2b.0p50.f0{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                            
-                        urls.append(url)
-                    
-                if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        for aa in m:
-                            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                    f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t12z.pgrb2b.0p50.f{i}{params}&"
-                                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                            
-                            urls.append(url)
-                            
-                if int(final_forecast_hour) > 240:
-                    for i in range(start, int(final_forecast_hour) + 6, 6):
-                        for aa in m:
-                            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                    f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t12z.pgrb2b.0p50.f{i}{params}&"
-                                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                            
-                            urls.append(url)
-                        
-        elif url == yd_06z:
-            for aa in m:
-                for i in range(0, stop, step):
-                        if i < 10:
-                            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t06z.pgrb2b.0p50.f00{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        else:
-                            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t06z.pgrb2b.0p50.f0{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                            
-                        urls.append(url)
-                    
-                if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t06z.pgrb2b.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-                if int(final_forecast_hour) > 240:
-                    for i in range(start, int(final_forecast_hour) + 6, 6):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t06z.pgrb2b.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-        else:
-            for aa in m:
-                for i in range(0, stop, step):
-                    if i < 10:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t00z.pgrb2b.0p50.f00{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    else:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t00z.pgrb2b.0p50.f0{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                    urls.append(url)
-                    
-                if int(final_forecast_hour) > 100 and int(final_forecast_hour) <= 240:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t00z.pgrb2b.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-                if int(final_forecast_hour) > 240:
-                    for i in range(start, int(final_forecast_hour) + 6, 6):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t00z.pgrb2b.0p50.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
+        files = m
+        
+    urls = []
+    for aa in files:
+        for i in forecast_hours:
+            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p50b.pl"
+                f"?dir=%2Fgefs.{date.strftime('%Y%m%d')}%2F{run:02d}%2Fatmos%2Fpgrb2bp5&file=ge{aa}.t{run:02d}z.pgrb2b.0p50.f{i:03d}{params}&"
+                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
+            
+            urls.append(url)
         
     # Extract the filename
     # Parse the URL
@@ -1804,7 +560,8 @@ def gefs_0p25_url_scanner(cat,
                           proxies, 
                           step, 
                           members,
-                          variables):
+                          variables,
+                          levels=None):
     
     
     """
@@ -1881,7 +638,10 @@ def gefs_0p25_url_scanner(cat,
             'vertical velocity'
             'water equivalent of accumulated snow depth'
     
-    Optional Arguments: None
+    Optional Arguments:
+    
+    1) levels (List or None) - Default=None. A list of the levels the user wants to download in plain language
+       (i.e. ['500 mb', '2 m above ground', 'surface']). When None, every level is downloaded.
     
     
     Returns
@@ -1889,6 +649,7 @@ def gefs_0p25_url_scanner(cat,
     
     The model runtime, download URL and server response code.    
     """
+    
     # Makes the category all lower case for consistency
     cat = cat.lower()
     
@@ -1941,189 +702,23 @@ def gefs_0p25_url_scanner(cat,
     else:
         final_forecast_hour = f"00{final_forecast_hour}"
            
-    # These are the different download URLs for the various runtimes in the past 24 hours
-    
-    # URLs to scan for the latest file
-    today_18z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{now.strftime('%Y%m%d')}/18/atmos/pgrb2sp25/")
-    today_12z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{now.strftime('%Y%m%d')}/12/atmos/pgrb2sp25/")
-    today_06z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{now.strftime('%Y%m%d')}/06/atmos/pgrb2sp25/")
-    today_00z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{now.strftime('%Y%m%d')}/00/atmos/pgrb2sp25/")
-    
-    yesterday_18z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{yd.strftime('%Y%m%d')}/18/atmos/pgrb2sp25/")
-    yesterday_12z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{yd.strftime('%Y%m%d')}/12/atmos/pgrb2sp25/")
-    yesterday_06z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{yd.strftime('%Y%m%d')}/06/atmos/pgrb2sp25/")
-    yesterday_00z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{yd.strftime('%Y%m%d')}/00/atmos/pgrb2sp25/")
+    # The file checked for each candidate run in the past 24 hours
+    # {date} and {hour} are filled in with the date and hour of each candidate run
+    scan_template = ("https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod/gefs.{date}/{hour}/atmos/pgrb2sp25/"
+                     f"ge{aa}.t{{hour}}z.pgrb2s.0p25.f{final_forecast_hour}")
     
     # Gets the variable list in a string format convered to GRIB filter keys
     
     keys = key_list(variables)
     params = result_string(keys)
-        
-    # Today's runs
-    today_18z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t18z.pgrb2s.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    today_12z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t12z.pgrb2s.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    today_06z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t06z.pgrb2s.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    today_00z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t00z.pgrb2s.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    # Yesterday's runs
-    yd_18z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t18z.pgrb2s.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    yd_12z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t12z.pgrb2s.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    yd_06z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t06z.pgrb2s.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    yd_00z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t00z.pgrb2s.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")    
     
+    # Gets the level list in a string format converted to GRIB filter keys
+    lev = level_string(levels)
 
-    # The filenames for the different run times
-    f_18z = f"ge{aa}.t18z.pgrb2s.0p25.f{final_forecast_hour}"
-    f_12z = f"ge{aa}.t12z.pgrb2s.0p25.f{final_forecast_hour}"
-    f_06z = f"ge{aa}.t06z.pgrb2s.0p25.f{final_forecast_hour}"
-    f_00z = f"ge{aa}.t00z.pgrb2s.0p25.f{final_forecast_hour}"
-    
-    # Tests the connection for each link. 
-    # The first link with a response of 200 will be the download link
-    
-    # This is if the user has proxy servers disabled
-    if proxies == None:
-        try:
-            t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True)
-            t_18.close()
-            t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True)
-            t_12.close()
-            t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True)
-            t_06.close()
-            t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True)
-            t_00.close()
-            y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True)
-            y_18.close()
-            y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True)
-            y_12.close()
-            y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True)
-            y_06.close()
-            y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True)
-            y_00.close()
-        except Exception as e:
-            for i in range(0, 5, 1):
-                try:
-                    t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True)
-                    t_18.close()
-                    t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True)
-                    t_12.close()
-                    t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True)
-                    t_06.close()
-                    t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True)
-                    t_00.close()
-                    y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True)
-                    y_18.close()
-                    y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True)
-                    y_12.close()
-                    y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True)
-                    y_06.close()
-                    y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True)
-                    y_00.close()   
-                    break
-                except Exception as e:
-                    i = i     
-    
-    # This is if the user has a VPN/Proxy Server connection enabled
-    else:
-        try:
-            t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True, proxies=proxies)
-            t_18.close()
-            t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True, proxies=proxies)
-            t_12.close()
-            t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True, proxies=proxies)
-            t_06.close()
-            t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True, proxies=proxies)
-            t_00.close()
-            y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True, proxies=proxies)
-            y_18.close()
-            y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True, proxies=proxies)
-            y_12.close()
-            y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True, proxies=proxies)
-            y_06.close()
-            y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True, proxies=proxies)
-            y_00.close()
-        except Exception as e:
-            for i in range(0, 5, 1):
-                try:
-                    t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True, proxies=proxies)
-                    t_18.close()
-                    t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True, proxies=proxies)
-                    t_12.close()
-                    t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True, proxies=proxies)
-                    t_06.close()
-                    t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True, proxies=proxies)
-                    t_00.close()
-                    y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True, proxies=proxies)
-                    y_18.close()
-                    y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True, proxies=proxies)
-                    y_12.close()
-                    y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True, proxies=proxies)
-                    y_06.close()
-                    y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True, proxies=proxies)
-                    y_00.close()   
-                    break
-                except Exception as e:
-                    i = i  
-        
-    # Creates a list of URLs and URL responses to loop through when checking
-    
-    urls = [
-        today_18z,
-        today_12z,
-        today_06z,
-        today_00z,
-        yd_18z,
-        yd_12z,
-        yd_06z,
-        yd_18z
-    ]
-    
-    responses = [
-        t_18,
-        t_12,
-        t_06,
-        t_00,
-        y_18,
-        y_12,
-        y_06,
-        y_00
-    ]
-    
-    # Testing the status code and then returning the first link with a status code of 200
-
-    for response, url in zip(responses, urls):
-        if response.status_code == 200:
-            url = url
-            run = int(f"{url[122]}{url[123]}")
-            break      
-    
-    try:
-        url = url
-    except Exception as e:
-        print(f"Latest forecast data is over 24 hours old. Aborting.....")
-        sys.exit(1)
+    # Probes every candidate run at the same time, newest run first
+    # The scan returns the date and hour of the latest available run as soon as it is confirmed
+    date, run = probe_runs(scan_template, 
+                           proxies=proxies)
     
     if step == 6:
         if int(final_forecast_hour) > 100:
@@ -2150,358 +745,28 @@ def gefs_0p25_url_scanner(cat,
         else:
             step = 6
             stop = int(final_forecast_hour) + step
-        
-        
-    urls = []
-    
-    if cat != 'members':
+
     
-        if url == today_18z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t18z.pgrb2s.0p25.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t18z.pgrb2s.0p25.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t18z.pgrb2s.0p25.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        elif url == today_12z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t12z.pgrb2s.0p25.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t12z.pgrb2s.0p25.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t12z.pgrb2s.0p25.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        elif url == today_06z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t06z.pgrb2s.0p25.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t06z.pgrb2s.0p25.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t06z.pgrb2s.0p25.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        elif url == today_00z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t00z.pgrb2s.0p25.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                        f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t00z.pgrb2s.0p25.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t00z.pgrb2s.0p25.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        elif url == yd_18z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t18z.pgrb2s.0p25.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t18z.pgrb2s.0p25.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                    
-            if int(final_forecast_hour) > 100:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t18z.pgrb2s.0p25.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        elif url == yd_12z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t12z.pgrb2s.0p25.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t12z.pgrb2s.0p25.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t12z.pgrb2s.0p25.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        elif url == yd_06z:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t06z.pgrb2s.0p25.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t06z.pgrb2s.0p25.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t06z.pgrb2s.0p25.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
-                        
-        else:
-            for i in range(0, stop, step):
-                if i < 10:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t00z.pgrb2s.0p25.f00{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                else:
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                        f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t00z.pgrb2s.0p25.f0{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                urls.append(url)
-                    
-            if int(final_forecast_hour) > 100:
-                for i in range(start, int(final_forecast_hour) + step, step):
-                    url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t00z.pgrb2s.0p25.f{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    
-                    urls.append(url)
+    forecast_hours = [i for i in range(0, stop, step)]
+    if int(final_forecast_hour) > 100:
+        forecast_hours = forecast_hours + [i for i in range(start, int(final_forecast_hour) + step, step)]
+    else:
+        pass
         
+    # Each ensemble member is downloaded when the members are requested
+    if cat != 'members':
+        files = [aa]
     else:
-        if url == today_18z:
-            for aa in m:
-                for i in range(0, stop, step):
-                    if i < 10:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t18z.pgrb2s.0p25.f00{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    else:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t18z.pgrb2s.0p25.f0{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                    urls.append(url)  
-                if int(final_forecast_hour) > 100:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t18z.pgrb2s.0p25.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-        elif url == today_12z:
-            for aa in m:
-                for i in range(0, stop, step):
-                    if i < 10:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t12z.pgrb2s.0p25.f00{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    else:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t12z.pgrb2s.0p25.f0{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                    urls.append(url)
-                    
-                if int(final_forecast_hour) > 100:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t12z.pgrb2s.0p25.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-        elif url == today_06z:
-            for aa in m:
-                for i in range(0, stop, step):
-                    if i < 10:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t06z.pgrb2s.0p25.f00{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    else:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t06z.pgrb2s.0p25.f0{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                    urls.append(url)
-                    
-                if int(final_forecast_hour) > 100:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t06z.pgrb2s.0p25.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-        elif url == today_00z:
-            for aa in m:
-                for i in range(0, stop, step):
-                    if i < 10:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t00z.pgrb2s.0p25.f00{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    else:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t00z.pgrb2s.0p25.f0{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                    urls.append(url)
-                    
-                if int(final_forecast_hour) > 100:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                                f"?dir=%2Fgefs.{now.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t00z.pgrb2s.0p25.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-        elif url == yd_18z:
-            for aa in m:
-                for i in range(0, stop, step):
-                    if i < 10:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t18z.pgrb2s.0p25.f00{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    else:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t18z.pgrb2s.0p25.f0{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                    urls.append(url)
-                    
-                if int(final_forecast_hour) > 100:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t18z.pgrb2s.0p25.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-        elif url == yd_12z:
-                for i in range(0, stop, step):
-                    for aa in m:
-                        if i < 10:
-                            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t12z.pgrb2s.0p25.f00{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        else:
-                            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t12z.pgrb2s.0p25.f0{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                            
-                        urls.append(url)
-                    
-                if int(final_forecast_hour) > 100:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        for aa in m:
-                            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                                    f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t12z.pgrb2s.0p25.f{i}{params}&"
-                                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                            
-                            urls.append(url)
-                        
-        elif url == yd_06z:
-            for aa in m:
-                for i in range(0, stop, step):
-                        if i < 10:
-                            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t06z.pgrb2s.0p25.f00{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        else:
-                            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t06z.pgrb2s.0p25.f0{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                            
-                        urls.append(url)
-                    
-                if int(final_forecast_hour) > 100:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t06z.pgrb2s.0p25.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
-                        
-        else:
-            for aa in m:
-                for i in range(0, stop, step):
-                    if i < 10:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t00z.pgrb2s.0p25.f00{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                    else:
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                            f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t00z.pgrb2s.0p25.f0{i}{params}&"
-                            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                    urls.append(url)
-                    
-                if int(final_forecast_hour) > 100:
-                    for i in range(start, int(final_forecast_hour) + step, step):
-                        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
-                                f"?dir=%2Fgefs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t00z.pgrb2s.0p25.f{i}{params}&"
-                                f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                        
-                        urls.append(url)
+        files = m
+        
+    urls = []
+    for aa in files:
+        for i in forecast_hours:
+            url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gefs_atmos_0p25s.pl"
+                f"?dir=%2Fgefs.{date.strftime('%Y%m%d')}%2F{run:02d}%2Fatmos%2Fpgrb2sp25&file=ge{aa}.t{run:02d}z.pgrb2s.0p25.f{i:03d}{params}&"
+                f"{lev}&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
+            
+            urls.append(url)
         
     # Extract the filename
     # Parse the URL
@@ -19,7 +19,13 @@ from wxdata.gfs.url_scanners import(
 )
 
 from wxdata.calc.unit_conversion import convert_temperature_units
-from wxdata.utils.file_scanner import local_file_scanner
+from wxdata.utils.file_scanner import manifest_file_scanner
+from wxdata.utils.manifest import(
+    record_files,
+    reuse_cached_bbox
+)
+from wxdata.utils.coords import subset_to_bbox
+from wxdata.utils.pipeline import download_and_process
 from wxdata.utils.recycle_bin import *
 
 
@@ -124,7 +130,10 @@ def gfs_0p25(final_forecast_hour=384,
             convert_temperature=True,
             convert_to='celsius',
             chunk_size=8192,
-            notifications='off'):
+            notifications='off',
+            max_workers=8,
+            pipeline=False,
+            levels=None):
     
     """
     This function downloads GFS0P25 data and saves it to a folder. 
@@ -271,10 +280,22 @@ def gfs_0p25(final_forecast_hour=384,
     
     16) notifications (String) - Default='off'. Notification when a file is downloaded and saved to {path}
     
+    17) max_workers (Integer) - Default=8. The maximum number of files downloaded at the same time.
+       Set max_workers=1 to download the files one at a time.
+       
+    18) pipeline (Boolean) - Default=False. When set to True (and process_data=True), each forecast hour is post-processed
+        as soon as it is downloaded while the later forecast hours are still downloading. A generator is returned that yields
+        each forecast hour as its own xarray.array in forecast hour order. Use xarray.concat(list(ds), dim='step') to combine them. 
+    
+    19) levels (String List or None) - Default=None. The levels the user wishes to query in plain language
+        (i.e. ['500 mb', '2 m above ground', 'surface']). Only these levels are downloaded from the NOMADS GRIB filter.
+        When None, every level is downloaded.
+    
     Returns
     -------
     
     An xarray.array dataset of the most recent GFS0P25 run. 
+    When pipeline=True, a generator of an xarray.array for each forecast hour.
     
     Post-processed Variable Key List
     --------------------------------
@@ -400,39 +421,75 @@ def gfs_0p25(final_forecast_hour=384,
                                             southern_bound, 
                                             proxies, 
                                             step, 
-                                            variables)
+                                            variables,
+                                            levels=levels)
     
-    download = local_file_scanner(path, 
-                                    filenames[-1],
-                                    'nomads',
-                                    run)   
+    fnames = [f"{filename}.grib2" for filename in filenames]
     
-    if download == True:
+    missing = manifest_file_scanner(path, 
+                                    urls,
+                                    fnames)   
+    
+    # Files already downloaded for a larger bounding box of the same cycle are reused and subset to the requested bounding box
+    urls, bbox = reuse_cached_bbox(path,
+                                   urls,
+                                   fnames,
+                                   missing)
+    
+    if len(missing) > 0:
         print(f"Downloading GFS0P25...")
         
-        try:
-            for file in os.listdir(f"{path}"):
-                os.remove(f"{path}/{file}")
-        except Exception as e:
+        if pipeline == True and process_data == True:
             pass
-        
-        for url, filename in zip(urls, filenames):
-            client.get_gridded_data(f"{url}",
+        else:
+            client.get_gridded_data_batch([urls[i] for i in missing],
                         path,
-                        f"{filename}.grib2",
+                        [fnames[i] for i in missing],
                         proxies=proxies,
                         chunk_size=chunk_size,
-                        notifications=notifications)  
-        
-        print("GFS0P25 Download Complete") 
+                        notifications=notifications,
+                        max_workers=max_workers)
+            
+            record_files(path,
+                         [urls[i] for i in missing],
+                         [fnames[i] for i in missing])
+            
+            print("GFS0P25 Download Complete") 
             
     else:
         print(f"GFS0P25 Data is up to date. Skipping download...") 
     
-    if process_data == True:
+    if process_data == True and pipeline == True:
+        print(f"GFS0P25 Data Processing (Pipelined)...")
+        
+        def process(files):
+            ds = gfs_post_processing.primary_gfs_post_processing(path,
+                                                                 files=files)
+            ds = subset_to_bbox(ds,
+                                bbox)
+            if convert_temperature == True:
+                ds = convert_temperature_units(ds, 
+                                               convert_to)
+            else:
+                pass
+            return ds
+        
+        return download_and_process(urls,
+                                    path,
+                                    fnames,
+                                    process,
+                                    missing=missing,
+                                    proxies=proxies,
+                                    chunk_size=chunk_size,
+                                    notifications=notifications,
+                                    max_workers=max_workers)
+    
+    elif process_data == True:
         print(f"GFS0P25 Data Processing...")
         
         ds = gfs_post_processing.primary_gfs_post_processing(path)
+        ds = subset_to_bbox(ds,
+                            bbox)
         
         if convert_temperature == True:
                 ds = convert_temperature_units(ds, 
@@ -485,7 +542,8 @@ def gfs_0p25_secondary_parameters(final_forecast_hour=384,
             convert_temperature=True,
             convert_to='celsius',
             chunk_size=8192,
-            notifications='off'):
+            notifications='off',
+            max_workers=8):
     
     """
     This function downloads GFS0P25 SECONDARY PARAMETERS data and saves it to a folder. 
@@ -567,6 +625,9 @@ def gfs_0p25_secondary_parameters(final_forecast_hour=384,
     
     16) notifications (String) - Default='off'. Notification when a file is downloaded and saved to {path}
     
+    17) max_workers (Integer) - Default=8. The maximum number of files downloaded at the same time.
+       Set max_workers=1 to download the files one at a time.
+    
     Returns
     -------
     
@@ -638,27 +699,32 @@ def gfs_0p25_secondary_parameters(final_forecast_hour=384,
                                             step, 
                                             variables)
     
-    download = local_file_scanner(path, 
-                                    filenames[-1],
-                                    'nomads',
-                                    run)   
+    fnames = [f"{filename}.grib2" for filename in filenames]
     
-    if download == True:
+    missing = manifest_file_scanner(path, 
+                                    urls,
+                                    fnames)   
+    
+    # Files already downloaded for a larger bounding box of the same cycle are reused and subset to the requested bounding box
+    urls, bbox = reuse_cached_bbox(path,
+                                   urls,
+                                   fnames,
+                                   missing)
+    
+    if len(missing) > 0:
         print(f"Downloading GFS0P25 Secondary Parameters...")
         
-        try:
-            for file in os.listdir(f"{path}"):
-                os.remove(f"{path}/{file}")
-        except Exception as e:
-            pass
+        client.get_gridded_data_batch([urls[i] for i in missing],
+                    path,
+                    [fnames[i] for i in missing],
+                    proxies=proxies,
+                    chunk_size=chunk_size,
+                    notifications=notifications,
+                    max_workers=max_workers)
         
-        for url, filename in zip(urls, filenames):
-            client.get_gridded_data(f"{url}",
-                        path,
-                        f"{filename}.grib2",
-                        proxies=proxies,
-                        chunk_size=chunk_size,
-                        notifications=notifications)   
+        record_files(path,
+                     [urls[i] for i in missing],
+                     [fnames[i] for i in missing])
             
         print("GFS0P25 Secondary Parameters Download Complete") 
             
@@ -669,6 +735,8 @@ def gfs_0p25_secondary_parameters(final_forecast_hour=384,
         print(f"GFS0P25 Secondary Parameters Data Processing...")
         
         ds = gfs_post_processing.secondary_gfs_post_processing(path)
+        ds = subset_to_bbox(ds,
+                            bbox)
         
         if convert_temperature == True:
                 ds = convert_temperature_units(ds, 
@@ -788,7 +856,9 @@ def gfs_0p50(final_forecast_hour=384,
             convert_temperature=True,
             convert_to='celsius',
             chunk_size=8192,
-            notifications='off'):
+            notifications='off',
+            max_workers=8,
+            levels=None):
     
     """
     This function downloads GFS0P50 data and saves it to a folder. 
@@ -937,6 +1007,13 @@ def gfs_0p50(final_forecast_hour=384,
     
     16) notifications (String) - Default='off'. Notification when a file is downloaded and saved to {path}
     
+    17) max_workers (Integer) - Default=8. The maximum number of files downloaded at the same time.
+       Set max_workers=1 to download the files one at a time.
+    
+    18) levels (String List or None) - Default=None. The levels the user wishes to query in plain language
+        (i.e. ['500 mb', '2 m above ground', 'surface']). Only these levels are downloaded from the NOMADS GRIB filter.
+        When None, every level is downloaded.
+    
     Returns
     -------
     
@@ -1064,29 +1141,35 @@ def gfs_0p50(final_forecast_hour=384,
                                             southern_bound, 
                                             proxies, 
                                             step, 
-                                            variables)
+                                            variables,
+                                            levels=levels)
+    
+    fnames = [f"{filename}.grib2" for filename in filenames]
+    
+    missing = manifest_file_scanner(path, 
+                                    urls,
+                                    fnames)   
     
-    download = local_file_scanner(path, 
-                                    filenames[-1],
-                                    'nomads',
-                                    run)   
+    # Files already downloaded for a larger bounding box of the same cycle are reused and subset to the requested bounding box
+    urls, bbox = reuse_cached_bbox(path,
+                                   urls,
+                                   fnames,
+                                   missing)
     
-    if download == True:
+    if len(missing) > 0:
         print(f"Downloading GFS0P50...")
         
-        try:
-            for file in os.listdir(f"{path}"):
-                os.remove(f"{path}/{file}")
-        except Exception as e:
-            pass
+        client.get_gridded_data_batch([urls[i] for i in missing],
+                    path,
+                    [fnames[i] for i in missing],
+                    proxies=proxies,
+                    chunk_size=chunk_size,
+                    notifications=notifications,
+                    max_workers=max_workers)
         
-        for url, filename in zip(urls, filenames):
-            client.get_gridded_data(f"{url}",
-                        path,
-                        f"{filename}.grib2",
-                        proxies=proxies,
-                        chunk_size=chunk_size,
-                        notifications=notifications)   
+        record_files(path,
+                     [urls[i] for i in missing],
+                     [fnames[i] for i in missing])
             
         print("GFS0P50 Download Complete") 
             
@@ -1097,6 +1180,8 @@ def gfs_0p50(final_forecast_hour=384,
         print(f"GFS0P50 Data Processing...")
         
         ds = gfs_post_processing.primary_gfs_post_processing(path)
+        ds = subset_to_bbox(ds,
+                            bbox)
         
         if convert_temperature == True:
                 ds = convert_temperature_units(ds, 
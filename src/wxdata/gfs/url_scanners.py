@@ -6,17 +6,19 @@ These functions return the URL and filename for the latest available data on the
 (C) Eric J. Drewitz 2025
 """
 
-import requests
-import sys
 import numpy as np
 
 from urllib.parse import urlparse, parse_qs
 from wxdata.utils.coords import convert_lon
+from wxdata.client.scanner import(
+    probe_runs
+)
 
 from wxdata.utils.nomads_gribfilter import(
     
     result_string,
-    key_list
+    key_list,
+    level_string
 )
 
 from wxdata.gfs.exception_messages import(
@@ -30,18 +32,6 @@ try:
 except Exception as e:
     from datetime import datetime, timedelta
 
-# Gets current time in UTC
-try:
-    now = datetime.now(UTC)
-except Exception as e:
-    now = datetime.utcnow()
-
-# Gets local time
-local = datetime.now()
-
-# Gets yesterday's date
-yd = now - timedelta(days=1)
-
 def assign_cat(cat):
     
     """
@@ -79,7 +69,8 @@ def gfs_0p50_url_scanner(final_forecast_hour,
                           southern_bound, 
                           proxies, 
                           step, 
-                          variables):
+                          variables,
+                          levels=None):
     
     
     """
@@ -154,7 +145,10 @@ def gfs_0p50_url_scanner(final_forecast_hour,
             'vertical velocity'
             'water equivalent of accumulated snow depth'
     
-    Optional Arguments: None
+    Optional Arguments:
+    
+    1) levels (List or None) - Default=None. A list of the levels the user wants to download in plain language
+       (i.e. ['500 mb', '2 m above ground', 'surface']). When None, every level is downloaded.
     
     
     Returns
@@ -162,6 +156,7 @@ def gfs_0p50_url_scanner(final_forecast_hour,
     
     The model runtime and the download URL.     
     """
+    
     # Makes the category all lower case for consistency
     
     # Converts the longitude from -180 to 180 into 0 to 360
@@ -182,191 +177,23 @@ def gfs_0p50_url_scanner(final_forecast_hour,
     else:
         final_forecast_hour = f"00{final_forecast_hour}"
            
-    # These are the different download URLs for the various runtimes in the past 24 hours
-    
-    # URLs to scan for the latest file
-    today_18z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{now.strftime('%Y%m%d')}/18/atmos/")
-    today_12z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{now.strftime('%Y%m%d')}/12/atmos/")
-    today_06z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{now.strftime('%Y%m%d')}/06/atmos/")
-    today_00z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{now.strftime('%Y%m%d')}/00/atmos/")
-    
-    yesterday_18z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{yd.strftime('%Y%m%d')}/18/atmos/")
-    yesterday_12z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{yd.strftime('%Y%m%d')}/12/atmos/")
-    yesterday_06z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{yd.strftime('%Y%m%d')}/06/atmos/")
-    yesterday_00z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{yd.strftime('%Y%m%d')}/00/atmos/")
+    # The file checked for each candidate run in the past 24 hours
+    # {date} and {hour} are filled in with the date and hour of each candidate run
+    scan_template = ("https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{date}/{hour}/atmos/"
+                     f"gfs.t{{hour}}z.pgrb2full.0p50.f{final_forecast_hour}")
     
     # Gets the variable list in a string format convered to GRIB filter keys
     
     keys = key_list(variables)
     params = result_string(keys)
-        
-    # Today's runs
-    today_18z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2full.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    today_12z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2full.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    today_06z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2full.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    today_00z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2full.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    # Yesterday's runs
-    yd_18z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2full.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    yd_12z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2full.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    yd_06z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2full.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    yd_00z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2full.0p50.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")    
     
+    # Gets the level list in a string format converted to GRIB filter keys
+    lev = level_string(levels)
 
-    # The filenames for the different run times
-    f_18z = f"gfs.t18z.pgrb2full.0p50.f{final_forecast_hour}"
-    f_12z = f"gfs.t12z.pgrb2full.0p50.f{final_forecast_hour}"
-    f_06z = f"gfs.t06z.pgrb2full.0p50.f{final_forecast_hour}"
-    f_00z = f"gfs.t00z.pgrb2full.0p50.f{final_forecast_hour}"
-    
-    # Tests the connection for each link. 
-    # The first link with a response of 200 will be the download link
-    
-    # This is if the user has proxy servers disabled
-    if proxies == None:
-        try:
-            t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True)
-            t_18.close()
-            t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True)
-            t_12.close()
-            t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True)
-            t_06.close()
-            t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True)
-            t_00.close()
-            y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True)
-            y_18.close()
-            y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True)
-            y_12.close()
-            y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True)
-            y_06.close()
-            y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True)
-            y_00.close()
-        except Exception as e:
-            for i in range(0, 5, 1):
-                try:
-                    t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True)
-                    t_18.close()
-                    t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True)
-                    t_12.close()
-                    t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True)
-                    t_06.close()
-                    t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True)
-                    t_00.close()
-                    y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True)
-                    y_18.close()
-                    y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True)
-                    y_12.close()
-                    y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True)
-                    y_06.close()
-                    y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True)
-                    y_00.close()
-                    break
-                except Exception as e:
-                    i = i       
-                    
-
-    # This is if the user has a VPN/Proxy Server connection enabled
-    else:
-        try:
-            t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True, proxies=proxies)
-            t_18.close()
-            t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True, proxies=proxies)
-            t_12.close()
-            t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True, proxies=proxies)
-            t_06.close()
-            t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True, proxies=proxies)
-            t_00.close()
-            y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True, proxies=proxies)
-            y_18.close()
-            y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True, proxies=proxies)
-            y_12.close()
-            y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True, proxies=proxies)
-            y_06.close()
-            y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True, proxies=proxies)
-            y_00.close()
-        except Exception as e:
-            for i in range(0, 5, 1):
-                try:
-                    t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True, proxies=proxies)
-                    t_18.close()
-                    t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True, proxies=proxies)
-                    t_12.close()
-                    t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True, proxies=proxies)
-                    t_06.close()
-                    t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True, proxies=proxies)
-                    t_00.close()
-                    y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True, proxies=proxies)
-                    y_18.close()
-                    y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True, proxies=proxies)
-                    y_12.close()
-                    y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True, proxies=proxies)
-                    y_06.close()
-                    y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True, proxies=proxies)
-                    y_00.close()
-                    break
-                except Exception as e:
-                    i = i         
- 
-        
-    # Creates a list of URLs and URL responses to loop through when checking
-    
-    urls = [
-        today_18z,
-        today_12z,
-        today_06z,
-        today_00z,
-        yd_18z,
-        yd_12z,
-        yd_06z,
-        yd_18z
-    ]
-    
-    responses = [
-        t_18,
-        t_12,
-        t_06,
-        t_00,
-        y_18,
-        y_12,
-        y_06,
-        y_00
-    ]
-    
-    # Testing the status code and then returning the first link with a status code of 200
-
-    for response, url in zip(responses, urls):
-        if response.status_code == 200:
-            url = url
-            run = int(f"{url[78]}{url[79]}")
-            break        
-    
-    try:
-        url = url
-    except Exception as e:
-        print(f"Latest forecast data is over 24 hours old. Aborting.....")
-        sys.exit(1)
+    # Probes every candidate run at the same time, newest run first
+    # The scan returns the date and hour of the latest available run as soon as it is confirmed
+    date, run = probe_runs(scan_template, 
+                           proxies=proxies)
     
     if step == 6:
         if int(final_forecast_hour) > 100:
@@ -393,182 +220,21 @@ def gfs_0p50_url_scanner(final_forecast_hour,
         else:
             step = 6
             stop = int(final_forecast_hour) + step
-        
-        
-    urls = []
-    
+
     
-    if url == today_18z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2full.0p50.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2full.0p50.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2full.0p50.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
-    elif url == today_12z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2full.0p50.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2full.0p50.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2full.0p50.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
-    elif url == today_06z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2full.0p50.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2full.0p50.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2full.0p50.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
-    elif url == today_00z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2full.0p50.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2full.0p50.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2full.0p50.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
-    elif url == yd_18z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2full.0p50.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2full.0p50.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2full.0p50.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
-    elif url == yd_12z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2full.0p50.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2full.0p50.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2full.0p50.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
-    elif url == yd_06z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2full.0p50.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2full.0p50.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2full.0p50.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
+    forecast_hours = [i for i in range(0, stop, step)]
+    if int(final_forecast_hour) > 100:
+        forecast_hours = forecast_hours + [i for i in range(start, int(final_forecast_hour) + step, step)]
     else:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2full.0p50.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2full.0p50.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
-                        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2full.0p50.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
+        pass
         
-
+    urls = []
+    for i in forecast_hours:
+        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p50.pl"
+            f"?dir=%2Fgfs.{date.strftime('%Y%m%d')}%2F{run:02d}%2Fatmos&file=gfs.t{run:02d}z.pgrb2full.0p50.f{i:03d}{params}&"
+            f"{lev}&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
+        
+        urls.append(url)
         
     # Extract the filename
     # Parse the URL
@@ -598,7 +264,8 @@ def gfs_0p25_url_scanner(final_forecast_hour,
                           southern_bound, 
                           proxies, 
                           step, 
-                          variables):
+                          variables,
+                          levels=None):
     
     
     """
@@ -674,7 +341,10 @@ def gfs_0p25_url_scanner(final_forecast_hour,
             'vertical velocity'
             'water equivalent of accumulated snow depth'
     
-    Optional Arguments: None
+    Optional Arguments:
+    
+    1) levels (List or None) - Default=None. A list of the levels the user wants to download in plain language
+       (i.e. ['500 mb', '2 m above ground', 'surface']). When None, every level is downloaded.
     
     
     Returns
@@ -700,191 +370,23 @@ def gfs_0p25_url_scanner(final_forecast_hour,
     else:
         final_forecast_hour = f"00{final_forecast_hour}"
            
-    # These are the different download URLs for the various runtimes in the past 24 hours
-    
-    # URLs to scan for the latest file
-    today_18z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{now.strftime('%Y%m%d')}/18/atmos/")
-    today_12z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{now.strftime('%Y%m%d')}/12/atmos/")
-    today_06z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{now.strftime('%Y%m%d')}/06/atmos/")
-    today_00z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{now.strftime('%Y%m%d')}/00/atmos/")
-    
-    yesterday_18z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{yd.strftime('%Y%m%d')}/18/atmos/")
-    yesterday_12z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{yd.strftime('%Y%m%d')}/12/atmos/")
-    yesterday_06z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{yd.strftime('%Y%m%d')}/06/atmos/")
-    yesterday_00z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{yd.strftime('%Y%m%d')}/00/atmos/")
+    # The file checked for each candidate run in the past 24 hours
+    # {date} and {hour} are filled in with the date and hour of each candidate run
+    scan_template = ("https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{date}/{hour}/atmos/"
+                     f"gfs.t{{hour}}z.pgrb2.0p25.f{final_forecast_hour}")
     
     # Gets the variable list in a string format convered to GRIB filter keys
     
     keys = key_list(variables)
     params = result_string(keys)
-        
-    # Today's runs
-    today_18z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    today_12z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    today_06z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    today_00z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    # Yesterday's runs
-    yd_18z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    yd_12z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    yd_06z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
     
-    yd_00z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")    
-    
-
-    # The filenames for the different run times
-    f_18z = f"gfs.t18z.pgrb2.0p25.f{final_forecast_hour}"
-    f_12z = f"gfs.t12z.pgrb2.0p25.f{final_forecast_hour}"
-    f_06z = f"gfs.t06z.pgrb2.0p25.f{final_forecast_hour}"
-    f_00z = f"gfs.t00z.pgrb2.0p25.f{final_forecast_hour}"
-    
-    # Tests the connection for each link. 
-    # The first link with a response of 200 will be the download link
-    
-    # This is if the user has proxy servers disabled
-    if proxies == None:
-        try:
-            t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True)
-            t_18.close()
-            t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True)
-            t_12.close()
-            t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True)
-            t_06.close()
-            t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True)
-            t_00.close()
-            y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True)
-            y_18.close()
-            y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True)
-            y_12.close()
-            y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True)
-            y_06.close()
-            y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True)
-            y_00.close()
-        except Exception as e:
-            for i in range(0, 5, 1):
-                try:
-                    t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True)
-                    t_18.close()
-                    t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True)
-                    t_12.close()
-                    t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True)
-                    t_06.close()
-                    t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True)
-                    t_00.close()
-                    y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True)
-                    y_18.close()
-                    y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True)
-                    y_12.close()
-                    y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True)
-                    y_06.close()
-                    y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True)
-                    y_00.close()
-                    break
-                except Exception as e:
-                    i = i       
-                    
+    # Gets the level list in a string format converted to GRIB filter keys
+    lev = level_string(levels)
 
-    # This is if the user has a VPN/Proxy Server connection enabled
-    else:
-        try:
-            t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True, proxies=proxies)
-            t_18.close()
-            t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True, proxies=proxies)
-            t_12.close()
-            t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True, proxies=proxies)
-            t_06.close()
-            t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True, proxies=proxies)
-            t_00.close()
-            y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True, proxies=proxies)
-            y_18.close()
-            y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True, proxies=proxies)
-            y_12.close()
-            y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True, proxies=proxies)
-            y_06.close()
-            y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True, proxies=proxies)
-            y_00.close()
-        except Exception as e:
-            for i in range(0, 5, 1):
-                try:
-                    t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True, proxies=proxies)
-                    t_18.close()
-                    t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True, proxies=proxies)
-                    t_12.close()
-                    t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True, proxies=proxies)
-                    t_06.close()
-                    t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True, proxies=proxies)
-                    t_00.close()
-                    y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True, proxies=proxies)
-                    y_18.close()
-                    y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True, proxies=proxies)
-                    y_12.close()
-                    y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True, proxies=proxies)
-                    y_06.close()
-                    y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True, proxies=proxies)
-                    y_00.close()
-                    break
-                except Exception as e:
-                    i = i                
-        
-    # Creates a list of URLs and URL responses to loop through when checking
-    
-    
-    urls = [
-        today_18z,
-        today_12z,
-        today_06z,
-        today_00z,
-        yd_18z,
-        yd_12z,
-        yd_06z,
-        yd_18z
-    ]
-    
-    responses = [
-        t_18,
-        t_12,
-        t_06,
-        t_00,
-        y_18,
-        y_12,
-        y_06,
-        y_00
-    ]
-    
-    # Testing the status code and then returning the first link with a status code of 200
-
-    for response, url in zip(responses, urls):
-        if response.status_code == 200:
-            url = url
-            run = int(f"{url[78]}{url[79]}")
-            break        
-    
-    try:
-        url = url
-    except Exception as e:
-        print(f"Latest forecast data is over 24 hours old. Aborting.....")
-        sys.exit(1)
+    # Probes every candidate run at the same time, newest run first
+    # The scan returns the date and hour of the latest available run as soon as it is confirmed
+    date, run = probe_runs(scan_template, 
+                           proxies=proxies)
     
     if step == 6:
         if int(final_forecast_hour) > 100:
@@ -911,182 +413,21 @@ def gfs_0p25_url_scanner(final_forecast_hour,
         else:
             step = 6
             stop = int(final_forecast_hour) + step
-        
-        
-    urls = []
-    
+
     
-    if url == today_18z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2.0p25.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2.0p25.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2.0p25.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
-    elif url == today_12z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2.0p25.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2.0p25.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2.0p25.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
-    elif url == today_06z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2.0p25.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2.0p25.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2.0p25.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
-    elif url == today_00z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2.0p25.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2.0p25.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2.0p25.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
-    elif url == yd_18z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2.0p25.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2.0p25.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2.0p25.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
-    elif url == yd_12z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2.0p25.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2.0p25.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2.0p25.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
-    elif url == yd_06z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2.0p25.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2.0p25.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2.0p25.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
+    forecast_hours = [i for i in range(0, stop, step)]
+    if int(final_forecast_hour) > 100:
+        forecast_hours = forecast_hours + [i for i in range(start, int(final_forecast_hour) + step, step)]
     else:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2.0p25.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2.0p25.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
-                        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2.0p25.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
+        pass
         
-
+    urls = []
+    for i in forecast_hours:
+        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl"
+            f"?dir=%2Fgfs.{date.strftime('%Y%m%d')}%2F{run:02d}%2Fatmos&file=gfs.t{run:02d}z.pgrb2.0p25.f{i:03d}{params}&"
+            f"{lev}&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
+        
+        urls.append(url)
         
     # Extract the filename
     # Parse the URL
@@ -1219,191 +560,20 @@ def gfs_0p25_secondary_parameters_url_scanner(final_forecast_hour,
     else:
         final_forecast_hour = f"00{final_forecast_hour}"
            
-    # These are the different download URLs for the various runtimes in the past 24 hours
-    
-    # URLs to scan for the latest file
-    today_18z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{now.strftime('%Y%m%d')}/18/atmos/")
-    today_12z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{now.strftime('%Y%m%d')}/12/atmos/")
-    today_06z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{now.strftime('%Y%m%d')}/06/atmos/")
-    today_00z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{now.strftime('%Y%m%d')}/00/atmos/")
-    
-    yesterday_18z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{yd.strftime('%Y%m%d')}/18/atmos/")
-    yesterday_12z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{yd.strftime('%Y%m%d')}/12/atmos/")
-    yesterday_06z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{yd.strftime('%Y%m%d')}/06/atmos/")
-    yesterday_00z_scan = (f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{yd.strftime('%Y%m%d')}/00/atmos/")
+    # The file checked for each candidate run in the past 24 hours
+    # {date} and {hour} are filled in with the date and hour of each candidate run
+    scan_template = ("https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{date}/{hour}/atmos/"
+                     f"gfs.t{{hour}}z.pgrb2b.0p25.f{final_forecast_hour}")
     
     # Gets the variable list in a string format convered to GRIB filter keys
     
     keys = key_list(variables)
     params = result_string(keys)
-        
-    # Today's runs
-    today_18z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2b.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    today_12z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2b.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    today_06z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2b.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    today_00z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2b.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    # Yesterday's runs
-    yd_18z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2b.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    yd_12z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2b.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    yd_06z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2b.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-    
-    yd_00z = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2b.0p25.f{final_forecast_hour}{params}&"
-        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")    
-    
-
-    # The filenames for the different run times
-    f_18z = f"gfs.t18z.pgrb2b.0p25.f{final_forecast_hour}"
-    f_12z = f"gfs.t12z.pgrb2b.0p25.f{final_forecast_hour}"
-    f_06z = f"gfs.t06z.pgrb2b.0p25.f{final_forecast_hour}"
-    f_00z = f"gfs.t00z.pgrb2b.0p25.f{final_forecast_hour}"
-    
-    # Tests the connection for each link. 
-    # The first link with a response of 200 will be the download link
-    
-    # This is if the user has proxy servers disabled
-    if proxies == None:
-        try:
-            t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True)
-            t_18.close()
-            t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True)
-            t_12.close()
-            t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True)
-            t_06.close()
-            t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True)
-            t_00.close()
-            y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True)
-            y_18.close()
-            y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True)
-            y_12.close()
-            y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True)
-            y_06.close()
-            y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True)
-            y_00.close()
-        except Exception as e:
-            for i in range(0, 5, 1):
-                try:
-                    t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True)
-                    t_18.close()
-                    t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True)
-                    t_12.close()
-                    t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True)
-                    t_06.close()
-                    t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True)
-                    t_00.close()
-                    y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True)
-                    y_18.close()
-                    y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True)
-                    y_12.close()
-                    y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True)
-                    y_06.close()
-                    y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True)
-                    y_00.close()
-                    break
-                except Exception as e:
-                    i = i       
-                    
 
-    # This is if the user has a VPN/Proxy Server connection enabled
-    else:
-        try:
-            t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True, proxies=proxies)
-            t_18.close()
-            t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True, proxies=proxies)
-            t_12.close()
-            t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True, proxies=proxies)
-            t_06.close()
-            t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True, proxies=proxies)
-            t_00.close()
-            y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True, proxies=proxies)
-            y_18.close()
-            y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True, proxies=proxies)
-            y_12.close()
-            y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True, proxies=proxies)
-            y_06.close()
-            y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True, proxies=proxies)
-            y_00.close()
-        except Exception as e:
-            for i in range(0, 5, 1):
-                try:
-                    t_18 = requests.get(f"{today_18z_scan}{f_18z}", stream=True, proxies=proxies)
-                    t_18.close()
-                    t_12 = requests.get(f"{today_12z_scan}{f_12z}", stream=True, proxies=proxies)
-                    t_12.close()
-                    t_06 = requests.get(f"{today_06z_scan}{f_06z}", stream=True, proxies=proxies)
-                    t_06.close()
-                    t_00 = requests.get(f"{today_00z_scan}{f_00z}", stream=True, proxies=proxies)
-                    t_00.close()
-                    y_18 = requests.get(f"{yesterday_18z_scan}{f_18z}", stream=True, proxies=proxies)
-                    y_18.close()
-                    y_12 = requests.get(f"{yesterday_12z_scan}{f_12z}", stream=True, proxies=proxies)
-                    y_12.close()
-                    y_06 = requests.get(f"{yesterday_06z_scan}{f_06z}", stream=True, proxies=proxies)
-                    y_06.close()
-                    y_00 = requests.get(f"{yesterday_00z_scan}{f_00z}", stream=True, proxies=proxies)
-                    y_00.close()
-                    break
-                except Exception as e:
-                    i = i                
-        
-    # Creates a list of URLs and URL responses to loop through when checking
-    
-    
-    urls = [
-        today_18z,
-        today_12z,
-        today_06z,
-        today_00z,
-        yd_18z,
-        yd_12z,
-        yd_06z,
-        yd_18z
-    ]
-    
-    responses = [
-        t_18,
-        t_12,
-        t_06,
-        t_00,
-        y_18,
-        y_12,
-        y_06,
-        y_00
-    ]
-    
-    # Testing the status code and then returning the first link with a status code of 200
-
-    for response, url in zip(responses, urls):
-        if response.status_code == 200:
-            url = url
-            run = int(f"{url[79]}{url[80]}")
-            break        
-    
-    try:
-        url = url
-    except Exception as e:
-        print(f"Latest forecast data is over 24 hours old. Aborting.....")
-        sys.exit(1)
+    # Probes every candidate run at the same time, newest run first
+    # The scan returns the date and hour of the latest available run as soon as it is confirmed
+    date, run = probe_runs(scan_template, 
+                           proxies=proxies)
     
     if step == 6:
         if int(final_forecast_hour) > 100:
@@ -1430,182 +600,21 @@ def gfs_0p25_secondary_parameters_url_scanner(final_forecast_hour,
         else:
             step = 6
             stop = int(final_forecast_hour) + step
-        
-        
-    urls = []
-    
+
     
-    if url == today_18z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2b.0p25.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2b.0p25.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2b.0p25.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
-    elif url == today_12z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2b.0p25.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2b.0p25.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2b.0p25.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
-    elif url == today_06z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2b.0p25.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2b.0p25.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2b.0p25.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
-    elif url == today_00z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2b.0p25.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                    f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2b.0p25.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                        f"?dir=%2Fgfs.{now.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2b.0p25.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
-    elif url == yd_18z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2b.0p25.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2b.0p25.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F18%2Fatmos&file=gfs.t18z.pgrb2b.0p25.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
-    elif url == yd_12z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2b.0p25.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2b.0p25.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F12%2Fatmos&file=gfs.t12z.pgrb2b.0p25.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
-    elif url == yd_06z:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2b.0p25.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2b.0p25.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F06%2Fatmos&file=gfs.t06z.pgrb2b.0p25.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
-                    
+    forecast_hours = [i for i in range(0, stop, step)]
+    if int(final_forecast_hour) > 100:
+        forecast_hours = forecast_hours + [i for i in range(start, int(final_forecast_hour) + step, step)]
     else:
-        for i in range(0, stop, step):
-            if i < 10:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2b.0p25.f00{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-            else:
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                    f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2b.0p25.f0{i}{params}&"
-                    f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-            urls.append(url)
-                
-        if int(final_forecast_hour) > 100:
-            for i in range(start, int(final_forecast_hour) + step, step):
-                url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
-                        f"?dir=%2Fgfs.{yd.strftime('%Y%m%d')}%2F00%2Fatmos&file=gfs.t00z.pgrb2b.0p25.f{i}{params}&"
-                        f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
-                
-                urls.append(url)
+        pass
         
-
+    urls = []
+    for i in forecast_hours:
+        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25b.pl"
+            f"?dir=%2Fgfs.{date.strftime('%Y%m%d')}%2F{run:02d}%2Fatmos&file=gfs.t{run:02d}z.pgrb2b.0p25.f{i:03d}{params}&"
+            f"all_lev=on&subregion=&toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
+        
+        urls.append(url)
         
     # Extract the filename
     # Parse the URL
@@ -1,51 +1,165 @@
 """
-This module has the functions that download, unzip and return METAR data. 
+This module has the functions that download, unzip and return METAR data.
 
 (C) Eric J. Drewitz 2025
 """
 
 import pandas as pd
-import csv
-import urllib.request
+import io
 import os
-import time
 
-from wxdata.utils.file_funcs import extract_gzipped_file
 from wxdata.utils.recycle_bin import *
+from wxdata.client import session
+from wxdata.client.retry import call_with_retries
+
+# The METAR cache on the NOAA/AWC dataserver
+metar_cache_url = f"https://aviationweather.gov/data/cache/metars.cache.csv.gz"
+
+# Columns in the METAR cache that hold text rather than numbers
+# The wind direction (i.e. VRB) and visibility (i.e. 10+) are not always numbers
+text_columns = [
+    'raw_text',
+    'station_id',
+    'wind_dir_degrees',
+    'visibility_statute_mi',
+    'wx_string',
+    'sky_cover',
+    'flight_category',
+    'metar_type'
+]
+
+# Columns in the METAR cache that are flags (TRUE or blank)
+flag_columns = [
+    'corrected',
+    'auto',
+    'auto_station',
+    'maintenance_indicator_on',
+    'no_signal',
+    'lightning_sensor_off',
+    'freezing_rain_sensor_off',
+    'present_weather_sensor_off'
+]
+
+def get_csv_column_names(f):
 
-def get_csv_column_names_csv_module(file_path):
     """
-    This function extracts the header in a CSV file. 
-    
+    This function finds the header row in the METAR cache and returns the column names.
+
+    The METAR cache begins with a few lines of metadata (i.e. 'No errors', '4537 results') before the header row.
+    Lines are read until the header row is found so the stream is left at the first row of data.
+
+    Repeated column names (i.e. sky_cover and cloud_base_ft_agl for each cloud layer) are numbered the same way as pandas
+    (i.e. sky_cover, sky_cover.1, sky_cover.2)
+
     Required Arguments:
-    
-    1) file_path (String) - The path to the file.
-    
+
+    1) f (File Object) - A text stream of the METAR cache.
+
     Optional Arguments: None
-    
+
     Returns
     -------
-    
-    The headers of the contents in the CSV file. 
+
+    The column names of the METAR data.
     """
-    with open(file_path, 'r', newline='') as csvfile:
-        reader = csv.reader(csvfile)
-        header = next(reader) 
-        return header
 
-def download_metar_data(clear_recycle_bin=True):
-    
+    for line in f:
+        fields = line.strip().split(',')
+        if 'station_id' in fields:
+            break
+    else:
+        raise ValueError("The METAR data does not have a header row.")
+
+    names = []
+    counts = {}
+    for field in fields:
+        if field in counts:
+            counts[field] = counts[field] + 1
+            names.append(f"{field}.{counts[field]}")
+        else:
+            counts[field] = 0
+            names.append(field)
+
+    return names
+
+
+def read_metar_csv(f,
+                   columns=None):
+
+    """
+    This function reads the METAR cache into a Pandas DataFrame in a single pass.
+
+    Required Arguments:
+
+    1) f (File Object) - A text stream of the METAR cache.
+
+    Optional Arguments:
+
+    1) columns (String List or None) - Default=None. The columns to return (i.e. ['station_id', 'temp_c', 'dewpoint_c']).
+       Only these columns are parsed. When None, every column except raw_text is returned.
+
+    Returns
+    -------
+
+    A Pandas DataFrame of the METAR data with numeric columns as numbers, flag columns as booleans
+    and observation_time as a UTC datetime.
+    """
+
+    names = get_csv_column_names(f)
+
+    if columns == None:
+        columns = [name for name in names if name != 'raw_text']
+    else:
+        pass
+
+    # The text columns are read as strings and the remaining columns are parsed as numbers
+    dtypes = {}
+    for name in names:
+        if name.split('.')[0] in text_columns or name.split('.')[0] in flag_columns or name == 'observation_time':
+            dtypes[name] = 'string'
+        else:
+            pass
+
+    df = pd.read_csv(f,
+                     header=None,
+                     names=names,
+                     usecols=columns,
+                     dtype=dtypes)
+
+    for name in df.columns:
+        if name.split('.')[0] in flag_columns:
+            df[name] = df[name].str.upper().eq('TRUE').fillna(False).astype(bool)
+        elif name == 'observation_time':
+            df[name] = pd.to_datetime(df[name], utc=True, errors='coerce')
+        else:
+            pass
+
+    return df
+
+
+def download_metar_data(clear_recycle_bin=True,
+                        columns=None,
+                        save_to_disk=True):
+
     """
     Downloads the latest METAR Data from NOAA/AWC and returns a Pandas DataFrame.
-    
+
+    The METAR cache is decompressed as it is downloaded and parsed in a single pass.
+
     Required Arguments: None
-    
+
     Optional Arguments:
-    
+
     1) clear_recycle_bin (Boolean) - Default=True. When set to True, the contents in your recycle/trash bin will be deleted with each run
-        of the program you are calling WxData. This setting is to help preserve memory on the machine. 
+        of the program you are calling WxData. This setting is to help preserve memory on the machine.
 
-    Returns:        
+    2) columns (String List or None) - Default=None. The columns to return (i.e. ['station_id', 'latitude', 'longitude', 'temp_c']).
+       Only these columns are parsed. When None, every column except raw_text is returned.
+
+    3) save_to_disk (Boolean) - Default=True. When set to True, the METAR data is saved to f:METAR Data/metars.csv.
+       When set to False, the METAR data is streamed straight into the DataFrame and nothing is written to disk.
+
+    Returns:
     pd.DataFrame: A DataFrame containing the METAR data.
     """
     if clear_recycle_bin == True:
@@ -54,53 +168,39 @@ def download_metar_data(clear_recycle_bin=True):
         clear_trash_bin_linux()
     else:
         pass
-    
-    try:
-        urllib.request.urlretrieve(f"https://aviationweather.gov/data/cache/metars.cache.csv.gz", f"metars.cache.csv.gz")
-    except Exception as e:
-        for i in range(0, 6, 1):
-            time.sleep(30)
-            try:
-                urllib.request.urlretrieve(f"https://aviationweather.gov/data/cache/metars.cache.csv.gz", f"metars.cache.csv.gz")
-                break
-            except Exception as e:
-                i = i
-    extract_gzipped_file('metars.cache.csv.gz', 'metars.csv')
-    
-    if os.path.exists(f"METAR Data"):
-        pass
-    else:
-        os.mkdir(f"METAR Data")
 
-    try:
-        for file in os.listdir(f"METAR Data"):
-            os.remove(f"METAR Data/{file}")
-    except Exception as e:
+    if save_to_disk == True:
+        if os.path.exists(f"METAR Data"):
+            pass
+        else:
+            os.mkdir(f"METAR Data")
+
+        try:
+            for file in os.listdir(f"METAR Data"):
+                os.remove(f"METAR Data/{file}")
+        except Exception as e:
+            pass
+    else:
         pass
-        
-    os.replace(f"metars.csv", f"METAR Data/metars.csv")
-
-    with open('METAR Data/metars.csv', 'r', newline='') as csvfile:
-        # Create a reader object
-        csv_reader = csv.reader(csvfile)
-        rows = []
-        for row in csv_reader:
-            rows.append(row)
-    
-    data = []
-    for i in range(0, len(rows), 1):
-        if i > 4:
-            data.append(rows[i])
-            
-    df = pd.DataFrame(data)
-    
-    new_column_names = get_csv_column_names_csv_module(f"METAR Data/metars.csv")
-    
-    df.columns = new_column_names
-
-    df = df.drop('raw_text', axis=1)
-
-    
-    df = df.drop(index=0)
-    
-    return df
\ No newline at end of file
+
+    def read_cache():
+        if save_to_disk == True:
+            # The METAR cache is decompressed as it is downloaded so the .gz file is never written to disk
+            session.download_decompressed_file(metar_cache_url,
+                                               f"METAR Data/metars.csv",
+                                               retry=False)
+            with open(f"METAR Data/metars.csv", 'r', newline='') as f:
+                df = read_metar_csv(f,
+                                    columns=columns)
+        else:
+            with session.open_decompressed_url(metar_cache_url,
+                                               retry=False) as stream:
+                df = read_metar_csv(io.TextIOWrapper(stream, encoding='utf-8', newline=''),
+                                    columns=columns)
+        return df
+
+    # The whole download is retried under the retry policy so a stream cut off part way through is downloaded again
+    df = call_with_retries(read_cache,
+                           metar_cache_url)
+
+    return df
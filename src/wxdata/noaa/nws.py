@@ -13,6 +13,10 @@ import warnings
 warnings.filterwarnings('ignore')
 
 from wxdata.utils.recycle_bin import *
+from wxdata.utils.island_grids import(
+    grid_shape,
+    unscramble_dataset
+)
 
 
 alaska = '/SL.us008001/ST.opnl/DF.gr2/DC.ndfd/AR.alaska/'
@@ -83,100 +87,37 @@ def FIX_1D_GRIB_DATA(ds_short,
         'weather'       
         
     4) short_term_fname (String) - The filename of the short-term NDFD Grids. 
+       Kept for compatibility. The file is no longer re-opened. 
     
     5) extended_fname (String) - The filename of the extended NDFD Grids. 
+       Kept for compatibility. The file is no longer re-opened. 
     
     Optional Arguments: None
     
     Returns
     -------
     
-    A cleaned up xarray data array for the Hawaii grids. 
+    A cleaned up xarray dataset for the Hawaii grids on a 2-D (latitude, longitude) grid. 
     """
     
 
-    nrow = 225
-    ncol = 321
+    nrow, ncol = grid_shape('hi ndfd')
 
-    ds_list_short = []
-    for i in range(0, len(ds_short['step']), 1):
-        ds_short = ds_short.isel(step=i)
-        
-        var = ds_short[varKey].values
-        lat = ds_short['latitude'].values
-        lon = ds_short['longitude'].values
-        
-        var2d = np.empty([nrow,ncol])
-        lat2d = np.empty([nrow,ncol])
-        lon2d = np.empty([nrow,ncol])
-        
-        for i in range(0,nrow):
-            start = i*ncol
-            end = start+ncol
-            if i%2==0:
-                var2d[i,:] = var[start:end]
-            else:
-                var2d[i,:] = np.flip(var[start:end],axis=0)
-            
-            lat2d[i,:] = lat[start:end]
-            lon2d[i,:] = lon[start:end]
-        
-        lon1d = lon2d[0,:]
-        lat1d = lat2d[:,0]
-        ds_list_short.append(var2d)
-        ds_short = xr.open_dataset(f"NWS Data/{short_term_fname}", engine='cfgrib')
-        data_var_names_1 = [var.name for var in ds_short.data_vars.values()]
-        ds_short[varKey] = ds_short[data_var_names_1[0]]
-        ds_short = ds_short.drop_vars(data_var_names_1[0])
-        
-    dims = ("step", "latitude", "longitude")
-    short_coords = {
-        "step": len(ds_list_short),
-        "latitude": lat1d,  
-        "longitude": lon1d,  
-    }
-    
-    ds_short = xr.DataArray(ds_list_short, coords=short_coords, dims=dims)
-        
-    ds_list_extended = []
-    for i in range(0, len(ds_extended['step']), 1):
-        ds_extended = ds_extended.isel(step=i)
-        
-        var = ds_extended[varKey].values
-        lat = ds_extended['latitude'].values
-        lon = ds_extended['longitude'].values
-        
-        var2d = np.empty([nrow,ncol])
-        lat2d = np.empty([nrow,ncol])
-        lon2d = np.empty([nrow,ncol])
-        
-        for i in range(0,nrow):
-            start = i*ncol
-            end = start+ncol
-            if i%2==0:
-                var2d[i,:] = var[start:end]
-            else:
-                var2d[i,:] = np.flip(var[start:end],axis=0)
-            
-            lat2d[i,:] = lat[start:end]
-            lon2d[i,:] = lon[start:end]
-        
-        lon1d = lon2d[0,:]
-        lat1d = lat2d[:,0]
-        ds_list_extended.append(var2d)
-        ds_extended = xr.open_dataset(f"NWS Data/{extended_fname}", engine='cfgrib')
-        data_var_names_1 = [var.name for var in ds_extended.data_vars.values()]
-        ds_extended[varKey] = ds_extended[data_var_names_1[0]]
-        ds_extended = ds_extended.drop_vars(data_var_names_1[0])
-        
-    dims = ("step", "latitude", "longitude")
-    extended_coords = {
-        "step": len(ds_list_extended),
-        "latitude": lat1d,  
-        "longitude": lon1d,  
-    }
+    # Every step is rebuilt at once and every other row is flipped back
+    ds_short = unscramble_dataset(ds_short,
+                                  nrow,
+                                  ncol,
+                                  serpentine=True,
+                                  variables=[varKey])
     
-    ds_extended = xr.DataArray(ds_list_extended, coords=extended_coords, dims=dims)
+    if ds_extended is not False:
+        ds_extended = unscramble_dataset(ds_extended,
+                                         nrow,
+                                         ncol,
+                                         serpentine=True,
+                                         variables=[varKey])
+    else:
+        pass
     
     return ds_short, ds_extended
 
@@ -1,6 +1,18 @@
-import wxdata.post_processors.ecmwf_post_processing as ecmwf_post_processing
-import wxdata.post_processors.gefs_post_processing as gefs_post_processing
-import wxdata.post_processors.gfs_post_processing as gfs_post_processing
-import wxdata.post_processors.aigefs_post_processing as aigefs_post_processing
+# The post-processors are imported the first time they are used
+from wxdata.utils.lazy_imports import lazy_loader
 
-from wxdata.post_processors.rtma_post_processing import process_rtma_data
\ No newline at end of file
+__getattr__, __dir__, __all__ = lazy_loader(__name__, 
+                                            
+    {'wxdata.post_processors.rtma_post_processing':[
+        'process_rtma_data'
+    ]},
+    
+    modules={
+        'ecmwf_post_processing':'wxdata.post_processors.ecmwf_post_processing',
+        'gefs_post_processing':'wxdata.post_processors.gefs_post_processing',
+        'gfs_post_processing':'wxdata.post_processors.gfs_post_processing',
+        'aigefs_post_processing':'wxdata.post_processors.aigefs_post_processing'
+    })
+
+# lazy_loader is not part of the public API of the package
+del lazy_loader
@@ -12,6 +12,7 @@ import warnings
 warnings.filterwarnings('ignore')
 
 from wxdata.utils.file_funcs import file_paths_for_xarray
+from wxdata.utils.index_cache import open_mfdataset
 from wxdata.utils.coords import(
     shift_longitude,
     convert_lon
@@ -78,15 +79,14 @@ def aigefs_members_post_processing(paths,
             ds_list_1 = []
             
             for path in paths:
-                ds1 = xr.open_mfdataset(path, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        backend_kwargs={"indexpath": ""}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                                                                    latitude=slice(northern_bound, southern_bound, 1))
+                ds1 = open_mfdataset(path, 
+                                     concat_dim='step', 
+                                     combine='nested', 
+                                     coords='minimal', 
+                                     engine='cfgrib', 
+                                     compat='override', 
+                                     decode_timedelta=False).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                                                                 latitude=slice(northern_bound, southern_bound, 1))
                 ds1 = shift_longitude(ds1)
                 ds_list_1.append(ds1)
         except Exception as e:
@@ -96,16 +96,15 @@ def aigefs_members_post_processing(paths,
             ds_list_2 = []
             
             for path in paths:
-                ds2 = xr.open_mfdataset(path, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'paramId':167},
-                                        backend_kwargs={"indexpath": ""}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                                                                    latitude=slice(northern_bound, southern_bound, 1))
+                ds2 = open_mfdataset(path, 
+                                     concat_dim='step', 
+                                     combine='nested', 
+                                     coords='minimal', 
+                                     engine='cfgrib', 
+                                     compat='override', 
+                                     decode_timedelta=False, 
+                                     filter_by_keys={'paramId':167}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                                                                 latitude=slice(northern_bound, southern_bound, 1))
                 ds2 = shift_longitude(ds2)
                 ds_list_2.append(ds2)
         except Exception as e:
@@ -247,15 +246,14 @@ def aigefs_single_post_processing(path,
     path = file_paths_for_xarray(path)
     
     try:
-        ds = xr.open_mfdataset(path, 
-                                concat_dim='step', 
-                                combine='nested', 
-                                coords='minimal', 
-                                engine='cfgrib', 
-                                compat='override', 
-                                decode_timedelta=False, 
-                                backend_kwargs={"indexpath": ""}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                                                            latitude=slice(northern_bound, southern_bound, 1))
+        ds = open_mfdataset(path, 
+                             concat_dim='step', 
+                             combine='nested', 
+                             coords='minimal', 
+                             engine='cfgrib', 
+                             compat='override', 
+                             decode_timedelta=False).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                                                         latitude=slice(northern_bound, southern_bound, 1))
         ds = shift_longitude(ds)
         
         try:
@@ -328,16 +326,15 @@ def aigefs_single_post_processing(path,
         pass
     
     try:
-        ds1 = xr.open_mfdataset(path, 
-                                concat_dim='step', 
-                                combine='nested', 
-                                coords='minimal', 
-                                engine='cfgrib', 
-                                compat='override', 
-                                decode_timedelta=False, 
-                                filter_by_keys={'paramId':167},
-                                backend_kwargs={"indexpath": ""}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                                                            latitude=slice(northern_bound, southern_bound, 1))
+        ds1 = open_mfdataset(path, 
+                             concat_dim='step', 
+                             combine='nested', 
+                             coords='minimal', 
+                             engine='cfgrib', 
+                             compat='override', 
+                             decode_timedelta=False, 
+                             filter_by_keys={'paramId':167}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                                                         latitude=slice(northern_bound, southern_bound, 1))
         ds1 = shift_longitude(ds1)
         
         try:
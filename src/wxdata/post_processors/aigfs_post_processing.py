@@ -5,6 +5,7 @@ import warnings
 warnings.filterwarnings('ignore')
 
 from wxdata.utils.file_funcs import file_paths_for_xarray
+from wxdata.utils.index_cache import open_mfdataset
 from wxdata.utils.coords import(
     shift_longitude,
     convert_lon
@@ -18,7 +19,8 @@ def aigfs_post_processing(path,
                             western_bound,
                             eastern_bound,
                             northern_bound,
-                            southern_bound):
+                            southern_bound,
+                            files=None):
     
     """
     This function post-processes the AIGFS Data into a more user-friendly format.
@@ -35,7 +37,10 @@ def aigfs_post_processing(path,
 
     5) southern_bound (Float or Integer) - Default=-90. The southern bound of the data needed.
     
-    Optional Arguments: None
+    Optional Arguments:
+    
+    1) files (String List or None) - Default=None. The complete paths of the files to post-process (i.e. a single forecast hour).
+       When None, every file in {path} is post-processed.
     
     Returns
     -------
@@ -64,18 +69,20 @@ def aigfs_post_processing(path,
     western_bound, eastern_bound = convert_lon(western_bound, 
                                                     eastern_bound) 
     
-    path = file_paths_for_xarray(path)
+    if files == None:
+        path = file_paths_for_xarray(path)
+    else:
+        path = files
     
     try:
-        ds = xr.open_mfdataset(path, 
-                                concat_dim='step', 
-                                combine='nested', 
-                                coords='minimal', 
-                                engine='cfgrib', 
-                                compat='override', 
-                                decode_timedelta=False, 
-                                backend_kwargs={"indexpath": ""}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                                                            latitude=slice(northern_bound, southern_bound, 1))
+        ds = open_mfdataset(path, 
+                             concat_dim='step', 
+                             combine='nested', 
+                             coords='minimal', 
+                             engine='cfgrib', 
+                             compat='override', 
+                             decode_timedelta=False).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                                                         latitude=slice(northern_bound, southern_bound, 1))
         ds = shift_longitude(ds)
         
         try:
@@ -148,16 +155,15 @@ def aigfs_post_processing(path,
         pass
     
     try:
-        ds1 = xr.open_mfdataset(path, 
-                                concat_dim='step', 
-                                combine='nested', 
-                                coords='minimal', 
-                                engine='cfgrib', 
-                                compat='override', 
-                                decode_timedelta=False, 
-                                filter_by_keys={'paramId':167},
-                                backend_kwargs={"indexpath": ""}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                                                            latitude=slice(northern_bound, southern_bound, 1))
+        ds1 = open_mfdataset(path, 
+                             concat_dim='step', 
+                             combine='nested', 
+                             coords='minimal', 
+                             engine='cfgrib', 
+                             compat='override', 
+                             decode_timedelta=False, 
+                             filter_by_keys={'paramId':167}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                                                         latitude=slice(northern_bound, southern_bound, 1))
         ds1 = shift_longitude(ds1)
         
         try:
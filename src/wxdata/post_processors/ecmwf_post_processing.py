@@ -16,6 +16,7 @@ from wxdata.utils.file_funcs import(
     clear_idx_files_in_path,
     sorted_paths
 )
+from wxdata.utils.index_cache import open_mfdataset
 
 sys.tracebacklimit = 0
 logging.disable()
@@ -24,7 +25,8 @@ def ecmwf_ifs_post_processing(path,
                             western_bound, 
                             eastern_bound, 
                             northern_bound, 
-                            southern_bound):
+                            southern_bound,
+                            files=None):
     
     """
     This function does the following:
@@ -45,7 +47,10 @@ def ecmwf_ifs_post_processing(path,
 
     5) southern_bound (Float or Integer) - Default=-90. The southern bound of the data needed.
     
-    Optional Arguments: None
+    Optional Arguments:
+    
+    1) files (String List or None) - Default=None. The complete paths of the files to post-process (i.e. a single forecast hour).
+       When None, every file in {path} is post-processed.
     
     Returns
     -------
@@ -109,72 +114,75 @@ def ecmwf_ifs_post_processing(path,
     """
     clear_idx_files_in_path(path)
     
-    files = sorted_paths(path)
+    if files == None:
+        files = sorted_paths(path)
+    else:
+        pass
     
     try:
-        ds = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                        latitude=slice(northern_bound, southern_bound, 1))
+        ds = open_mfdataset(files, 
+                         concat_dim='step', 
+                         combine='nested', 
+                         coords='minimal', 
+                         engine='cfgrib', 
+                         compat='override', 
+                         decode_timedelta=False).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                     latitude=slice(northern_bound, southern_bound, 1))
     except Exception as e:
         pass
     
     try:
-        ds1 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False, 
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround', 'paramId':238167}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                                                                        latitude=slice(northern_bound, southern_bound, 1))
+        ds1 = open_mfdataset(files, 
+                         concat_dim='step', 
+                         combine='nested', 
+                         coords='minimal', 
+                         engine='cfgrib', 
+                         compat='override', 
+                         decode_timedelta=False, 
+                         filter_by_keys={'typeOfLevel': 'heightAboveGround', 'paramId':238167}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                                                                     latitude=slice(northern_bound, southern_bound, 1))
     
     except Exception as e:
         pass
     
     try:
-        ds2 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround', 'paramId':228246}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                                                                       latitude=slice(northern_bound, southern_bound, 1))
+        ds2 = open_mfdataset(files, 
+                         concat_dim='step', 
+                         combine='nested', 
+                         coords='minimal', 
+                         engine='cfgrib', 
+                         compat='override', 
+                         decode_timedelta=False,
+                         filter_by_keys={'typeOfLevel': 'heightAboveGround', 'paramId':228246}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                                                                    latitude=slice(northern_bound, southern_bound, 1))
     
     except Exception as e:
         pass
     
     try:
-        ds3 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround', 'paramId':228247}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                                                                       latitude=slice(northern_bound, southern_bound, 1))
+        ds3 = open_mfdataset(files, 
+                         concat_dim='step', 
+                         combine='nested', 
+                         coords='minimal', 
+                         engine='cfgrib', 
+                         compat='override', 
+                         decode_timedelta=False,
+                         filter_by_keys={'typeOfLevel': 'heightAboveGround', 'paramId':228247}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                                                                    latitude=slice(northern_bound, southern_bound, 1))
         
     except Exception as e:
         pass
     
     try:
-        ds4 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround', 'paramId':168}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                                                                    latitude=slice(northern_bound, southern_bound, 1))
+        ds4 = open_mfdataset(files, 
+                         concat_dim='step', 
+                         combine='nested', 
+                         coords='minimal', 
+                         engine='cfgrib', 
+                         compat='override', 
+                         decode_timedelta=False,
+                         filter_by_keys={'typeOfLevel': 'heightAboveGround', 'paramId':168}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                                                                 latitude=slice(northern_bound, southern_bound, 1))
     except Exception as e:
         pass
     
@@ -604,184 +612,184 @@ def ecmwf_aifs_post_processing(path,
     files = sorted_paths(path)
     
     try:
-        ds = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'soilLayer'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                        latitude=slice(northern_bound, southern_bound, 1))
+        ds = open_mfdataset(files, 
+                         concat_dim='step', 
+                         combine='nested', 
+                         coords='minimal', 
+                         engine='cfgrib', 
+                         compat='override', 
+                         decode_timedelta=False,
+                         filter_by_keys={'typeOfLevel': 'soilLayer'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                     latitude=slice(northern_bound, southern_bound, 1))
                             
     except Exception as e:
         pass
     
     try:
-        ds1 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'isobaricInhPa'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                        latitude=slice(northern_bound, southern_bound, 1))
+        ds1 = open_mfdataset(files, 
+                         concat_dim='step', 
+                         combine='nested', 
+                         coords='minimal', 
+                         engine='cfgrib', 
+                         compat='override', 
+                         decode_timedelta=False,
+                         filter_by_keys={'typeOfLevel': 'isobaricInhPa'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                     latitude=slice(northern_bound, southern_bound, 1))
                             
     except Exception as e:
         pass
     
     try:
-        ds2 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                        latitude=slice(northern_bound, southern_bound, 1))
+        ds2 = open_mfdataset(files, 
+                         concat_dim='step', 
+                         combine='nested', 
+                         coords='minimal', 
+                         engine='cfgrib', 
+                         compat='override', 
+                         decode_timedelta=False,
+                         filter_by_keys={'typeOfLevel': 'heightAboveGround'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                     latitude=slice(northern_bound, southern_bound, 1))
                             
     except Exception as e:
         pass
     
     try:
-        ds3 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'10u'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                        latitude=slice(northern_bound, southern_bound, 1))
+        ds3 = open_mfdataset(files, 
+                         concat_dim='step', 
+                         combine='nested', 
+                         coords='minimal', 
+                         engine='cfgrib', 
+                         compat='override', 
+                         decode_timedelta=False,
+                         filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'10u'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                     latitude=slice(northern_bound, southern_bound, 1))
                             
     except Exception as e:
         pass
     
     
     try:
-        ds4 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'10v'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                        latitude=slice(northern_bound, southern_bound, 1))
+        ds4 = open_mfdataset(files, 
+                         concat_dim='step', 
+                         combine='nested', 
+                         coords='minimal', 
+                         engine='cfgrib', 
+                         compat='override', 
+                         decode_timedelta=False,
+                         filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'10v'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                     latitude=slice(northern_bound, southern_bound, 1))
                             
     except Exception as e:
         pass
     
     try:
-        ds5 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround', 'paramId':167}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                        latitude=slice(northern_bound, southern_bound, 1))
+        ds5 = open_mfdataset(files, 
+                         concat_dim='step', 
+                         combine='nested', 
+                         coords='minimal', 
+                         engine='cfgrib', 
+                         compat='override', 
+                         decode_timedelta=False,
+                         filter_by_keys={'typeOfLevel': 'heightAboveGround', 'paramId':167}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                     latitude=slice(northern_bound, southern_bound, 1))
                             
     except Exception as e:
         pass
     
     try:
-        ds6 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround', 'paramId':168}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                        latitude=slice(northern_bound, southern_bound, 1))
+        ds6 = open_mfdataset(files, 
+                         concat_dim='step', 
+                         combine='nested', 
+                         coords='minimal', 
+                         engine='cfgrib', 
+                         compat='override', 
+                         decode_timedelta=False,
+                         filter_by_keys={'typeOfLevel': 'heightAboveGround', 'paramId':168}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                     latitude=slice(northern_bound, southern_bound, 1))
                             
     except Exception as e:
         pass
     
     try:
-        ds7 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'surface'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                        latitude=slice(northern_bound, southern_bound, 1))
+        ds7 = open_mfdataset(files, 
+                         concat_dim='step', 
+                         combine='nested', 
+                         coords='minimal', 
+                         engine='cfgrib', 
+                         compat='override', 
+                         decode_timedelta=False,
+                         filter_by_keys={'typeOfLevel': 'surface'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                     latitude=slice(northern_bound, southern_bound, 1))
                             
     except Exception as e:
         pass
     
     try:
-        ds8 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'lowCloudLayer'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                        latitude=slice(northern_bound, southern_bound, 1))
+        ds8 = open_mfdataset(files, 
+                         concat_dim='step', 
+                         combine='nested', 
+                         coords='minimal', 
+                         engine='cfgrib', 
+                         compat='override', 
+                         decode_timedelta=False,
+                         filter_by_keys={'typeOfLevel': 'lowCloudLayer'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                     latitude=slice(northern_bound, southern_bound, 1))
                             
     except Exception as e:
         pass
     
     try:
-        ds9 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'mediumCloudLayer'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                        latitude=slice(northern_bound, southern_bound, 1))
+        ds9 = open_mfdataset(files, 
+                         concat_dim='step', 
+                         combine='nested', 
+                         coords='minimal', 
+                         engine='cfgrib', 
+                         compat='override', 
+                         decode_timedelta=False,
+                         filter_by_keys={'typeOfLevel': 'mediumCloudLayer'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                     latitude=slice(northern_bound, southern_bound, 1))
                             
     except Exception as e:
         pass
     
     try:
-        ds10 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'highCloudLayer'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                        latitude=slice(northern_bound, southern_bound, 1))
+        ds10 = open_mfdataset(files, 
+                         concat_dim='step', 
+                         combine='nested', 
+                         coords='minimal', 
+                         engine='cfgrib', 
+                         compat='override', 
+                         decode_timedelta=False,
+                         filter_by_keys={'typeOfLevel': 'highCloudLayer'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                     latitude=slice(northern_bound, southern_bound, 1))
                             
     except Exception as e:
         pass
     
     try:
-        ds11 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'entireAtmosphere'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                        latitude=slice(northern_bound, southern_bound, 1))
+        ds11 = open_mfdataset(files, 
+                         concat_dim='step', 
+                         combine='nested', 
+                         coords='minimal', 
+                         engine='cfgrib', 
+                         compat='override', 
+                         decode_timedelta=False,
+                         filter_by_keys={'typeOfLevel': 'entireAtmosphere'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                     latitude=slice(northern_bound, southern_bound, 1))
                             
     except Exception as e:
         pass
     
     try:
-        ds12 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'meanSea'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                        latitude=slice(northern_bound, southern_bound, 1))
+        ds12 = open_mfdataset(files, 
+                         concat_dim='step', 
+                         combine='nested', 
+                         coords='minimal', 
+                         engine='cfgrib', 
+                         compat='override', 
+                         decode_timedelta=False,
+                         filter_by_keys={'typeOfLevel': 'meanSea'}).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                     latitude=slice(northern_bound, southern_bound, 1))
                             
     except Exception as e:
         pass
@@ -1013,14 +1021,14 @@ def ecmwf_ifs_wave_post_processing(path,
     files = sorted_paths(path)
     
     try:
-        ds = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False).sel(longitude=slice(western_bound, eastern_bound, 1), 
-                                                        latitude=slice(northern_bound, southern_bound, 1))
+        ds = open_mfdataset(files, 
+                         concat_dim='step', 
+                         combine='nested', 
+                         coords='minimal', 
+                         engine='cfgrib', 
+                         compat='override', 
+                         decode_timedelta=False).sel(longitude=slice(western_bound, eastern_bound, 1), 
+                                                     latitude=slice(northern_bound, southern_bound, 1))
     except Exception as e:
         pass
     
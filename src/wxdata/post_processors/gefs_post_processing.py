@@ -16,12 +16,14 @@ from wxdata.utils.file_funcs import(
     clear_gefs_idx_files
 )
 
+from wxdata.utils.index_cache import open_mfdataset
 from wxdata.utils.coords import shift_longitude
 
 sys.tracebacklimit = 0
 logging.disable()
 
-def primary_gefs_post_processing(paths):
+def primary_gefs_post_processing(paths,
+                                 files=None):
     
     """
     This function post-processes the GEFS (Primary) Parameters for GEFS0P50 and GEFS0P25. 
@@ -30,6 +32,12 @@ def primary_gefs_post_processing(paths):
     
     1) paths (List) - A list of file paths to the GEFS0P50 or GEFS0P25 files. 
     
+    Optional Arguments:
+    
+    1) files (List or None) - Default=None. The complete paths of the files to post-process (i.e. a single forecast hour).
+       When more than one path is passed in, this is a list of the files of each path in the same order as paths.
+       When None, every file in paths is post-processed.
+    
     Returns
     -------
     
@@ -121,20 +129,23 @@ def primary_gefs_post_processing(paths):
 
     if len(paths) > 1:
         
-        paths = file_paths_for_xarray(paths)
+        if files == None:
+            paths = file_paths_for_xarray(paths)
+        else:
+            paths = files
         try:
             ds_list_1 = []
             
             for path in paths:
                 file_pattern = path
-                ds1 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'surface'})
+                ds1 = open_mfdataset(file_pattern, 
+                                     concat_dim='step', 
+                                     combine='nested', 
+                                     coords='minimal', 
+                                     engine='cfgrib', 
+                                     compat='override', 
+                                     decode_timedelta=False, 
+                                     filter_by_keys={'typeOfLevel': 'surface'})
                 ds1 = shift_longitude(ds1)
                 ds_list_1.append(ds1)
         except Exception as e:
@@ -143,14 +154,14 @@ def primary_gefs_post_processing(paths):
             ds_list_2 = []
             for path in paths:
                 file_pattern = path
-                ds2 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'meanSea'})
+                ds2 = open_mfdataset(file_pattern, 
+                                     concat_dim='step', 
+                                     combine='nested', 
+                                     coords='minimal', 
+                                     engine='cfgrib', 
+                                     compat='override', 
+                                     decode_timedelta=False, 
+                                     filter_by_keys={'typeOfLevel': 'meanSea'})
                 ds2 = shift_longitude(ds2)
                 ds_list_2.append(ds2)
         except Exception as e:
@@ -159,14 +170,14 @@ def primary_gefs_post_processing(paths):
             ds_list_3 = []
             for path in paths:
                 file_pattern = path
-                ds3 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'depthBelowLandLayer'})
+                ds3 = open_mfdataset(file_pattern, 
+                                     concat_dim='step', 
+                                     combine='nested', 
+                                     coords='minimal', 
+                                     engine='cfgrib', 
+                                     compat='override', 
+                                     decode_timedelta=False, 
+                                     filter_by_keys={'typeOfLevel': 'depthBelowLandLayer'})
                 ds3 = shift_longitude(ds3)
                 ds_list_3.append(ds3)
         except Exception as e:
@@ -175,14 +186,14 @@ def primary_gefs_post_processing(paths):
             ds_list_4 = []
             for path in paths:
                 file_pattern = path
-                ds4 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'heightAboveGround'})
+                ds4 = open_mfdataset(file_pattern, 
+                                     concat_dim='step', 
+                                     combine='nested', 
+                                     coords='minimal', 
+                                     engine='cfgrib', 
+                                     compat='override', 
+                                     decode_timedelta=False, 
+                                     filter_by_keys={'typeOfLevel': 'heightAboveGround'})
                 ds4 = shift_longitude(ds4)
                 ds_list_4.append(ds4)
         except Exception as e:
@@ -192,14 +203,14 @@ def primary_gefs_post_processing(paths):
             ds_list_5 = []
             for path in paths:
                 file_pattern = path
-                ds5 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'10u'})
+                ds5 = open_mfdataset(file_pattern, 
+                                     concat_dim='step', 
+                                     combine='nested', 
+                                     coords='minimal', 
+                                     engine='cfgrib', 
+                                     compat='override', 
+                                     decode_timedelta=False, 
+                                     filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'10u'})
                 ds5 = shift_longitude(ds5)
                 ds_list_5.append(ds5)
         except Exception as e:
@@ -209,14 +220,14 @@ def primary_gefs_post_processing(paths):
             ds_list_6 = []
             for path in paths:
                 file_pattern = path
-                ds6 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'10v'})
+                ds6 = open_mfdataset(file_pattern, 
+                                     concat_dim='step', 
+                                     combine='nested', 
+                                     coords='minimal', 
+                                     engine='cfgrib', 
+                                     compat='override', 
+                                     decode_timedelta=False, 
+                                     filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'10v'})
                 ds6 = shift_longitude(ds6)
                 ds_list_6.append(ds6)
         except Exception as e:
@@ -226,14 +237,14 @@ def primary_gefs_post_processing(paths):
             ds_list_7 = []
             for path in paths:
                 file_pattern = path
-                ds7 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'atmosphereSingleLayer'})
+                ds7 = open_mfdataset(file_pattern, 
+                                     concat_dim='step', 
+                                     combine='nested', 
+                                     coords='minimal', 
+                                     engine='cfgrib', 
+                                     compat='override', 
+                                     decode_timedelta=False, 
+                                     filter_by_keys={'typeOfLevel': 'atmosphereSingleLayer'})
                 ds7 = shift_longitude(ds7)
                 ds_list_7.append(ds7)
         except Exception as e:
@@ -242,14 +253,14 @@ def primary_gefs_post_processing(paths):
             ds_list_8 = []
             for path in paths:
                 file_pattern = path
-                ds8 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer'})
+                ds8 = open_mfdataset(file_pattern, 
+                                     concat_dim='step', 
+                                     combine='nested', 
+                                     coords='minimal', 
+                                     engine='cfgrib', 
+                                     compat='override', 
+                                     decode_timedelta=False, 
+                                     filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer'})
                 ds8 = shift_longitude(ds8)
                 ds_list_8.append(ds8)
         except Exception as e:
@@ -258,14 +269,14 @@ def primary_gefs_post_processing(paths):
             ds_list_9 = []
             for path in paths:
                 file_pattern = path
-                ds9 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'isobaricInhPa'})
+                ds9 = open_mfdataset(file_pattern, 
+                                     concat_dim='step', 
+                                     combine='nested', 
+                                     coords='minimal', 
+                                     engine='cfgrib', 
+                                     compat='override', 
+                                     decode_timedelta=False, 
+                                     filter_by_keys={'typeOfLevel': 'isobaricInhPa'})
                 ds9 = shift_longitude(ds9)
                 ds_list_9.append(ds9)
         except Exception as e:
@@ -274,14 +285,14 @@ def primary_gefs_post_processing(paths):
             ds_list_10 = []
             for path in paths:
                 file_pattern = path
-                ds10 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'t'})
+                ds10 = open_mfdataset(file_pattern, 
+                                      concat_dim='step', 
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'t'})
                 ds10 = shift_longitude(ds10)
                 ds_list_10.append(ds10)
         except Exception as e:
@@ -290,14 +301,14 @@ def primary_gefs_post_processing(paths):
             ds_list_11 = []
             for path in paths:
                 file_pattern = path
-                ds11 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'r'})
+                ds11 = open_mfdataset(file_pattern, 
+                                      concat_dim='step', 
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'r'})
                 ds11 = shift_longitude(ds11)
                 ds_list_11.append(ds11)
         except Exception as e:
@@ -306,14 +317,14 @@ def primary_gefs_post_processing(paths):
             ds_list_12 = []
             for path in paths:
                 file_pattern = path
-                ds12 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'u'})
+                ds12 = open_mfdataset(file_pattern, 
+                                      concat_dim='step', 
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'u'})
                 ds12 = shift_longitude(ds12)
                 ds_list_12.append(ds12)
         except Exception as e:
@@ -322,14 +333,14 @@ def primary_gefs_post_processing(paths):
             ds_list_13 = []
             for path in paths:
                 file_pattern = path
-                ds13 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'v'})
+                ds13 = open_mfdataset(file_pattern, 
+                                      concat_dim='step', 
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'v'})
                 ds13 = shift_longitude(ds13)
                 ds_list_13.append(ds13)
         except Exception as e:
@@ -339,14 +350,14 @@ def primary_gefs_post_processing(paths):
             ds_list_14 = []
             for path in paths:
                 file_pattern = path
-                ds14 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer'})
+                ds14 = open_mfdataset(file_pattern, 
+                                      concat_dim='step', 
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer'})
                 ds14 = shift_longitude(ds14)
                 ds_list_14.append(ds14)
         except Exception as e:
@@ -479,178 +490,181 @@ def primary_gefs_post_processing(paths):
         
     else:
         
-        file_pattern = file_paths_for_xarray(paths)
+        if files == None:
+            file_pattern = file_paths_for_xarray(paths)
+        else:
+            file_pattern = files
         
         try:
-            ds = xr.open_mfdataset(file_pattern, 
-                                concat_dim='step', 
-                                combine='nested', 
-                                coords='minimal', 
-                                engine='cfgrib', 
-                                compat='override', 
-                                decode_timedelta=False, 
-                                filter_by_keys={'typeOfLevel': 'surface'})
+            ds = open_mfdataset(file_pattern, 
+                             concat_dim='step', 
+                             combine='nested', 
+                             coords='minimal', 
+                             engine='cfgrib', 
+                             compat='override', 
+                             decode_timedelta=False, 
+                             filter_by_keys={'typeOfLevel': 'surface'})
             ds = shift_longitude(ds)
         except Exception as e:
             pass
 
         try:        
-            ds1 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'meanSea'})
+            ds1 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'meanSea'})
             ds1 = shift_longitude(ds1)
         except Exception as e:
             pass
 
         try: 
-            ds2 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'depthBelowLandLayer'})
+            ds2 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'depthBelowLandLayer'})
             ds2 = shift_longitude(ds2)
         except Exception as e:
             pass
         try: 
-            ds3 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'heightAboveGround'})
+            ds3 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'heightAboveGround'})
             ds3 = shift_longitude(ds3)
         except Exception as e:
             pass
         try: 
-            ds4 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False,
-                                    filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'10u'})
+            ds4 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False,
+                                 filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'10u'})
             ds4 = shift_longitude(ds4)
         except Exception as e:
             pass
         
         try: 
-            ds5 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'10v'})
+            ds5 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'10v'})
             ds5 = shift_longitude(ds5)
         except Exception as e:
             pass
         
         try: 
-            ds6 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'atmosphereSingleLayer'})
+            ds6 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'atmosphereSingleLayer'})
             ds6 = shift_longitude(ds6)
         except Exception as e:
             pass            
         try: 
-            ds7 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested',
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer'})
+            ds7 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested',
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer'})
             ds7 = shift_longitude(ds7)
         except Exception as e:
             pass
         try: 
-            ds8 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'isobaricInhPa'})
+            ds8 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'isobaricInhPa'})
             ds8 = shift_longitude(ds8)
         except Exception as e:
             pass
         try: 
-            ds9 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'t'})
+            ds9 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'t'})
             ds9 = shift_longitude(ds9)
         except Exception as e:
             pass
         try: 
-            ds10 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'r'})
+            ds10 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'r'})
             ds10 = shift_longitude(ds10)
         except Exception as e:
             pass
         try: 
-            ds11 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested',
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'u'})
+            ds11 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested',
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'u'})
             ds11 = shift_longitude(ds11)
         except Exception as e:
             pass
         try: 
-            ds12 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'v'})
+            ds12 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'v'})
             ds12 = shift_longitude(ds12)
         except Exception as e:
             pass     
         
         try: 
-            ds13 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False,
-                                    filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer'})
+            ds13 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False,
+                                 filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer'})
             ds13 = shift_longitude(ds13)
         except Exception as e:
             pass       
@@ -1020,577 +1034,577 @@ def secondary_gefs_post_processing(paths):
         file_pattern = file_paths_for_xarray(paths)
         
         try:
-            ds = xr.open_mfdataset(file_pattern, 
-                                   concat_dim='step', 
-                                   combine='nested', 
-                                   coords='minimal', 
-                                   engine='cfgrib', 
-                                   compat='override',
-                                   decode_timedelta=False,
-                                   filter_by_keys={'typeOfLevel': 'surface'})
+            ds = open_mfdataset(file_pattern, 
+                                concat_dim='step', 
+                                combine='nested', 
+                                coords='minimal', 
+                                engine='cfgrib', 
+                                compat='override',
+                                decode_timedelta=False,
+                                filter_by_keys={'typeOfLevel': 'surface'})
             ds = shift_longitude(ds)
         except Exception as e:
             pass    
         try:        
-            ds1 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False,
-                                    filter_by_keys={'typeOfLevel': 'meanSea'})
+            ds1 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False,
+                                 filter_by_keys={'typeOfLevel': 'meanSea'})
             ds1 = shift_longitude(ds1) 
         except Exception as e:
             pass        
         try:        
-            ds2 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal',
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'planetaryBoundaryLayer'})
+            ds2 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal',
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'planetaryBoundaryLayer'})
             ds2 = shift_longitude(ds2)
         except Exception as e:
             pass          
         try:        
-            ds3 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step',
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False,
-                                    filter_by_keys={'typeOfLevel': 'isobaricInhPa'})
+            ds3 = open_mfdataset(file_pattern, 
+                                 concat_dim='step',
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False,
+                                 filter_by_keys={'typeOfLevel': 'isobaricInhPa'})
             ds3 = shift_longitude(ds3)  
         except Exception as e:
             pass        
         try:        
-            ds4 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step',
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'t'})
+            ds4 = open_mfdataset(file_pattern, 
+                                 concat_dim='step',
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'t'})
             ds4 = shift_longitude(ds4)
         except Exception as e:
             pass                    
         try:        
-            ds5 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override',
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'w'})
+            ds5 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override',
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'w'})
             ds5 = shift_longitude(ds5)
         except Exception as e:
             pass        
         try:        
-            ds6 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested',
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'u'})
+            ds6 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested',
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'u'})
             ds6 = shift_longitude(ds6)
         except Exception as e:
             pass        
         try:        
-            ds7 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step',
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'v'})
+            ds7 = open_mfdataset(file_pattern, 
+                                 concat_dim='step',
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'v'})
             ds7 = shift_longitude(ds7)
         except Exception as e:
             pass        
         try:        
-            ds8 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override',
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'o3mr'})
+            ds8 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override',
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'o3mr'})
             ds8 = shift_longitude(ds8)
         except Exception as e:
             pass        
         try:        
-            ds9 = xr.open_mfdataset(file_pattern, 
-                                    concat_dim='step', 
-                                    combine='nested', 
-                                    coords='minimal', 
-                                    engine='cfgrib', 
-                                    compat='override', 
-                                    decode_timedelta=False, 
-                                    filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'absv'})
+            ds9 = open_mfdataset(file_pattern, 
+                                 concat_dim='step', 
+                                 combine='nested', 
+                                 coords='minimal', 
+                                 engine='cfgrib', 
+                                 compat='override', 
+                                 decode_timedelta=False, 
+                                 filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'absv'})
             ds9 = shift_longitude(ds9)
         except Exception as e:
             pass        
         try:        
-            ds10 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal',
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'clwmr'})
+            ds10 = open_mfdataset(file_pattern,
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal',
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'clwmr'})
             ds10 = shift_longitude(ds10)
         except Exception as e:
             pass        
         try:        
-            ds12 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'ICSEV'})
+            ds12 = open_mfdataset(file_pattern,
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'ICSEV'})
             ds12 = shift_longitude(ds12)
         except Exception as e:
             pass        
         try:        
-            ds13 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal',
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'tcc'})
+            ds13 = open_mfdataset(file_pattern,
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal',
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'tcc'})
             ds13 = shift_longitude(ds13)
         except Exception as e:
             pass        
         try:        
-            ds14 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'r'})
+            ds14 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'r'})
             ds14 = shift_longitude(ds14) 
         except Exception as e:
             pass        
         try:        
-            ds15 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'depthBelowLandLayer'})
+            ds15 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'depthBelowLandLayer'})
             ds15 = shift_longitude(ds15)
         except Exception as e:
             pass        
         try:        
-            ds16 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'depthBelowLandLayer', 'shortName':'st'})
+            ds16 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'depthBelowLandLayer', 'shortName':'st'})
             ds16 = shift_longitude(ds16)
         except Exception as e:
             pass        
         try:        
-            ds17 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'depthBelowLandLayer', 'shortName':'soilw'})
+            ds17 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'depthBelowLandLayer', 'shortName':'soilw'})
             ds17 = shift_longitude(ds17)
         except Exception as e:
             pass        
         try:        
-            ds18 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib',
-                                     compat='override',
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'heightAboveGround'})
+            ds18 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib',
+                                  compat='override',
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'heightAboveGround'})
             ds18 = shift_longitude(ds18)
         except Exception as e:
             pass        
         try:        
-            ds19 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'q'})
+            ds19 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'q'})
             ds19 = shift_longitude(ds19)
         except Exception as e:
             pass        
         try:        
-            ds20 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'t'})
+            ds20 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'t'})
             ds20 = shift_longitude(ds20)
         except Exception as e:
             pass        
         try:        
-            ds21 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'pres'})
+            ds21 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'pres'})
             ds21 = shift_longitude(ds21)
         except Exception as e:
             pass        
         try:        
-            ds22 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'u'})
+            ds22 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'u'})
             ds22= shift_longitude(ds22)
         except Exception as e:
             pass        
         try:        
-            ds23 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'v'})
+            ds23 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'v'})
             ds23 = shift_longitude(ds23)
         except Exception as e:
             pass        
         try:        
-            ds24 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'atmosphereSingleLayer'})
+            ds24 = open_mfdataset(file_pattern,
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'atmosphereSingleLayer'})
             ds24 = shift_longitude(ds24)
         except Exception as e:
             pass        
         try:        
-            ds25 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'cloudCeiling'})
+            ds25 = open_mfdataset(file_pattern,
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'cloudCeiling'})
             ds25 = shift_longitude(ds25)
         except Exception as e:
             pass        
         try:        
-            ds26 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'nominalTop'})
+            ds26 = open_mfdataset(file_pattern,
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'nominalTop'})
             ds26 = shift_longitude(ds26)
         except Exception as e:
             pass        
         try:        
-            ds27 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib',
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer'})
+            ds27 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib',
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer'})
             ds27 = shift_longitude(ds27)
         except Exception as e:
             pass        
         try:        
-            ds28 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer', 'shortName':'ustm'})
+            ds28 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer', 'shortName':'ustm'})
             ds28 = shift_longitude(ds28)
         except Exception as e:
             pass        
         try:        
-            ds29 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal',
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer', 'shortName':'vstm'})
+            ds29 = open_mfdataset(file_pattern,
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal',
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer', 'shortName':'vstm'})
             ds29 = shift_longitude(ds29)
         except Exception as e:
             pass        
         try:        
-            ds30 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'tropopause'})
+            ds30 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'tropopause'})
             ds30 = shift_longitude(ds30)
         except Exception as e:
             pass        
         try:        
-            ds31 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'maxWind'})
+            ds31 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'maxWind'})
             ds31 = shift_longitude(ds31)
         except Exception as e:
             pass        
         try:        
-            ds32 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal',
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'isothermZero'})
+            ds32 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal',
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'isothermZero'})
             ds32 = shift_longitude(ds32)
         except Exception as e:
             pass        
         try:        
-            ds33 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override',
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'highestTroposphericFreezing'})
+            ds33 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override',
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'highestTroposphericFreezing'})
             ds33 = shift_longitude(ds33)
         except Exception as e:
             pass        
         try:        
-            ds34 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal',
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'sigmaLayer'})
+            ds34 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal',
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'sigmaLayer'})
             ds34 = shift_longitude(ds33)
         except Exception as e:
             pass        
         try:        
-            ds35 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'sigma'})
+            ds35 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'sigma'})
             ds35 = shift_longitude(ds35)
         except Exception as e:
             pass        
         try:        
-            ds36 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal',
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'theta'})
+            ds36 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal',
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'theta'})
             ds36 = shift_longitude(ds36)
         except Exception as e:
             pass        
         try:        
-            ds37 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step', 
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib',
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'theta', 'shortName':'u'})
+            ds37 = open_mfdataset(file_pattern,
+                                  concat_dim='step', 
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib',
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'theta', 'shortName':'u'})
             ds37 = shift_longitude(ds37)
         except Exception as e:
             pass        
         try:        
-            ds38 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'theta', 'shortName':'v'})
+            ds38 = open_mfdataset(file_pattern,
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'theta', 'shortName':'v'})
             ds38 = shift_longitude(ds38)
         except Exception as e:
             pass        
         try:        
-            ds39 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib',
-                                     compat='override',
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'theta', 'shortName':'t'})
+            ds39 = open_mfdataset(file_pattern,
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib',
+                                  compat='override',
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'theta', 'shortName':'t'})
             ds39 = shift_longitude(ds39)
         except Exception as e:
             pass        
         try:        
-            ds40 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested',
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'theta', 'shortName':'mont'})
+            ds40 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested',
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'theta', 'shortName':'mont'})
             ds40 = shift_longitude(ds40)
         except Exception as e:
             pass        
         try:        
-            ds41 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'potentialVorticity'})
+            ds41 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'potentialVorticity'})
             ds41 = shift_longitude(ds41)
         except Exception as e:
             pass        
         try:        
-            ds42 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override',
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer'})
+            ds42 = open_mfdataset(file_pattern,
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override',
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer'})
             ds42 = shift_longitude(ds42)
         except Exception as e:
             pass        
         try:        
-            ds43 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'dpt'})
+            ds43 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'dpt'})
             ds43 = shift_longitude(ds43)
         except Exception as e:
             pass        
         try:        
-            ds44 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'pwat'})
+            ds44 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'pwat'})
             ds44 = shift_longitude(ds44)
         except Exception as e:
             pass        
         try:        
-            ds45 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False,
-                                     filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'pli'})
+            ds45 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False,
+                                  filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'pli'})
             ds45 = shift_longitude(ds45)
         except Exception as e:
             pass        
         try:        
-            ds46 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step',
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'cape'})
+            ds46 = open_mfdataset(file_pattern, 
+                                  concat_dim='step',
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'cape'})
             ds46 = shift_longitude(ds46)
         except Exception as e:
             pass        
         try:        
-            ds47 = xr.open_mfdataset(file_pattern,
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib', 
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'cin'})
+            ds47 = open_mfdataset(file_pattern,
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib', 
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'cin'})
             ds47 = shift_longitude(ds47)
         except Exception as e:
             pass        
         try:        
-            ds48 = xr.open_mfdataset(file_pattern, 
-                                     concat_dim='step', 
-                                     combine='nested', 
-                                     coords='minimal', 
-                                     engine='cfgrib',
-                                     compat='override', 
-                                     decode_timedelta=False, 
-                                     filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'plpl'})
+            ds48 = open_mfdataset(file_pattern, 
+                                  concat_dim='step', 
+                                  combine='nested', 
+                                  coords='minimal', 
+                                  engine='cfgrib',
+                                  compat='override', 
+                                  decode_timedelta=False, 
+                                  filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'plpl'})
             ds48 = shift_longitude(ds48)
         except Exception as e:
             pass        
@@ -1604,14 +1618,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_1 = []      
             for path in paths:
                 file_pattern = path
-                ds = xr.open_mfdataset(file_pattern, 
-                                       concat_dim='step',
-                                       combine='nested',
-                                       coords='minimal', 
-                                       engine='cfgrib', 
-                                       compat='override', 
-                                       decode_timedelta=False,
-                                       filter_by_keys={'typeOfLevel': 'surface'})
+                ds = open_mfdataset(file_pattern, 
+                                    concat_dim='step',
+                                    combine='nested',
+                                    coords='minimal', 
+                                    engine='cfgrib', 
+                                    compat='override', 
+                                    decode_timedelta=False,
+                                    filter_by_keys={'typeOfLevel': 'surface'})
                 ds = shift_longitude(ds)
                 ds_list_1.append(ds)
         except Exception as e:
@@ -1620,14 +1634,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_2 = []
             for path in paths:
                 file_pattern = path
-                ds1 = xr.open_mfdataset(file_pattern,
-                                        concat_dim='step',
-                                        combine='nested',
-                                        coords='minimal',
-                                        engine='cfgrib', 
-                                        compat='override',
-                                        decode_timedelta=False,
-                                        filter_by_keys={'typeOfLevel': 'meanSea'})
+                ds1 = open_mfdataset(file_pattern,
+                                     concat_dim='step',
+                                     combine='nested',
+                                     coords='minimal',
+                                     engine='cfgrib', 
+                                     compat='override',
+                                     decode_timedelta=False,
+                                     filter_by_keys={'typeOfLevel': 'meanSea'})
                 ds1 = shift_longitude(ds1) 
                 ds_list_2.append(ds1)
         except Exception as e:
@@ -1636,14 +1650,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_3 = []
             for path in paths:
                 file_pattern = path
-                ds2 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step',
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False,
-                                        filter_by_keys={'typeOfLevel': 'planetaryBoundaryLayer'})
+                ds2 = open_mfdataset(file_pattern, 
+                                     concat_dim='step',
+                                     combine='nested', 
+                                     coords='minimal', 
+                                     engine='cfgrib', 
+                                     compat='override', 
+                                     decode_timedelta=False,
+                                     filter_by_keys={'typeOfLevel': 'planetaryBoundaryLayer'})
                 ds2 = shift_longitude(ds2)
                 ds_list_3.append(ds2)
         except Exception as e:
@@ -1652,14 +1666,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_4 = []
             for path in paths:
                 file_pattern = path
-                ds3 = xr.open_mfdataset(file_pattern,
-                                        concat_dim='step',
-                                        combine='nested',
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override',
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'isobaricInhPa'})
+                ds3 = open_mfdataset(file_pattern,
+                                     concat_dim='step',
+                                     combine='nested',
+                                     coords='minimal', 
+                                     engine='cfgrib', 
+                                     compat='override',
+                                     decode_timedelta=False, 
+                                     filter_by_keys={'typeOfLevel': 'isobaricInhPa'})
                 ds3 = shift_longitude(ds3)
                 ds_list_4.append(ds3)  
         except Exception as e:
@@ -1668,14 +1682,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_5 = []
             for path in paths:
                 file_pattern = path
-                ds4 = xr.open_mfdataset(file_pattern,
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False,
-                                        filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'t'})
+                ds4 = open_mfdataset(file_pattern,
+                                     concat_dim='step', 
+                                     combine='nested', 
+                                     coords='minimal', 
+                                     engine='cfgrib', 
+                                     compat='override', 
+                                     decode_timedelta=False,
+                                     filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'t'})
                 ds4 = shift_longitude(ds4)
                 ds_list_5.append(ds4)
         except Exception as e:
@@ -1684,14 +1698,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_6 = []
             for path in paths:
                 file_pattern = path
-                ds5 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step', 
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'w'})
+                ds5 = open_mfdataset(file_pattern, 
+                                     concat_dim='step', 
+                                     combine='nested', 
+                                     coords='minimal', 
+                                     engine='cfgrib', 
+                                     compat='override', 
+                                     decode_timedelta=False, 
+                                     filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'w'})
                 ds5 = shift_longitude(ds5)
                 ds_list_6.append(ds5)
         except Exception as e:
@@ -1700,14 +1714,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_7 = []
             for path in paths:
                 file_pattern = path
-                ds6 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step',
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False, 
-                                        filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'u'})
+                ds6 = open_mfdataset(file_pattern, 
+                                     concat_dim='step',
+                                     combine='nested', 
+                                     coords='minimal', 
+                                     engine='cfgrib', 
+                                     compat='override', 
+                                     decode_timedelta=False, 
+                                     filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'u'})
                 ds6 = shift_longitude(ds6)
                 ds_list_7.append(ds6)  
         except Exception as e:
@@ -1716,14 +1730,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_8 = []
             for path in paths:
                 file_pattern = path
-                ds7 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step',
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False,
-                                        filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'v'})
+                ds7 = open_mfdataset(file_pattern, 
+                                     concat_dim='step',
+                                     combine='nested', 
+                                     coords='minimal', 
+                                     engine='cfgrib', 
+                                     compat='override', 
+                                     decode_timedelta=False,
+                                     filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'v'})
                 ds7 = shift_longitude(ds7)
                 ds_list_8.append(ds7)
         except Exception as e:
@@ -1732,14 +1746,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_9 = []
             for path in paths:
                 file_pattern = path
-                ds8 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step',
-                                        combine='nested', 
-                                        coords='minimal',
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False,
-                                        filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'o3mr'})
+                ds8 = open_mfdataset(file_pattern, 
+                                     concat_dim='step',
+                                     combine='nested', 
+                                     coords='minimal',
+                                     engine='cfgrib', 
+                                     compat='override', 
+                                     decode_timedelta=False,
+                                     filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'o3mr'})
                 ds8 = shift_longitude(ds8)
                 ds_list_9.append(ds8) 
         except Exception as e:
@@ -1748,14 +1762,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_10 = []
             for path in paths:
                 file_pattern = path
-                ds9 = xr.open_mfdataset(file_pattern, 
-                                        concat_dim='step',
-                                        combine='nested', 
-                                        coords='minimal', 
-                                        engine='cfgrib', 
-                                        compat='override', 
-                                        decode_timedelta=False,
-                                        filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'absv'})
+                ds9 = open_mfdataset(file_pattern, 
+                                     concat_dim='step',
+                                     combine='nested', 
+                                     coords='minimal', 
+                                     engine='cfgrib', 
+                                     compat='override', 
+                                     decode_timedelta=False,
+                                     filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'absv'})
                 ds9 = shift_longitude(ds9)
                 ds_list_10.append(ds9)
         except Exception as e:
@@ -1764,14 +1778,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_11 = []
             for path in paths:
                 file_pattern = path
-                ds10 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'clwmr'})
+                ds10 = open_mfdataset(file_pattern, 
+                                      concat_dim='step',
+                                      combine='nested',
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override',
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'clwmr'})
                 ds10 = shift_longitude(ds10)
                 ds_list_11.append(ds10)  
         except Exception as e:
@@ -1780,14 +1794,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_12 = []
             for path in paths:
                 file_pattern = path
-                ds12 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'ICSEV'})
+                ds12 = open_mfdataset(file_pattern,
+                                      concat_dim='step',
+                                      combine='nested',
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override',
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'ICSEV'})
                 ds12 = shift_longitude(ds12)
                 ds_list_12.append(ds12) 
         except Exception as e:
@@ -1796,14 +1810,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_13 = []
             for path in paths:
                 file_pattern = path
-                ds13 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib',
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'tcc'})
+                ds13 = open_mfdataset(file_pattern,
+                                      concat_dim='step',
+                                      combine='nested',
+                                      coords='minimal', 
+                                      engine='cfgrib',
+                                      compat='override', 
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'tcc'})
                 ds13 = shift_longitude(ds13)
                 ds_list_13.append(ds13)
         except Exception as e:
@@ -1812,14 +1826,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_14 = []
             for path in paths:
                 file_pattern = path
-                ds14 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal',
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'r'})
+                ds14 = open_mfdataset(file_pattern, 
+                                      concat_dim='step',
+                                      combine='nested',
+                                      coords='minimal',
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'r'})
                 ds14 = shift_longitude(ds14)
                 ds_list_14.append(ds14)
         except Exception as e:
@@ -1828,14 +1842,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_15 = []
             for path in paths:
                 file_pattern = path
-                ds15 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal',
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'depthBelowLandLayer'})
+                ds15 = open_mfdataset(file_pattern, 
+                                      concat_dim='step',
+                                      combine='nested', 
+                                      coords='minimal',
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'depthBelowLandLayer'})
                 ds15 = shift_longitude(ds15)
                 ds_list_15.append(ds15) 
         except Exception as e:
@@ -1844,14 +1858,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_16 = []
             for path in paths:
                 file_pattern = path
-                ds16 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'depthBelowLandLayer', 'shortName':'st'})
+                ds16 = open_mfdataset(file_pattern, 
+                                      concat_dim='step', 
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override',
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'depthBelowLandLayer', 'shortName':'st'})
                 ds16 = shift_longitude(ds16)
                 ds_list_16.append(ds16)
         except Exception as e:
@@ -1860,14 +1874,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_17 = []
             for path in paths:
                 file_pattern = path
-                ds17 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'depthBelowLandLayer', 'shortName':'soilw'})
+                ds17 = open_mfdataset(file_pattern,
+                                      concat_dim='step', 
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'depthBelowLandLayer', 'shortName':'soilw'})
                 ds17 = shift_longitude(ds17)
                 ds_list_17.append(ds17)
         except Exception as e:
@@ -1876,14 +1890,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_18 = []
             for path in paths:
                 file_pattern = path
-                ds18 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step', 
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGround'})
+                ds18 = open_mfdataset(file_pattern, 
+                                      concat_dim='step', 
+                                      combine='nested',
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'heightAboveGround'})
                 ds18 = shift_longitude(ds18)
                 ds_list_18.append(ds18)
         except Exception as e:
@@ -1892,14 +1906,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_19 = []
             for path in paths:
                 file_pattern = path
-                ds19 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib',
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'q'})
+                ds19 = open_mfdataset(file_pattern,
+                                      concat_dim='step',
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib',
+                                      compat='override',
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'q'})
                 ds19 = shift_longitude(ds19)
                 ds_list_19.append(ds19)                
         except Exception as e:
@@ -1908,14 +1922,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_20 = []
             for path in paths:
                 file_pattern = path
-                ds20 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal',
-                                         engine='cfgrib',
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'t'})
+                ds20 = open_mfdataset(file_pattern,
+                                      concat_dim='step',
+                                      combine='nested',
+                                      coords='minimal',
+                                      engine='cfgrib',
+                                      compat='override',
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'t'})
                 ds20 = shift_longitude(ds20)
                 ds_list_20.append(ds20)            
         except Exception as e:
@@ -1924,14 +1938,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_21 = []
             for path in paths:
                 file_pattern = path
-                ds21 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'pres'})
+                ds21 = open_mfdataset(file_pattern,
+                                      concat_dim='step',
+                                      combine='nested',
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override',
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'pres'})
                 ds21 = shift_longitude(ds21) 
                 ds_list_21.append(ds21)            
         except Exception as e:
@@ -1940,14 +1954,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_22 = []
             for path in paths:
                 file_pattern = path
-                ds22 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'u'})
+                ds22 = open_mfdataset(file_pattern,
+                                      concat_dim='step',
+                                      combine='nested',
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override',
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'u'})
                 ds22 = shift_longitude(ds22)
                 ds_list_22.append(ds22)            
         except Exception as e:
@@ -1956,14 +1970,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_23 = []
             for path in paths:
                 file_pattern = path
-                ds23 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal',
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'v'})
+                ds23 = open_mfdataset(file_pattern, 
+                                      concat_dim='step',
+                                      combine='nested',
+                                      coords='minimal',
+                                      engine='cfgrib', 
+                                      compat='override',
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'heightAboveGround', 'shortName':'v'})
                 ds23 = shift_longitude(ds23)
                 ds_list_23.append(ds23)            
         except Exception as e:
@@ -1972,14 +1986,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_24 = []
             for path in paths:
                 file_pattern = path
-                ds24 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'atmosphereSingleLayer'})
+                ds24 = open_mfdataset(file_pattern, 
+                                      concat_dim='step',
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'atmosphereSingleLayer'})
                 ds24 = shift_longitude(ds24)
                 ds_list_24.append(ds24)
         except Exception as e:
@@ -1988,14 +2002,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_25= []
             for path in paths:
                 file_pattern = path
-                ds25 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'cloudCeiling'})
+                ds25 = open_mfdataset(file_pattern, 
+                                      concat_dim='step', 
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'cloudCeiling'})
                 ds25 = shift_longitude(ds25)
                 ds_list_25.append(ds25)            
         except Exception as e:
@@ -2004,14 +2018,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_26 = []
             for path in paths:
                 file_pattern = path
-                ds26 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal',
-                                         engine='cfgrib',
-                                         compat='override',
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'nominalTop'})
+                ds26 = open_mfdataset(file_pattern,
+                                      concat_dim='step',
+                                      combine='nested',
+                                      coords='minimal',
+                                      engine='cfgrib',
+                                      compat='override',
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'nominalTop'})
                 ds26 = shift_longitude(ds26)
                 ds_list_26.append(ds26)            
         except Exception as e:
@@ -2020,14 +2034,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_27 = []
             for path in paths:
                 file_pattern = path
-                ds27 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal',
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer'})
+                ds27 = open_mfdataset(file_pattern,
+                                      concat_dim='step',
+                                      combine='nested',
+                                      coords='minimal',
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer'})
                 ds27 = shift_longitude(ds27)
                 ds_list_27.append(ds27)            
         except Exception as e:
@@ -2036,14 +2050,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_28 = []
             for path in paths:
                 file_pattern = path
-                ds28 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal',
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer', 'shortName':'ustm'})
+                ds28 = open_mfdataset(file_pattern,
+                                      concat_dim='step',
+                                      combine='nested', 
+                                      coords='minimal',
+                                      engine='cfgrib', 
+                                      compat='override',
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer', 'shortName':'ustm'})
                 ds28 = shift_longitude(ds28)
                 ds_list_28.append(ds28)            
         except Exception as e:
@@ -2052,14 +2066,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_29 = []
             for path in paths:
                 file_pattern = path
-                ds29 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer', 'shortName':'vstm'})
+                ds29 = open_mfdataset(file_pattern, 
+                                      concat_dim='step',
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override',
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer', 'shortName':'vstm'})
                 ds29 = shift_longitude(ds29) 
                 ds_list_29.append(ds29)            
         except Exception as e:
@@ -2068,14 +2082,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_30 = []
             for path in paths:
                 file_pattern = path
-                ds30 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'tropopause'})
+                ds30 = open_mfdataset(file_pattern,
+                                      concat_dim='step',
+                                      combine='nested',
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'tropopause'})
                 ds30 = shift_longitude(ds30)
                 ds_list_30.append(ds30)
         except Exception as e:
@@ -2084,14 +2098,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_31 = []
             for path in paths:
                 file_pattern = path
-                ds31 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal',
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'maxWind'})
+                ds31 = open_mfdataset(file_pattern, 
+                                      concat_dim='step',
+                                      combine='nested', 
+                                      coords='minimal',
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'maxWind'})
                 ds31 = shift_longitude(ds31)
                 ds_list_31.append(ds31)
         except Exception as e:
@@ -2100,14 +2114,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_32 = []
             for path in paths:
                 file_pattern = path
-                ds32 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'isothermZero'})
+                ds32 = open_mfdataset(file_pattern,
+                                      concat_dim='step',
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override',
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'isothermZero'})
                 ds32 = shift_longitude(ds32)
                 ds_list_32.append(ds32)
         except Exception as e:
@@ -2116,14 +2130,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_33 = []
             for path in paths:
                 file_pattern = path
-                ds33 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'highestTroposphericFreezing'})
+                ds33 = open_mfdataset(file_pattern, 
+                                      concat_dim='step',
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override',
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'highestTroposphericFreezing'})
                 ds33 = shift_longitude(ds33)
                 ds_list_33.append(ds33)  
         except Exception as e:
@@ -2132,14 +2146,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_34 = []
             for path in paths:
                 file_pattern = path
-                ds34 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib',
-                                         compat='override', 
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'sigmaLayer'})
+                ds34 = open_mfdataset(file_pattern, 
+                                      concat_dim='step', 
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib',
+                                      compat='override', 
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'sigmaLayer'})
                 ds34 = shift_longitude(ds33)
                 ds_list_34.append(ds34)            
         except Exception as e:
@@ -2148,14 +2162,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_35 = []
             for path in paths:
                 file_pattern = path
-                ds35 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'sigma'})
+                ds35 = open_mfdataset(file_pattern,
+                                      concat_dim='step',
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'sigma'})
                 ds35 = shift_longitude(ds35)
                 ds_list_35.append(ds35)
         except Exception as e:
@@ -2164,14 +2178,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_36 = []
             for path in paths:
                 file_pattern = path
-                ds36 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'theta'})
+                ds36 = open_mfdataset(file_pattern, 
+                                      concat_dim='step',
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'theta'})
                 ds36 = shift_longitude(ds36)
                 ds_list_36.append(ds36)            
         except Exception as e:
@@ -2180,14 +2194,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_37 = []
             for path in paths:
                 file_pattern = path
-                ds37 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'theta', 'shortName':'u'})
+                ds37 = open_mfdataset(file_pattern, 
+                                      concat_dim='step',
+                                      combine='nested',
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'theta', 'shortName':'u'})
                 ds37 = shift_longitude(ds37)
                 ds_list_37.append(ds37)            
         except Exception as e:
@@ -2196,14 +2210,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_38 = []
             for path in paths:
                 file_pattern = path
-                ds38 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib',
-                                         compat='override',
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'theta', 'shortName':'v'})
+                ds38 = open_mfdataset(file_pattern,
+                                      concat_dim='step',
+                                      combine='nested',
+                                      coords='minimal', 
+                                      engine='cfgrib',
+                                      compat='override',
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'theta', 'shortName':'v'})
                 ds38 = shift_longitude(ds38)
                 ds_list_38.append(ds38)            
         except Exception as e:
@@ -2212,14 +2226,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_39 = []
             for path in paths:
                 file_pattern = path
-                ds39 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step', 
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'theta', 'shortName':'t'})
+                ds39 = open_mfdataset(file_pattern,
+                                      concat_dim='step', 
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override',
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'theta', 'shortName':'t'})
                 ds39 = shift_longitude(ds39)
                 ds_list_39.append(ds39)            
         except Exception as e:
@@ -2228,14 +2242,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_40 = []
             for path in paths:
                 file_pattern = path
-                ds40 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'theta', 'shortName':'mont'})
+                ds40 = open_mfdataset(file_pattern,
+                                      concat_dim='step',
+                                      combine='nested',
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override',
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'theta', 'shortName':'mont'})
                 ds40 = shift_longitude(ds40)
                 ds_list_40.append(ds40)            
         except Exception as e:
@@ -2244,14 +2258,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_41 = []
             for path in paths:
                 file_pattern = path
-                ds41 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'potentialVorticity'})
+                ds41 = open_mfdataset(file_pattern, 
+                                      concat_dim='step',
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override',
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'potentialVorticity'})
                 ds41 = shift_longitude(ds41)
                 ds_list_41.append(ds41)
         except Exception as e:
@@ -2260,14 +2274,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_42 = []
             for path in paths:
                 file_pattern = path
-                ds42 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer'})
+                ds42 = open_mfdataset(file_pattern,
+                                      concat_dim='step',
+                                      combine='nested',
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override',
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer'})
                 ds42 = shift_longitude(ds42)
                 ds_list_42.append(ds42)
         except Exception as e:
@@ -2276,14 +2290,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_43 = []
             for path in paths:
                 file_pattern = path
-                ds43 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal',
-                                         engine='cfgrib',
-                                         compat='override',
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'dpt'})
+                ds43 = open_mfdataset(file_pattern, 
+                                      concat_dim='step',
+                                      combine='nested', 
+                                      coords='minimal',
+                                      engine='cfgrib',
+                                      compat='override',
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'dpt'})
                 ds43 = shift_longitude(ds43)
                 ds_list_43.append(ds43)            
         except Exception as e:
@@ -2292,14 +2306,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_44 = []
             for path in paths:
                 file_pattern = path
-                ds44 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'pwat'})
+                ds44 = open_mfdataset(file_pattern,
+                                      concat_dim='step',
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'pwat'})
                 ds44 = shift_longitude(ds44)
                 ds_list_44.append(ds44)            
         except Exception as e:
@@ -2308,14 +2322,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_45 = []
             for path in paths:
                 file_pattern = path
-                ds45 = xr.open_mfdataset(file_pattern, 
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'pli'})
+                ds45 = open_mfdataset(file_pattern, 
+                                      concat_dim='step',
+                                      combine='nested',
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override',
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'pli'})
                 ds45 = shift_longitude(ds45)
                 ds_list_45.append(ds45)            
         except Exception as e:
@@ -2324,14 +2338,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_46 = []
             for path in paths:
                 file_pattern = path
-                ds46 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal',
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'cape'})
+                ds46 = open_mfdataset(file_pattern,
+                                      concat_dim='step',
+                                      combine='nested',
+                                      coords='minimal',
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'cape'})
                 ds46 = shift_longitude(ds46)
                 ds_list_46.append(ds46)            
         except Exception as e:
@@ -2340,14 +2354,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_47 = []
             for path in paths:
                 file_pattern = path
-                ds47 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested', 
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override',
-                                         decode_timedelta=False,
-                                         filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'cin'})
+                ds47 = open_mfdataset(file_pattern,
+                                      concat_dim='step',
+                                      combine='nested', 
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override',
+                                      decode_timedelta=False,
+                                      filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'cin'})
                 ds47 = shift_longitude(ds47)
                 ds_list_47.append(ds47)            
         except Exception as e:
@@ -2356,14 +2370,14 @@ def secondary_gefs_post_processing(paths):
             ds_list_48 = []
             for path in paths:
                 file_pattern = path
-                ds48 = xr.open_mfdataset(file_pattern,
-                                         concat_dim='step',
-                                         combine='nested',
-                                         coords='minimal', 
-                                         engine='cfgrib', 
-                                         compat='override', 
-                                         decode_timedelta=False, 
-                                         filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'plpl'})
+                ds48 = open_mfdataset(file_pattern,
+                                      concat_dim='step',
+                                      combine='nested',
+                                      coords='minimal', 
+                                      engine='cfgrib', 
+                                      compat='override', 
+                                      decode_timedelta=False, 
+                                      filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer', 'shortName':'plpl'})
                 ds48 = shift_longitude(ds48)
                 ds_list_48.append(ds48) 
         except Exception as e:
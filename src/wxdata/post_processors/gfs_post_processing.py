@@ -17,12 +17,17 @@ from wxdata.utils.file_funcs import(
     sorted_paths
 )
 from wxdata.utils.coords import shift_longitude 
+from wxdata.utils.grib_index import(
+    build_grib_index,
+    open_grib_group
+)
 
 sys.tracebacklimit = 0
 logging.disable()
 
 
-def primary_gfs_post_processing(path):
+def primary_gfs_post_processing(path,
+                                files=None):
     
     """
     This function post-processes the GFS0P25 and GFS0P50 GRIB Primary Variable Keys into Plain-Language Variable Keys
@@ -31,7 +36,10 @@ def primary_gfs_post_processing(path):
     
     1) path (String) - The path to the files.
     
-    Optional Arguments: None
+    Optional Arguments:
+    
+    1) files (String List or None) - Default=None. The complete paths of the files to post-process (i.e. a single forecast hour).
+       When None, every file in {path} is post-processed.
     
     Returns
     -------
@@ -235,59 +243,43 @@ def primary_gfs_post_processing(path):
     """
     
     clear_idx_files_in_path(path)
-    files = sorted_paths(path)
+    if files == None:
+        files = sorted_paths(path)
+    else:
+        pass
+    index = build_grib_index(files)
 
     try:
-        ds = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'meanSea'})
+        ds = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'meanSea'})
         
         ds = shift_longitude(ds)
     except Exception as e:
         pass
     
     try:
-        ds1 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'hybrid'})
+        ds1 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'hybrid'})
         
         ds1 = shift_longitude(ds1)
     except Exception as e:
         pass
     
     try:
-        ds2 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'hybrid', 'shortName':'refd'})
+        ds2 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'hybrid', 'shortName':'refd'})
         
         ds2 = shift_longitude(ds2)
     except Exception as e:
         pass
     
     try:
-        ds3 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'atmosphere'})
+        ds3 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'atmosphere'})
         
         ds3 = shift_longitude(ds3)
     except Exception as e:
@@ -295,125 +287,80 @@ def primary_gfs_post_processing(path):
     
 
     try:
-        ds4 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'surface'})
+        ds4 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'surface'})
         
         ds4 = shift_longitude(ds4)
     except Exception as e:
         pass
     
     try:
-        ds5 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'planetaryBoundaryLayer'})
+        ds5 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'planetaryBoundaryLayer'})
         
         ds5 = shift_longitude(ds5)
     except Exception as e:
         pass
     
     try:
-        ds6 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'isobaricInhPa'})
+        ds6 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'isobaricInhPa'})
         
         ds6 = shift_longitude(ds6)
     except Exception as e:
         pass
     
     try:
-        ds7 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'tcc'})
+        ds7 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'isobaricInhPa', 'shortName':'tcc'})
         
         ds7 = shift_longitude(ds7)
     except Exception as e:
         pass
     
     try:
-        ds8 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'clwmr'})
+        ds8 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'isobaricInhPa', 'shortName':'clwmr'})
         
         ds8 = shift_longitude(ds8)
     except Exception as e:
         pass
     
     try:
-        ds9 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'icmr'})
+        ds9 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'isobaricInhPa', 'shortName':'icmr'})
         
         ds9 = shift_longitude(ds9)
     except Exception as e:
         pass
     
     try:
-        ds10 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'rwmr'})
+        ds10 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'isobaricInhPa', 'shortName':'rwmr'})
         
         ds10 = shift_longitude(ds10)
     except Exception as e:
         pass
     
     try:
-        ds11 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'snmr'})
+        ds11 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'isobaricInhPa', 'shortName':'snmr'})
         ds11 = shift_longitude(ds11)
     except Exception as e:
         pass
     
     try:
-        ds12 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'isobaricInhPa', 'shortName':'grle'})
+        ds12 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'isobaricInhPa', 'shortName':'grle'})
         
         ds12 = shift_longitude(ds12)
     except Exception as e:
@@ -421,518 +368,333 @@ def primary_gfs_post_processing(path):
     
     
     try:
-        ds13 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround'})
+        ds13 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveGround'})
         
         ds13 = shift_longitude(ds13)
     except Exception as e:
         pass
     
     try:
-        ds14 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround','paramId':167})
+        ds14 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveGround','paramId':167})
         
         ds14 = shift_longitude(ds14)
     except Exception as e:
         pass
     
     try:
-        ds15 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround','paramId':174096})
+        ds15 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveGround','paramId':174096})
         
         ds15 = shift_longitude(ds15)
     except Exception as e:
         pass
     
     try:
-        ds16 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround','paramId':168})
+        ds16 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveGround','paramId':168})
         
         ds16 = shift_longitude(ds16)
     except Exception as e:
         pass
     
     try:
-        ds17 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround','paramId':260242})
+        ds17 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveGround','paramId':260242})
         
         ds17 = shift_longitude(ds17)
     except Exception as e:
         pass
     
     try:
-        ds18 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround','paramId':165})
+        ds18 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveGround','paramId':165})
         
         ds18 = shift_longitude(ds18)
     except Exception as e:
         pass
     
     try:
-        ds19 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround','paramId':166})
+        ds19 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveGround','paramId':166})
         
         ds19 = shift_longitude(ds19)
     except Exception as e:
         pass
     
     try:
-        ds20 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround','paramId':131})
+        ds20 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveGround','paramId':131})
         
         ds20 = shift_longitude(ds20)
     except Exception as e:
         pass
     
     try:
-        ds21 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround','paramId':132})
+        ds21 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveGround','paramId':132})
         
         ds21 = shift_longitude(ds21)
     except Exception as e:
         pass
     
     try:
-        ds22 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround','paramId':130})
+        ds22 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveGround','paramId':130})
         
         ds22 = shift_longitude(ds22)
     except Exception as e:
         pass
     
     try:
-        ds23 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround','paramId':133})
+        ds23 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveGround','paramId':133})
         
         ds23 = shift_longitude(ds23)
     except Exception as e:
         pass
     
     try:
-        ds24 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround','paramId':54})
+        ds24 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveGround','paramId':54})
         
         ds24 = shift_longitude(ds24)
     except Exception as e:
         pass
     
     try:
-        ds25 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround','paramId':228246})
+        ds25 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveGround','paramId':228246})
         
         ds25 = shift_longitude(ds25)
     except Exception as e:
         pass
     
     try:
-        ds26 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGround','paramId':228247})
+        ds26 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveGround','paramId':228247})
         
         ds26 = shift_longitude(ds26)
     except Exception as e:
         pass
     
     try:
-        ds27 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'depthBelowLandLayer'})
+        ds27 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'depthBelowLandLayer'})
         
         ds27 = shift_longitude(ds27)
     except Exception as e:
         pass
     
     try:
-        ds28 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveSea','paramId':130})
+        ds28 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveSea','paramId':130})
         
         ds28 = shift_longitude(ds28)
     except Exception as e:
         pass
     
     try:
-        ds29 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveSea','paramId':131})
+        ds29 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveSea','paramId':131})
         
         ds29 = shift_longitude(ds29)
     except Exception as e:
         pass
     
     try:
-        ds30 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveSea','paramId':132})
+        ds30 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveSea','paramId':132})
         
         ds30 = shift_longitude(ds30)
     except Exception as e:
         pass
     
     try:
-        ds31 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'atmosphereSingleLayer'})
+        ds31 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'atmosphereSingleLayer'})
         
         ds31 = shift_longitude(ds31)
     except Exception as e:
         pass
     
     try:
-        ds32 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'lowCloudLayer'})
+        ds32 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'lowCloudLayer'})
         
         ds32 = shift_longitude(ds32)
     except Exception as e:
         pass
     
     try:
-        ds33 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'middleCloudLayer'})
+        ds33 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'middleCloudLayer'})
         
         ds33 = shift_longitude(ds33)
     except Exception as e:
         pass
     
     try:
-        ds34 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'highCloudLayer'})
+        ds34 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'highCloudLayer'})
         
         ds34 = shift_longitude(ds34)
     except Exception as e:
         pass
     
     try:
-        ds35 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'cloudCeiling'})
+        ds35 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'cloudCeiling'})
         
         ds35 = shift_longitude(ds35)
     except Exception as e:
         pass
     
     try:
-        ds36 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer'})
+        ds36 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveGroundLayer'})
         
         ds36 = shift_longitude(ds36)
     except Exception as e:
         pass
     
     try:
-        ds37 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer','paramId':260070})
+        ds37 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveGroundLayer','paramId':260070})
         
         ds37 = shift_longitude(ds37)
     except Exception as e:
         pass
     
     try:
-        ds38 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveGroundLayer','paramId':260071})
+        ds38 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveGroundLayer','paramId':260071})
         
         ds38 = shift_longitude(ds38)
     except Exception as e:
         pass
     
     try:
-        ds39 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'tropopause'})
+        ds39 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'tropopause'})
         
         ds39 = shift_longitude(ds39)
     except Exception as e:
         pass
     
     try:
-        ds40 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'maxWind'})
+        ds40 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'maxWind'})
         
         ds40 = shift_longitude(ds40)
     except Exception as e:
         pass
     
     try:
-        ds41 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'isothermZero'})
+        ds41 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'isothermZero'})
         
         ds41 = shift_longitude(ds41)
     except Exception as e:
         pass
     
     try:
-        ds42 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'highestTroposphericFreezing'})
+        ds42 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'highestTroposphericFreezing'})
         
         ds42 = shift_longitude(ds42)
     except Exception as e:
         pass
     
     try:
-        ds43 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer'})
+        ds43 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'pressureFromGroundLayer'})
         
         ds43 = shift_longitude(ds43)
     except Exception as e:
         pass
     
     try:
-        ds44 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer','paramId':59})
+        ds44 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'pressureFromGroundLayer','paramId':59})
         
         ds44 = shift_longitude(ds44)
     except Exception as e:
         pass
     
     try:
-        ds45 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer','paramId':228001})
+        ds45 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'pressureFromGroundLayer','paramId':228001})
         
         ds45 = shift_longitude(ds45)
     except Exception as e:
         pass
     
     try:
-        ds46 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer','paramId':260325})
+        ds46 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'pressureFromGroundLayer','paramId':260325})
         
         ds46 = shift_longitude(ds46)
     except Exception as e:
         pass
     
     try:
-        ds47 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'sigmaLayer'})
+        ds47 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'sigmaLayer'})
         
         ds47 = shift_longitude(ds47)
     except Exception as e:
         pass
     
     try:
-        ds48 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'sigma'})
+        ds48 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'sigma'})
         
         ds48 = shift_longitude(ds48)
     except Exception as e:
         pass
     
     try:
-        ds49 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'potentialVorticity'})
+        ds49 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'potentialVorticity'})
         
         ds49 = shift_longitude(ds49)
     except Exception as e:
@@ -1623,212 +1385,138 @@ def secondary_gfs_post_processing(path):
     
     clear_idx_files_in_path(path)
     files = sorted_paths(path)
+    index = build_grib_index(files)
 
     try:
-        ds = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'isobaricInhPa'})
+        ds = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'isobaricInhPa'})
         
         ds = shift_longitude(ds)
     except Exception as e:
         pass
     
     try:
-        ds1 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'isobaricInhPa','paramId':260131})
+        ds1 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'isobaricInhPa','paramId':260131})
         
         ds1 = shift_longitude(ds1)
     except Exception as e:
         pass
     
     try:
-        ds2 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'isobaricInhPa','paramId':228164})
+        ds2 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'isobaricInhPa','paramId':228164})
         
         ds2 = shift_longitude(ds2)
     except Exception as e:
         pass
     
     try:
-        ds3 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'isobaricInhPa','paramId':260018})
+        ds3 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'isobaricInhPa','paramId':260018})
         
         ds3 = shift_longitude(ds3)
     except Exception as e:
         pass
     
     try:
-        ds4 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'isobaricInhPa','paramId':260019})
+        ds4 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'isobaricInhPa','paramId':260019})
         
         ds4 = shift_longitude(ds4)
     except Exception as e:
         pass
     
     try:
-        ds5 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'isobaricInhPa','paramId':260020})
+        ds5 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'isobaricInhPa','paramId':260020})
         
         ds5 = shift_longitude(ds5)
     except Exception as e:
         pass
     
     try:
-        ds6 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'isobaricInhPa','paramId':260021})
+        ds6 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'isobaricInhPa','paramId':260021})
         
         ds6 = shift_longitude(ds6)
     except Exception as e:
         pass
     
     try:
-        ds7 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'isobaricInhPa','paramId':260028})
+        ds7 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'isobaricInhPa','paramId':260028})
         
         ds7 = shift_longitude(ds7)
     except Exception as e:
         pass
     
     try:
-        ds8 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'isobaricInhPa','paramId':135})
+        ds8 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'isobaricInhPa','paramId':135})
         
         ds8 = shift_longitude(ds8)
     except Exception as e:
         pass
     
     try:
-        ds9 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'isobaricInhPa','paramId':260238})
+        ds9 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'isobaricInhPa','paramId':260238})
         
         ds9 = shift_longitude(ds9)
     except Exception as e:
         pass
     
     try:
-        ds10 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'depthBelowLandLayer'})
+        ds10 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'depthBelowLandLayer'})
         
         ds10 = shift_longitude(ds10)
     except Exception as e:
         pass
     
     try:
-        ds11 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'surface'})
+        ds11 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'surface'})
         
         ds11 = shift_longitude(ds11)
     except Exception as e:
         pass
     
     try:
-        ds12 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'heightAboveSea'})
+        ds12 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'heightAboveSea'})
         
         ds12 = shift_longitude(ds12)
     except Exception as e:
         pass
     
     try:
-        ds13 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'pressureFromGroundLayer'})
+        ds13 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'pressureFromGroundLayer'})
         
         ds13 = shift_longitude(ds13)
     except Exception as e:
         pass 
     
     try:
-        ds14 = xr.open_mfdataset(files, 
-                            concat_dim='step', 
-                            combine='nested', 
-                            coords='minimal', 
-                            engine='cfgrib', 
-                            compat='override', 
-                            decode_timedelta=False,
-                            filter_by_keys={'typeOfLevel': 'potentialVorticity'})
+        ds14 = open_grib_group(index, 
+                            path, 
+                            {'typeOfLevel': 'potentialVorticity'})
         
         ds14 = shift_longitude(ds14)
     except Exception as e:
@@ -1,4 +1,5 @@
 from wxdata.rtma.rtma import(
     rtma,
-    rtma_comparison
+    rtma_comparison,
+    rtma_time_series
 )
\ No newline at end of file
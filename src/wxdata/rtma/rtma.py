@@ -5,6 +5,7 @@ This file hosts the function that downloads and returns RTMA Data from the NCEP/
 """
 import os
 import warnings
+import xarray as xr
 import wxdata.client.client as client
 warnings.filterwarnings('ignore')
 
@@ -15,15 +16,20 @@ from wxdata.rtma.file_funcs import(
 
 from wxdata.rtma.url_scanners import(
     rtma_url_scanner,
-    rtma_comparison_url_scanner
+    rtma_comparison_url_scanner,
+    rtma_time_series_url_scanner
 )
 
 from wxdata.utils.file_funcs import custom_branch
 from wxdata.calc.derived_fields import rtma_derived_fields
-from wxdata.utils.file_scanner import local_file_scanner
+from wxdata.utils.file_scanner import manifest_file_scanner
+from wxdata.utils.manifest import record_files
 from wxdata.calc.unit_conversion import convert_temperature_units
 from wxdata.rtma.process import process_rtma_data
+from wxdata.calc.time_series import time_series_statistics
+from wxdata.utils.pipeline import download_and_process
 from wxdata.utils.recycle_bin import *
+from wxdata.client.retry import NoDataAvailableError
 
 def bounds(model):
     
@@ -181,18 +187,6 @@ def rtma(model='rtma',
         southern_bound = southern_bound 
         northern_bound = northern_bound
             
-    try:
-        files = []
-        for file in os.listdir(f"{path}"):
-            files.append(file)
-        if len(files) > 2:
-            for file in os.listdir(f"{path}"):
-                os.remove(f"{path}/{file}")
-        else:
-            pass
-    except Exception as e:
-        pass
-    
     url, filename, run = rtma_url_scanner(model, 
                     cat,
                     western_bound, 
@@ -203,24 +197,17 @@ def rtma(model='rtma',
     
     print(filename)
     
-    download = local_file_scanner(path, 
-                                filename,
-                                'nomads',
-                                run) 
+    missing = manifest_file_scanner(path, 
+                                    [url],
+                                    [f"{filename}.grib2"]) 
     
     if clear_data == True:
-        download = True
+        missing = [0]
     else:
         pass
     
-    if download == True:
+    if len(missing) > 0:
         print(f"Downloading {model.upper()}...")
-        
-        try:
-            for file in os.listdir(f"{path}"):
-                os.remove(f"{path}/{file}")
-        except Exception as e:
-            pass
 
         client.get_gridded_data(f"{url}", 
                     path,
@@ -229,6 +216,10 @@ def rtma(model='rtma',
                     chunk_size=chunk_size,
                     notifications=notifications)
         
+        record_files(path,
+                     [url],
+                     [f"{filename}.grib2"])
+        
         print(f"{model.upper()} Download Complete.")
     else:
         print(f"{model.upper()} Data is current. Skipping download.")
@@ -397,18 +388,6 @@ def rtma_comparison(model='rtma',
     
     clear_idx_files(path)
     
-    try:
-        files = []
-        for file in os.listdir(f"{path}"):
-            files.append(file)
-        if len(files) > 2:
-            for file in os.listdir(f"{path}"):
-                os.remove(f"{path}/{file}")
-        else:
-            pass
-    except Exception as e:
-        pass
-    
     if western_bound == None and eastern_bound == None and southern_bound == None and northern_bound == None:
         western_bound, eastern_bound, southern_bound, northern_bound = bounds(model)
     else:
@@ -426,38 +405,42 @@ def rtma_comparison(model='rtma',
                     proxies,
                     hours)
     
-    download = local_file_scanner(path, 
-                                filename,
-                                source='nomads',
-                                run=run) 
+    missing = manifest_file_scanner(path, 
+                                    [url, url_dt],
+                                    [f"{filename}.grib2", f"{filename_dt}.grib2"]) 
     
     if clear_data == True:
-        download = True
+        missing = [0, 1]
     else:
         pass
     
-    if download == True:
+    if len(missing) > 0:
         
-        try:
-            for file in os.listdir(f"{path}"):
-                os.remove(f"{path}/{file}")
-        except Exception as e:
+        if 0 in missing:
+            print(f"Current {model.upper()} Data Downloading...")
+            client.get_gridded_data(f"{url}", 
+                        path,
+                        f"{filename}.grib2",
+                        proxies=proxies,
+                        chunk_size=chunk_size,
+                        notifications=notifications)
+        else:
+            pass
+        if 1 in missing:
+            print(f"Comparison {model.upper()} Data Downloading...")
+            client.get_gridded_data(f"{url_dt}", 
+                        path,
+                        f"{filename_dt}.grib2",
+                        proxies=proxies,
+                        chunk_size=chunk_size,
+                        notifications=notifications)
+        else:
             pass
         
-        print(f"Current {model.upper()} Data Downloading...")
-        client.get_gridded_data(f"{url}", 
-                    path,
-                    f"{filename}.grib2",
-                    proxies=proxies,
-                    chunk_size=chunk_size,
-                    notifications=notifications)
-        print(f"Comparison {model.upper()} Data Downloading...")
-        client.get_gridded_data(f"{url_dt}", 
-                    path,
-                    f"{filename_dt}.grib2",
-                    proxies=proxies,
-                    chunk_size=chunk_size,
-                    notifications=notifications)
+        record_files(path,
+                     [[url, url_dt][i] for i in missing],
+                     [[f"{filename}.grib2", f"{filename_dt}.grib2"][i] for i in missing])
+        
         print(f"{model.upper()} Download Complete.")
     else:
         print(f"{model.upper()} Data is current. Skipping download.")
@@ -509,4 +492,265 @@ def rtma_comparison(model='rtma',
         
     
     
-    
\ No newline at end of file
+    
+
+
+def rtma_time_series(model='rtma', 
+         cat='analysis', 
+         hours=24,
+         step=1,
+         proxies=None,
+         process_data=True,
+         clear_recycle_bin=True,
+         western_bound=None,
+         eastern_bound=None,
+         southern_bound=None,
+         northern_bound=None,
+         clear_data=False,
+         convert_temperature=True,
+         convert_to='fahrenheit',
+         custom_directory=None,
+         chunk_size=8192,
+         notifications='off',
+         max_workers=8,
+         statistics=False,
+         window=None):
+    
+    """
+    This function downloads every RTMA Dataset in a window of hours ending at the latest RTMA Dataset (i.e. the past 24 hours) 
+    and returns them stacked along the time dimension as one xarray data array. 
+    
+    The datasets are downloaded at the same time and each dataset is post-processed as soon as it is saved while the others are still downloading. 
+    The datasets are stacked lazily (dask) so only the data that is used is loaded into memory. 
+    
+    Required Arguments: None
+    
+    Optional Arguments:
+    
+    1) model (String) - Default='rtma'. The RTMA model being used:
+    
+    RTMA Models
+    -----------
+    
+    CONUS = 'rtma'
+    Alaska = 'ak rtma'
+    Hawaii = 'hi rtma'
+    Puerto Rico = 'pr rtma'
+    Guam = 'gu rtma'
+    
+    2) cat (String) - Default='analysis'. The category of the RTMA dataset. 
+    
+    RTMA Categories
+    ---------------
+    
+    analysis - Latest RTMA Analysis
+    error - Latest RTMA Error
+    surface 1 hour forecast - RTMA Surface 1 Hour Forecast
+    
+    3) hours (Integer) - Default=24. The length of the window in hours. 
+    
+    4) step (Integer) - Default=1. The amount of hours between each dataset in the window (i.e. step=3 for every 3rd hour). 
+    
+    5) proxies (dict or None) - If the user is using a proxy server, the user must change the following:
+
+    proxies=None ---> proxies={'http':'http://url',
+                            'https':'https://url'
+                        }
+                        
+    6) process_data (Boolean) - Default=True. When set to True, WxData will preprocess the model data. If the user wishes to process the 
+       data via their own external method, set process_data=False which means the data will be downloaded but not processed. 
+       
+    7) clear_recycle_bin (Boolean) - Default=True. When set to True, the contents in your recycle/trash bin will be deleted with each run
+        of the program you are calling WxData. This setting is to help preserve memory on the machine. 
+        
+    8) western_bound (Float or Integer) - Default=-180. The western bound of the data needed. 
+
+    9) eastern_bound (Float or Integer) - Default=180. The eastern bound of the data needed.
+
+    10) southern_bound (Float or Integer) - Default=-90. The northern bound of the data needed.
+
+    11) northern_bound (Float or Integer) - Default=90. The southern bound of the data needed.
+    
+    12) clear_data (Boolean) - Default=False. When set to True, the current data in the folder is deleted
+        and new data is downloaded automatically with each run. 
+        
+    13) convert_temperature (Boolean) - Default=True. When set to True, the temperature related fields will be converted from Kelvin to
+        either Celsius or Fahrenheit. When False, this data remains in Kelvin.
+        
+    14) convert_to (String) - Default='celsius'. When set to 'celsius' temperature related fields convert to Celsius.
+        Set convert_to='fahrenheit' for Fahrenheit. 
+        
+    15) custom_directory (String or None) - Default=None. The directory path where the RTMA files will be saved to.
+        Default = f:{MODEL}/{CAT}/TIME SERIES
+        
+    16) chunk_size (Integer) - Default=8192. The size of the chunks when writing the GRIB/NETCDF data to a file.
+    
+    17) notifications (String) - Default='off'. Notification when a file is downloaded and saved to {path}
+    
+    18) max_workers (Integer) - Default=8. The maximum number of files downloaded at the same time.
+        Set max_workers=1 to download the files one at a time.
+        
+    19) statistics (Boolean) - Default=False. When set to True, the running changes and the running maximum and minimum 
+        of each variable are added to the dataset (see time_series_statistics()). 
+        
+    20) window (Integer or None) - Default=None. The number of datasets in the running maximum and minimum when statistics=True.
+        When None, the maximum and minimum are taken over the whole window up to each dataset. 
+    
+    Returns
+    -------
+    
+    An xarray data array of the RTMA Datasets along the time dimension (oldest first) with variable keys converted from the GRIB format to a Plain Language format. 
+    Datasets that could not be post-processed are left out of the time dimension. 
+    
+    Variable Keys
+    -------------
+    
+    'orography'
+    'surface_pressure'
+    '2m_temperature'
+    '2m_dew_point'
+    '2m_relative_humidity'
+    '2m_specific_humidity'
+    'surface_visibility'
+    'cloud_ceiling_height'
+    'total_cloud_cover'
+    '10m_u_wind_component'
+    '10m_v_wind_component'
+    '10m_wind_direction'
+    '10m_wind_speed'
+    '10m_wind_gust'
+    '2m_apparent_temperature'
+    '2m_dew_point_depression'
+    
+    When statistics=True, the '{variable}_change', '{variable}_total_change', '{variable}_running_max' and '{variable}_running_min'
+    keys of each variable are also returned. 
+    """
+    
+    if clear_recycle_bin == True:
+        clear_recycle_bin_windows()
+        clear_trash_bin_mac()
+        clear_trash_bin_linux()
+    
+    model = model.upper()
+    cat = cat.upper()
+    
+    if custom_directory == None:
+        path = f"{build_directory(model, cat)}/TIME SERIES"
+        os.makedirs(path, exist_ok=True)
+    else:
+        path = custom_branch(custom_directory)
+    
+    clear_idx_files(path)
+    
+    if western_bound == None and eastern_bound == None and southern_bound == None and northern_bound == None:
+        western_bound, eastern_bound, southern_bound, northern_bound = bounds(model)
+    else:
+        western_bound = western_bound
+        eastern_bound = eastern_bound 
+        southern_bound = southern_bound 
+        northern_bound = northern_bound
+    
+    urls, filenames, times = rtma_time_series_url_scanner(model, 
+                    cat,
+                    western_bound, 
+                    eastern_bound, 
+                    northern_bound, 
+                    southern_bound, 
+                    proxies,
+                    hours,
+                    step)
+    
+    fnames = [f"{filename}.grib2" for filename in filenames]
+    
+    missing = manifest_file_scanner(path, 
+                                    urls,
+                                    fnames) 
+    
+    if clear_data == True:
+        missing = list(range(0, len(urls), 1))
+    else:
+        pass
+    
+    if len(missing) > 0:
+        print(f"Downloading {len(missing)} {model.upper()} Datasets...")
+    else:
+        print(f"{model.upper()} Data is current. Skipping download.")
+    
+    if process_data == True:
+        print(f"{model.upper()} Data Processing...")
+        
+        def process(files):
+            ds = process_rtma_data(path, 
+                                   os.path.basename(files[0]), 
+                                   model,
+                                   chunks={})
+            
+            if convert_temperature == True:
+                try:
+                    ds = convert_temperature_units(ds, 
+                                                   convert_to)
+                except Exception as e:
+                    pass
+            else:
+                pass
+            
+            try:
+                ds = rtma_derived_fields(ds,
+                                         convert_temperature,
+                                         convert_to)
+            except Exception as e:
+                pass
+            
+            return ds
+        
+        # The files are downloaded at the same time and each dataset is post-processed as soon as it is saved
+        datasets = list(download_and_process(urls,
+                                             path,
+                                             fnames,
+                                             process,
+                                             missing=missing,
+                                             proxies=proxies,
+                                             chunk_size=chunk_size,
+                                             notifications=notifications,
+                                             max_workers=max_workers,
+                                             load=False))
+        
+        if len(datasets) == 0:
+            raise NoDataAvailableError(f"None of the {model.upper()} analyses could be downloaded and post-processed.")
+        else:
+            pass
+        
+        ds = xr.concat(datasets, 
+                       dim='time', 
+                       data_vars='all',
+                       coords='different', 
+                       compat='equals', 
+                       join='override',
+                       combine_attrs='drop_conflicts')
+        
+        if statistics == True:
+            ds = ds.merge(time_series_statistics(ds,
+                                                 window=window))
+        else:
+            pass
+        
+        clear_idx_files(path)
+        
+        print(f"{model.upper()} Data Processing Complete.")
+        return ds
+    
+    else:
+        if len(missing) > 0:
+            client.get_gridded_data_batch([urls[i] for i in missing],
+                                          path,
+                                          [fnames[i] for i in missing],
+                                          proxies=proxies,
+                                          chunk_size=chunk_size,
+                                          notifications=notifications,
+                                          max_workers=max_workers)
+            
+            record_files(path,
+                         [urls[i] for i in missing],
+                         [fnames[i] for i in missing])
+        else:
+            pass
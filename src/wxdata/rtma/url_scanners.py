@@ -6,13 +6,18 @@ These functions return the URL and filename for the latest available data on the
 (C) Eric J. Drewitz 2025
 """
 
-import requests
-import sys
 import numpy as np
 
 from urllib.parse import urlparse, parse_qs
 from wxdata.utils.coords import convert_lon
 from wxdata.rtma.keys import *
+from wxdata.client import session
+from wxdata.client.scanner import(
+    probe_url,
+    probe_urls,
+    scan_times
+)
+from wxdata.client.retry import NoDataAvailableError
 
 # Exception handling for Python >= 3.13 and Python < 3.13
 try:
@@ -20,18 +25,6 @@ try:
 except Exception as e:
     from datetime import datetime, timedelta
 
-# Gets current time in UTC
-try:
-    now = datetime.now(UTC)
-except Exception as e:
-    now = datetime.utcnow()
-
-# Gets local time
-local = datetime.now()
-
-# Gets yesterday's date
-yd = now - timedelta(days=1)
-
 
 def rtma_url_scanner(model, 
                     cat,
@@ -81,6 +74,10 @@ def rtma_url_scanner(model,
     The URL path to the file and the filename for the most recent RTMA Dataset.
     
     """
+    
+    # Gets the current times so the latest runs are scanned
+    now, local, yd = scan_times()
+    
     model = model.upper()
     cat = cat.upper()
     
@@ -159,64 +156,16 @@ def rtma_url_scanner(model,
         f_03 = f"{directory}.{abbrev_3}z.2dvar{f_cat}_ndfd.grb2"
         f_04 = f"{directory}.{abbrev_4}z.2dvar{f_cat}_ndfd.grb2"
     
-    if proxies == None:
-        try:
-            r0 = requests.get(f"{url_00}/{f_00}", stream=True)
-            r0.close()
-            r1 = requests.get(f"{url_01}/{f_01}", stream=True)
-            r1.close()
-            r2 = requests.get(f"{url_02}/{f_02}", stream=True)
-            r2.close()
-            r3 = requests.get(f"{url_03}/{f_03}", stream=True)
-            r3.close()
-            r4 = requests.get(f"{url_04}/{f_04}", stream=True)
-            r4.close()
-        except Exception as e:
-            for i in range(0, 5, 1):
-                try:
-                    r0 = requests.get(f"{url_00}/{f_00}", stream=True)
-                    r0.close()
-                    r1 = requests.get(f"{url_01}/{f_01}", stream=True)
-                    r1.close()
-                    r2 = requests.get(f"{url_02}/{f_02}", stream=True)
-                    r2.close()
-                    r3 = requests.get(f"{url_03}/{f_03}", stream=True)
-                    r3.close()
-                    r4 = requests.get(f"{url_04}/{f_04}", stream=True)
-                    r4.close()
-                    break
-                except Exception as e:
-                    i = i                
-        
-    else:
-        try:
-            r0 = requests.get(f"{url_00}/{f_00}", stream=True, proxies=proxies)
-            r0.close()
-            r1 = requests.get(f"{url_01}/{f_01}", stream=True, proxies=proxies)
-            r1.close()
-            r2 = requests.get(f"{url_02}/{f_02}", stream=True, proxies=proxies)
-            r2.close()
-            r3 = requests.get(f"{url_03}/{f_03}", stream=True, proxies=proxies)
-            r3.close()
-            r4 = requests.get(f"{url_04}/{f_04}", stream=True, proxies=proxies)
-            r4.close()
-        except Exception as e:
-            for i in range(0, 5, 1):
-                try:
-                    r0 = requests.get(f"{url_00}/{f_00}", stream=True, proxies=proxies)
-                    r0.close()
-                    r1 = requests.get(f"{url_01}/{f_01}", stream=True, proxies=proxies)
-                    r1.close()
-                    r2 = requests.get(f"{url_02}/{f_02}", stream=True, proxies=proxies)
-                    r2.close()
-                    r3 = requests.get(f"{url_03}/{f_03}", stream=True, proxies=proxies)
-                    r3.close()
-                    r4 = requests.get(f"{url_04}/{f_04}", stream=True, proxies=proxies)
-                    r4.close()
-                    break
-                except Exception as e:
-                    i = i      
-        
+    # Probes every candidate run at the same time, newest run first
+    # The scan returns as soon as the latest available run is confirmed
+    statuses = probe_urls([
+        f"{url_00}/{f_00}",
+        f"{url_01}/{f_01}",
+        f"{url_02}/{f_02}",
+        f"{url_03}/{f_03}",
+        f"{url_04}/{f_04}"
+    ], proxies=proxies)
+
     url_0 = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_{directory}.pl?"
              f"dir=%2F{directory}.{h_00.strftime('%Y%m%d')}&file={f_00}&all_var=on&all_lev=on&subregion=&"
              f"toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")    
@@ -245,16 +194,8 @@ def rtma_url_scanner(model,
         url_4
     ]
     
-    responses = [
-        r0,
-        r1,
-        r2,
-        r3,
-        r4
-    ]
-    
-    for response, url in zip(responses, urls):
-        if response.status_code == 200:
+    for status, url in zip(statuses, urls):
+        if status == 200:
             url = url
             run = get_run_by_keyword(url)
             break        
@@ -262,8 +203,7 @@ def rtma_url_scanner(model,
     try:
         url = url
     except Exception as e:
-        print(f"Latest analysis data is over 4 hours old. Aborting.....")
-        sys.exit(1)
+        raise NoDataAvailableError(f"Latest analysis data is over 4 hours old.")
         
     parsed_url = urlparse(url)
 
@@ -330,6 +270,10 @@ def rtma_comparison_url_scanner(model,
     The URL path to the file and the filename for the most recent RTMA Dataset and the dataset for a user specified amount of hours prior to the latest available dataset.
     
     """
+    
+    # Gets the current times so the latest runs are scanned
+    now, local, yd = scan_times()
+    
     model = model.upper()
     cat = cat.upper()
     
@@ -461,50 +405,50 @@ def rtma_comparison_url_scanner(model,
     
     if proxies == None:
         try:
-            r0 = requests.get(f"{url_00}/{f_00}", stream=True)
+            r0 = session.get(f"{url_00}/{f_00}", stream=True, retry=False)
             r0.close()
-            r1 = requests.get(f"{url_01}/{f_01}", stream=True)
+            r1 = session.get(f"{url_01}/{f_01}", stream=True, retry=False)
             r1.close()
-            r2 = requests.get(f"{url_02}/{f_02}", stream=True)
+            r2 = session.get(f"{url_02}/{f_02}", stream=True, retry=False)
             r2.close()
-            r3 = requests.get(f"{url_03}/{f_03}", stream=True)
+            r3 = session.get(f"{url_03}/{f_03}", stream=True, retry=False)
             r3.close()
-            r4 = requests.get(f"{url_04}/{f_04}", stream=True)
+            r4 = session.get(f"{url_04}/{f_04}", stream=True, retry=False)
             r4.close()
             
-            r5 = requests.get(f"{url_00}/{f_00}", stream=True)
+            r5 = session.get(f"{url_00}/{f_00}", stream=True, retry=False)
             r5.close()
-            r6 = requests.get(f"{url_01}/{f_01}", stream=True)
+            r6 = session.get(f"{url_01}/{f_01}", stream=True, retry=False)
             r6.close()
-            r7 = requests.get(f"{url_02}/{f_02}", stream=True)
+            r7 = session.get(f"{url_02}/{f_02}", stream=True, retry=False)
             r7.close()
-            r8 = requests.get(f"{url_03}/{f_03}", stream=True)
+            r8 = session.get(f"{url_03}/{f_03}", stream=True, retry=False)
             r8.close()
-            r9 = requests.get(f"{url_04}/{f_04}", stream=True)
+            r9 = session.get(f"{url_04}/{f_04}", stream=True, retry=False)
             r9.close()
         except Exception as e:
             for i in range(0, 5, 1):
                 try:
-                    r0 = requests.get(f"{url_00}/{f_00}", stream=True)
+                    r0 = session.get(f"{url_00}/{f_00}", stream=True, retry=False)
                     r0.close()
-                    r1 = requests.get(f"{url_01}/{f_01}", stream=True)
+                    r1 = session.get(f"{url_01}/{f_01}", stream=True, retry=False)
                     r1.close()
-                    r2 = requests.get(f"{url_02}/{f_02}", stream=True)
+                    r2 = session.get(f"{url_02}/{f_02}", stream=True, retry=False)
                     r2.close()
-                    r3 = requests.get(f"{url_03}/{f_03}", stream=True)
+                    r3 = session.get(f"{url_03}/{f_03}", stream=True, retry=False)
                     r3.close()
-                    r4 = requests.get(f"{url_04}/{f_04}", stream=True)
+                    r4 = session.get(f"{url_04}/{f_04}", stream=True, retry=False)
                     r4.close()
                     
-                    r5 = requests.get(f"{url_00}/{f_00}", stream=True)
+                    r5 = session.get(f"{url_00}/{f_00}", stream=True, retry=False)
                     r5.close()
-                    r6 = requests.get(f"{url_01}/{f_01}", stream=True)
+                    r6 = session.get(f"{url_01}/{f_01}", stream=True, retry=False)
                     r6.close()
-                    r7 = requests.get(f"{url_02}/{f_02}", stream=True)
+                    r7 = session.get(f"{url_02}/{f_02}", stream=True, retry=False)
                     r7.close()
-                    r8 = requests.get(f"{url_03}/{f_03}", stream=True)
+                    r8 = session.get(f"{url_03}/{f_03}", stream=True, retry=False)
                     r8.close()
-                    r9 = requests.get(f"{url_04}/{f_04}", stream=True)
+                    r9 = session.get(f"{url_04}/{f_04}", stream=True, retry=False)
                     r9.close()
                     break
                 except Exception as e:
@@ -512,50 +456,50 @@ def rtma_comparison_url_scanner(model,
                                      
     else:
         try:
-            r0 = requests.get(f"{url_00}/{f_00}", stream=True, proxies=proxies)
+            r0 = session.get(f"{url_00}/{f_00}", stream=True, proxies=proxies, retry=False)
             r0.close()
-            r1 = requests.get(f"{url_01}/{f_01}", stream=True, proxies=proxies)
+            r1 = session.get(f"{url_01}/{f_01}", stream=True, proxies=proxies, retry=False)
             r1.close()
-            r2 = requests.get(f"{url_02}/{f_02}", stream=True, proxies=proxies)
+            r2 = session.get(f"{url_02}/{f_02}", stream=True, proxies=proxies, retry=False)
             r2.close()
-            r3 = requests.get(f"{url_03}/{f_03}", stream=True, proxies=proxies)
+            r3 = session.get(f"{url_03}/{f_03}", stream=True, proxies=proxies, retry=False)
             r3.close()
-            r4 = requests.get(f"{url_04}/{f_04}", stream=True, proxies=proxies)
+            r4 = session.get(f"{url_04}/{f_04}", stream=True, proxies=proxies, retry=False)
             r4.close()
             
-            r5 = requests.get(f"{url_00}/{f_00}", stream=True, proxies=proxies)
+            r5 = session.get(f"{url_00}/{f_00}", stream=True, proxies=proxies, retry=False)
             r5.close()
-            r6 = requests.get(f"{url_01}/{f_01}", stream=True, proxies=proxies)
+            r6 = session.get(f"{url_01}/{f_01}", stream=True, proxies=proxies, retry=False)
             r6.close()
-            r7 = requests.get(f"{url_02}/{f_02}", stream=True, proxies=proxies)
+            r7 = session.get(f"{url_02}/{f_02}", stream=True, proxies=proxies, retry=False)
             r7.close()
-            r8 = requests.get(f"{url_03}/{f_03}", stream=True, proxies=proxies)
+            r8 = session.get(f"{url_03}/{f_03}", stream=True, proxies=proxies, retry=False)
             r8.close()
-            r9 = requests.get(f"{url_04}/{f_04}", stream=True, proxies=proxies)
+            r9 = session.get(f"{url_04}/{f_04}", stream=True, proxies=proxies, retry=False)
             r9.close()
         except Exception as e:
             for i in range(0, 5, 1):
                 try:
-                    r0 = requests.get(f"{url_00}/{f_00}", stream=True, proxies=proxies)
+                    r0 = session.get(f"{url_00}/{f_00}", stream=True, proxies=proxies, retry=False)
                     r0.close()
-                    r1 = requests.get(f"{url_01}/{f_01}", stream=True, proxies=proxies)
+                    r1 = session.get(f"{url_01}/{f_01}", stream=True, proxies=proxies, retry=False)
                     r1.close()
-                    r2 = requests.get(f"{url_02}/{f_02}", stream=True, proxies=proxies)
+                    r2 = session.get(f"{url_02}/{f_02}", stream=True, proxies=proxies, retry=False)
                     r2.close()
-                    r3 = requests.get(f"{url_03}/{f_03}", stream=True, proxies=proxies)
+                    r3 = session.get(f"{url_03}/{f_03}", stream=True, proxies=proxies, retry=False)
                     r3.close()
-                    r4 = requests.get(f"{url_04}/{f_04}", stream=True, proxies=proxies)
+                    r4 = session.get(f"{url_04}/{f_04}", stream=True, proxies=proxies, retry=False)
                     r4.close()
                     
-                    r5 = requests.get(f"{url_00}/{f_00}", stream=True, proxies=proxies)
+                    r5 = session.get(f"{url_00}/{f_00}", stream=True, proxies=proxies, retry=False)
                     r5.close()
-                    r6 = requests.get(f"{url_01}/{f_01}", stream=True, proxies=proxies)
+                    r6 = session.get(f"{url_01}/{f_01}", stream=True, proxies=proxies, retry=False)
                     r6.close()
-                    r7 = requests.get(f"{url_02}/{f_02}", stream=True, proxies=proxies)
+                    r7 = session.get(f"{url_02}/{f_02}", stream=True, proxies=proxies, retry=False)
                     r7.close()
-                    r8 = requests.get(f"{url_03}/{f_03}", stream=True, proxies=proxies)
+                    r8 = session.get(f"{url_03}/{f_03}", stream=True, proxies=proxies, retry=False)
                     r8.close()
-                    r9 = requests.get(f"{url_04}/{f_04}", stream=True, proxies=proxies)
+                    r9 = session.get(f"{url_04}/{f_04}", stream=True, proxies=proxies, retry=False)
                     r9.close()
                     break
                 except Exception as e:
@@ -647,8 +591,7 @@ def rtma_comparison_url_scanner(model,
     try:
         url = url
     except Exception as e:
-        print(f"Latest analysis data is over 4 hours old. Aborting.....")
-        sys.exit(1)
+        raise NoDataAvailableError(f"Latest analysis data is over 4 hours old.")
         
     parsed_url = urlparse(url)
 
@@ -674,4 +617,190 @@ def rtma_comparison_url_scanner(model,
     
     filename_dt = f"{filename_dt}_dt"
     
-    return url, url_dt, filename, filename_dt, run
\ No newline at end of file
+    return url, url_dt, filename, filename_dt, run
+
+
+def rtma_directory(model):
+    
+    """
+    This function returns the NOMADS directory of an RTMA model.
+    
+    Required Arguments:
+    
+    1) model (String) - The RTMA Model (i.e. 'RTMA', 'AK RTMA', 'HI RTMA', 'GU RTMA' or 'PR RTMA').
+    
+    Optional Arguments: None
+    
+    Returns
+    -------
+    
+    The NOMADS directory of the RTMA model (i.e. 'rtma2p5').
+    """
+    
+    directories = {
+        'RTMA':'rtma2p5',
+        'AK RTMA':'akrtma',
+        'HI RTMA':'hirtma',
+        'GU RTMA':'gurtma',
+        'PR RTMA':'prrtma'
+    }
+    
+    return directories[model.upper()]
+
+def rtma_file(model,
+              cat,
+              time):
+    
+    """
+    This function returns the name of an RTMA file on NOMADS.
+    
+    Required Arguments:
+    
+    1) model (String) - The RTMA Model (i.e. 'RTMA', 'AK RTMA', 'HI RTMA', 'GU RTMA' or 'PR RTMA').
+    
+    2) cat (String) - The category of the variables (i.e. 'ANALYSIS', 'ERROR' or 'FORECAST').
+    
+    3) time (datetime) - The time of the analysis.
+    
+    Optional Arguments: None
+    
+    Returns
+    -------
+    
+    The name of the RTMA file on NOMADS (i.e. 'rtma2p5.t12z.2dvaranl_ndfd.grb2_wexp').
+    """
+    
+    model = model.upper()
+    cat = cat.upper()
+    directory = rtma_directory(model)
+    
+    if cat == 'ANALYSIS':
+        f_cat = 'anl'
+    elif cat == 'ERROR':
+        f_cat = 'err'
+    else:
+        f_cat = 'ges'
+    
+    if model == 'AK RTMA':
+        fname = f"{directory}.t{time.strftime('%H')}z.2dvar{f_cat}_ndfd_3p0.grb2"
+    elif model == 'RTMA':
+        fname = f"{directory}.t{time.strftime('%H')}z.2dvar{f_cat}_ndfd.grb2_wexp"
+    else:
+        fname = f"{directory}.t{time.strftime('%H')}z.2dvar{f_cat}_ndfd.grb2"
+        
+    return fname
+
+def rtma_time_series_url_scanner(model, 
+                    cat,
+                    western_bound, 
+                    eastern_bound, 
+                    northern_bound, 
+                    southern_bound, 
+                    proxies,
+                    hours,
+                    step):
+    
+    """
+    This function scans for the latest available RTMA Dataset within the past 4 hours and returns the URLs 
+    of every dataset in a window of hours ending at the latest available dataset. 
+    
+    Required Arguments:
+    
+    1) model (String) - The RTMA Model:
+    
+    RTMA Models:
+    i) RTMA - CONUS
+    ii) AK RTMA - Alaska
+    iii) HI RTMA - Hawaii
+    iv) GU RTMA - Guam
+    v) PR RTMA - Puerto Rico
+    
+    2) cat (String) - The category of the variables. 
+    
+    i) Analysis
+    ii) Error
+    iii) Forecast
+    
+    3) western_bound (Float or Integer) - Default=-180. The western bound of the data needed. 
+
+    4) eastern_bound (Float or Integer) - Default=180. The eastern bound of the data needed.
+
+    5) northern_bound (Float or Integer) - Default=90. The northern bound of the data needed.
+
+    6) southern_bound (Float or Integer) - Default=-90. The southern bound of the data needed.
+    
+    7) proxies (dict or None) - If the user is using a proxy server, the user must change the following:
+
+    proxies=None ---> proxies={'http':'http://url',
+                            'https':'https://url'
+                        }
+                        
+    8) hours (Integer) - The length of the window in hours (i.e. hours=24 for the past 24 hours). 
+    
+    9) step (Integer) - The amount of hours between each dataset in the window (i.e. step=3 for every 3rd hour). 
+    
+    Returns
+    -------
+    
+    1) The URLs of the datasets in the window, oldest first.
+    
+    2) The filenames of the datasets in the window. The date is added to each filename so a window longer than 24 hours has unique filenames. 
+    
+    3) The times of the datasets in the window. 
+    """
+    
+    # Gets the current times so the latest runs are scanned
+    now, local, yd = scan_times()
+    
+    model = model.upper()
+    cat = cat.upper()
+    
+    western_bound, eastern_bound = convert_lon(western_bound, eastern_bound)
+    
+    directory = rtma_directory(model)
+    
+    candidates = [now - timedelta(hours=i) for i in range(0, 5, 1)]
+    
+    # Probes every candidate run at the same time, newest run first
+    statuses = probe_urls([f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/rtma/prod/{directory}.{t.strftime('%Y%m%d')}/{rtma_file(model, cat, t)}" for t in candidates], 
+                          proxies=proxies)
+    
+    latest = None
+    for status, t in zip(statuses, candidates):
+        if status == 200:
+            latest = t
+            break
+        else:
+            pass
+        
+    if latest == None:
+        raise NoDataAvailableError(f"Latest analysis data is over 4 hours old.")
+    else:
+        pass
+    
+    times = [latest - timedelta(hours=i) for i in range(0, max(hours, 1), max(step, 1))]
+    times.reverse()
+    
+    # The oldest dataset is checked before any download so a window longer than the data kept on NOMADS fails right away
+    oldest = times[0]
+    status = probe_url(f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/rtma/prod/{directory}.{oldest.strftime('%Y%m%d')}/{rtma_file(model, cat, oldest)}",
+                       proxies)
+    
+    if status != 200:
+        raise NoDataAvailableError(f"The {model} data from {oldest.strftime('%Y-%m-%d %H:00 UTC')} is no longer available on NOMADS. Try a shorter window of hours.")
+    else:
+        pass
+    
+    urls = []
+    filenames = []
+    for t in times:
+        f = rtma_file(model, cat, t)
+        
+        url = (f"https://nomads.ncep.noaa.gov/cgi-bin/filter_{directory}.pl?"
+               f"dir=%2F{directory}.{t.strftime('%Y%m%d')}&file={f}&all_var=on&all_lev=on&subregion=&"
+               f"toplat={northern_bound}&leftlon={western_bound}&rightlon={eastern_bound}&bottomlat={southern_bound}")
+        
+        urls.append(url)
+        filenames.append(f"{t.strftime('%Y%m%d')}.{f}")
+    
+    return urls, filenames, times
@@ -6,10 +6,8 @@ This data is for observed soundings.
 (C) Eric J. Drewitz
 """
 # Imports the needed libraries
-import requests
 import pandas as pd
 import metpy.calc as mpcalc
-import sys
 
 from wxdata.calc.thermodynamics import(
 
@@ -23,6 +21,8 @@ from bs4 import BeautifulSoup
 from io import StringIO
 
 from wxdata.utils.recycle_bin import *
+from wxdata.client import session
+from wxdata.client.retry import NoDataAvailableError
 
 try:
     from datetime import datetime, timedelta, UTC
@@ -417,19 +417,19 @@ def get_observed_sounding_data(station_id,
         max_retries = 5
         retry = 0
         if proxies == None:
-            response = requests.get(url, stream=True)
+            response = session.get(url, stream=True, retry=False)
             response.close()
             while response.status_code != 200:
-                response = requests.get(url, stream=True)
+                response = session.get(url, stream=True, retry=False)
                 response.close()
                 retry = retry + 1
                 if retry > max_retries:
                     break
         else:
-            response = requests.get(url, stream=True, proxies=proxies)
+            response = session.get(url, stream=True, proxies=proxies, retry=False)
             response.close()
             while response.status_code != 200:
-                response = requests.get(url, stream=True, proxies=proxies)
+                response = session.get(url, stream=True, proxies=proxies, retry=False)
                 response.close()
                 retry = retry + 1
                 if retry > max_retries:
@@ -458,19 +458,19 @@ def get_observed_sounding_data(station_id,
             max_retries = 5
             retry = 0
             if proxies == None:
-                response = requests.get(url, stream=True)
+                response = session.get(url, stream=True, retry=False)
                 response.close()
                 while response.status_code != 200:
-                    response = requests.get(url, stream=True)
+                    response = session.get(url, stream=True, retry=False)
                     response.close()
                     retry = retry + 1
                     if retry > max_retries:
                         break
             else:
-                response = requests.get(url, stream=True, proxies=proxies)
+                response = session.get(url, stream=True, proxies=proxies, retry=False)
                 response.close()
                 while response.status_code != 200:
-                    response = requests.get(url, stream=True, proxies=proxies)
+                    response = session.get(url, stream=True, proxies=proxies, retry=False)
                     response.close()
                     retry = retry + 1
                     if retry > max_retries:
@@ -481,8 +481,7 @@ def get_observed_sounding_data(station_id,
                 data = StringIO(soup.find_all('pre')[0].contents[0])
                 success = True
             except Exception as e:
-                print(f"No Recent Sounding Data for {station_id}.\nQuitting Now")
-                sys.exit()
+                raise NoDataAvailableError(f"No Recent Sounding Data for {station_id}.")
         else:
             pass
             
@@ -536,27 +535,27 @@ def get_observed_sounding_data(station_id,
         max_retries = 5
         retry = 0
         if proxies == None:
-            response = requests.get(url, stream=True)
+            response = session.get(url, stream=True, retry=False)
             response.close()
-            response_24 = requests.get(url_24, stream=True)
+            response_24 = session.get(url_24, stream=True, retry=False)
             response_24.close()
             while response.status_code != 200 and response_24.status_code != 200:
-                response = requests.get(url, stream=True)
+                response = session.get(url, stream=True, retry=False)
                 response.close()
-                response_24 = requests.get(url_24, stream=True)
+                response_24 = session.get(url_24, stream=True, retry=False)
                 response_24.close()
                 retry = retry + 1
                 if retry > max_retries:
                     break
         else:
-            response = requests.get(url, stream=True, proxies=proxies)
+            response = session.get(url, stream=True, proxies=proxies, retry=False)
             response.close()
-            response_24 = requests.get(url_24, stream=True, proxies=proxies)
+            response_24 = session.get(url_24, stream=True, proxies=proxies, retry=False)
             response_24.close()
             while response.status_code != 200 and response_24.status_code != 200:
-                response = requests.get(url, stream=True, proxies=proxies)
+                response = session.get(url, stream=True, proxies=proxies, retry=False)
                 response.close()
-                response_24 = requests.get(url_24, stream=True, proxies=proxies)
+                response_24 = session.get(url_24, stream=True, proxies=proxies, retry=False)
                 response_24.close()
                 retry = retry + 1
                 if retry > max_retries:
@@ -598,27 +597,27 @@ def get_observed_sounding_data(station_id,
             max_retries = 5
             retry = 0
             if proxies == None:
-                response = requests.get(url, stream=True)
+                response = session.get(url, stream=True, retry=False)
                 response.close()
-                response_24 = requests.get(url_24, stream=True)
+                response_24 = session.get(url_24, stream=True, retry=False)
                 response_24.close()
                 while response.status_code != 200 and response_24.status_code != 200:
-                    response = requests.get(url, stream=True)
+                    response = session.get(url, stream=True, retry=False)
                     response.close()
-                    response_24 = requests.get(url_24, stream=True)
+                    response_24 = session.get(url_24, stream=True, retry=False)
                     response_24.close()
                     retry = retry + 1
                     if retry > max_retries:
                         break
             else:
-                response = requests.get(url, stream=True, proxies=proxies)
+                response = session.get(url, stream=True, proxies=proxies, retry=False)
                 response.close()
-                response_24 = requests.get(url_24, stream=True, proxies=proxies)
+                response_24 = session.get(url_24, stream=True, proxies=proxies, retry=False)
                 response_24.close()
                 while response.status_code != 200 and response_24.status_code != 200:
-                    response = requests.get(url, stream=True, proxies=proxies)
+                    response = session.get(url, stream=True, proxies=proxies, retry=False)
                     response.close()
-                    response_24 = requests.get(url_24, stream=True, proxies=proxies)
+                    response_24 = session.get(url_24, stream=True, proxies=proxies, retry=False)
                     response_24.close()
                     retry = retry + 1
                     if retry > max_retries:
@@ -631,8 +630,7 @@ def get_observed_sounding_data(station_id,
                 data_24 = StringIO(soup_24.find_all('pre')[0].contents[0])
                 success = True
             except Exception as e:
-                print(f"No Recent Sounding Data for {station_id}.\nQuitting Now")
-                sys.exit()
+                raise NoDataAvailableError(f"No Recent Sounding Data for {station_id}.")
         else:
             pass
             
@@ -1,23 +1,65 @@
-from wxdata.utils.recycle_bin import(
-    
-    clear_trash_bin_mac,
-    clear_trash_bin_linux,
-    clear_recycle_bin_windows
-)
-
-from wxdata.utils.file_funcs import *
-from wxdata.utils.coords import *
-from wxdata.utils.file_scanner import local_file_scanner
-from wxdata.utils.nomads_gribfilter import(
-    
-    result_string,
-    key_list
-)
+# The utility functions are imported the first time they are used
+from wxdata.utils.lazy_imports import lazy_loader
 
-from wxdata.utils.tools import(
-    pixel_query,
-    line_query
-)
+__getattr__, __dir__, __all__ = lazy_loader(__name__, {
+    
+    'wxdata.utils.recycle_bin':[
+        'clear_trash_bin_mac',
+        'clear_trash_bin_linux',
+        'clear_recycle_bin_windows'
+    ],
+    
+    'wxdata.utils.file_funcs':[
+        'clear_gefs_idx_files',
+        'clear_idx_files_in_path',
+        'custom_branch',
+        'custom_branches',
+        'decompress_to_file',
+        'decompression_chunk_size',
+        'extract_gzipped_file',
+        'file_paths_for_xarray',
+        'open_decompressed',
+        'sorted_paths'
+    ],
+    
+    'wxdata.utils.coords':[
+        'convert_lon',
+        'cyclic_point',
+        'lon_bounds',
+        'shift_longitude',
+        'subset_to_bbox'
+    ],
+    
+    'wxdata.utils.file_scanner':[
+        'local_file_scanner',
+        'manifest_file_scanner'
+    ],
+    
+    'wxdata.utils.nomads_gribfilter':[
+        'result_string',
+        'key_list',
+        'level_string'
+    ],
+    
+    'wxdata.utils.tools':[
+        'pixel_query',
+        'line_query',
+        'points_query'
+    ],
+    
+    'wxdata.utils.scripts':[
+        'run_external_scripts'
+    ],
+    
+    'wxdata.utils.xmacis2_cleanup':[
+        'clean_pandas_dataframe'
+    ],
+    
+    'wxdata.utils.index_cache':[
+        'set_index_cache',
+        'clear_index_cache'
+    ]
+})
 
-from wxdata.utils.scripts import run_external_scripts
-from wxdata.utils.xmacis2_cleanup import clean_pandas_dataframe
\ No newline at end of file
+# lazy_loader is not part of the public API of the package
+del lazy_loader
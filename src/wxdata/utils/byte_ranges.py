@@ -0,0 +1,441 @@
+"""
+This file hosts the functions that read the index (inventory) files published next to GRIB2 files on the dataservers
+and return the byte ranges of the GRIB2 messages the user needs.
+
+Rather than downloading a full global GRIB2 file and throwing most of it away during post-processing,
+only the byte ranges of the requested messages are downloaded with HTTP Range requests.
+Adjacent byte ranges are coalesced so each file needs as few requests as possible.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import json
+
+from wxdata.client import session
+from wxdata.utils.nomads_gribfilter import var_keys
+
+def ecmwf_index_url(url):
+
+    """
+    This function returns the URL of the JSON .index file ECMWF publishes next to each GRIB2 file.
+
+    Required Arguments:
+
+    1) url (String) - The download URL of the GRIB2 file.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The URL of the .index file.
+    """
+
+    if url.endswith('.grib2'):
+        return f"{url[:-6]}.index"
+    else:
+        return f"{url}.index"
+
+
+def parse_ecmwf_index(text):
+
+    """
+    This function parses an ECMWF .index file.
+
+    Each line of the .index file is a JSON object describing one GRIB2 message (i.e. param, levtype, levelist, step)
+    along with the _offset and _length of the message in the GRIB2 file.
+
+    Required Arguments:
+
+    1) text (String) - The contents of the .index file.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A list of dictionaries with the keys param, level, offset and length.
+    """
+
+    messages = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line == '':
+            continue
+        entry = json.loads(line)
+        messages.append({
+            'param':entry.get('param'),
+            'level':entry.get('levelist', entry.get('levtype')),
+            'offset':int(entry['_offset']),
+            'length':int(entry['_length'])
+        })
+
+    return messages
+
+
+def select_messages(messages,
+                    variables=None,
+                    levels=None):
+
+    """
+    This function selects the messages matching the requested variables and levels.
+
+    Required Arguments:
+
+    1) messages (List) - The messages returned by parse_ecmwf_index() or parse_nomads_index().
+
+    Optional Arguments:
+
+    1) variables (String List or None) - Default=None. The variables (i.e. ['2t', '10u', '10v', 'msl']).
+       When None, every variable is selected.
+
+    2) levels (List or None) - Default=None. The levels (i.e. [850, 500] or ['sfc']).
+       When None, every level is selected.
+
+    Returns
+    -------
+
+    A list of (start, end) byte ranges of the selected messages. The end byte is inclusive.
+    """
+
+    if variables != None:
+        variables = [str(v).lower() for v in variables]
+    else:
+        pass
+
+    if levels != None:
+        levels = [str(l).lower() for l in levels]
+    else:
+        pass
+
+    ranges = []
+    for message in messages:
+        if variables != None and str(message['param']).lower() not in variables:
+            continue
+        if levels != None and str(message['level']).lower() not in levels:
+            continue
+        if message['length'] == None:
+            ranges.append((message['offset'], None))
+        else:
+            ranges.append((message['offset'], message['offset'] + message['length'] - 1))
+
+    return ranges
+
+
+def coalesce_ranges(ranges,
+                    max_gap=0):
+
+    """
+    This function merges adjacent and overlapping byte ranges.
+
+    Required Arguments:
+
+    1) ranges (List) - A list of (start, end) byte ranges. An end of None means the range runs to the end of the file.
+
+    Optional Arguments:
+
+    1) max_gap (Integer) - Default=0. Ranges separated by this many bytes or fewer are merged into one range.
+       A small gap downloads a few unneeded bytes in exchange for fewer requests.
+
+    Returns
+    -------
+
+    A sorted list of merged (start, end) byte ranges.
+    """
+
+    merged = []
+    for start, end in sorted(ranges, key=lambda r: r[0]):
+        if len(merged) > 0 and merged[-1][1] == None:
+            continue
+        if len(merged) > 0 and start <= merged[-1][1] + 1 + max_gap:
+            if end == None:
+                merged[-1] = (merged[-1][0], None)
+            else:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+def range_header(start,
+                 end):
+
+    """
+    This function returns the HTTP Range header for a byte range.
+
+    Required Arguments:
+
+    1) start (Integer) - The first byte.
+
+    2) end (Integer or None) - The last byte (inclusive). None means the end of the file.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A dictionary of the Range header.
+    """
+
+    if end == None:
+        return {'Range':f"bytes={start}-"}
+    else:
+        return {'Range':f"bytes={start}-{end}"}
+
+
+def ecmwf_message_ranges(url,
+                         variables=None,
+                         levels=None,
+                         proxies=None):
+
+    """
+    This function downloads the ECMWF .index file for a GRIB2 file and returns the coalesced byte ranges
+    of the requested messages.
+
+    Required Arguments:
+
+    1) url (String) - The download URL of the GRIB2 file.
+
+    Optional Arguments:
+
+    1) variables (String List or None) - Default=None. The ECMWF parameter short names (i.e. ['2t', '10u', '10v', 'msl']).
+
+    2) levels (List or None) - Default=None. The levels (i.e. [850, 500] or ['sfc']).
+
+    3) proxies (dict or None) - Default=None. If the user is using proxy server(s), the user must change the following:
+
+       proxies=None ---> proxies={
+                           'http':'http://url',
+                           'https':'https://url'
+                        }
+
+    Returns
+    -------
+
+    A sorted list of merged (start, end) byte ranges.
+    """
+
+    response = session.get(ecmwf_index_url(url), proxies=proxies, timeout=60)
+    response.raise_for_status()
+
+    messages = parse_ecmwf_index(response.text)
+
+    return coalesce_ranges(select_messages(messages,
+                                           variables=variables,
+                                           levels=levels))
+
+
+def nomads_index_url(url):
+
+    """
+    This function returns the URL of the .idx inventory file NOMADS publishes next to each GRIB2 file.
+
+    Required Arguments:
+
+    1) url (String) - The download URL of the GRIB2 file.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The URL of the .idx file.
+    """
+
+    return f"{url}.idx"
+
+
+def parse_nomads_index(text):
+
+    """
+    This function parses a NOMADS .idx inventory file.
+
+    Each line of the .idx file describes one GRIB2 message (i.e. 1:0:d=2025101800:HGT:1000 mb:anl:).
+    The length of a message is the next distinct offset minus its own offset. Sub-messages (i.e. 5.1 and 5.2) share
+    the offset of the GRIB2 message they are packed in, so each one returns the byte range of the whole message.
+    The last message runs to the end of the file.
+
+    Required Arguments:
+
+    1) text (String) - The contents of the .idx file.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A list of dictionaries with the keys param, level, offset and length.
+    """
+
+    messages = []
+    for line in text.splitlines():
+        fields = line.strip().split(':')
+        if len(fields) < 5:
+            continue
+        messages.append({
+            'param':fields[3],
+            'level':fields[4],
+            'offset':int(fields[1]),
+            'length':None
+        })
+
+    # Sub-messages (i.e. 5.1 and 5.2 for UGRD and VGRD) share the offset of the GRIB2 message they are packed in
+    # so the length of each message runs to the next distinct offset
+    offsets = sorted(set([message['offset'] for message in messages]))
+    following = {offsets[i]:offsets[i + 1] for i in range(0, len(offsets) - 1, 1)}
+    for message in messages:
+        if message['offset'] in following:
+            message['length'] = following[message['offset']] - message['offset']
+        else:
+            pass
+
+    return messages
+
+
+def nomads_keys(variables=None,
+                levels=None):
+
+    """
+    This function converts the variables and levels into the keys used in the NOMADS .idx files.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) variables (String List or None) - Default=None. The variables in plain language (i.e. 'temperature')
+       or as GRIB keys (i.e. 'TMP').
+
+    2) levels (List or None) - Default=None. Pressure levels in hPa (i.e. [850, 500]) or .idx level
+       strings (i.e. '2 m above ground').
+
+    Returns
+    -------
+
+    The variables and levels as NOMADS .idx keys.
+    """
+
+    if variables != None:
+        keys = []
+        for v in variables:
+            try:
+                keys.append(var_keys(v.lower()))
+            except Exception as e:
+                keys.append(v.upper())
+        variables = keys
+    else:
+        pass
+
+    if levels != None:
+        keys = []
+        for l in levels:
+            if type(l) == type(1) or type(l) == type(1.0):
+                keys.append(f"{l:g} mb")
+            else:
+                keys.append(l)
+        levels = keys
+    else:
+        pass
+
+    return variables, levels
+
+
+def nomads_message_ranges(url,
+                          variables=None,
+                          levels=None,
+                          proxies=None):
+
+    """
+    This function downloads the NOMADS .idx file for a GRIB2 file and returns the coalesced byte ranges
+    of the requested messages.
+
+    Required Arguments:
+
+    1) url (String) - The download URL of the GRIB2 file.
+
+    Optional Arguments:
+
+    1) variables (String List or None) - Default=None. The variables in plain language (i.e. 'temperature')
+       or as GRIB keys (i.e. 'TMP').
+
+    2) levels (List or None) - Default=None. Pressure levels in hPa (i.e. [850, 500]) or .idx level
+       strings (i.e. '2 m above ground').
+
+    3) proxies (dict or None) - Default=None. If the user is using proxy server(s), the user must change the following:
+
+       proxies=None ---> proxies={
+                           'http':'http://url',
+                           'https':'https://url'
+                        }
+
+    Returns
+    -------
+
+    A sorted list of merged (start, end) byte ranges.
+    """
+
+    response = session.get(nomads_index_url(url), proxies=proxies, timeout=60)
+    response.raise_for_status()
+
+    messages = parse_nomads_index(response.text)
+    variables, levels = nomads_keys(variables=variables,
+                                    levels=levels)
+
+    return coalesce_ranges(select_messages(messages,
+                                           variables=variables,
+                                           levels=levels))
+
+
+def message_ranges(url,
+                   index_format,
+                   variables=None,
+                   levels=None,
+                   proxies=None):
+
+    """
+    This function returns the coalesced byte ranges of the requested messages in a GRIB2 file
+    using the index file published by the dataserver.
+
+    Required Arguments:
+
+    1) url (String) - The download URL of the GRIB2 file.
+
+    2) index_format (String) - The format of the index file.
+
+    Valid index formats
+    -------------------
+
+    1) 'ecmwf' - The JSON .index files on the ECMWF open dataserver.
+    2) 'nomads' - The .idx inventory files on the NCEP/NOMADS dataserver.
+
+    Optional Arguments:
+
+    1) variables (String List or None) - Default=None. The variables to download.
+
+    2) levels (List or None) - Default=None. The levels to download.
+
+    3) proxies (dict or None) - Default=None. If the user is using proxy server(s), the user must change the following:
+
+       proxies=None ---> proxies={
+                           'http':'http://url',
+                           'https':'https://url'
+                        }
+
+    Returns
+    -------
+
+    A sorted list of merged (start, end) byte ranges.
+    """
+
+    if index_format == 'ecmwf':
+        return ecmwf_message_ranges(url,
+                                    variables=variables,
+                                    levels=levels,
+                                    proxies=proxies)
+    elif index_format == 'nomads':
+        return nomads_message_ranges(url,
+                                     variables=variables,
+                                     levels=levels,
+                                     proxies=proxies)
+    else:
+        raise ValueError(f"{index_format} is not a supported index format.")
@@ -3,6 +3,8 @@ This file hosts functions that process geographical coordinates in netCDF data.
 
 (C) Eric J. Drewitz 2025
 """
+import numpy as np
+
 from cartopy.util import add_cyclic_point
 
 def convert_lon(western_bound, 
@@ -119,3 +121,54 @@ def cyclic_point(ds,
     var, lon = add_cyclic_point(var.values, coord=var_lon, axis=var_lon_idx)
 
     return var, lon
+
+def subset_to_bbox(ds,
+                   bbox,
+                   lon_name='longitude',
+                   lat_name='latitude'):
+
+    """
+    This function subsets data to the bounding box of a NOMADS GRIB filter request.
+
+    This is used when the data was reused from files downloaded for a larger bounding box,
+    so the data returned is the same as if the smaller bounding box was downloaded.
+
+    Required Arguments:
+
+    1) ds (xarray.dataarray) - The dataset of the model data.
+
+    2) bbox (List or None) - The bounding box of the request [leftlon, rightlon, toplat, bottomlat]
+       with longitude in terms of 0 to 360. When None, the data is returned as is.
+
+    Optional Arguments:
+
+    1) lon_name (String) - Default = longitude. The abbreviation for the longitude key.
+
+    2) lat_name (String) - Default = latitude. The abbreviation for the latitude key.
+
+    Returns
+    -------
+
+    An xarray.dataarray of the data inside of the bounding box.
+    """
+
+    if bbox == None:
+        return ds
+    else:
+        pass
+
+    left, right, top, bottom = [float(value) for value in bbox]
+
+    lon = ds[lon_name].values % 360
+    if left <= right:
+        lon_mask = (lon >= left - 1e-6) & (lon <= right + 1e-6)
+    else:
+        lon_mask = (lon >= left - 1e-6) | (lon <= right + 1e-6)
+
+    lat = ds[lat_name].values
+    lat_mask = (lat >= bottom - 1e-6) & (lat <= top + 1e-6)
+
+    ds = ds.isel({lon_name:np.nonzero(lon_mask)[0],
+                  lat_name:np.nonzero(lat_mask)[0]})
+
+    return ds
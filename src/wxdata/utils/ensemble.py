@@ -0,0 +1,169 @@
+"""
+This file hosts the functions that open the ensemble members of a model in parallel.
+
+Each ensemble member is saved to its own directory (i.e. f:GEFS0P25/MEMBERS/1). Rather than opening every member
+one after the other for each group of GRIB2 messages (i.e. typeOfLevel='surface' or typeOfLevel='isobaricInhPa' with shortName='t'),
+the files of each member are scanned one time and every group is opened from that single GRIB2 message index.
+The members of each group are then concatenated along the member (number) dimension.
+
+By default the members are opened lazily in the calling process. When more than one worker is requested, each member directory
+is handed to its own worker process which decodes the data of each group.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import os
+import glob
+import warnings
+import multiprocessing
+import xarray as xr
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from wxdata.utils.coords import shift_longitude
+from wxdata.utils.grib_index import(
+    build_grib_index,
+    open_grib_group
+)
+
+def open_member_groups(path,
+                       groups,
+                       files=None,
+                       load=False):
+
+    """
+    This function opens every group of GRIB2 messages for a single ensemble member.
+
+    The files of the member are scanned one time and each group is opened from that GRIB2 message index.
+
+    Required Arguments:
+
+    1) path (String) - The path to the directory of the ensemble member.
+
+    2) groups (List) - A list of cfgrib style filters (i.e. [{'typeOfLevel': 'surface'}, {'typeOfLevel': 'isobaricInhPa', 'shortName':'t'}])
+
+    Optional Arguments:
+
+    1) files (String List or None) - Default=None. The complete paths of the files of the member to open (i.e. a single forecast hour).
+       When None, every GRIB2 file in {path} is opened.
+
+    2) load (Boolean) - Default=False. When set to True, the data of each group is decoded and loaded into memory
+       (i.e. inside a worker process). When False, the data is not decoded until it is used.
+
+    Returns
+    -------
+
+    A list of xarray.arrays in the same order as groups. A group that cannot be opened is None.
+    """
+
+    if files == None:
+        files = sorted(glob.glob(f"{path}/*.grib2"))
+    else:
+        pass
+    index = build_grib_index(files)
+
+    datasets = []
+    for filter_by_keys in groups:
+        try:
+            ds = open_grib_group(index,
+                                 path,
+                                 filter_by_keys)
+            ds = shift_longitude(ds)
+            if load == True:
+                ds = ds.load()
+                ds.close()
+            else:
+                pass
+        except Exception as e:
+            ds = None
+        datasets.append(ds)
+
+    return datasets
+
+
+def open_ensemble_groups(paths,
+                         groups,
+                         max_workers=1,
+                         files=None):
+
+    """
+    This function opens every group of GRIB2 messages for a list of ensemble members and concatenates
+    the members of each group along the member (number) dimension.
+
+    By default (max_workers=1) the members are opened one after the other in the calling process and the data stays lazy
+    (it is not decoded until it is used), so the memory of the ensemble is only used when the data is loaded.
+
+    With more than one worker, each member directory is opened and decoded by its own worker process. Worker processes are started
+    with forkserver (or spawn where forkserver is not available) rather than fork, so they never inherit the threads or open files
+    of the calling process. These start methods re-import the __main__ module of the program, so programs that use more than one
+    worker must guard their entry point with if __name__ == '__main__':
+    The decoded members are sent back to the calling process, so every member of the ensemble is held in memory at once.
+
+    If the worker processes cannot be started, a warning is issued and the members are opened in the calling process.
+    An error raised inside a worker is raised to the caller.
+
+    Required Arguments:
+
+    1) paths (String List) - The paths to the directories of the ensemble members.
+
+    2) groups (List) - A list of cfgrib style filters (i.e. [{'typeOfLevel': 'surface'}, {'typeOfLevel': 'isobaricInhPa', 'shortName':'t'}])
+
+    Optional Arguments:
+
+    1) max_workers (Integer or None) - Default=1. The maximum number of worker processes.
+       When 1, the members are opened lazily in the calling process and no worker processes are started.
+       When None, one worker is used per member up to the number of CPUs on the machine.
+
+    2) files (List or None) - Default=None. A list of the complete file paths to open for each member in the same order as paths.
+       When None, every GRIB2 file in each member directory is opened.
+
+    Returns
+    -------
+
+    A dictionary keyed by the position of each group in groups with the xarray.array of that group.
+    Groups that could not be opened for any member are left out of the dictionary.
+    """
+
+    if max_workers == None:
+        max_workers = min(len(paths), os.cpu_count() or 1)
+    else:
+        pass
+
+    if files == None:
+        files = [None] * len(paths)
+    else:
+        pass
+
+    members = None
+    if max_workers > 1 and len(paths) > 1:
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('forkserver')
+        else:
+            context = multiprocessing.get_context('spawn')
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=context) as executor:
+                members = list(executor.map(open_member_groups, paths, [groups] * len(paths), files, [True] * len(paths)))
+        except BrokenProcessPool as e:
+            warnings.warn(f"The worker processes could not be started ({e}). Opening the ensemble members in this process.")
+            members = None
+    else:
+        pass
+
+    if members == None:
+        members = [open_member_groups(path, groups, files=f) for path, f in zip(paths, files)]
+    else:
+        pass
+
+    datasets = {}
+    for i in range(0, len(groups), 1):
+        ds_list = [member[i] for member in members if member[i] is not None]
+        if len(ds_list) == 0:
+            continue
+        try:
+            datasets[i] = xr.concat(ds_list,
+                                    dim='number')
+        except Exception as e:
+            pass
+
+    return datasets
@@ -5,29 +5,138 @@ This file hosts the functions that do the following:
 
 2) Clear IDX files
 
-3) Unzip files
+3) Unzip and stream-decompress files (gzip and bz2)
 
 (C) Eric J. Drewitz 2025
 """
 
 
 import os
+import io
 import gzip
+import bz2
+import shutil
+
+from wxdata.utils.manifest import manifest_order
+
+# The size of the blocks read and written when decompressing a file
+decompression_chunk_size = 1024 * 1024
+
+def open_decompressed(fileobj,
+                      compression='auto'):
+    
+    """
+    This function wraps a binary file object (i.e. an open file or the raw stream of an HTTP response) in a streaming decompressor.
+    
+    The data is decompressed block by block as it is read so the full decompressed payload is never held in memory.
+    
+    Required Arguments:
+    
+    1) fileobj (File Object) - A binary file object opened for reading. 
+    
+    Optional Arguments:
+    
+    1) compression (String or None) - Default='auto'. The compression of the data. 
+    
+        Compression Types
+        -----------------
+        
+        1) 'auto' - Detects gzip or bz2 from the first bytes of the data. Uncompressed data is passed through.
+        2) 'gzip'
+        3) 'bz2'
+        4) None - The data is not compressed.
+    
+    Returns
+    -------
+    
+    A binary file object of the decompressed data.    
+    """
+    
+    if hasattr(fileobj, 'peek') == False:
+        fileobj = io.BufferedReader(fileobj)
+    else:
+        pass
+    
+    if compression == 'auto':
+        magic = fileobj.peek(3)[:3]
+        if magic[:2] == b'\x1f\x8b':
+            compression = 'gzip'
+        elif magic == b'BZh':
+            compression = 'bz2'
+        else:
+            compression = None
+    else:
+        pass
+    
+    if compression == 'gzip':
+        return gzip.GzipFile(fileobj=fileobj, mode='rb')
+    elif compression == 'bz2':
+        return bz2.BZ2File(fileobj, mode='rb')
+    else:
+        return fileobj
+    
+    
+def decompress_to_file(fileobj,
+                       decompressed_file,
+                       compression='auto',
+                       chunk_size=decompression_chunk_size):
+    
+    """
+    This function streams a compressed binary file object to a decompressed file on disk. 
+    
+    The decompressed data is written to a temporary file and renamed when complete so an interrupted
+    decompression never leaves a partial file behind. 
+    
+    Required Arguments:
+    
+    1) fileobj (File Object) - A binary file object opened for reading (i.e. an open file or the raw stream of an HTTP response). 
+    
+    2) decompressed_file (String) - Path where the decompressed file will be saved. 
+    
+    Optional Arguments:
+    
+    1) compression (String or None) - Default='auto'. 'auto', 'gzip', 'bz2' or None. 
+    
+    2) chunk_size (Integer) - Default=1048576. The size of the blocks written to the file in bytes. 
+    
+    Returns
+    -------
+    
+    The decompressed file saved to {decompressed_file}
+    """
+    
+    try:
+        with open_decompressed(fileobj, compression=compression) as f_in:
+            with open(f"{decompressed_file}.part", 'wb') as f_out:
+                shutil.copyfileobj(f_in, f_out, chunk_size)
+    except Exception as e:
+        # A truncated or corrupt archive leaves neither the partial file nor the decompressed file behind
+        if os.path.exists(f"{decompressed_file}.part"):
+            os.remove(f"{decompressed_file}.part")
+        else:
+            pass
+        raise
+            
+    os.replace(f"{decompressed_file}.part", decompressed_file)
+    
 
 def extract_gzipped_file(compressed_file, 
                          decompressed_file):
     
     """
     Extracts a gzipped file to a specified location.
+    
+    The file is decompressed in blocks so the decompressed data is never held in memory all at once.
 
     Parameters:
     compressed_file (str): Path to the gzipped file.
     decompressed_file (str): Path where the decompressed file will be saved.
     """
 
-    with gzip.open(compressed_file, 'rb') as f_in:
-        with open(decompressed_file, 'wb') as f_out:
-            f_out.write(f_in.read())
+    with open(compressed_file, 'rb') as f_in:
+        decompress_to_file(f_in, 
+                           decompressed_file, 
+                           compression='gzip')
             
     if os.path.exists(compressed_file):
         os.remove(compressed_file)
@@ -199,6 +308,14 @@ def sorted_paths(folder_path, ascending=True):
         # Sort the files based on their modification time
         # os.path.getmtime() returns the modification time as a float (seconds since epoch)
         sorted_files = sorted(files, key=os.path.getmtime, reverse=not ascending)
+        
+        # Files recorded in the run manifest are sorted in forecast hour order
+        # since concurrent and resumed downloads do not finish in forecast hour order
+        order = manifest_order(folder_path)
+        if len(order) > 0:
+            sorted_files = sorted(sorted_files, key=lambda f: order.get(os.path.basename(f), len(order)), reverse=not ascending)
+        else:
+            pass
         return sorted_files
     except FileNotFoundError:
         print(f"Error: Folder '{folder_path}' not found.")
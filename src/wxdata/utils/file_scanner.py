@@ -2,6 +2,10 @@
 """
 This file hosts the functions that scan files to make sure existing files are up to date. 
 
+manifest_file_scanner() checks every file of a request against the run manifest of its data directory
+so only the missing, partially downloaded or changed files are downloaded again. 
+local_file_scanner() is the older check that compares the modification time of the last file to the local time. 
+
 (C) Eric J. Drewitz 2025
 """
 
@@ -9,6 +13,10 @@ import os
 import time
 
 from datetime import datetime, timedelta
+from wxdata.utils.manifest import(
+    files_to_download,
+    remove_stale_files
+)
     
 # Gets local time
 local = datetime.now()
@@ -97,6 +105,9 @@ def local_file_scanner(path,
     A boolean value whether the data needs updating.
     """
     
+    # Gets local time
+    local = datetime.now()
+    
     download = False
     
     if source == 'nomads':
@@ -157,4 +168,56 @@ def local_file_scanner(path,
         else:
             download = True        
         
-    return download
\ No newline at end of file
+    return download
+
+
+def manifest_file_scanner(paths,
+                          urls,
+                          filenames,
+                          variables=None,
+                          levels=None,
+                          verify=False):
+    
+    """
+    This function scans the files on the desktop against the run manifest of each data directory 
+    to find the files that need to be downloaded. 
+    
+    Files in the data directories that are not part of the request (i.e. a previous cycle) are removed. 
+    The files that are already up to date are kept so a re-run only downloads the missing or changed files. 
+    
+    Required Arguments:
+    
+    1) paths (String or String List) - The directory where the files are saved to.
+       If a list is passed in, each file is saved to the path at the same position in the list (i.e. ensemble members).
+    
+    2) urls (String List) - The download URLs to the files.
+    
+    3) filenames (String List) - The names of the files.
+    
+    Optional Arguments: 
+    
+    1) variables (List or None) - Default=None. The variables requested from each file when they are not in the URL
+       (i.e. the byte-range downloads of the ECMWF data). 
+    
+    2) levels (List or None) - Default=None. The levels requested from each file when they are not in the URL.
+    
+    3) verify (Boolean) - Default=False. When set to True, the checksum of every file is compared to the manifest. 
+       Otherwise only the files modified since they were recorded are checksummed. 
+    
+    Returns
+    -------
+    
+    A list of the positions of the files that need downloading. An empty list means the data is up to date. 
+    """
+    
+    remove_stale_files(paths,
+                       filenames)
+    
+    missing = files_to_download(paths,
+                                urls,
+                                filenames,
+                                variables=variables,
+                                levels=levels,
+                                verify=verify)
+    
+    return missing
@@ -0,0 +1,233 @@
+"""
+This file hosts the functions that build a GRIB2 message index in a single pass over each file
+and open groups of GRIB2 messages from that index.
+
+The post-processors pull dozens of groups (i.e. typeOfLevel='isobaricInhPa' or
+typeOfLevel='heightAboveGround' with paramId=167) out of the same set of files.
+Rather than having cfgrib re-scan every GRIB2 message in every file for each group,
+each file is scanned once and only the messages matching a group are handed to cfgrib.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import os
+import time
+import hashlib
+import eccodes
+
+import wxdata.utils.index_cache as index_cache
+
+from wxdata.utils.index_cache import(
+    file_hash,
+    load_cached_object,
+    save_cached_object,
+    evict_index_cache,
+    open_mfdataset
+)
+
+# The keys each GRIB2 message is indexed by
+index_keys = ['typeOfLevel',
+              'shortName',
+              'paramId',
+              'level',
+              'step']
+
+def index_grib_file(file):
+
+    """
+    This function scans a GRIB2 file one time and indexes every message in the file.
+
+    Only the message headers are read. The data sections are not decoded.
+
+    Required Arguments:
+
+    1) file (String) - The path to the GRIB2 file.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A dictionary keyed by (typeOfLevel, shortName, paramId, level, step) with a list of
+    (offset, length) byte ranges for each message matching that key.
+    """
+
+    index = {}
+
+    with open(file, 'rb') as f:
+        while True:
+            gid = eccodes.codes_grib_new_from_file(f, headers_only=True)
+            if gid is None:
+                break
+            try:
+                key = []
+                for k in index_keys:
+                    try:
+                        key.append(eccodes.codes_get(gid, k))
+                    except Exception as e:
+                        key.append(None)
+                offset = int(eccodes.codes_get(gid, 'offset'))
+                length = int(eccodes.codes_get(gid, 'totalLength'))
+            finally:
+                eccodes.codes_release(gid)
+
+            index.setdefault(tuple(key), []).append((offset, length))
+
+    return index
+
+
+def build_grib_index(files):
+
+    """
+    This function builds the GRIB2 message index for a list of files.
+
+    Each file is scanned one time. The index of each file is stored in the persistent index cache
+    so re-running the same post-processing does not re-scan the files. The cache is trimmed here, before any group is opened,
+    so the subsets opened by open_grib_group() afterwards are never evicted while their datasets are still lazy.
+
+    Required Arguments:
+
+    1) files (String List) - The list of paths to the GRIB2 files.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A dictionary with the file path as the key and the index of that file as the value.
+    The order of the files is preserved.
+    """
+
+    evict_index_cache()
+
+    indexes = {}
+    for file in files:
+        try:
+            index = load_cached_object(file, 'msgidx')
+            if index == None:
+                index = index_grib_file(file)
+                save_cached_object(file, 'msgidx', index)
+            else:
+                pass
+            indexes[file] = index
+        except Exception as e:
+            pass
+
+    return indexes
+
+
+def key_matches(key,
+                filter_by_keys):
+
+    """
+    This function checks if an index key matches the filter_by_keys of a group.
+
+    Only the indexed keys (typeOfLevel, shortName, paramId, level and step) are checked. Any other key
+    (i.e. stepType) is left to cfgrib, which applies the full filter_by_keys when the group is opened.
+
+    Required Arguments:
+
+    1) key (Tuple) - The (typeOfLevel, shortName, paramId, level, step) index key.
+
+    2) filter_by_keys (dict) - The cfgrib style filter (i.e. {'typeOfLevel': 'heightAboveGround','paramId':167})
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A boolean value whether the key matches the indexed keys of the filter.
+    """
+
+    for k, v in filter_by_keys.items():
+        if k in index_keys:
+            if key[index_keys.index(k)] != v:
+                return False
+            else:
+                pass
+        else:
+            pass
+
+    return True
+
+
+def open_grib_group(indexes,
+                    path,
+                    filter_by_keys,
+                    concat_dim='step'):
+
+    """
+    This function opens a group of GRIB2 messages from the GRIB2 message index.
+
+    The messages matching filter_by_keys are copied byte for byte out of each file
+    into a small subset file so cfgrib only scans the messages of that group.
+    Keys that are not indexed (i.e. stepType) are applied by cfgrib when the subset is opened.
+    Subset files are stored in the index cache and named by the content hash of the file
+    they were cut from and the hash of the group, so an unchanged file keeps its subset
+    (and its cached cfgrib index) between runs. Subsets are only ever removed by evict_index_cache().
+
+    Required Arguments:
+
+    1) indexes (dict) - The GRIB2 message index returned by build_grib_index(files).
+
+    2) path (String) - The path to the data files. Kept for compatibility, the subsets are stored in the index cache.
+
+    3) filter_by_keys (dict) - The cfgrib style filter (i.e. {'typeOfLevel': 'heightAboveGround','paramId':167})
+
+    Optional Arguments:
+
+    1) concat_dim (String) - Default='step'. The dimension the files are concatenated along.
+
+    Returns
+    -------
+
+    An xarray.array of the GRIB2 messages in the group.
+    """
+
+    group = hashlib.md5(repr(sorted(filter_by_keys.items())).encode()).hexdigest()[:12]
+    os.makedirs(index_cache.cache_path, exist_ok=True)
+
+    files = []
+    for file, index in indexes.items():
+        ranges = []
+        for key, messages in index.items():
+            if key_matches(key, filter_by_keys) == True:
+                ranges = ranges + messages
+            else:
+                pass
+
+        if len(ranges) == 0:
+            continue
+
+        subset = os.path.join(index_cache.cache_path, f"{file_hash(file)}.{group}.grib2")
+        if os.path.exists(subset) == False:
+            ranges.sort()
+            with open(file, 'rb') as f_in:
+                with open(f"{subset}.{os.getpid()}.tmp", 'wb') as f_out:
+                    for offset, length in ranges:
+                        f_in.seek(offset)
+                        f_out.write(f_in.read(length))
+            os.replace(f"{subset}.{os.getpid()}.tmp", subset)
+        else:
+            # Only the access time is updated so the content hash (and the cached cfgrib index) of the subset is unchanged
+            try:
+                os.utime(subset, ns=(time.time_ns(), os.stat(subset).st_mtime_ns))
+            except Exception as e:
+                pass
+
+        files.append(subset)
+
+    # The subsets hold the data of the returned (lazy) dataset so they are kept until this process exits
+    index_cache.open_entries.update(files)
+
+    ds = open_mfdataset(files,
+                        concat_dim=concat_dim,
+                        combine='nested',
+                        coords='minimal',
+                        engine='cfgrib',
+                        compat='override',
+                        evict=False,
+                        decode_timedelta=False,
+                        filter_by_keys=filter_by_keys)
+
+    return ds
@@ -0,0 +1,442 @@
+"""
+This file hosts the functions that manage the persistent GRIB2 index cache.
+
+cfgrib builds an index of every GRIB2 message in a file before it can open the file.
+Rather than clearing the .idx files and rebuilding the index on every call, the index of each
+file is stored in a cache directory outside of the data directory. The cache is content-addressed,
+keyed by a hash of the file and its modification time, so an index is only ever reused for the exact
+file it was built from.
+
+The cache is shared by all of the WxData post-processors and the least recently used index files
+are evicted once the cache exceeds its size limit.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import os
+import glob
+import pickle
+import hashlib
+import cfgrib
+import xarray as xr
+
+# The default location and size limit of the index cache
+# Users may override these with the WXDATA_INDEX_CACHE and WXDATA_INDEX_CACHE_SIZE environment variables
+cache_path = os.environ.get('WXDATA_INDEX_CACHE', os.path.join(os.path.expanduser('~'), '.wxdata', 'index_cache'))
+max_cache_size = int(os.environ.get('WXDATA_INDEX_CACHE_SIZE', 1024 * 1024 * 1024))
+
+# The number of bytes read from the start and end of a file to build the content hash
+sample_size = 65536
+
+# The cache entries that hold the data of a dataset opened lazily by this process (i.e. GRIB2 subset files)
+# These entries are never evicted by this process since the dataset reads them when it is loaded
+open_entries = set()
+
+def set_index_cache(path=None,
+                    max_size=None):
+
+    """
+    This function configures the location and size limit of the index cache.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) path (String or None) - Default=None. The directory where the index files are stored.
+       When None, the current directory is kept.
+
+    2) max_size (Integer or None) - Default=None. The size limit of the cache in bytes.
+       When None, the current size limit is kept.
+
+    Returns
+    -------
+
+    The index cache directory and size limit in bytes.
+    """
+
+    global cache_path
+    global max_cache_size
+
+    if path != None:
+        cache_path = path
+    else:
+        pass
+
+    if max_size != None:
+        max_cache_size = int(max_size)
+    else:
+        pass
+
+    return cache_path, max_cache_size
+
+
+def file_hash(file):
+
+    """
+    This function builds the content hash of a file.
+
+    The hash is built from the size, modification time and the first and last bytes of the file.
+    The path is not part of the hash so a file that is moved or copied keeps its cache entries.
+    This avoids reading multi-hundred megabyte GRIB2 files in full while still detecting a file that
+    has been replaced by a different download.
+
+    Required Arguments:
+
+    1) file (String) - The path to the file.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The hexadecimal hash of the file.
+    """
+
+    stat = os.stat(file)
+
+    h = hashlib.sha1()
+    h.update(f"{stat.st_size}|{stat.st_mtime_ns}".encode())
+
+    with open(file, 'rb') as f:
+        h.update(f.read(sample_size))
+        if stat.st_size > sample_size:
+            f.seek(max(stat.st_size - sample_size, sample_size))
+            h.update(f.read(sample_size))
+        else:
+            pass
+
+    return h.hexdigest()
+
+
+def cache_file(file,
+               extension):
+
+    """
+    This function returns the path to the cache entry of a file and marks the entry as recently used.
+
+    Required Arguments:
+
+    1) file (String) - The path to the data file.
+
+    2) extension (String) - The extension of the cache entry (i.e. 'idx')
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The path to the cache entry.
+    """
+
+    os.makedirs(cache_path, exist_ok=True)
+
+    entry = os.path.join(cache_path, f"{file_hash(file)}.{extension}")
+
+    if os.path.exists(entry):
+        try:
+            os.utime(entry)
+        except Exception as e:
+            pass
+    else:
+        pass
+
+    return entry
+
+
+def cached_indexpath(file):
+
+    """
+    This function returns the cfgrib indexpath for a file inside the index cache.
+
+    Required Arguments:
+
+    1) file (String) - The path to the GRIB2 file.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The path to the cfgrib .idx file in the cache.
+    """
+
+    return cache_file(file, 'idx')
+
+
+def load_cached_object(file,
+                       extension):
+
+    """
+    This function loads a cached object (i.e. a GRIB2 message index) for a file.
+
+    Required Arguments:
+
+    1) file (String) - The path to the data file.
+
+    2) extension (String) - The extension of the cache entry.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The cached object or None if the file has no cache entry.
+    """
+
+    entry = cache_file(file, extension)
+
+    try:
+        with open(entry, 'rb') as f:
+            return pickle.load(f)
+    except Exception as e:
+        return None
+
+
+def save_cached_object(file,
+                       extension,
+                       obj):
+
+    """
+    This function saves an object (i.e. a GRIB2 message index) to the cache for a file.
+
+    The entry is written to a temporary file and renamed so an interrupted run never leaves
+    a partial entry behind.
+
+    Required Arguments:
+
+    1) file (String) - The path to the data file.
+
+    2) extension (String) - The extension of the cache entry.
+
+    3) obj (Object) - The object to cache.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The object saved to the index cache.
+    """
+
+    entry = cache_file(file, extension)
+
+    try:
+        with open(f"{entry}.{os.getpid()}.tmp", 'wb') as f:
+            pickle.dump(obj, f)
+        os.replace(f"{entry}.{os.getpid()}.tmp", entry)
+    except Exception as e:
+        pass
+
+    return obj
+
+
+def evict_index_cache(max_size=None,
+                      exclude=None):
+
+    """
+    This function evicts the least recently used entries once the cache exceeds its size limit.
+
+    An entry is used when its access or modification time is updated (i.e. GRIB2 subset files only update their access time).
+    The entries in open_entries (the data of the datasets this process has opened lazily) are never evicted.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) max_size (Integer or None) - Default=None. The size limit in bytes. When None, the configured limit is used.
+
+    2) exclude (String List or None) - Default=None. The paths of the entries that are kept (i.e. the entries the current call is about to open).
+
+    Returns
+    -------
+
+    The total size of the cache in bytes after eviction.
+    """
+
+    if max_size == None:
+        max_size = max_cache_size
+    else:
+        pass
+
+    if exclude == None:
+        exclude = []
+    else:
+        pass
+
+    keep = set(os.path.abspath(entry) for entry in list(exclude) + list(open_entries))
+
+    try:
+        entries = []
+        for f in os.listdir(cache_path):
+            entry = os.path.join(cache_path, f)
+            if os.path.isfile(entry):
+                stat = os.stat(entry)
+                entries.append((max(stat.st_atime, stat.st_mtime), stat.st_size, entry))
+    except Exception as e:
+        return 0
+
+    total = sum(e[1] for e in entries)
+
+    for mtime, size, entry in sorted(entries):
+        if total <= max_size:
+            break
+        if os.path.abspath(entry) in keep:
+            continue
+        try:
+            os.remove(entry)
+            total = total - size
+        except Exception as e:
+            pass
+
+    return total
+
+
+def clear_index_cache():
+
+    """
+    This function clears every entry in the index cache.
+    """
+
+    try:
+        for f in os.listdir(cache_path):
+            os.remove(os.path.join(cache_path, f))
+    except Exception as e:
+        pass
+
+
+def open_dataset(file,
+                 **kwargs):
+
+    """
+    This function opens a GRIB2 file with cfgrib using the index cache.
+
+    Required Arguments:
+
+    1) file (String) - The path to the GRIB2 file.
+
+    Optional Arguments:
+
+    Any keyword argument accepted by xarray.open_dataset(engine='cfgrib')
+
+    Returns
+    -------
+
+    An xarray.array of the GRIB2 data.
+    """
+
+    backend_kwargs = dict(kwargs.pop('backend_kwargs', None) or {})
+    backend_kwargs.pop('indexpath', None)
+    kwargs['engine'] = 'cfgrib'
+
+    ds = xr.open_dataset(file,
+                         indexpath=cached_indexpath(file),
+                         backend_kwargs=backend_kwargs,
+                         **kwargs)
+
+    return ds
+
+
+def open_datasets(file,
+                  **kwargs):
+
+    """
+    This function opens every GRIB2 message in a file in a single pass with cfgrib using the index cache.
+
+    The messages are indexed one time and grouped into datasets that can be merged (i.e. one dataset for
+    typeOfLevel='surface' and one for each heightAboveGround level). This replaces opening the same file
+    over and over with a different filter_by_keys for each variable.
+
+    Required Arguments:
+
+    1) file (String) - The path to the GRIB2 file.
+
+    Optional Arguments:
+
+    Any keyword argument accepted by xarray.open_dataset(engine='cfgrib')
+
+    Returns
+    -------
+
+    A list of xarray.arrays of the GRIB2 data.
+    """
+
+    backend_kwargs = dict(kwargs.pop('backend_kwargs', None) or {})
+    backend_kwargs['indexpath'] = cached_indexpath(file)
+    kwargs.pop('engine', None)
+
+    datasets = cfgrib.open_datasets(file,
+                                    backend_kwargs=backend_kwargs,
+                                    **kwargs)
+
+    return datasets
+
+
+def open_mfdataset(paths,
+                   concat_dim='step',
+                   combine='nested',
+                   coords='minimal',
+                   compat='override',
+                   evict=True,
+                   **kwargs):
+
+    """
+    This function opens multiple GRIB2 files with cfgrib using the index cache.
+
+    This is a drop-in replacement for xarray.open_mfdataset(engine='cfgrib') where each
+    file is opened with its own cached index. The attributes of the first file are kept (combine_attrs='override')
+    in the same manner as xarray.open_mfdataset(). The cache is trimmed before the files are opened so the
+    entries of the returned (lazy) dataset are not evicted.
+
+    Required Arguments:
+
+    1) paths (String or String List) - The path(s) to the GRIB2 files or a glob pattern (i.e. f"{path}/*.grib2")
+
+    Optional Arguments:
+
+    1) concat_dim (String) - Default='step'. The dimension the files are concatenated along.
+
+    2) combine (String) - Default='nested'. 'nested' or 'by_coords'.
+
+    3) coords (String) - Default='minimal'.
+
+    4) compat (String) - Default='override'.
+
+    5) evict (Boolean) - Default=True. When set to True, the least recently used cache entries are evicted before the files are opened.
+
+    Any other keyword argument accepted by xarray.open_dataset(engine='cfgrib')
+
+    Returns
+    -------
+
+    An xarray.array of the GRIB2 data.
+    """
+
+    if type(paths) == type('String'):
+        paths = sorted(glob.glob(paths))
+    else:
+        pass
+
+    kwargs.setdefault('chunks', {})
+
+    if evict == True:
+        evict_index_cache(exclude=list(paths) + [cached_indexpath(path) for path in paths])
+    else:
+        pass
+
+    datasets = []
+    for path in paths:
+        datasets.append(open_dataset(path, **kwargs))
+
+    if combine == 'nested':
+        ds = xr.combine_nested(datasets,
+                               concat_dim=concat_dim,
+                               coords=coords,
+                               compat=compat,
+                               combine_attrs='override')
+    else:
+        ds = xr.combine_by_coords(datasets,
+                                  coords=coords,
+                                  compat=compat,
+                                  combine_attrs='override')
+
+    return ds
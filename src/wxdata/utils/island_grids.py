@@ -0,0 +1,199 @@
+"""
+This file hosts the functions that rebuild the 1-D island grids (NDFD Hawaii and the Hawaii, Puerto Rico and Guam RTMA) into 2-D grids.
+
+These GRIB2 files store each grid as a single row of points. Rather than rebuilding the grid one row at a time
+for each variable and each time step, every variable is reshaped for every time step at once:
+
+1) The points are reshaped into (rows, columns) with a single NumPy reshape.
+2) For grids stored in a serpentine (boustrophedon) order, every other row is flipped with a single fancy-index flip.
+3) The 1-D latitude and longitude coordinates of each grid are only built one time and then cached.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import numpy as np
+import xarray as xr
+
+# The number of rows and columns of each 1-D grid
+grid_shapes = {
+    'HI NDFD':[225, 321],
+    'HI RTMA':[225, 321],
+    'PR RTMA':[176, 251],
+    'GU RTMA':[193, 193]
+}
+
+# The 1-D latitude and longitude coordinates of each grid
+_coordinate_cache = {}
+
+def grid_shape(grid):
+
+    """
+    This function returns the number of rows and columns of a 1-D grid.
+
+    Required Arguments:
+
+    1) grid (String) - The grid (i.e. 'hi ndfd', 'hi rtma', 'pr rtma' or 'gu rtma').
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The number of rows and columns of the grid.
+    """
+
+    nrows, ncols = grid_shapes[grid.upper()]
+
+    return nrows, ncols
+
+
+def reshape_1d(values,
+               nrows,
+               ncols,
+               serpentine=False):
+
+    """
+    This function reshapes 1-D grid points into a 2-D grid for every time step at once.
+
+    Required Arguments:
+
+    1) values (numpy.array) - The grid points. The last axis is the points of the grid (i.e. (step, points)).
+
+    2) nrows (Integer) - The number of rows of the grid.
+
+    3) ncols (Integer) - The number of columns of the grid.
+
+    Optional Arguments:
+
+    1) serpentine (Boolean) - Default=False. When set to True, every other row (starting with the second row)
+       is stored in reverse order and is flipped back.
+
+    Returns
+    -------
+
+    A numpy.array with the points axis replaced by (rows, columns).
+    """
+
+    values = np.asarray(values)
+    values = values.reshape(values.shape[:-1] + (nrows, ncols))
+
+    if serpentine == True:
+        values = values.copy()
+        values[..., 1::2, :] = values[..., 1::2, ::-1]
+    else:
+        pass
+
+    return values
+
+
+def grid_coordinates(lat,
+                     lon,
+                     nrows,
+                     ncols):
+
+    """
+    This function returns the 1-D latitude and longitude coordinates of a 1-D grid.
+
+    The coordinates are cached for each grid so they are only built one time.
+
+    Required Arguments:
+
+    1) lat (numpy.array) - The latitude of each grid point.
+
+    2) lon (numpy.array) - The longitude of each grid point.
+
+    3) nrows (Integer) - The number of rows of the grid.
+
+    4) ncols (Integer) - The number of columns of the grid.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    1) The latitude of each row.
+
+    2) The longitude of each column.
+    """
+
+    lat = np.asarray(lat)
+    lon = np.asarray(lon)
+
+    key = (nrows, ncols, float(lat[0]), float(lat[-1]), float(lon[0]), float(lon[-1]))
+
+    if key not in _coordinate_cache:
+        lat1d = lat.reshape(nrows, ncols)[:, 0].copy()
+        lon1d = lon.reshape(nrows, ncols)[0, :].copy()
+        _coordinate_cache[key] = (lat1d, lon1d)
+    else:
+        pass
+
+    return _coordinate_cache[key]
+
+
+def unscramble_dataset(ds,
+                       nrows,
+                       ncols,
+                       serpentine=False,
+                       variables=None,
+                       keep_attrs=True):
+
+    """
+    This function rebuilds every variable of a dataset on a 1-D grid into a 2-D (latitude, longitude) grid.
+
+    Required Arguments:
+
+    1) ds (xarray.array) - The dataset with latitude and longitude on the same 1-D dimension as the variables.
+
+    2) nrows (Integer) - The number of rows of the grid.
+
+    3) ncols (Integer) - The number of columns of the grid.
+
+    Optional Arguments:
+
+    1) serpentine (Boolean) - Default=False. When set to True, every other row (starting with the second row)
+       is stored in reverse order and is flipped back (i.e. NDFD Hawaii).
+
+    2) variables (String List or None) - Default=None. The variables to rebuild. When None, every variable is rebuilt.
+
+    3) keep_attrs (Boolean) - Default=True. When set to False, the GRIB attributes (i.e. units) of the variables are dropped.
+
+    Returns
+    -------
+
+    An xarray.array dataset on a 2-D (latitude, longitude) grid.
+    """
+
+    points = ds['latitude'].dims[0]
+
+    lat1d, lon1d = grid_coordinates(ds['latitude'].values,
+                                    ds['longitude'].values,
+                                    nrows,
+                                    ncols)
+
+    coords = {name:coord for name, coord in ds.coords.items() if points not in coord.dims}
+    coords['latitude'] = lat1d
+    coords['longitude'] = lon1d
+
+    if variables == None:
+        variables = list(ds.data_vars)
+    else:
+        pass
+
+    data_vars = {}
+    for name in variables:
+        var = ds[name]
+        if points not in var.dims:
+            continue
+        var = var.transpose(*[dim for dim in var.dims if dim != points], points)
+        dims = var.dims[:-1] + ('latitude', 'longitude')
+        data_vars[name] = xr.Variable(dims,
+                                      reshape_1d(var.values,
+                                                 nrows,
+                                                 ncols,
+                                                 serpentine=serpentine),
+                                      attrs=var.attrs if keep_attrs == True else None)
+
+    return xr.Dataset(data_vars,
+                      coords=coords,
+                      attrs=ds.attrs)
@@ -0,0 +1,82 @@
+"""
+This file hosts the function that lazily imports the functions and modules of a WxData package.
+
+Importing WxData used to import every model module right away and through them metpy, cartopy, xarray, dask and cfgrib.
+A script that only needed a single client (i.e. get_xmacis_data()) paid for all of it.
+
+Each package now lists its public names along with the module they come from. A module is only imported
+the first time one of its names is used, so the heavy scientific libraries are only imported when a function that needs them is called.
+The subpackages and submodules of a package (i.e. wxdata.gfs) are imported the first time they are used as an attribute as well.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import sys
+import pkgutil
+import importlib
+import importlib.util
+
+def lazy_loader(package,
+                attributes,
+                modules=None):
+
+    """
+    This function builds the module level __getattr__() and __dir__() functions (PEP 562) that lazily import the public names of a package.
+    A name that is not in attributes or modules is imported as a subpackage or submodule of the package (i.e. wxdata.gfs) when one exists.
+
+    Usage (in the __init__.py of a package):
+
+    __getattr__, __dir__, __all__ = lazy_loader(__name__,
+                                                {'wxdata.gfs.gfs':['gfs_0p25', 'gfs_0p50']},
+                                                modules={'gfs_post_processing':'wxdata.post_processors.gfs_post_processing'})
+
+    Required Arguments:
+
+    1) package (String) - The name of the package (i.e. __name__).
+
+    2) attributes (dict) - A dictionary keyed by the module with the list of the names imported from that module.
+
+    Optional Arguments:
+
+    1) modules (dict or None) - Default=None. A dictionary keyed by the name with the module imported under that name.
+
+    Returns
+    -------
+
+    1) The __getattr__() function of the package.
+
+    2) The __dir__() function of the package.
+
+    3) The __all__ list of the public names of the package.
+    """
+
+    if modules == None:
+        modules = {}
+    else:
+        pass
+
+    names = {}
+    for module, attribute_list in attributes.items():
+        for attribute in attribute_list:
+            names[attribute] = module
+
+    def __getattr__(name):
+        if name in names:
+            value = getattr(importlib.import_module(names[name]), name)
+        elif name in modules:
+            value = importlib.import_module(modules[name])
+        elif name.startswith('__') == False and importlib.util.find_spec(f"{package}.{name}") != None:
+            value = importlib.import_module(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+
+        # The name is saved to the package so the module is only looked up the first time
+        setattr(sys.modules[package], name, value)
+
+        return value
+
+    def __dir__():
+        submodules = [module.name for module in pkgutil.iter_modules(getattr(sys.modules[package], '__path__', []))]
+        return sorted(set(vars(sys.modules[package])) | set(names) | set(modules) | set(submodules))
+
+    return __getattr__, __dir__, list(names) + list(modules)
@@ -0,0 +1,682 @@
+"""
+This file hosts the functions that manage the run manifest of each data directory.
+
+The manifest records every file that was downloaded into a data directory along with the request it came from:
+
+1) The URL of the file.
+2) The model cycle (i.e. /gfs.20250101/00/atmos).
+3) The forecast hour.
+4) The variables, levels and bounding box (from the NOMADS GRIB filter query or passed in by the client).
+5) The size of the file in bytes and a SHA-256 checksum.
+
+Rather than guessing from the modification time of the last file whether the data is up to date, each file
+is checked against the manifest. Only the files that are missing, partially downloaded or were requested
+with different parameters (a new cycle, variables or bounding box) are downloaded again.
+
+A file that was downloaded for a larger bounding box (i.e. the whole globe) of the same cycle, variables and levels
+is reused for any smaller bounding box inside of it. The data is then subset to the smaller bounding box in post-processing.
+
+The manifests are kept outside of the data directory so they are never mistaken for model data.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import os
+import re
+import json
+import hashlib
+import urllib.parse
+
+# The default location of the manifests
+# Users may override this with the WXDATA_MANIFESTS environment variable
+manifest_directory = os.environ.get('WXDATA_MANIFESTS', os.path.join(os.path.expanduser('~'), '.wxdata', 'manifests'))
+
+# The query parameters of the bounding box in a NOMADS GRIB filter request
+bbox_keys = ['subregion', 'leftlon', 'rightlon', 'toplat', 'bottomlat']
+
+def manifest_path(path):
+
+    """
+    This function returns the path to the manifest of a data directory.
+
+    Required Arguments:
+
+    1) path (String) - The path to the data directory.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The path to the manifest file.
+    """
+
+    name = hashlib.md5(os.path.abspath(path).encode()).hexdigest()
+
+    return os.path.join(manifest_directory, f"{name}.json")
+
+
+def read_manifest(path):
+
+    """
+    This function reads the manifest of a data directory.
+
+    Required Arguments:
+
+    1) path (String) - The path to the data directory.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A dictionary of the manifest. A missing or unreadable manifest returns an empty manifest.
+    """
+
+    try:
+        with open(manifest_path(path), 'r') as f:
+            manifest = json.load(f)
+    except Exception as e:
+        manifest = {}
+
+    if 'files' not in manifest:
+        manifest = {'path':os.path.abspath(path),
+                    'files':{}}
+    else:
+        pass
+
+    return manifest
+
+
+def write_manifest(path,
+                   manifest):
+
+    """
+    This function saves the manifest of a data directory.
+
+    The manifest is written to a temporary file and then renamed so an interrupted write never leaves a corrupt manifest.
+    Each process writes its own temporary file so processes sharing a data directory never rename each other's partial writes.
+
+    Required Arguments:
+
+    1) path (String) - The path to the data directory.
+
+    2) manifest (dict) - The manifest.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The manifest saved to the manifest directory.
+    """
+
+    file = manifest_path(path)
+    os.makedirs(os.path.dirname(file), exist_ok=True)
+
+    with open(f"{file}.{os.getpid()}.tmp", 'w') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(f"{file}.{os.getpid()}.tmp", file)
+
+    return manifest
+
+
+def file_checksum(file,
+                  chunk_size=1024 * 1024):
+
+    """
+    This function returns the SHA-256 checksum of a file.
+
+    Required Arguments:
+
+    1) file (String) - The complete path to the file.
+
+    Optional Arguments:
+
+    1) chunk_size (Integer) - Default=1048576. The number of bytes read at a time.
+
+    Returns
+    -------
+
+    The hexadecimal SHA-256 checksum of the file.
+    """
+
+    checksum = hashlib.sha256()
+    with open(file, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            checksum.update(chunk)
+
+    return checksum.hexdigest()
+
+
+def url_bbox(url):
+
+    """
+    This function returns the bounding box of a NOMADS GRIB filter request.
+
+    Required Arguments:
+
+    1) url (String) - The download URL to the file.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A list of the bounding box [leftlon, rightlon, toplat, bottomlat] or None when the URL is not for a subregion.
+    """
+
+    # The subregion parameter is sent without a value so blank values are kept
+    query = urllib.parse.parse_qs(urllib.parse.urlparse(url).query, keep_blank_values=True)
+
+    if 'subregion' in query:
+        return [query.get(key, [None])[0] for key in ['leftlon', 'rightlon', 'toplat', 'bottomlat']]
+    else:
+        return None
+
+
+def request_parameters(url,
+                       filename,
+                       variables=None,
+                       levels=None):
+
+    """
+    This function returns the request parameters of a file that are recorded in the manifest.
+
+    For the NOMADS GRIB filter, the cycle, variables, levels and bounding box are parsed from the query of the URL.
+    For the other dataservers, the cycle is the directory of the file on the server.
+
+    Required Arguments:
+
+    1) url (String) - The download URL to the file.
+
+    2) filename (String) - The name of the file.
+
+    Optional Arguments:
+
+    1) variables (List or None) - Default=None. The variables requested from the file (i.e. the variables of a byte-range download).
+       When None, the variables are parsed from the URL.
+
+    2) levels (List or None) - Default=None. The levels requested from the file (i.e. the levels of a byte-range download).
+       When None, the levels are parsed from the URL.
+
+    Returns
+    -------
+
+    A dictionary of the request parameters.
+    """
+
+    parsed = urllib.parse.urlparse(url)
+    query = urllib.parse.parse_qs(parsed.query)
+
+    if 'dir' in query:
+        cycle = query['dir'][0]
+    else:
+        cycle = os.path.dirname(parsed.path)
+
+    if variables == None:
+        variables = sorted([key[4:] for key in query.keys() if key.startswith('var_')])
+    else:
+        variables = sorted([str(v) for v in variables])
+
+    if levels == None:
+        levels = sorted([key[4:] for key in query.keys() if key.startswith('lev_')])
+    else:
+        levels = sorted([str(l) for l in levels])
+
+    match = re.search(r'\.f(\d{2,3})', filename)
+    if match == None:
+        match = re.search(r'-(\d+)h-', filename)
+    else:
+        pass
+
+    if match != None:
+        forecast_hour = int(match.group(1))
+    else:
+        forecast_hour = None
+
+    return {
+        'url':url,
+        'cycle':cycle,
+        'forecast_hour':forecast_hour,
+        'variables':variables,
+        'levels':levels,
+        'bbox':url_bbox(url)
+    }
+
+
+def lon_intervals(left,
+                  right):
+
+    """
+    This function returns the longitude intervals (0 to 360) covered by the leftlon and rightlon of a NOMADS GRIB filter request.
+
+    Required Arguments:
+
+    1) left (Float) - The leftlon of the request.
+
+    2) right (Float) - The rightlon of the request.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A list of (start, end) longitude intervals. A region crossing 0 degrees is split into two intervals.
+    """
+
+    if left <= right:
+        return [(left, right)]
+    else:
+        return [(left, 360), (0, right)]
+
+
+def bbox_covers(cached,
+                requested):
+
+    """
+    This function checks whether the bounding box of a cached file covers the bounding box of a request.
+
+    Required Arguments:
+
+    1) cached (List or None) - The bounding box of the cached file [leftlon, rightlon, toplat, bottomlat].
+       None is the whole globe.
+
+    2) requested (List or None) - The bounding box of the request [leftlon, rightlon, toplat, bottomlat].
+       None is the whole globe.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A boolean value whether the requested bounding box is inside of the cached bounding box.
+    """
+
+    if cached == None:
+        return True
+    elif requested == None:
+        return False
+    else:
+        pass
+
+    try:
+        c_left, c_right, c_top, c_bottom = [float(value) for value in cached]
+        r_left, r_right, r_top, r_bottom = [float(value) for value in requested]
+    except Exception as e:
+        return False
+
+    if r_top > c_top or r_bottom < c_bottom:
+        return False
+    else:
+        pass
+
+    for r_start, r_end in lon_intervals(r_left, r_right):
+        if any(c_start <= r_start and r_end <= c_end for c_start, c_end in lon_intervals(c_left, c_right)) == False:
+            return False
+        else:
+            pass
+
+    return True
+
+
+def request_key(url):
+
+    """
+    This function returns the request of a URL without its bounding box.
+
+    Required Arguments:
+
+    1) url (String) - The download URL to the file.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A tuple of the host, path and query parameters of the URL other than the bounding box.
+    """
+
+    parsed = urllib.parse.urlparse(url)
+    query = [(key, value) for key, value in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True) if key not in bbox_keys]
+
+    return (parsed.netloc, parsed.path, tuple(sorted(query)))
+
+
+def covered_by_cache(entry,
+                     parameters):
+
+    """
+    This function checks whether a file in the manifest was downloaded for the same request with a larger bounding box.
+
+    Required Arguments:
+
+    1) entry (dict) - The manifest entry of the file.
+
+    2) parameters (dict) - The request parameters of the file.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A boolean value whether the cached file can be subset to the request.
+    """
+
+    if any(entry.get(key) != value for key, value in parameters.items() if key not in ['url', 'bbox']):
+        return False
+    elif request_key(entry.get('url', '')) != request_key(parameters['url']):
+        return False
+    else:
+        return bbox_covers(url_bbox(entry.get('url', '')), parameters['bbox'])
+
+
+def files_to_download(paths,
+                      urls,
+                      filenames,
+                      variables=None,
+                      levels=None,
+                      verify=False):
+
+    """
+    This function compares the files of a request to the manifest of each data directory and returns the files that need downloading.
+
+    A file needs downloading when:
+
+    1) The file is not in the manifest.
+    2) The file was requested with different parameters (URL, cycle, variables, levels or a bounding box that is not inside of the cached bounding box).
+    3) The file is missing or its size does not match the manifest (i.e. an interrupted download).
+    4) The file was modified since it was recorded and its checksum no longer matches the manifest.
+
+    Files that were recorded as empty (i.e. a variable without a 0th forecast hour) are not downloaded again.
+
+    Required Arguments:
+
+    1) paths (String or String List) - The directory where the files are saved to.
+       If a list is passed in, each file is saved to the path at the same position in the list (i.e. ensemble members).
+
+    2) urls (String List) - The download URLs to the files.
+
+    3) filenames (String List) - The names of the files.
+
+    Optional Arguments:
+
+    1) variables (List or None) - Default=None. The variables requested from each file when they are not in the URL.
+
+    2) levels (List or None) - Default=None. The levels requested from each file when they are not in the URL.
+
+    3) verify (Boolean) - Default=False. When set to True, the checksum of every file is compared to the manifest.
+
+    Returns
+    -------
+
+    A list of the positions of the files that need downloading.
+    """
+
+    if type(paths) == type('String'):
+        paths = [paths] * len(filenames)
+    else:
+        pass
+
+    manifests = {}
+    missing = []
+    for i, (path, url, filename) in enumerate(zip(paths, urls, filenames)):
+        if path not in manifests:
+            manifests[path] = read_manifest(path)
+        else:
+            pass
+
+        entry = manifests[path]['files'].get(filename)
+        if entry == None:
+            missing.append(i)
+            continue
+
+        parameters = request_parameters(url,
+                                        filename,
+                                        variables=variables,
+                                        levels=levels)
+        if any(entry.get(key) != value for key, value in parameters.items()) and covered_by_cache(entry, parameters) == False:
+            missing.append(i)
+            continue
+
+        file = f"{path}/{filename}"
+        if os.path.exists(file) == False:
+            if entry['size'] == 0:
+                pass
+            else:
+                missing.append(i)
+            continue
+
+        if os.path.getsize(file) != entry['size']:
+            missing.append(i)
+        elif verify == True or os.path.getmtime(file) != entry['mtime']:
+            if file_checksum(file) != entry['sha256']:
+                missing.append(i)
+            else:
+                pass
+        else:
+            pass
+
+    return missing
+
+
+def record_files(paths,
+                 urls,
+                 filenames,
+                 variables=None,
+                 levels=None):
+
+    """
+    This function records downloaded files in the manifest of each data directory.
+
+    Files that do not exist are not recorded so they are downloaded again on the next run.
+
+    Required Arguments:
+
+    1) paths (String or String List) - The directory where the files are saved to.
+       If a list is passed in, each file is saved to the path at the same position in the list (i.e. ensemble members).
+
+    2) urls (String List) - The download URLs to the files.
+
+    3) filenames (String List) - The names of the files.
+
+    Optional Arguments:
+
+    1) variables (List or None) - Default=None. The variables requested from each file when they are not in the URL.
+
+    2) levels (List or None) - Default=None. The levels requested from each file when they are not in the URL.
+
+    Returns
+    -------
+
+    The files recorded in the manifest of each data directory.
+    """
+
+    if type(paths) == type('String'):
+        paths = [paths] * len(filenames)
+    else:
+        pass
+
+    manifests = {}
+    for path, url, filename in zip(paths, urls, filenames):
+        if path not in manifests:
+            manifests[path] = read_manifest(path)
+        else:
+            pass
+
+        file = f"{path}/{filename}"
+        if os.path.exists(file) == False:
+            manifests[path]['files'].pop(filename, None)
+            continue
+
+        entry = request_parameters(url,
+                                   filename,
+                                   variables=variables,
+                                   levels=levels)
+        entry['size'] = os.path.getsize(file)
+        entry['mtime'] = os.path.getmtime(file)
+        entry['sha256'] = file_checksum(file)
+        manifests[path]['files'][filename] = entry
+
+    for path, manifest in manifests.items():
+        write_manifest(path, manifest)
+
+
+def reuse_cached_bbox(paths,
+                      urls,
+                      filenames,
+                      missing):
+
+    """
+    This function checks whether a request reuses files that were downloaded for a larger bounding box.
+
+    When it does, the files that still need downloading are requested with the same larger bounding box
+    so every file in the data directory has the same grid. The data is then subset to the requested bounding box
+    in post-processing.
+
+    Required Arguments:
+
+    1) paths (String or String List) - The directory where the files are saved to.
+       If a list is passed in, each file is saved to the path at the same position in the list (i.e. ensemble members).
+
+    2) urls (String List) - The download URLs to the files.
+
+    3) filenames (String List) - The names of the files.
+
+    4) missing (Integer List) - The positions of the files that need downloading (returned by files_to_download()).
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    1) The download URLs to the files.
+
+    2) The requested bounding box [leftlon, rightlon, toplat, bottomlat] to subset the data to or None when no cached file is reused.
+    """
+
+    if type(paths) == type('String'):
+        paths = [paths] * len(filenames)
+    else:
+        pass
+
+    manifests = {}
+    cached = None
+    requested = None
+    for i, (path, url, filename) in enumerate(zip(paths, urls, filenames)):
+        if i in missing:
+            continue
+        if path not in manifests:
+            manifests[path] = read_manifest(path)
+        else:
+            pass
+
+        entry = manifests[path]['files'].get(filename)
+        if entry == None:
+            continue
+        if url_bbox(entry.get('url', '')) != url_bbox(url):
+            cached = url_bbox(entry.get('url', ''))
+            requested = url_bbox(url)
+            break
+        else:
+            pass
+
+    if requested == None:
+        return urls, None
+    else:
+        pass
+
+    urls = list(urls)
+    for i in missing:
+        if cached == None:
+            urls[i] = re.sub(r'&(subregion|leftlon|rightlon|toplat|bottomlat)=[^&]*', '', urls[i])
+        else:
+            for key, value in zip(['leftlon', 'rightlon', 'toplat', 'bottomlat'], cached):
+                urls[i] = re.sub(f"{key}=[^&]*", f"{key}={value}", urls[i])
+
+    return urls, requested
+
+
+def remove_stale_files(paths,
+                       filenames):
+
+    """
+    This function removes the files in each data directory that are not part of the current request
+    (i.e. a previous cycle or forecast hours beyond the final forecast hour) along with their manifest entries.
+
+    Required Arguments:
+
+    1) paths (String or String List) - The directory where the files are saved to.
+       If a list is passed in, each file is saved to the path at the same position in the list (i.e. ensemble members).
+
+    2) filenames (String List) - The names of the files of the current request.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The stale files are removed from each data directory.
+    """
+
+    if type(paths) == type('String'):
+        paths = [paths] * len(filenames)
+    else:
+        pass
+
+    requested = {}
+    for path, filename in zip(paths, filenames):
+        if path not in requested:
+            requested[path] = set()
+        else:
+            pass
+        requested[path].add(filename)
+
+    for path, names in requested.items():
+        try:
+            for file in os.listdir(f"{path}"):
+                if file not in names and os.path.isfile(f"{path}/{file}"):
+                    os.remove(f"{path}/{file}")
+                else:
+                    pass
+        except Exception as e:
+            pass
+
+        manifest = read_manifest(path)
+        stale = [filename for filename in manifest['files'] if filename not in names]
+        if len(stale) > 0:
+            for filename in stale:
+                manifest['files'].pop(filename)
+            write_manifest(path, manifest)
+        else:
+            pass
+
+
+def manifest_order(path):
+
+    """
+    This function returns the files of a data directory in the order they were requested.
+
+    Required Arguments:
+
+    1) path (String) - The path to the data directory.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A dictionary of the position of each recorded filename in forecast hour order.
+    """
+
+    manifest = read_manifest(path)
+
+    def key(item):
+        hour = item[1].get('forecast_hour')
+        if hour == None:
+            hour = -1
+        else:
+            pass
+        return (hour, item[0])
+
+    return {filename:i for i, (filename, entry) in enumerate(sorted(manifest['files'].items(), key=key))}
@@ -4,6 +4,10 @@ This file hosts the functions that parse the plain language into NCEP/NOMADS GRI
 (C) Eric J. Drewitz 2025
 """
 
+import re
+
+from urllib.parse import quote
+
 def var_keys(varKey):
     
     """
@@ -184,4 +188,82 @@ def result_string(keys):
     for key in keys:
         result += "&var_" + str(key) + "=on"
         
-    return result
\ No newline at end of file
+    return result
+
+def level_key(level):
+    
+    """
+    This function converts a plain language level into a GRIB Filter level key. 
+    
+    The GRIB Filter level keys are the lowercase level names of the GRIB2 inventory with the spaces replaced by underscores 
+    (i.e. '500 mb' ---> 'lev_500_mb', '2 m above ground' ---> 'lev_2_m_above_ground' and 
+    'entire atmosphere (considered as a single layer)' ---> 'lev_entire_atmosphere_(considered_as_a_single_layer)'). 
+    
+    Required Arguments: 
+    
+    1) level (String) - The level in plain language format (i.e. '500 mb', '500mb', '500 hPa', '2 m above ground' or 'surface'). 
+    
+    Optional Arguments: None
+    
+    Returns
+    -------
+    
+    The GRIB Filter level key (not URL-quoted).     
+    """
+    
+    aliases = {
+        'mslp':'mean sea level',
+        'sea level':'mean sea level',
+        'entire atmosphere':'entire atmosphere (considered as a single layer)',
+        '2 m':'2 m above ground',
+        '10 m':'10 m above ground',
+        '100 m':'100 m above ground'
+    }
+    
+    # The NOMADS level names are lowercase (i.e. 'Surface' ---> 'surface')
+    level = " ".join(level.strip().lower().split())
+    level = aliases.get(level, level)
+    
+    # Pressure levels may be passed in as mb, hPa or millibars
+    match = re.match(r'^(\d+(?:\.\d+)?)\s*(mb|hpa|millibars)$', level)
+    if match != None:
+        level = f"{match.group(1)} mb"
+    else:
+        pass
+        
+    return "lev_" + level.replace(" ", "_")
+
+
+def level_string(levels):
+    
+    """
+    This function returns the level section of the data request URL for the NOMADS GFS/GEFS data. 
+    
+    Required Arguments:
+    
+    1) levels (List or None) - The list of levels in plain language (i.e. ['500 mb', '2 m above ground', 'surface']). 
+       When None, every level is requested. 
+    
+    Optional Arguments: None
+    
+    Returns
+    -------
+    
+    The level list in the form of a string for the URL using GRIB Filter Keys. 
+    The keys are URL-quoted (i.e. the parentheses of 'lev_entire_atmosphere_(considered_as_a_single_layer)'). 
+    """
+    
+    if levels == None:
+        return "all_lev=on"
+    else:
+        pass
+    
+    if type(levels) == type('String'):
+        levels = [levels]
+    else:
+        pass
+    
+    # Levels passed in more than one way (i.e. '500 mb' and '500 hPa') are only requested one time
+    keys = list(dict.fromkeys([level_key(level) for level in levels]))
+    
+    return "&".join([f"{quote(key)}=on" for key in keys])
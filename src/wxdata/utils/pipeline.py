@@ -0,0 +1,219 @@
+"""
+This file hosts the function that overlaps the download and the post-processing of the forecast hours of a model run.
+
+Normally every forecast hour is downloaded and only then is the whole directory post-processed. In the pipelined mode,
+each forecast hour is handed to the post-processor as soon as its file(s) are saved while the later forecast hours
+are still downloading on a pool of worker threads. The total time of a model run is then closer to the longer of the
+download and the post-processing rather than the sum of the two.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import os
+import warnings
+
+from wxdata.client.client import iter_gridded_data_batch
+from wxdata.utils.manifest import record_files
+
+def forecast_hour_groups(files,
+                         members=1):
+
+    """
+    This function groups the files of a model run by forecast hour.
+
+    Ensemble members are downloaded member by member (every forecast hour of member 1, then every forecast hour of member 2 etc.)
+    so the files of a forecast hour are spread evenly through the list of files.
+
+    Required Arguments:
+
+    1) files (String List) - The complete file paths in download order.
+
+    Optional Arguments:
+
+    1) members (Integer) - Default=1. The number of ensemble members in files.
+
+    Returns
+    -------
+
+    A list of the positions of the files of each forecast hour in forecast hour order.
+    """
+
+    increment = int(len(files) / max(1, members))
+
+    return [[i + (increment * m) for m in range(0, max(1, members), 1)] for i in range(0, increment, 1)]
+
+
+def download_and_process(urls,
+                         paths,
+                         filenames,
+                         process,
+                         download=True,
+                         members=1,
+                         proxies=None,
+                         chunk_size=8192,
+                         notifications='off',
+                         max_workers=8,
+                         index_format=None,
+                         variables=None,
+                         levels=None,
+                         missing=None,
+                         load=True):
+
+    """
+    This function downloads the files of a model run and post-processes each forecast hour as soon as its file(s) are saved.
+
+    The downloads run on a pool of worker threads while the forecast hours that have already been saved are post-processed
+    and decoded (loaded into memory) on the calling thread. Downloads begin when the first forecast hour is requested.
+
+    Required Arguments:
+
+    1) urls (String List) - The download URLs to the files.
+
+    2) paths (String or String List) - The directory where the files are saved to.
+       If a list is passed in, each file is saved to the path at the same position in the list (i.e. ensemble members).
+
+    3) filenames (String List) - The names of the files.
+
+    4) process (Function) - The function that post-processes a single forecast hour. It is passed the list of complete file paths
+       of the forecast hour (one per ensemble member) and returns an xarray.array.
+
+    Optional Arguments:
+
+    1) download (Boolean) - Default=True. When False, the files are already on the computer and are only post-processed.
+
+    2) members (Integer) - Default=1. The number of ensemble members in urls.
+
+    3) proxies (dict or None) - Default=None. If the user is using proxy server(s), the user must change the following:
+
+       proxies=None ---> proxies={
+                           'http':'http://url',
+                           'https':'https://url'
+                        }
+
+    4) chunk_size (Integer) - Default=8192. The size of the chunks when writing the GRIB/NETCDF data to a file.
+
+    5) notifications (String) - Default='off'. Notification when a file is downloaded and saved to {path}
+
+    6) max_workers (Integer) - Default=8. The maximum number of files downloaded at the same time.
+
+    7) index_format (String or None) - Default=None. The format of the index files published next to the GRIB2 files (i.e. 'ecmwf').
+
+    8) variables (List or None) - Default=None. The variables to download when index_format is set.
+
+    9) levels (List or None) - Default=None. The levels to download when index_format is set.
+
+    10) missing (Integer List or None) - Default=None. The positions of the files to download (i.e. from manifest_file_scanner()).
+        The other files are already up to date on the computer. When None, every file is downloaded.
+
+    11) load (Boolean) - Default=True. When set to True, each forecast hour is decoded (loaded into memory) as soon as it is post-processed.
+        When False, each forecast hour is returned as it comes out of the post-processor (i.e. lazy dask arrays).
+
+    Returns
+    -------
+
+    A generator of an xarray.array for each forecast hour in forecast hour order.
+    Forecast hours that are missing are skipped. Forecast hours that cannot be post-processed are skipped with a warning
+    that names the files.
+    The downloaded files of each forecast hour are recorded in the run manifest as soon as the forecast hour is saved.
+    """
+
+    if type(paths) == type('String'):
+        paths = [paths] * len(filenames)
+    else:
+        pass
+
+    files = [f"{path}/{filename}" for path, filename in zip(paths, filenames)]
+    groups = forecast_hour_groups(files,
+                                  members=members)
+
+    def decode(group):
+        group_files = [files[i] for i in group]
+        for file in group_files:
+            if os.path.exists(file) == False or os.path.getsize(file) == 0:
+                return None
+            else:
+                pass
+        try:
+            ds = process(group_files)
+            if load == True:
+                ds = ds.load()
+            else:
+                pass
+        except Exception as e:
+            warnings.warn(f"{', '.join(os.path.basename(file) for file in group_files)} could not be post-processed and will be skipped: {e}")
+            ds = None
+        return ds
+
+    if missing == None:
+        missing = list(range(0, len(files), 1))
+    else:
+        pass
+
+    if download == False or len(missing) == 0:
+        for group in groups:
+            ds = decode(group)
+            if ds is not None:
+                yield ds
+            else:
+                pass
+        return
+
+    # The number of files of each forecast hour that are still downloading
+    downloads = set(missing)
+    remaining = {}
+    for g, group in enumerate(groups):
+        remaining[g] = len([i for i in group if i in downloads])
+    group_of_file = {}
+    for g, group in enumerate(groups):
+        for i in group:
+            group_of_file[i] = g
+
+    # Forecast hours are decoded in the order they finish downloading
+    # and held until every earlier forecast hour has been yielded
+    decoded = {}
+    next_group = 0
+
+    # Forecast hours that are already up to date are decoded when their turn comes
+    up_to_date = set([g for g in range(0, len(groups), 1) if remaining[g] == 0])
+
+    def release():
+        nonlocal next_group
+        while next_group in decoded or next_group in up_to_date:
+            if next_group in decoded:
+                ds = decoded.pop(next_group)
+            else:
+                ds = decode(groups[next_group])
+            next_group = next_group + 1
+            if ds is not None:
+                yield ds
+            else:
+                pass
+
+    yield from release()
+
+    for j in iter_gridded_data_batch([urls[i] for i in missing],
+                                     [paths[i] for i in missing],
+                                     [filenames[i] for i in missing],
+                                     proxies=proxies,
+                                     chunk_size=chunk_size,
+                                     notifications=notifications,
+                                     clear_recycle_bin=False,
+                                     max_workers=max_workers,
+                                     index_format=index_format,
+                                     variables=variables,
+                                     levels=levels):
+        i = missing[j]
+        g = group_of_file[i]
+        remaining[g] = remaining[g] - 1
+        if remaining[g] == 0:
+            group_downloads = [k for k in groups[g] if k in downloads]
+            record_files([paths[k] for k in group_downloads],
+                         [urls[k] for k in group_downloads],
+                         [filenames[k] for k in group_downloads],
+                         variables=variables,
+                         levels=levels)
+            decoded[g] = decode(groups[g])
+        else:
+            pass
+
+        yield from release()
@@ -7,34 +7,44 @@ These functions are useful for users who wish to extract the following:
 
 2) Data points along a line connecting points A and B (Plotting Model Cross-Sections)
 
+3) Many points at once (Point Forecasts for thousands of stations)
+
 (C) Eric J. Drewitz 2025
 """
 
-import urllib.request
 import pandas as pd
+import numpy as np
 import xarray as xr
+import hashlib
 import os
 
+from collections import OrderedDict
+from scipy.spatial import cKDTree
 from metpy.interpolate import cross_section
+from wxdata.client import session
 
-def station_coords(station_id):
+# The spatial index of each grid keyed by the grid signature
+# Only the most recently used grids are kept so a long-running process does not hold every grid it has seen
+_tree_cache = OrderedDict()
+_tree_cache_size = 8
+
+# The radius of the Earth in kilometers
+earth_radius = 6371.0
+
+def airport_codes():
     
     """
-    This function will retrieve the latitude/longitude point for an ASOS Station ID.
+    This function returns the table of ASOS stations (airports) and their latitude/longitude points.
     
-    Required Arguments: 
-    
-    1) station_id (String) - The 4 letter ASOS station ID.
+    Required Arguments: None
     
     Optional Arguments: None
     
     Returns
     -------
     
-    The latitude (float) and longitude (float) of the ASOS station.    
+    A pandas.DataFrame of the ASOS stations.    
     """
-
-    station_id = station_id.upper()
     
     if os.path.exists(f"Airport Codes"):
         pass
@@ -44,11 +54,35 @@ def station_coords(station_id):
     if os.path.exists(f"Airport Codes/airport-codes.csv"):
         pass
     else:
-        urllib.request.urlretrieve(f"https://raw.githubusercontent.com/Unidata/MetPy/refs/heads/main/staticdata/airport-codes.csv", f"Airport Codes/airport-codes.csv")
+        session.download_file(f"https://raw.githubusercontent.com/Unidata/MetPy/refs/heads/main/staticdata/airport-codes.csv", f"Airport Codes/airport-codes.csv")
         
     df = pd.read_csv(f"Airport Codes/airport-codes.csv")
     
     df = df[(df['type'] == 'large_airport') | (df['type'] == 'medium_airport') | (df['type'] == 'small_airport')]
+    
+    return df
+
+
+def station_coords(station_id):
+    
+    """
+    This function will retrieve the latitude/longitude point for an ASOS Station ID.
+    
+    Required Arguments: 
+    
+    1) station_id (String) - The 4 letter ASOS station ID.
+    
+    Optional Arguments: None
+    
+    Returns
+    -------
+    
+    The latitude (float) and longitude (float) of the ASOS station.    
+    """
+
+    station_id = station_id.upper()
+    
+    df = airport_codes()
 
     df = df[df['ident'] == station_id]
 
@@ -209,4 +243,246 @@ def line_query(ds,
         height_cross = cross_section(sfc_pressure, starting_point, ending_point)
         ds_grid, pressure, index, lon, height = xr.broadcast(cross, cross[pressure_level_key], cross['index'], cross[ref], height_cross) 
         
-    return ds_grid, pressure, index, lon, height
\ No newline at end of file
+    return ds_grid, pressure, index, lon, height
+
+
+def unit_vectors(latitude,
+                 longitude):
+    
+    """
+    This function converts latitude/longitude points into 3-D unit vectors on the sphere.
+    
+    The distance between two unit vectors grows with the great circle distance between the points,
+    so the nearest grid point is found the same way across the poles and the dateline (0 to 360 or -180 to 180 degrees).
+    
+    Required Arguments:
+    
+    1) latitude (numpy.array) - The latitude of each point in decimal degrees.
+    
+    2) longitude (numpy.array) - The longitude of each point in decimal degrees.
+    
+    Optional Arguments: None
+    
+    Returns
+    -------
+    
+    A numpy.array of the unit vectors with a shape of (points, 3).    
+    """
+    
+    lat = np.radians(np.asarray(latitude, dtype=np.float64).ravel())
+    lon = np.radians(np.asarray(longitude, dtype=np.float64).ravel())
+    
+    cos_lat = np.cos(lat)
+    
+    return np.column_stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)])
+
+
+def grid_points(ds,
+                coord_names=['latitude',
+                             'longitude']):
+    
+    """
+    This function returns the latitude/longitude of every grid point and the spatial dimensions of a grid.
+    
+    Regular grids (1-D latitude and longitude), curvilinear grids (2-D latitude and longitude on y/x i.e. RTMA Lambert or NDFD)
+    and unstructured grids (latitude and longitude on a single points dimension) are supported.
+    
+    Required Arguments:
+    
+    1) ds (xarray.array) - The dataset.
+    
+    Optional Arguments:
+    
+    1) coord_names (String List) - Default=['latitude', 'longitude'] A list of the coordinate names (i.e. 'latitude'/'longitude', 'lat'/'lon')
+    
+    Returns
+    -------
+    
+    1) The latitude of every grid point (2-D numpy.array in the shape of the spatial dimensions).
+    
+    2) The longitude of every grid point (2-D numpy.array in the shape of the spatial dimensions).
+    
+    3) The spatial dimensions.    
+    """
+    
+    lat = ds[coord_names[0]]
+    lon = ds[coord_names[1]]
+    
+    if lat.ndim == 1 and lon.ndim == 1 and lat.dims != lon.dims:
+        dims = (lat.dims[0], lon.dims[0])
+        lon_2d, lat_2d = np.meshgrid(lon.values, lat.values)
+    else:
+        dims = lat.dims
+        lat_2d = lat.values
+        lon_2d = lon.transpose(*dims).values
+    
+    return lat_2d, lon_2d, dims
+
+
+def grid_tree(latitude,
+              longitude):
+    
+    """
+    This function returns the spatial index (KD-tree) of a grid.
+    
+    The spatial index is built one time for each grid and cached by the grid signature 
+    (a hash of the shape and the latitude/longitude of every grid point). The spatial indexes of the 8 most recently used grids are kept.
+    
+    Required Arguments:
+    
+    1) latitude (numpy.array) - The latitude of every grid point.
+    
+    2) longitude (numpy.array) - The longitude of every grid point.
+    
+    Optional Arguments: None
+    
+    Returns
+    -------
+    
+    A scipy.spatial.cKDTree of the 3-D unit vectors of the grid points.    
+    """
+    
+    latitude = np.ascontiguousarray(latitude, dtype=np.float64)
+    longitude = np.ascontiguousarray(longitude, dtype=np.float64)
+    
+    h = hashlib.sha1()
+    h.update(str(latitude.shape).encode())
+    h.update(latitude.tobytes())
+    h.update(longitude.tobytes())
+    signature = h.hexdigest()
+    
+    if signature not in _tree_cache:
+        _tree_cache[signature] = cKDTree(unit_vectors(latitude, longitude))
+        if len(_tree_cache) > _tree_cache_size:
+            _tree_cache.popitem(last=False)
+        else:
+            pass
+    else:
+        _tree_cache.move_to_end(signature)
+    
+    return _tree_cache[signature]
+
+
+def points_query(ds,
+                 latitudes=None,
+                 longitudes=None,
+                 station_ids=None,
+                 variables=None,
+                 coord_names=['latitude',
+                              'longitude'],
+                 max_distance=None,
+                 to_dataframe=False):
+    
+    """
+    This function queries for the nearest pixel to each of many points (i.e. thousands of stations) at once. 
+    
+    A spatial index (KD-tree) of the grid is built one time and cached, so each following query of the same grid
+    only looks up the points. Every variable is then gathered for every point in one vectorized selection.
+    Unlike pixel_query(), this works on curvilinear grids (i.e. RTMA Lambert or NDFD x/y) and on the 1-D island grids. 
+    
+    Applications include
+    ---------------------
+    
+    1) point forecasts for many stations
+    
+    2) forecast meteograms for many stations
+    
+    Required Arguments:
+    
+    1) ds (xarray.array) - The forecast model dataset. 
+    
+    Optional Arguments:
+    
+    1) latitudes (Float List or None) - Default=None. The latitude of each point in decimal degrees.
+    
+    2) longitudes (Float List or None) - Default=None. The longitude of each point in decimal degrees.
+    
+    3) station_ids (String List or None) - Default=None. The 4 letter station IDs of ASOS stations. 
+       When latitudes and longitudes are also passed in, the station IDs are used as the names of the points. 
+    
+    4) variables (String List or None) - Default=None. The variables to query. When None, every variable is queried.
+    
+    5) coord_names (String List) - Default=['latitude', 'longitude'] A list of the coordinate names (i.e. 'latitude'/'longitude', 'lat'/'lon')
+    
+    6) max_distance (Float or None) - Default=None. The greatest distance in kilometers between a point and its nearest pixel.
+       Points farther than max_distance from the grid (i.e. outside of the domain) are set to NaN. 
+       
+    7) to_dataframe (Boolean) - Default=False. When set to True, a pandas.DataFrame is returned with one row for each station and 
+       time step and one column for each variable. 
+    
+    Returns
+    -------
+    
+    An xarray.array with a station dimension of the pixel closest to each point (or a pandas.DataFrame when to_dataframe=True).
+    
+    The 'station_latitude', 'station_longitude' and 'distance' (kilometers between each point and its pixel) coordinates are added. 
+    
+    Raises a ValueError when neither latitudes and longitudes nor station_ids are passed in or when latitudes and longitudes are not the same length.
+    """
+    
+    if (latitudes is None or longitudes is None) and station_ids is None:
+        raise ValueError("points_query() needs either latitudes and longitudes or station_ids.")
+    else:
+        pass
+    
+    if latitudes is None or longitudes is None:
+        df = airport_codes()
+        df = df.drop_duplicates(subset='ident').set_index('ident')
+        station_ids = [station_id.upper() for station_id in station_ids]
+        df = df.loc[station_ids]
+        latitudes = df['latitude_deg'].values
+        longitudes = df['longitude_deg'].values
+    else:
+        pass
+    
+    latitudes = np.atleast_1d(np.asarray(latitudes, dtype=np.float64))
+    longitudes = np.atleast_1d(np.asarray(longitudes, dtype=np.float64))
+    
+    if len(latitudes) != len(longitudes):
+        raise ValueError(f"latitudes has {len(latitudes)} points and longitudes has {len(longitudes)} points. Both must be the same length.")
+    else:
+        pass
+    
+    if station_ids is None:
+        station_ids = np.arange(0, len(latitudes), 1)
+    else:
+        pass
+    
+    if variables != None:
+        ds = ds[variables]
+    else:
+        pass
+    
+    lat_2d, lon_2d, dims = grid_points(ds,
+                                       coord_names=coord_names)
+    
+    tree = grid_tree(lat_2d, 
+                     lon_2d)
+    
+    chord, index = tree.query(unit_vectors(latitudes, longitudes))
+    
+    # The distance between the unit vectors is converted into the great circle distance
+    distance = 2 * earth_radius * np.arcsin(np.clip(chord / 2, 0, 1))
+    
+    # Every variable is gathered for every point in one selection
+    indexes = np.unravel_index(index, lat_2d.shape)
+    ds = ds.isel({dim:xr.DataArray(i, dims='station') for dim, i in zip(dims, indexes)})
+    
+    ds = ds.assign_coords(station=('station', station_ids),
+                          station_latitude=('station', latitudes),
+                          station_longitude=('station', longitudes),
+                          distance=('station', distance))
+    
+    ds = ds.transpose('station', ...)
+    
+    if max_distance != None:
+        ds = ds.where(ds['distance'] <= max_distance)
+    else:
+        pass
+    
+    if to_dataframe == True:
+        ds = ds.to_dataframe()
+    else:
+        pass
+    
+    return ds
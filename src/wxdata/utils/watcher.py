@@ -0,0 +1,691 @@
+"""
+This file hosts the watcher that ingests the forecast hours of the GFS and GEFS as NOMADS publishes them.
+
+The GFS and GEFS forecast hours appear on NOMADS over roughly 90 minutes. The URL scanners only accept a model run
+once the final forecast hour exists, so the normal clients wait for the whole run. The watcher instead tracks the
+newest model run that has started (forecast hour 0 exists), downloads each new forecast hour as it appears,
+post-processes only the new forecast hours, appends them to the post-processed dataset of that run along the step dimension
+and emits an event for each forecast hour.
+
+Supported Models
+----------------
+
+'gfs0p25'
+'gfs0p50'
+'gefs0p25'
+'gefs0p50'
+
+(C) Eric J. Drewitz 2025
+"""
+
+import os
+import re
+import time
+import inspect
+import xarray as xr
+from wxdata.client import client
+
+from datetime import datetime
+from urllib.parse import urlparse, parse_qs
+from wxdata.client.scanner import probe_url
+from wxdata.client.retry import NoDataAvailableError
+from wxdata.utils.manifest import(
+    record_files,
+    remove_stale_files
+)
+from wxdata.calc.unit_conversion import convert_temperature_units
+from wxdata.post_processors.gfs_post_processing import primary_gfs_post_processing
+from wxdata.post_processors.gefs_post_processing import primary_gefs_post_processing
+from wxdata.gfs.gfs import(
+    gfs_0p25,
+    gfs_0p50
+)
+from wxdata.gefs.gefs import(
+    gefs_0p25,
+    gefs_0p50
+)
+from wxdata.gfs.url_scanners import(
+    gfs_0p25_url_scanner,
+    gfs_0p50_url_scanner
+)
+from wxdata.gefs.url_scanners import(
+    gefs_0p25_url_scanner,
+    gefs_0p50_url_scanner
+)
+import wxdata.gfs.paths as gfs_paths
+import wxdata.gefs.file_funcs as gefs_file_funcs
+
+# The models the watcher supports
+# client: The WxData client of the model (the default variables are read from the client)
+# scanner: The URL scanner of the model
+# server: The NOMADS directory the GRIB filter 'dir' parameter is relative to
+models = {
+
+    'gfs0p25':{
+        'client':gfs_0p25,
+        'scanner':gfs_0p25_url_scanner,
+        'server':'https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod',
+        'ensemble':False
+    },
+
+    'gfs0p50':{
+        'client':gfs_0p50,
+        'scanner':gfs_0p50_url_scanner,
+        'server':'https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod',
+        'ensemble':False
+    },
+
+    'gefs0p25':{
+        'client':gefs_0p25,
+        'scanner':gefs_0p25_url_scanner,
+        'server':'https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod',
+        'ensemble':True
+    },
+
+    'gefs0p50':{
+        'client':gefs_0p50,
+        'scanner':gefs_0p50_url_scanner,
+        'server':'https://nomads.ncep.noaa.gov/pub/data/nccf/com/gens/prod',
+        'ensemble':True
+    }
+}
+
+def scan_model(model,
+               final_forecast_hour,
+               western_bound,
+               eastern_bound,
+               northern_bound,
+               southern_bound,
+               proxies,
+               step,
+               variables,
+               cat='mean',
+               members=[1]):
+
+    """
+    This function runs the URL scanner of a model.
+
+    Required Arguments:
+
+    1) model (String) - The model (i.e. 'gfs0p25').
+
+    2) final_forecast_hour (Integer) - The final forecast hour that must exist for a run to be found.
+
+    3) western_bound (Float or Integer) - The western bound of the data needed.
+
+    4) eastern_bound (Float or Integer) - The eastern bound of the data needed.
+
+    5) northern_bound (Float or Integer) - The northern bound of the data needed.
+
+    6) southern_bound (Float or Integer) - The southern bound of the data needed.
+
+    7) proxies (dict or None) - The VPN/PROXY settings.
+
+    8) step (Integer) - The forecast hour increment.
+
+    9) variables (String List) - The variables to download.
+
+    Optional Arguments:
+
+    1) cat (String) - Default='mean'. The category of the ensemble data (GEFS only).
+
+    2) members (List) - Default=[1]. The ensemble members (GEFS only).
+
+    Returns
+    -------
+
+    The download URLs, filenames and model run. None is returned if no run was found.
+    Any other error of the URL scanner is raised.
+    """
+
+    scanner = models[model]['scanner']
+
+    # The URL scanners raise NoDataAvailableError when no run is found in the past 24 hours
+    # The watcher keeps polling instead
+    try:
+        if models[model]['ensemble'] == True:
+            return scanner(cat,
+                           final_forecast_hour,
+                           western_bound,
+                           eastern_bound,
+                           northern_bound,
+                           southern_bound,
+                           proxies,
+                           step,
+                           members,
+                           variables)
+        else:
+            return scanner(final_forecast_hour,
+                           western_bound,
+                           eastern_bound,
+                           northern_bound,
+                           southern_bound,
+                           proxies,
+                           step,
+                           variables)
+    except NoDataAvailableError as e:
+        return None
+
+
+def error_event(model,
+                cycle,
+                run,
+                ingested,
+                error):
+
+    """
+    This function returns the event of an error of the watcher.
+
+    Required Arguments:
+
+    1) model (String) - The model.
+
+    2) cycle (datetime or None) - The initialization time of the model run being ingested.
+
+    3) run (Integer or None) - The model run being ingested.
+
+    4) ingested (Integer List) - The forecast hours ingested so far.
+
+    5) error (Exception) - The error.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    An event dictionary.
+    """
+
+    return {
+        'event':'error',
+        'model':model,
+        'cycle':cycle,
+        'run':run,
+        'forecast_hour':None,
+        'forecast_hours':ingested,
+        'files':[],
+        'ds':None,
+        'dataset':None,
+        'error':error
+    }
+
+
+def parse_cycle(url):
+
+    """
+    This function returns the initialization time of the model run of a NOMADS GRIB filter URL.
+
+    Required Arguments:
+
+    1) url (String) - The NOMADS GRIB filter URL.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A datetime of the initialization time of the model run.
+    """
+
+    directory = parse_qs(urlparse(url).query).get('dir', [''])[0]
+    match = re.search(r'\.(\d{8})/(\d{2})', directory)
+
+    return datetime.strptime(f"{match.group(1)}{match.group(2)}", '%Y%m%d%H')
+
+
+def data_url(url,
+             server):
+
+    """
+    This function returns the URL of the full GRIB2 file behind a NOMADS GRIB filter URL.
+
+    The full file is probed to check if a forecast hour has been published without running the GRIB filter.
+
+    Required Arguments:
+
+    1) url (String) - The NOMADS GRIB filter URL.
+
+    2) server (String) - The NOMADS directory the GRIB filter 'dir' parameter is relative to.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The URL of the full GRIB2 file.
+    """
+
+    query = parse_qs(urlparse(url).query)
+
+    return f"{server}{query.get('dir', [''])[0]}/{query.get('file', [''])[0]}"
+
+
+def forecast_hour_url(url,
+                      forecast_hour):
+
+    """
+    This function returns the URL or filename of forecast hour 0 for another forecast hour.
+
+    Required Arguments:
+
+    1) url (String) - The URL or filename of forecast hour 0.
+
+    2) forecast_hour (Integer) - The forecast hour.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The URL or filename of the forecast hour.
+    """
+
+    return url.replace('.f000', f".f{forecast_hour:03d}")
+
+
+def iter_watch(model='gfs0p25',
+               final_forecast_hour=None,
+               western_bound=-180,
+               eastern_bound=180,
+               northern_bound=90,
+               southern_bound=-90,
+               step=3,
+               cat='mean',
+               members=[1, 2, 3, 4, 5, 6, 7, 8, 9, 10,
+                        11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+                        21, 22, 23, 24, 25, 26, 27, 28, 29, 30],
+               variables=None,
+               process_data=True,
+               convert_temperature=True,
+               convert_to='celsius',
+               custom_directory=None,
+               proxies=None,
+               poll_interval=60,
+               max_cycles=None,
+               timeout=None,
+               chunk_size=8192,
+               notifications='off',
+               max_workers=8):
+
+    """
+    This function watches NOMADS for the forecast hours of the newest model run and yields an event as each
+    forecast hour is downloaded and post-processed.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) model (String) - Default='gfs0p25'. The model to watch ('gfs0p25', 'gfs0p50', 'gefs0p25' or 'gefs0p50').
+
+    2) final_forecast_hour (Integer or None) - Default=None. The final forecast hour to ingest.
+       When None, the default final forecast hour of the model client is used.
+
+    3) western_bound (Float or Integer) - Default=-180. The western bound of the data needed.
+
+    4) eastern_bound (Float or Integer) - Default=180. The eastern bound of the data needed.
+
+    5) northern_bound (Float or Integer) - Default=90. The northern bound of the data needed.
+
+    6) southern_bound (Float or Integer) - Default=-90. The southern bound of the data needed.
+
+    7) step (Integer) - Default=3. Set to 3 for 3hr increments and 6 for 6hrly increments.
+
+    8) cat (String) - Default='mean'. The category of the ensemble data (GEFS only).
+
+    9) members (List) - Default=All 30 members. The ensemble members when cat='members' (GEFS only).
+
+    10) variables (String List or None) - Default=None. The variables to download.
+        When None, the default variables of the model client are used.
+
+    11) process_data (Boolean) - Default=True. When False, the forecast hours are downloaded but not post-processed.
+
+    12) convert_temperature (Boolean) - Default=True. When set to True, the temperature related fields will be converted from Kelvin to
+        either Celsius or Fahrenheit. When False, this data remains in Kelvin.
+
+    13) convert_to (String) - Default='celsius'. When set to 'celsius' temperature related fields convert to Celsius.
+        Set convert_to='fahrenheit' for Fahrenheit.
+
+    14) custom_directory (String, String List or None) - Default=None. The directory where the files are saved to.
+        When None, the default WxData directory of the model is used. For cat='members', a list of one directory per member.
+
+    15) proxies (dict or None) - Default=None. If the user is using proxy server(s), the user must change the following:
+
+       proxies=None ---> proxies={
+                           'http':'http://url',
+                           'https':'https://url'
+                        }
+
+    16) poll_interval (Integer) - Default=60. The number of seconds between each poll of NOMADS.
+
+    17) max_cycles (Integer or None) - Default=None. The number of complete model runs to ingest before the watcher stops.
+        When None, the watcher runs until timeout (or forever).
+
+    18) timeout (Integer or None) - Default=None. The number of seconds before the watcher stops.
+
+    19) chunk_size (Integer) - Default=8192. The size of the chunks when writing the GRIB/NETCDF data to a file.
+
+    20) notifications (String) - Default='off'. Notification when a file is downloaded and saved to {path}
+
+    21) max_workers (Integer) - Default=8. The maximum number of files downloaded at the same time.
+
+    Returns
+    -------
+
+    A generator of event dictionaries with the following keys:
+
+    'event' - 'cycle' when a new model run is found, 'forecast_hour' when a forecast hour is ingested,
+              'complete' when the final forecast hour is ingested and 'error' when the URL scanner, the download or the post-processing fails.
+              The watcher keeps polling after an 'error' event. The forecast hours of a failed download are downloaded again on the next poll.
+    'model' - The model.
+    'cycle' - The initialization time (datetime) of the model run.
+    'run' - The model run (i.e. 12).
+    'forecast_hour' - The forecast hour (None for 'cycle' events).
+    'forecast_hours' - The forecast hours ingested so far.
+    'files' - The files of the forecast hour (all files for 'complete' events).
+    'ds' - The post-processed xarray.array of the forecast hour (None when process_data=False).
+    'dataset' - The post-processed xarray.array of every forecast hour ingested so far concatenated along step (None when process_data=False).
+                The forecast hours that failed to post-process are left out.
+    'error' - The exception ('error' events only).
+    """
+
+    model = model.lower()
+    cat = cat.lower()
+
+    if model not in models:
+        raise ValueError(f"{model} is not supported. Valid models: {', '.join(models.keys())}")
+    else:
+        pass
+
+    parameters = inspect.signature(models[model]['client']).parameters
+
+    if final_forecast_hour == None:
+        final_forecast_hour = parameters['final_forecast_hour'].default
+    else:
+        pass
+
+    if variables == None:
+        variables = parameters['variables'].default
+    else:
+        pass
+
+    if models[model]['ensemble'] == True:
+        if custom_directory == None:
+            paths = gefs_file_funcs.build_directory(model,
+                                                    cat,
+                                                    members)
+        elif type(custom_directory) == type('String'):
+            paths = [custom_directory]
+        else:
+            paths = custom_directory
+    else:
+        if custom_directory == None:
+            paths = [gfs_paths.build_directory(model,
+                                               'atmospheric')]
+        else:
+            paths = [custom_directory]
+
+    for path in paths:
+        os.makedirs(path, exist_ok=True)
+
+    # The forecast hours of a model run are read from the URL scanner one time
+    # Every model run has the same forecast hours
+    hours = None
+
+    start = time.monotonic()
+    cycles = 0
+    cycle = None
+    ingested = []
+    urls = None
+    filenames = None
+    run = None
+    dataset = None
+
+    while True:
+
+        if hours == None:
+            try:
+                scan = scan_model(model,
+                                  final_forecast_hour,
+                                  western_bound,
+                                  eastern_bound,
+                                  northern_bound,
+                                  southern_bound,
+                                  proxies,
+                                  step,
+                                  variables,
+                                  cat=cat,
+                                  members=members)
+            except Exception as e:
+                scan = None
+                yield error_event(model, cycle, run, ingested, e)
+            if scan != None:
+                hours = sorted(set([int(f) for f in re.findall(r'\.f(\d{3})', ' '.join(scan[1]))]))
+            else:
+                pass
+        else:
+            pass
+
+        # The newest model run that has started (forecast hour 0 exists)
+        try:
+            scan = scan_model(model,
+                              0,
+                              western_bound,
+                              eastern_bound,
+                              northern_bound,
+                              southern_bound,
+                              proxies,
+                              step,
+                              variables,
+                              cat=cat,
+                              members=members)
+        except Exception as e:
+            scan = None
+            yield error_event(model, cycle, run, ingested, e)
+
+        if scan != None and hours != None:
+            new_cycle = parse_cycle(scan[0][0])
+
+            if cycle == None or new_cycle > cycle:
+                cycle = new_cycle
+                urls, filenames, run = scan
+                ingested = []
+                dataset = None
+
+                # Only the files of the previous model runs are removed (along with their manifest entries)
+                cycle_paths = []
+                cycle_filenames = []
+                for filename, path in zip(filenames, paths):
+                    for hour in hours:
+                        cycle_paths.append(path)
+                        cycle_filenames.append(f"{forecast_hour_url(filename, hour)}.grib2")
+
+                remove_stale_files(cycle_paths,
+                                   cycle_filenames)
+
+                yield {
+                    'event':'cycle',
+                    'model':model,
+                    'cycle':cycle,
+                    'run':run,
+                    'forecast_hour':None,
+                    'forecast_hours':[],
+                    'files':[],
+                    'ds':None,
+                    'dataset':None
+                }
+            else:
+                pass
+
+            # Forecast hours are published in order so the probing stops at the first missing forecast hour
+            new_hours = []
+            for hour in hours:
+                if hour in ingested:
+                    continue
+                available = True
+                for url in urls:
+                    if probe_url(data_url(forecast_hour_url(url, hour),
+                                          models[model]['server']),
+                                 proxies=proxies,
+                                 retries=1) != 200:
+                        available = False
+                        break
+                if available == True:
+                    new_hours.append(hour)
+                else:
+                    break
+
+            if len(new_hours) > 0:
+                hour_urls = []
+                hour_paths = []
+                hour_filenames = []
+                for hour in new_hours:
+                    for url, filename, path in zip(urls, filenames, paths):
+                        hour_urls.append(forecast_hour_url(url, hour))
+                        hour_paths.append(path)
+                        hour_filenames.append(f"{forecast_hour_url(filename, hour)}.grib2")
+
+                # A failed download is retried on the next poll
+                try:
+                    client.get_gridded_data_batch(hour_urls,
+                                                  hour_paths,
+                                                  hour_filenames,
+                                                  proxies=proxies,
+                                                  chunk_size=chunk_size,
+                                                  notifications=notifications,
+                                                  clear_recycle_bin=False,
+                                                  max_workers=max_workers)
+
+                    # The files are recorded in the run manifest so a later call to the client skips them
+                    record_files(hour_paths,
+                                 hour_urls,
+                                 hour_filenames)
+                except Exception as e:
+                    new_hours = []
+                    yield error_event(model, cycle, run, ingested, e)
+            else:
+                pass
+
+            if len(new_hours) > 0:
+                ingested = ingested + new_hours
+
+                # The files of each member (or the single directory) in forecast hour order
+                files = [[f"{path}/{forecast_hour_url(filename, hour)}.grib2" for hour in ingested] for filename, path in zip(filenames, paths)]
+                new_files = [[f"{path}/{forecast_hour_url(filename, hour)}.grib2" for hour in new_hours] for filename, path in zip(filenames, paths)]
+
+                # Only the new forecast hours are post-processed and appended to the dataset of the model run
+                new_dataset = None
+                if process_data == True:
+                    try:
+                        if models[model]['ensemble'] == False:
+                            new_dataset = primary_gfs_post_processing(paths[0],
+                                                                      files=new_files[0])
+                        elif len(paths) > 1:
+                            new_dataset = primary_gefs_post_processing(paths,
+                                                                       files=new_files)
+                        else:
+                            new_dataset = primary_gefs_post_processing(paths,
+                                                                       files=new_files[0])
+
+                        if 'step' not in new_dataset.dims:
+                            new_dataset = new_dataset.expand_dims('step')
+                        else:
+                            pass
+
+                        if convert_temperature == True:
+                            new_dataset = convert_temperature_units(new_dataset,
+                                                                    convert_to,
+                                                                    cat=cat)
+                        else:
+                            pass
+
+                        if dataset is None:
+                            dataset = new_dataset
+                        else:
+                            dataset = xr.concat([dataset, new_dataset],
+                                                dim='step')
+                    except Exception as e:
+                        new_dataset = None
+                        yield error_event(model, cycle, run, ingested, e)
+                else:
+                    pass
+
+                for i, hour in enumerate(new_hours):
+                    position = ingested.index(hour)
+                    try:
+                        ds = new_dataset.isel(step=i)
+                    except Exception as e:
+                        ds = None
+                    yield {
+                        'event':'forecast_hour',
+                        'model':model,
+                        'cycle':cycle,
+                        'run':run,
+                        'forecast_hour':hour,
+                        'forecast_hours':ingested[0:position + 1],
+                        'files':[f[position] for f in files],
+                        'ds':ds,
+                        'dataset':dataset
+                    }
+
+                if len(ingested) == len(hours):
+                    cycles = cycles + 1
+                    yield {
+                        'event':'complete',
+                        'model':model,
+                        'cycle':cycle,
+                        'run':run,
+                        'forecast_hour':hours[-1],
+                        'forecast_hours':ingested,
+                        'files':files,
+                        'ds':None,
+                        'dataset':dataset
+                    }
+                else:
+                    pass
+            else:
+                pass
+        else:
+            pass
+
+        if max_cycles != None and cycles >= max_cycles:
+            return
+        else:
+            pass
+
+        if timeout != None and time.monotonic() - start + poll_interval > timeout:
+            return
+        else:
+            pass
+
+        time.sleep(poll_interval)
+
+
+def watch(callback,
+          model='gfs0p25',
+          **kwargs):
+
+    """
+    This function runs the watcher and calls a function with each event.
+
+    This is a long-running function. Run it in its own process (i.e. a daemon or a scheduled service)
+    so the products built from the first forecast hours ship while the rest of the model run is still on its way.
+
+    Required Arguments:
+
+    1) callback (Function) - The function called with each event dictionary (see iter_watch()).
+
+    Optional Arguments:
+
+    1) model (String) - Default='gfs0p25'. The model to watch ('gfs0p25', 'gfs0p50', 'gefs0p25' or 'gefs0p50').
+
+    2) **kwargs - Any of the optional arguments of iter_watch() (i.e. final_forecast_hour=12, poll_interval=120, max_cycles=1).
+
+    Returns
+    -------
+
+    None
+    """
+
+    for event in iter_watch(model=model,
+                            **kwargs):
+        callback(event)
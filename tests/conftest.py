@@ -0,0 +1,57 @@
+"""
+This file hosts the fixtures shared by the WxData tests.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import pytest
+import numpy as np
+
+# The messages of each GRIB2 fixture file (typeOfLevel, level, paramId)
+grib_messages = [
+    ('heightAboveGround', 2, 167),
+    ('isobaricInhPa', 500, 130),
+    ('isobaricInhPa', 850, 130),
+    ('surface', 0, 134)
+]
+
+def write_grib_file(file,
+                    step):
+
+    import eccodes
+
+    with open(file, 'wb') as f:
+        for i, (type_of_level, level, param) in enumerate(grib_messages):
+            gid = eccodes.codes_grib_new_from_samples('regular_ll_sfc_grib2')
+            try:
+                eccodes.codes_set(gid, 'dataDate', 20250101)
+                eccodes.codes_set(gid, 'dataTime', 0)
+                eccodes.codes_set(gid, 'typeOfLevel', type_of_level)
+                eccodes.codes_set(gid, 'level', level)
+                eccodes.codes_set(gid, 'paramId', param)
+                eccodes.codes_set(gid, 'step', step)
+                eccodes.codes_set_values(gid, np.arange(16 * 31, dtype=np.float64) + 100 * i + step)
+                eccodes.codes_write(gid, f)
+            finally:
+                eccodes.codes_release(gid)
+
+    return file
+
+
+@pytest.fixture
+def index_cache(tmp_path, monkeypatch):
+    import wxdata.utils.index_cache as index_cache
+
+    monkeypatch.setattr(index_cache, 'cache_path', str(tmp_path / 'index_cache'))
+    monkeypatch.setattr(index_cache, 'open_entries', set())
+
+    return index_cache
+
+
+@pytest.fixture
+def grib_files(tmp_path):
+    # Two forecast hours (f000 and f003) of a small 16 x 31 grid
+    data = tmp_path / 'data'
+    data.mkdir()
+
+    return [write_grib_file(str(data / f"test.f{step:03d}.grib2"), step) for step in [0, 3]]
@@ -0,0 +1,118 @@
+"""
+This file hosts the tests of the index (inventory) file parsers and the byte range selection.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import json
+
+import wxdata.utils.byte_ranges as byte_ranges
+
+from wxdata.utils.byte_ranges import(
+    ecmwf_index_url,
+    parse_ecmwf_index,
+    select_messages,
+    coalesce_ranges,
+    range_header,
+    ecmwf_message_ranges,
+    parse_nomads_index,
+    nomads_message_ranges
+)
+
+# An ECMWF .index file of 5 back to back messages of 100 bytes
+ecmwf_index = "\n".join([json.dumps(entry) for entry in [
+    {'param':'2t', 'levtype':'sfc', 'step':'0', '_offset':0, '_length':100},
+    {'param':'msl', 'levtype':'sfc', 'step':'0', '_offset':100, '_length':100},
+    {'param':'t', 'levtype':'pl', 'levelist':'850', 'step':'0', '_offset':200, '_length':100},
+    {'param':'t', 'levtype':'pl', 'levelist':'500', 'step':'0', '_offset':300, '_length':100},
+    {'param':'10u', 'levtype':'sfc', 'step':'0', '_offset':400, '_length':100}
+]]) + "\n"
+
+class Response:
+
+    def __init__(self, text):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+
+def test_ecmwf_index_url():
+    assert ecmwf_index_url('https://data.ecmwf.int/forecasts/20250101/00z/ifs/0p25/oper/20250101000000-0h-oper-fc.grib2') == 'https://data.ecmwf.int/forecasts/20250101/00z/ifs/0p25/oper/20250101000000-0h-oper-fc.index'
+
+
+def test_parse_ecmwf_index():
+    messages = parse_ecmwf_index(ecmwf_index)
+
+    assert len(messages) == 5
+    assert messages[0] == {'param':'2t', 'level':'sfc', 'offset':0, 'length':100}
+    assert messages[3] == {'param':'t', 'level':'500', 'offset':300, 'length':100}
+
+
+def test_select_messages():
+    messages = parse_ecmwf_index(ecmwf_index)
+
+    assert select_messages(messages, variables=['2T', 'msl']) == [(0, 99), (100, 199)]
+    assert select_messages(messages, variables=['t'], levels=[500]) == [(300, 399)]
+    assert select_messages(messages, levels=['sfc']) == [(0, 99), (100, 199), (400, 499)]
+    assert len(select_messages(messages)) == 5
+
+
+def test_coalesce_ranges():
+    assert coalesce_ranges([(100, 199), (0, 99), (400, 499)]) == [(0, 199), (400, 499)]
+    assert coalesce_ranges([(0, 99), (50, 149)]) == [(0, 149)]
+    assert coalesce_ranges([(0, 99), (150, 199)], max_gap=50) == [(0, 199)]
+    assert coalesce_ranges([(0, 99), (150, 199)], max_gap=49) == [(0, 99), (150, 199)]
+    assert coalesce_ranges([(300, None), (0, 99), (400, 499)]) == [(0, 99), (300, None)]
+
+
+def test_range_header():
+    assert range_header(0, 99) == {'Range':'bytes=0-99'}
+    assert range_header(300, None) == {'Range':'bytes=300-'}
+
+
+def test_ecmwf_message_ranges(monkeypatch):
+    requested = []
+
+    def get(url, **kwargs):
+        requested.append(url)
+        return Response(ecmwf_index)
+
+    monkeypatch.setattr(byte_ranges.session, 'get', get)
+
+    ranges = ecmwf_message_ranges('https://data.ecmwf.int/test-fc.grib2',
+                                  variables=['2t', 'msl', '10u'])
+
+    assert requested == ['https://data.ecmwf.int/test-fc.index']
+    assert ranges == [(0, 199), (400, 499)]
+
+
+# A NOMADS .idx file where message 2 holds the UGRD and VGRD sub-messages
+nomads_index = """1:0:d=2025010100:TMP:2 m above ground:anl:
+2.1:500:d=2025010100:UGRD:10 m above ground:anl:
+2.2:500:d=2025010100:VGRD:10 m above ground:anl:
+3:1200:d=2025010100:PRMSL:mean sea level:anl:
+4:1800:d=2025010100:HGT:500 mb:anl:
+"""
+
+def test_parse_nomads_index_sub_messages():
+    messages = parse_nomads_index(nomads_index)
+
+    assert [m['offset'] for m in messages] == [0, 500, 500, 1200, 1800]
+    assert [m['length'] for m in messages] == [500, 700, 700, 600, None]
+
+    # Each sub-message returns the byte range of the whole message
+    assert select_messages(messages, variables=['VGRD']) == [(500, 1199)]
+    assert select_messages(messages, variables=['UGRD', 'VGRD']) == [(500, 1199), (500, 1199)]
+    assert select_messages(messages, variables=['HGT']) == [(1800, None)]
+    for start, end in select_messages(messages):
+        assert end == None or end >= start
+
+
+def test_nomads_message_ranges(monkeypatch):
+    monkeypatch.setattr(byte_ranges.session, 'get', lambda url, **kwargs: Response(nomads_index))
+
+    ranges = nomads_message_ranges('https://nomads.ncep.noaa.gov/test.grib2',
+                                   variables=['u-component of wind', 'v-component of wind', 'TMP'])
+
+    assert ranges == [(0, 1199)]
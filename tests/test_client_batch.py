@@ -0,0 +1,141 @@
+"""
+This file hosts the tests of the batch client (get_gridded_data_batch()) against a local HTTP server.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import os
+import time
+import threading
+import pytest
+
+from http.server import(
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer
+)
+
+from wxdata.client.client import get_gridded_data_batch
+from wxdata.client.retry import(
+    DownloadError,
+    reset_circuits
+)
+
+# The time each response is held open so the downloads overlap
+delay = 0.5
+
+# The body of each file
+body = b'WxData' * 1024
+
+class Server(ThreadingHTTPServer):
+
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+
+class Handler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.startswith('/missing'):
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        else:
+            pass
+
+        with self.server.lock:
+            self.server.active = self.server.active + 1
+            self.server.peak = max(self.server.peak, self.server.active)
+
+        try:
+            time.sleep(delay)
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with self.server.lock:
+                self.server.active = self.server.active - 1
+
+
+@pytest.fixture
+def server():
+    server = Server(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    reset_circuits()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def urls(server, names):
+    return [f"http://127.0.0.1:{server.server_address[1]}/{name}" for name in names]
+
+
+def download(server, tmp_path, names, **kwargs):
+    get_gridded_data_batch(urls(server, names),
+                           str(tmp_path),
+                           names,
+                           notifications='off',
+                           clear_recycle_bin=False,
+                           **kwargs)
+
+
+def test_downloads_run_concurrently(server, tmp_path):
+    names = [f"file_{i}.nc" for i in range(0, 4, 1)]
+
+    start = time.monotonic()
+    download(server, tmp_path, names, max_workers=4, max_workers_per_host=4)
+    elapsed = time.monotonic() - start
+
+    for name in names:
+        with open(os.path.join(tmp_path, name), 'rb') as f:
+            assert f.read() == body
+
+    assert server.peak > 1
+    assert elapsed < len(names) * delay
+
+
+def test_max_workers_per_host(server, tmp_path):
+    names = [f"file_{i}.nc" for i in range(0, 6, 1)]
+
+    download(server, tmp_path, names, max_workers=6, max_workers_per_host=2)
+
+    assert server.peak == 2
+    for name in names:
+        assert os.path.exists(os.path.join(tmp_path, name))
+
+
+def test_failed_url_raises(server, tmp_path):
+    names = ['file_0.nc', 'missing.nc', 'file_1.nc']
+
+    start = time.monotonic()
+    with pytest.raises(DownloadError, match='404'):
+        download(server, tmp_path, names, max_workers=3, max_workers_per_host=3)
+
+    assert time.monotonic() - start < 10
+    assert os.path.exists(os.path.join(tmp_path, 'missing.nc')) == False
+
+
+def test_failed_url_cancels_pending_downloads(server, tmp_path):
+    names = ['missing.nc'] + [f"file_{i}.nc" for i in range(0, 10, 1)]
+
+    start = time.monotonic()
+    with pytest.raises(DownloadError, match='404'):
+        download(server, tmp_path, names, max_workers=2, max_workers_per_host=2)
+    elapsed = time.monotonic() - start
+
+    # Only the download in progress when the failure is raised finishes, the rest are cancelled
+    assert elapsed < 4 * delay
+    assert sum(os.path.exists(os.path.join(tmp_path, name)) for name in names) <= 2
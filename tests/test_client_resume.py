@@ -0,0 +1,206 @@
+"""
+This file hosts the tests of resuming an interrupted download (get_gridded_data()) against a local HTTP server
+that supports Range requests.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import os
+import re
+import threading
+import pytest
+
+from http.server import(
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer
+)
+
+from wxdata.client.client import get_gridded_data
+from wxdata.client.retry import(
+    DownloadError,
+    reset_circuits
+)
+
+# A GRIB2 file starts with GRIB and ends with the 7777 end marker
+body = b'GRIB' + bytes(range(0, 256)) * 64 + b'7777'
+
+class Server(ThreadingHTTPServer):
+
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The body and ETag of each file
+        self.files = {}
+        # The number of responses of each file that are cut off half way through
+        self.drops = {}
+        # When False, the Range header is ignored (a server without Range support)
+        self.ranges = True
+        # The (path, Range, If-Range) of each request
+        self.requests = []
+
+
+class Handler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests.append((self.path, self.headers.get('Range'), self.headers.get('If-Range')))
+
+        if self.path not in self.server.files:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        else:
+            pass
+
+        data, etag = self.server.files[self.path]
+
+        start = 0
+        match = re.match(r'bytes=(\d+)-$', self.headers.get('Range') or '')
+        if self.server.ranges == True and match != None and self.headers.get('If-Range') in [None, etag]:
+            start = int(match.group(1))
+        else:
+            pass
+
+        if start > 0:
+            self.send_response(206)
+            self.send_header('Content-Range', f"bytes {start}-{len(data) - 1}/{len(data)}")
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', str(len(data) - start))
+        self.send_header('ETag', etag)
+        self.end_headers()
+
+        if self.server.drops.get(self.path, 0) > 0:
+            # The connection drops half way through the response
+            self.server.drops[self.path] = self.server.drops[self.path] - 1
+            self.wfile.write(data[start:start + int((len(data) - start) / 2)])
+            self.wfile.flush()
+            self.close_connection = True
+        else:
+            self.wfile.write(data[start:])
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr('wxdata.client.retry.time.sleep', lambda delay: None)
+    server = Server(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    reset_circuits()
+    yield server
+    server.shutdown()
+    server.server_close()
+    reset_circuits()
+
+
+def download(server, tmp_path, name):
+    get_gridded_data(f"http://127.0.0.1:{server.server_address[1]}/{name}",
+                     str(tmp_path),
+                     name,
+                     notifications='off',
+                     clear_recycle_bin=False)
+
+
+def test_dropped_download_resumes_with_a_range_request(server, tmp_path):
+    server.files['/gfs.f003.grib2'] = (body, '"v1"')
+    server.drops['/gfs.f003.grib2'] = 1
+
+    download(server, tmp_path, 'gfs.f003.grib2')
+
+    with open(tmp_path / 'gfs.f003.grib2', 'rb') as f:
+        assert f.read() == body
+    assert os.listdir(tmp_path) == ['gfs.f003.grib2']
+
+    # The second attempt only asks for the bytes that were not saved (the saved chunks of the first half)
+    assert server.requests[0] == ('/gfs.f003.grib2', None, None)
+    path, byte_range, if_range = server.requests[1]
+    start = int(re.match(r'bytes=(\d+)-$', byte_range).group(1))
+    assert 0 < start <= len(body) / 2
+    assert if_range == '"v1"'
+    assert len(server.requests) == 2
+
+
+def test_server_without_range_support_starts_over(server, tmp_path):
+    server.files['/gfs.f003.grib2'] = (body, '"v1"')
+    server.drops['/gfs.f003.grib2'] = 1
+    server.ranges = False
+
+    download(server, tmp_path, 'gfs.f003.grib2')
+
+    with open(tmp_path / 'gfs.f003.grib2', 'rb') as f:
+        assert f.read() == body
+    assert len(server.requests) == 2
+
+
+def test_file_changed_on_the_server_is_downloaded_again(server, tmp_path):
+    server.files['/gfs.f003.grib2'] = (body, '"v1"')
+    server.drops['/gfs.f003.grib2'] = 1
+    new_body = b'GRIB' + bytes(range(255, -1, -1)) * 64 + b'7777'
+
+    # The file is replaced after the first attempt is cut off
+    def replace(request, client_address, server_instance):
+        if len(server.requests) == 1:
+            server.files['/gfs.f003.grib2'] = (new_body, '"v2"')
+        else:
+            pass
+        return Handler(request, client_address, server_instance)
+
+    server.RequestHandlerClass = replace
+
+    download(server, tmp_path, 'gfs.f003.grib2')
+
+    # The If-Range header no longer matches so the server sends the whole new file
+    with open(tmp_path / 'gfs.f003.grib2', 'rb') as f:
+        assert f.read() == new_body
+    assert server.requests[1][2] == '"v1"'
+
+
+def test_stale_partial_file_is_not_resumed(server, tmp_path):
+    server.files['/gfs.f003.grib2'] = (body, '"v1"')
+    with open(tmp_path / 'gfs.f003.grib2.part', 'wb') as f:
+        f.write(b'GRIB from an older model run')
+
+    download(server, tmp_path, 'gfs.f003.grib2')
+
+    with open(tmp_path / 'gfs.f003.grib2', 'rb') as f:
+        assert f.read() == body
+    assert server.requests == [('/gfs.f003.grib2', None, None)]
+
+
+def test_incomplete_file_is_never_renamed(server, tmp_path):
+    # A GRIB2 file that does not end with the 7777 end marker
+    server.files['/gfs.f003.grib2'] = (body[0:-4], '"v1"')
+
+    with pytest.raises(DownloadError):
+        download(server, tmp_path, 'gfs.f003.grib2')
+
+    assert os.path.exists(tmp_path / 'gfs.f003.grib2') == False
+
+
+def test_existing_file_is_replaced_atomically(server, tmp_path):
+    server.files['/gfs.f003.grib2'] = (body, '"v1"')
+    server.drops['/gfs.f003.grib2'] = 1
+    with open(tmp_path / 'gfs.f003.grib2', 'wb') as f:
+        f.write(b'the previous model run')
+
+    seen = []
+
+    # The previous file stays in place until the new file is complete
+    def watch(request, client_address, server_instance):
+        with open(tmp_path / 'gfs.f003.grib2', 'rb') as f:
+            seen.append(f.read())
+        return Handler(request, client_address, server_instance)
+
+    server.RequestHandlerClass = watch
+
+    download(server, tmp_path, 'gfs.f003.grib2')
+
+    assert seen == [b'the previous model run', b'the previous model run']
+    with open(tmp_path / 'gfs.f003.grib2', 'rb') as f:
+        assert f.read() == body
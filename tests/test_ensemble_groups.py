@@ -0,0 +1,82 @@
+"""
+This file hosts the tests of opening the ensemble members of a model.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import os
+import sys
+import subprocess
+
+import numpy as np
+import pytest
+
+import wxdata.utils.ensemble as ensemble
+
+from conftest import write_grib_file
+
+groups = [{'typeOfLevel':'isobaricInhPa'},
+          {'typeOfLevel':'heightAboveGround', 'paramId':167}]
+
+@pytest.fixture
+def member_paths(tmp_path):
+    # Three ensemble members with the same two forecast hours
+    paths = []
+    for member in range(1, 4, 1):
+        path = tmp_path / 'MEMBERS' / str(member)
+        path.mkdir(parents=True)
+        for step in [0, 3]:
+            write_grib_file(str(path / f"test.f{step:03d}.grib2"), step)
+        paths.append(str(path))
+
+    return paths
+
+
+def test_members_are_opened_lazily_in_this_process(index_cache, member_paths, monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("A worker process was started.")
+
+    monkeypatch.setattr(ensemble, 'ProcessPoolExecutor', no_pool)
+
+    datasets = ensemble.open_ensemble_groups(member_paths,
+                                             groups)
+
+    assert sorted(datasets) == [0, 1]
+    assert datasets[0]['t'].dims[0:2] == ('number', 'step')
+    assert datasets[0].sizes['number'] == 3
+
+    # The data is not decoded until it is used
+    assert datasets[0]['t'].chunks != None
+    assert datasets[1]['t2m'].chunks != None
+
+
+def test_unguarded_script_runs_by_default(index_cache, member_paths, tmp_path):
+    # A script without an if __name__ == '__main__': guard
+    script = tmp_path / 'script.py'
+    script.write_text("import wxdata.utils.index_cache as index_cache\n"
+                      f"index_cache.cache_path = {index_cache.cache_path!r}\n"
+                      "from wxdata.utils.ensemble import open_ensemble_groups\n"
+                      f"datasets = open_ensemble_groups({member_paths!r}, {groups!r})\n"
+                      "print('members', datasets[0].sizes['number'], flush=True)\n")
+
+    result = subprocess.run([sys.executable, str(script)],
+                            capture_output=True,
+                            text=True,
+                            cwd=str(tmp_path),
+                            timeout=300)
+
+    assert 'members 3' in result.stdout
+    assert 'RuntimeError' not in result.stderr
+
+
+def test_worker_processes_match_serial(index_cache, member_paths):
+    serial = ensemble.open_ensemble_groups(member_paths,
+                                           groups)
+    parallel = ensemble.open_ensemble_groups(member_paths,
+                                             groups,
+                                             max_workers=2)
+
+    assert sorted(parallel) == sorted(serial)
+    for i in serial:
+        for var in serial[i].data_vars:
+            np.testing.assert_array_equal(parallel[i][var].values, serial[i][var].values)
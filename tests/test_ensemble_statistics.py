@@ -0,0 +1,147 @@
+"""
+This file hosts the tests of the ensemble statistics calculated one member at a time.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import numpy as np
+import xarray as xr
+import pytest
+
+from wxdata.calc.ensemble import(
+    ensemble_statistics,
+    iter_ensemble_members,
+    sample_quantiles
+)
+
+@pytest.fixture
+def members():
+    # A small synthetic ensemble of 7 members on a 2 step x 4 x 5 grid
+    rng = np.random.default_rng(0)
+    values = rng.normal(280, 5, size=(7, 2, 4, 5))
+    precipitation = rng.gamma(1, 5, size=(7, 2, 4, 5))
+    ds = xr.Dataset({'2m_temperature':(('number', 'step', 'latitude', 'longitude'), values),
+                     'total_precipitation':(('number', 'step', 'latitude', 'longitude'), precipitation)},
+                    coords={'number':np.arange(1, 8, 1),
+                            'step':[0, 3],
+                            'latitude':np.linspace(40, 43, 4),
+                            'longitude':np.linspace(-110, -106, 5)})
+    return ds
+
+
+@pytest.mark.parametrize('ddof', [0, 1])
+def test_mean_and_spread_match_numpy(members, ddof):
+    stats = ensemble_statistics(members,
+                                ddof=ddof)
+
+    for var in members.data_vars:
+        values = members[var].values
+        np.testing.assert_allclose(stats[f"{var}_mean"].values, np.mean(values, axis=0), rtol=1e-6)
+        np.testing.assert_allclose(stats[f"{var}_spread"].values, np.std(values, axis=0, ddof=ddof), rtol=1e-5)
+
+    assert stats.attrs['number_of_members'] == 7
+    assert stats['2m_temperature_mean'].dims == ('step', 'latitude', 'longitude')
+
+
+def test_quantiles_match_numpy(members):
+    quantiles = [0.1, 0.5, 0.9]
+    stats = ensemble_statistics(members,
+                                quantiles=quantiles,
+                                reservoir_size=31)
+
+    for var in members.data_vars:
+        np.testing.assert_allclose(stats[f"{var}_quantiles"].values,
+                                   np.quantile(members[var].values, quantiles, axis=0),
+                                   rtol=1e-5)
+
+    assert list(stats['quantile'].values) == quantiles
+
+
+def test_reservoir_quantiles_are_a_sample_of_the_members(members):
+    stats = ensemble_statistics(members,
+                                variables=['2m_temperature'],
+                                quantiles=[0.0, 1.0],
+                                reservoir_size=3,
+                                seed=1)
+
+    values = members['2m_temperature'].values
+    low = stats['2m_temperature_quantiles'].values[0]
+    high = stats['2m_temperature_quantiles'].values[1]
+
+    # The sample holds whole members so its extremes fall inside the extremes of the ensemble
+    assert np.all(low >= np.min(values, axis=0).astype(np.float32))
+    assert np.all(high <= np.max(values, axis=0).astype(np.float32))
+    assert np.all(low <= high)
+
+
+def test_exceedance_matches_numpy(members):
+    thresholds = {'total_precipitation':[2.54, 10]}
+    stats = ensemble_statistics(members,
+                                thresholds=thresholds)
+
+    probability = stats['total_precipitation_exceedance_probability']
+    for i, threshold in enumerate(thresholds['total_precipitation']):
+        np.testing.assert_allclose(probability.values[i],
+                                   np.mean(members['total_precipitation'].values > threshold, axis=0),
+                                   rtol=1e-6)
+
+    assert '2m_temperature_exceedance_probability' not in stats
+
+
+def test_missing_values_are_skipped(members):
+    members['2m_temperature'][0, 0, 0, 0] = np.nan
+    stats = ensemble_statistics(members,
+                                variables=['2m_temperature'],
+                                quantiles=[0.5])
+
+    values = members['2m_temperature'].values
+    np.testing.assert_allclose(stats['2m_temperature_mean'].values, np.nanmean(values, axis=0), rtol=1e-6)
+    np.testing.assert_allclose(stats['2m_temperature_spread'].values, np.nanstd(values, axis=0), rtol=1e-5)
+    np.testing.assert_allclose(stats['2m_temperature_quantiles'].values[0], np.nanmedian(values, axis=0), rtol=1e-5)
+
+
+def test_generator_of_members_matches_dataset(members):
+    opened = []
+
+    def post_processor(paths):
+        # Each member is opened only when the statistics ask for it
+        opened.append(paths[0])
+        return members.sel(number=[paths[0]])
+
+    generator = iter_ensemble_members(list(members['number'].values),
+                                      post_processor)
+
+    assert opened == []
+
+    stats = ensemble_statistics(generator,
+                                quantiles=[0.25, 0.75],
+                                thresholds={'2m_temperature':[280]})
+    expected = ensemble_statistics(members,
+                                   quantiles=[0.25, 0.75],
+                                   thresholds={'2m_temperature':[280]})
+
+    assert opened == list(members['number'].values)
+    xr.testing.assert_allclose(stats, expected)
+
+
+def test_iter_ensemble_members_passes_the_files_of_each_member():
+    calls = []
+
+    def post_processor(paths, files=None, western_bound=None):
+        calls.append((paths, files, western_bound))
+        return paths
+
+    generator = iter_ensemble_members(['a', 'b'],
+                                      post_processor,
+                                      files=[['a/f003.grib2'], ['b/f003.grib2']],
+                                      western_bound=-110)
+
+    assert list(generator) == [['a'], ['b']]
+    assert calls == [(['a'], ['a/f003.grib2'], -110),
+                     (['b'], ['b/f003.grib2'], -110)]
+
+
+def test_sample_quantiles_match_numpy():
+    sample = np.random.default_rng(2).normal(size=(9, 6))
+    np.testing.assert_allclose(sample_quantiles(sample, [0, 0.33, 0.5, 1]),
+                               np.quantile(sample, [0, 0.33, 0.5, 1], axis=0))
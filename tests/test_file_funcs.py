@@ -0,0 +1,68 @@
+"""
+This file hosts the tests of the streaming gzip/bz2 decompression.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import io
+import os
+import bz2
+import gzip
+import pytest
+
+from wxdata.utils.file_funcs import(
+    open_decompressed,
+    decompress_to_file,
+    extract_gzipped_file
+)
+
+# Several blocks of the decompression chunk size so the data is streamed in more than one block
+payload = b''.join([f"KSAN,2025-01-01T00:00:00Z,{i},{i % 37}\n".encode() for i in range(0, 200000, 1)])
+
+@pytest.mark.parametrize('compress, compression', [(gzip.compress, 'gzip'),
+                                                   (bz2.compress, 'bz2'),
+                                                   (lambda data: data, None)])
+def test_open_decompressed_detects_compression(compress, compression):
+    with open_decompressed(io.BytesIO(compress(payload))) as f:
+        assert f.read() == payload
+
+    with open_decompressed(io.BytesIO(compress(payload)), compression=compression) as f:
+        assert f.read() == payload
+
+
+@pytest.mark.parametrize('compress', [gzip.compress, bz2.compress])
+def test_decompress_to_file(tmp_path, compress):
+    file = str(tmp_path / 'metars.csv')
+
+    decompress_to_file(io.BytesIO(compress(payload)),
+                       file,
+                       chunk_size=4096)
+
+    with open(file, 'rb') as f:
+        assert f.read() == payload
+    assert os.listdir(tmp_path) == ['metars.csv']
+
+
+@pytest.mark.parametrize('compress', [gzip.compress, bz2.compress])
+def test_truncated_archive_leaves_no_file(tmp_path, compress):
+    file = str(tmp_path / 'metars.csv')
+    data = compress(payload)
+
+    with pytest.raises(EOFError):
+        decompress_to_file(io.BytesIO(data[:len(data) // 2]),
+                           file)
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_extract_gzipped_file(tmp_path):
+    compressed = str(tmp_path / 'metars.csv.gz')
+    with open(compressed, 'wb') as f:
+        f.write(gzip.compress(payload))
+
+    extract_gzipped_file(compressed,
+                         str(tmp_path / 'metars.csv'))
+
+    with open(tmp_path / 'metars.csv', 'rb') as f:
+        assert f.read() == payload
+    assert os.path.exists(compressed) == False
@@ -0,0 +1,75 @@
+"""
+This file hosts the tests of the single-pass GRIB2 message index.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import numpy as np
+
+from wxdata.utils.grib_index import(
+    index_grib_file,
+    build_grib_index,
+    key_matches,
+    open_grib_group
+)
+
+def test_index_grib_file(grib_files):
+    index = index_grib_file(grib_files[0])
+
+    assert len(index) == 4
+    assert ('heightAboveGround', '2t', 167, 2, 0) in index
+    assert ('isobaricInhPa', 't', 130, 500, 0) in index
+
+    # The byte ranges cover every message of the file back to back
+    ranges = sorted(r for messages in index.values() for r in messages)
+    assert ranges[0][0] == 0
+    for (offset, length), (next_offset, next_length) in zip(ranges[:-1], ranges[1:]):
+        assert offset + length == next_offset
+
+
+def test_build_grib_index_is_cached(index_cache, grib_files, monkeypatch):
+    indexes = build_grib_index(grib_files)
+
+    assert list(indexes) == grib_files
+
+    # The second call reads the index cache instead of re-scanning the files
+    monkeypatch.setattr('wxdata.utils.grib_index.index_grib_file', lambda file: None)
+    assert build_grib_index(grib_files) == indexes
+
+
+def test_key_matches_ignores_keys_that_are_not_indexed():
+    key = ('heightAboveGround', '2t', 167, 2, 0)
+
+    assert key_matches(key, {'typeOfLevel':'heightAboveGround', 'paramId':167}) == True
+    assert key_matches(key, {'typeOfLevel':'heightAboveGround', 'stepType':'instant'}) == True
+    assert key_matches(key, {'typeOfLevel':'surface', 'stepType':'instant'}) == False
+
+
+def test_open_grib_group(index_cache, grib_files):
+    indexes = build_grib_index(grib_files)
+
+    ds = open_grib_group(indexes,
+                         None,
+                         {'typeOfLevel':'isobaricInhPa'})
+
+    assert list(ds.data_vars) == ['t']
+    assert ds.sizes['step'] == 2
+    assert sorted(ds['isobaricInhPa'].values.tolist()) == [500, 850]
+    assert ds['t'].attrs['units'] == 'K'
+
+    # The values match the messages of each file (message 1 is 500 mb, step 3 adds 3)
+    values = ds['t'].sel(isobaricInhPa=500).values
+    expected = np.arange(16 * 31, dtype=np.float64).reshape(31, 16) + 100
+    np.testing.assert_allclose(values[0], expected)
+    np.testing.assert_allclose(values[1], expected + 3)
+
+
+def test_open_grib_group_with_key_that_is_not_indexed(index_cache, grib_files):
+    indexes = build_grib_index(grib_files)
+
+    ds = open_grib_group(indexes,
+                         None,
+                         {'typeOfLevel':'heightAboveGround', 'paramId':167, 'stepType':'instant'})
+
+    assert list(ds.data_vars) == ['t2m']
+    assert ds.sizes['step'] == 2
@@ -0,0 +1,49 @@
+"""
+This file hosts the tests of the persistent GRIB2 index cache.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import os
+
+def test_open_mfdataset_keeps_attributes(index_cache, grib_files):
+    ds = index_cache.open_mfdataset(grib_files,
+                                    concat_dim='step',
+                                    decode_timedelta=False,
+                                    filter_by_keys={'typeOfLevel':'isobaricInhPa'})
+
+    assert ds.sizes['step'] == 2
+    assert ds.attrs['GRIB_centre'] == 'ecmf'
+    assert ds['t'].attrs['units'] == 'K'
+    assert ds['t'].attrs['GRIB_shortName'] == 't'
+    assert len(ds['step'].attrs) > 0
+
+    # The second open reads the cached cfgrib index and keeps the attributes as well
+    cached = index_cache.open_mfdataset(grib_files,
+                                        concat_dim='step',
+                                        decode_timedelta=False,
+                                        filter_by_keys={'typeOfLevel':'isobaricInhPa'})
+
+    assert cached.attrs == ds.attrs
+    assert cached['t'].attrs == ds['t'].attrs
+
+
+def test_eviction_keeps_excluded_entries(index_cache, tmp_path):
+    os.makedirs(index_cache.cache_path)
+    entries = []
+    for i in range(0, 4, 1):
+        entry = os.path.join(index_cache.cache_path, f"{i}.grib2")
+        with open(entry, 'wb') as f:
+            f.write(b'0' * 100)
+        os.utime(entry, (i, i))
+        entries.append(entry)
+
+    index_cache.open_entries.add(entries[1])
+    total = index_cache.evict_index_cache(max_size=200,
+                                          exclude=[entries[0]])
+
+    assert total == 200
+    assert os.path.exists(entries[0]) == True
+    assert os.path.exists(entries[1]) == True
+    assert os.path.exists(entries[2]) == False
+    assert os.path.exists(entries[3]) == False
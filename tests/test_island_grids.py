@@ -0,0 +1,126 @@
+"""
+This file hosts the tests of rebuilding the 1-D island grids into 2-D grids.
+
+The vectorized rebuild is checked against the row by row loops it replaced in the NDFD Hawaii and RTMA post-processing.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import numpy as np
+import xarray as xr
+import pytest
+
+import wxdata.utils.island_grids as island_grids
+
+from wxdata.utils.island_grids import(
+    grid_shape,
+    reshape_1d,
+    unscramble_dataset
+)
+
+def loop_rebuild(var, lat, lon, nrow, ncol, serpentine):
+    # The row by row loop of FIX_1D_GRIB_DATA() (serpentine) and process_rtma_data() before the rebuild was vectorized
+    var2d = np.empty([nrow,ncol])
+    lat2d = np.empty([nrow,ncol])
+    lon2d = np.empty([nrow,ncol])
+
+    for i in range(0,nrow):
+        start = i*ncol
+        end = start+ncol
+        if serpentine == True and i%2 != 0:
+            var2d[i,:] = np.flip(var[start:end],axis=0)
+        else:
+            var2d[i,:] = var[start:end]
+
+        lat2d[i,:] = lat[start:end]
+        lon2d[i,:] = lon[start:end]
+
+    return var2d, lat2d[:,0], lon2d[0,:]
+
+
+def island_dataset(grid, steps, variables, seed=0):
+    nrows, ncols = grid_shape(grid)
+    rng = np.random.default_rng(seed)
+    lat = np.repeat(np.linspace(18, 23, nrows), ncols)
+    lon = np.tile(np.linspace(198, 206, ncols), nrows)
+    data_vars = {var:(('step', 'values'), rng.normal(size=(steps, nrows * ncols)), {'units':'K'}) for var in variables}
+    return xr.Dataset(data_vars,
+                      coords={'time':np.datetime64('2026-10-18T06:00'),
+                              'step':np.arange(0, steps, 1),
+                              'latitude':(('values',), lat),
+                              'longitude':(('values',), lon)},
+                      attrs={'GRIB_centre':'kwbc'})
+
+
+@pytest.mark.parametrize('grid, serpentine', [
+    ('hi ndfd', True),
+    ('HI RTMA', False),
+    ('pr rtma', False),
+    ('gu rtma', False)
+])
+def test_rebuild_matches_the_row_loop(grid, serpentine):
+    nrows, ncols = grid_shape(grid)
+    ds = island_dataset(grid, 3, ['t2m', 'sp'])
+
+    result = unscramble_dataset(ds,
+                                nrows,
+                                ncols,
+                                serpentine=serpentine)
+
+    assert result['t2m'].dims == ('step', 'latitude', 'longitude')
+    for var in ['t2m', 'sp']:
+        for step in range(0, 3, 1):
+            var2d, lat1d, lon1d = loop_rebuild(ds[var].values[step],
+                                               ds['latitude'].values,
+                                               ds['longitude'].values,
+                                               nrows,
+                                               ncols,
+                                               serpentine)
+            np.testing.assert_array_equal(result[var].values[step], var2d)
+    np.testing.assert_array_equal(result['latitude'].values, lat1d)
+    np.testing.assert_array_equal(result['longitude'].values, lon1d)
+
+    # The coordinates that are not on the grid are kept
+    assert result['time'].values == ds['time'].values
+    np.testing.assert_array_equal(result['step'].values, ds['step'].values)
+    assert result['t2m'].attrs == {'units':'K'}
+    assert result.attrs == ds.attrs
+
+
+def test_reshape_flips_every_other_row():
+    values = np.arange(0, 12, 1)
+
+    np.testing.assert_array_equal(reshape_1d(values, 3, 4), [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 10, 11]])
+    np.testing.assert_array_equal(reshape_1d(values, 3, 4, serpentine=True), [[0, 1, 2, 3], [7, 6, 5, 4], [8, 9, 10, 11]])
+
+    # The input is left as it is
+    np.testing.assert_array_equal(values, np.arange(0, 12, 1))
+
+
+def test_points_dimension_last_and_other_variables_skipped():
+    nrows, ncols = 4, 5
+    ds = xr.Dataset({'t2m':(('values', 'step'), np.arange(0, 40, 1.0).reshape(20, 2)),
+                     'valid':(('step',), [0, 3])},
+                    coords={'latitude':(('values',), np.repeat(np.arange(0, 4, 1.0), 5)),
+                            'longitude':(('values',), np.tile(np.arange(0, 5, 1.0), 4))})
+
+    result = unscramble_dataset(ds,
+                                nrows,
+                                ncols,
+                                keep_attrs=False)
+
+    assert list(result.data_vars) == ['t2m']
+    assert result['t2m'].dims == ('step', 'latitude', 'longitude')
+    np.testing.assert_array_equal(result['t2m'].values[1], np.arange(1, 40, 2.0).reshape(4, 5))
+
+
+def test_grid_coordinates_are_cached(monkeypatch):
+    monkeypatch.setattr(island_grids, '_coordinate_cache', {})
+    nrows, ncols = grid_shape('gu rtma')
+    ds = island_dataset('gu rtma', 1, ['t2m'])
+
+    first = island_grids.grid_coordinates(ds['latitude'].values, ds['longitude'].values, nrows, ncols)
+    second = island_grids.grid_coordinates(ds['latitude'].values, ds['longitude'].values, nrows, ncols)
+
+    assert first[0] is second[0]
+    assert len(island_grids._coordinate_cache) == 1
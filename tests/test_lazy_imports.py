@@ -0,0 +1,46 @@
+"""
+This file hosts the tests of the lazy imports of the WxData packages.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import sys
+import subprocess
+
+import pytest
+
+@pytest.mark.parametrize('name', ['client', 'calc', 'fems', 'post_processors'])
+def test_subpackage_attribute(name):
+    # A fresh interpreter so the subpackage has not been imported by another test
+    result = subprocess.run([sys.executable, '-c', f"import wxdata; print(wxdata.{name}.__name__)"],
+                            capture_output=True,
+                            text=True)
+
+    assert f"wxdata.{name}" in result.stdout
+
+
+def test_subpackages_are_listed():
+    import wxdata
+
+    names = dir(wxdata)
+    for name in ['gfs', 'gefs', 'aigefs', 'ecmwf', 'fems', 'metars', 'noaa', 'soundings', 'calc', 'post_processors']:
+        assert name in names
+
+
+def test_missing_attribute_raises():
+    import wxdata
+
+    with pytest.raises(AttributeError):
+        wxdata.not_a_function
+
+
+@pytest.mark.parametrize('package', ['wxdata', 'wxdata.calc', 'wxdata.post_processors', 'wxdata.utils'])
+def test_lazy_loader_is_not_public(package):
+    import importlib
+
+    module = importlib.import_module(package)
+
+    assert 'lazy_loader' not in dir(module)
+    assert 'lazy_loader' not in module.__all__
+    with pytest.raises(AttributeError):
+        module.lazy_loader
@@ -0,0 +1,184 @@
+"""
+This file hosts the tests of the run manifest of each data directory.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import os
+import json
+import multiprocessing
+import pytest
+
+import wxdata.utils.manifest as manifest
+
+@pytest.fixture
+def manifest_directory(tmp_path, monkeypatch):
+    directory = tmp_path / 'manifests'
+    monkeypatch.setattr(manifest, 'manifest_directory', str(directory))
+    return directory
+
+
+def write_many(path, writer, count):
+    for i in range(0, count, 1):
+        manifest.write_manifest(path, {'path':path,
+                                       'files':{f"file{i}.grib2":{'writer':writer}}})
+
+
+def test_manifest_round_trip(manifest_directory, tmp_path):
+    path = str(tmp_path / 'data')
+    saved = manifest.write_manifest(path, {'path':path,
+                                           'files':{'a.grib2':{'size':10}}})
+
+    assert manifest.read_manifest(path) == saved
+    assert os.listdir(manifest_directory) == [os.path.basename(manifest.manifest_path(path))]
+
+
+def test_temporary_file_is_unique_to_the_process(manifest_directory, tmp_path, monkeypatch):
+    renamed = []
+    replace = os.replace
+
+    def record_replace(src, dst):
+        renamed.append(src)
+        replace(src, dst)
+
+    monkeypatch.setattr(manifest.os, 'replace', record_replace)
+
+    path = str(tmp_path / 'data')
+    manifest.write_manifest(path, {'path':path,
+                                   'files':{}})
+
+    assert renamed == [f"{manifest.manifest_path(path)}.{os.getpid()}.tmp"]
+
+
+def test_processes_writing_the_same_manifest(manifest_directory, tmp_path):
+    path = str(tmp_path / 'data')
+    context = multiprocessing.get_context('fork')
+    processes = [context.Process(target=write_many, args=(path, writer, 100)) for writer in range(0, 4, 1)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    # A shared temporary file is renamed out from under the other writers (FileNotFoundError)
+    assert [process.exitcode for process in processes] == [0, 0, 0, 0]
+
+    with open(manifest.manifest_path(path), 'r') as f:
+        saved = json.load(f)
+    assert list(saved['files']) == ['file99.grib2']
+    assert os.listdir(manifest_directory) == [os.path.basename(manifest.manifest_path(path))]
+
+
+def gfs_url(hour, bbox=None, variable='TMP'):
+    url = f"https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl?dir=%2Fgfs.20261018%2F06%2Fatmos&file=gfs.t06z.pgrb2.0p25.f{hour:03d}&var_{variable}=on&lev_2_m_above_ground=on"
+    if bbox != None:
+        url = url + f"&subregion=&leftlon={bbox[0]}&rightlon={bbox[1]}&toplat={bbox[2]}&bottomlat={bbox[3]}"
+    else:
+        pass
+    return url
+
+
+def save(path, hours, **kwargs):
+    os.makedirs(path, exist_ok=True)
+    filenames = [f"gfs.t06z.pgrb2.0p25.f{hour:03d}.grib2" for hour in hours]
+    for filename in filenames:
+        with open(f"{path}/{filename}", 'wb') as f:
+            f.write(b"GRIB" + filename.encode() + b"7777")
+    manifest.record_files(path, [gfs_url(hour, **kwargs) for hour in hours], filenames)
+    return filenames
+
+
+@pytest.mark.parametrize('cached, requested, covers', [
+    (None, [250, 290, 50, 20], True),
+    (None, None, True),
+    ([250, 290, 50, 20], None, False),
+    ([250, 290, 50, 20], [260, 280, 45, 25], True),
+    ([250, 290, 50, 20], [250, 290, 50, 20], True),
+    (['250', '290', '50', '20'], [260.5, 280, 45, 25], True),
+    ([250, 290, 50, 20], [260, 280, 55, 25], False),
+    ([250, 290, 50, 20], [260, 280, 45, 15], False),
+    ([250, 290, 50, 20], [240, 280, 45, 25], False),
+    # Bounding boxes crossing 0 degrees longitude
+    ([350, 10, 60, 40], [355, 5, 55, 45], True),
+    ([350, 10, 60, 40], [340, 5, 55, 45], False),
+    ([350, 10, 60, 40], [0, 5, 55, 45], True),
+    ([0, 360, 90, -90], [355, 5, 55, 45], True),
+    ([250, 290, 50, 20], ['', '', '', ''], False)
+])
+def test_bbox_covers(cached, requested, covers):
+    assert manifest.bbox_covers(cached, requested) == covers
+
+
+def test_global_file_is_reused_for_a_smaller_bbox(manifest_directory, tmp_path):
+    path = str(tmp_path / 'data')
+    filenames = save(path, [0, 3])
+
+    missing = manifest.files_to_download(path,
+                                         [gfs_url(hour, bbox=[250, 290, 50, 20]) for hour in [0, 3]],
+                                         filenames)
+
+    assert missing == []
+
+
+def test_larger_bbox_or_other_variables_are_downloaded(manifest_directory, tmp_path):
+    path = str(tmp_path / 'data')
+    filenames = save(path, [0, 3], bbox=[250, 290, 50, 20])
+
+    # A bounding box inside of the cached bounding box is reused
+    assert manifest.files_to_download(path,
+                                      [gfs_url(hour, bbox=[260, 280, 45, 25]) for hour in [0, 3]],
+                                      filenames) == []
+
+    # A larger bounding box is not
+    assert manifest.files_to_download(path,
+                                      [gfs_url(hour, bbox=[240, 290, 50, 20]) for hour in [0, 3]],
+                                      filenames) == [0, 1]
+
+    # Neither is the whole globe
+    assert manifest.files_to_download(path,
+                                      [gfs_url(hour) for hour in [0, 3]],
+                                      filenames) == [0, 1]
+
+    # Nor a different variable
+    assert manifest.files_to_download(path,
+                                      [gfs_url(hour, bbox=[260, 280, 45, 25], variable='RH') for hour in [0, 3]],
+                                      filenames) == [0, 1]
+
+
+def test_missing_files_use_the_cached_global_grid(manifest_directory, tmp_path):
+    path = str(tmp_path / 'data')
+    save(path, [0])
+    filenames = [f"gfs.t06z.pgrb2.0p25.f{hour:03d}.grib2" for hour in [0, 3]]
+    urls = [gfs_url(hour, bbox=[250, 290, 50, 20]) for hour in [0, 3]]
+
+    missing = manifest.files_to_download(path, urls, filenames)
+    assert missing == [1]
+
+    new_urls, requested = manifest.reuse_cached_bbox(path, urls, filenames, missing)
+
+    # Forecast hour 3 is downloaded for the whole globe so every file has the same grid
+    assert new_urls[0] == urls[0]
+    assert new_urls[1] == gfs_url(3)
+    assert requested == ['250', '290', '50', '20']
+
+
+def test_missing_files_use_the_cached_bbox(manifest_directory, tmp_path):
+    path = str(tmp_path / 'data')
+    save(path, [0], bbox=[240, 300, 55, 15])
+    filenames = [f"gfs.t06z.pgrb2.0p25.f{hour:03d}.grib2" for hour in [0, 3]]
+    urls = [gfs_url(hour, bbox=[250, 290, 50, 20]) for hour in [0, 3]]
+
+    missing = manifest.files_to_download(path, urls, filenames)
+    new_urls, requested = manifest.reuse_cached_bbox(path, urls, filenames, missing)
+
+    assert missing == [1]
+    assert new_urls[1] == gfs_url(3, bbox=[240, 300, 55, 15])
+    assert requested == ['250', '290', '50', '20']
+
+
+def test_same_bbox_is_not_subset(manifest_directory, tmp_path):
+    path = str(tmp_path / 'data')
+    save(path, [0], bbox=[250, 290, 50, 20])
+    filenames = [f"gfs.t06z.pgrb2.0p25.f{hour:03d}.grib2" for hour in [0, 3]]
+    urls = [gfs_url(hour, bbox=[250, 290, 50, 20]) for hour in [0, 3]]
+
+    assert manifest.reuse_cached_bbox(path, urls, filenames, [1]) == (urls, None)
@@ -0,0 +1,87 @@
+"""
+This file hosts the tests of the single-pass METAR cache parser.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import io
+import csv
+
+import numpy as np
+import pandas as pd
+
+from wxdata.metars.metar_obs import(
+    get_csv_column_names,
+    read_metar_csv,
+    text_columns,
+    flag_columns
+)
+
+header = ('raw_text,station_id,observation_time,latitude,longitude,temp_c,dewpoint_c,wind_dir_degrees,wind_speed_kt,wind_gust_kt,'
+          'visibility_statute_mi,altim_in_hg,sea_level_pressure_mb,corrected,auto,auto_station,maintenance_indicator_on,no_signal,'
+          'lightning_sensor_off,freezing_rain_sensor_off,present_weather_sensor_off,wx_string,sky_cover,cloud_base_ft_agl,'
+          'sky_cover,cloud_base_ft_agl,sky_cover,cloud_base_ft_agl,sky_cover,cloud_base_ft_agl,flight_category,'
+          'three_hr_pressure_tendency_mb,maxT_c,minT_c,maxT24hr_c,minT24hr_c,precip_in,pcp3hr_in,pcp6hr_in,pcp24hr_in,snow_in,'
+          'vert_vis_ft,metar_type,elevation_m')
+
+rows = [
+    ('KSAN 011951Z 27008KT 10SM FEW020 SCT250 18/09 A3002,KSAN,2025-01-01T19:51:00Z,32.73,-117.18,18.3,8.9,270,8,,10+,30.02,1016.6,'
+     ',,TRUE,,,,,,,FEW,2000,SCT,25000,,,,,VFR,,,,,,,,,,,,METAR,4'),
+    ('KDEN 011953Z VRB03KT 6SM -SN BR OVC008 M04/M05 A2990 RMK AO2,KDEN,2025-01-01T19:53:00Z,39.85,-104.66,-4.4,-5,VRB,3,,6,29.9,,'
+     ',TRUE,TRUE,TRUE,,,,,-SN BR,OVC,800,,,,,,,IFR,-1.2,,,,,0.01,,,,,,METAR,1656'),
+    ('PANC 011953Z 36012G22KT 1/2SM FZFG VV002 M12/M13 A2968 RMK AO2 $,PANC,2025-01-01T19:53:00Z,61.17,-150.02,-12,-13,360,12,22,0.5,29.68,1005.1,'
+     'TRUE,,TRUE,TRUE,,,,,FZFG,OVX,0,,,,,,,LIFR,,,,,,,,,,,200,SPECI,40')
+]
+
+cache = "\n".join(['No errors', 'No warnings', '7 ms', 'data source=metars', f"{len(rows)} results", header] + rows) + "\n"
+
+def old_metar_dataframe(text):
+    # The csv module parse of the METAR cache (every column is a string and raw_text is dropped)
+    parsed = list(csv.reader(io.StringIO(text)))
+    start = [i for i, row in enumerate(parsed) if 'station_id' in row][0]
+    df = pd.DataFrame(parsed[start + 1:], columns=parsed[start])
+    return df.drop('raw_text', axis=1)
+
+
+def test_get_csv_column_names():
+    f = io.StringIO(cache)
+    names = get_csv_column_names(f)
+
+    assert names[0:3] == ['raw_text', 'station_id', 'observation_time']
+    assert [name for name in names if name.startswith('sky_cover')] == ['sky_cover', 'sky_cover.1', 'sky_cover.2', 'sky_cover.3']
+
+    # The stream is left at the first row of data
+    assert f.readline().startswith('KSAN')
+
+
+def test_read_metar_csv_matches_old_dataframe():
+    old = old_metar_dataframe(cache)
+    df = read_metar_csv(io.StringIO(cache))
+
+    assert len(df) == len(old) == len(rows)
+    assert len(df.columns) == len(old.columns)
+    assert 'raw_text' not in df.columns
+
+    for position, name in enumerate(df.columns):
+        base = name.split('.')[0]
+        expected = old.iloc[:, position]
+        values = df[name]
+        if base in flag_columns:
+            assert values.tolist() == (expected == 'TRUE').tolist()
+        elif name == 'observation_time':
+            assert values.tolist() == pd.to_datetime(expected, utc=True).tolist()
+        elif base in text_columns:
+            assert values.fillna('').tolist() == expected.tolist()
+        else:
+            np.testing.assert_array_equal(values.to_numpy(dtype=np.float64),
+                                          pd.to_numeric(expected).to_numpy(dtype=np.float64))
+
+
+def test_read_metar_csv_columns():
+    df = read_metar_csv(io.StringIO(cache),
+                        columns=['station_id', 'temp_c', 'wind_dir_degrees'])
+
+    assert list(df.columns) == ['station_id', 'temp_c', 'wind_dir_degrees']
+    assert df['station_id'].tolist() == ['KSAN', 'KDEN', 'PANC']
+    assert df['temp_c'].tolist() == [18.3, -4.4, -12.0]
+    assert df['wind_dir_degrees'].tolist() == ['270', 'VRB', '360']
@@ -0,0 +1,55 @@
+"""
+This file hosts the tests of the level keys of the NOMADS GRIB filter requests.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import urllib.parse
+import pytest
+
+from wxdata.utils.nomads_gribfilter import(
+    level_key,
+    level_string
+)
+
+@pytest.mark.parametrize('level, key', [
+    ('500 mb', 'lev_500_mb'),
+    ('500mb', 'lev_500_mb'),
+    ('500 hPa', 'lev_500_mb'),
+    ('500hPa', 'lev_500_mb'),
+    ('500 millibars', 'lev_500_mb'),
+    ('  500   MB ', 'lev_500_mb'),
+    ('0.4 mb', 'lev_0.4_mb'),
+    ('Surface', 'lev_surface'),
+    ('2 m above ground', 'lev_2_m_above_ground'),
+    ('2 m', 'lev_2_m_above_ground'),
+    ('10 M', 'lev_10_m_above_ground'),
+    ('100 m', 'lev_100_m_above_ground'),
+    ('MSLP', 'lev_mean_sea_level'),
+    ('sea level', 'lev_mean_sea_level'),
+    ('mean sea level', 'lev_mean_sea_level'),
+    ('Entire Atmosphere', 'lev_entire_atmosphere_(considered_as_a_single_layer)'),
+    ('entire atmosphere (considered as a single layer)', 'lev_entire_atmosphere_(considered_as_a_single_layer)'),
+    ('30-0 mb above ground', 'lev_30-0_mb_above_ground')
+])
+def test_level_key(level, key):
+    assert level_key(level) == key
+
+
+def test_level_string_quotes_the_keys():
+    levels = level_string(['Entire Atmosphere', '500 mb'])
+
+    assert levels == "lev_entire_atmosphere_%28considered_as_a_single_layer%29=on&lev_500_mb=on"
+
+    # The NOMADS GRIB filter receives the unquoted key
+    query = urllib.parse.parse_qs(levels)
+    assert list(query) == ['lev_entire_atmosphere_(considered_as_a_single_layer)', 'lev_500_mb']
+
+
+def test_level_string_requests_each_level_one_time():
+    assert level_string(['500 mb', '500 hPa', '500mb', '2 m', '2 m above ground']) == "lev_500_mb=on&lev_2_m_above_ground=on"
+
+
+def test_level_string_defaults():
+    assert level_string(None) == "all_lev=on"
+    assert level_string('surface') == "lev_surface=on"
@@ -0,0 +1,169 @@
+"""
+This file hosts the tests of the pipelined download and post-processing of a model run (download_and_process()).
+
+The downloads are stubbed so the files finish in a chosen order without any request leaving the machine.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import re
+import numpy as np
+import xarray as xr
+import pytest
+
+import wxdata.utils.pipeline as pipeline
+
+from wxdata.utils.pipeline import(
+    download_and_process,
+    forecast_hour_groups
+)
+
+def forecast_hour(file):
+    return int(re.search(r'\.f(\d{3})', file).group(1))
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    # The positions of the files in the order their downloads finish
+    state = {
+        'order':None,
+        'downloaded':[],
+        'recorded':[]
+    }
+
+    def iter_gridded_data_batch(urls, paths, filenames, **kwargs):
+        order = state['order'] if state['order'] != None else list(range(0, len(urls), 1))
+        for j in order:
+            with open(f"{paths[j]}/{filenames[j]}", 'wb') as f:
+                f.write(b"GRIB")
+            state['downloaded'].append(filenames[j])
+            yield j
+
+    def record_files(paths, urls, filenames, **kwargs):
+        state['recorded'].append(list(filenames))
+
+    monkeypatch.setattr(pipeline, 'iter_gridded_data_batch', iter_gridded_data_batch)
+    monkeypatch.setattr(pipeline, 'record_files', record_files)
+
+    return state
+
+
+def model_run(tmp_path, hours, members=1):
+    # Ensemble members are listed member by member
+    urls = []
+    paths = []
+    filenames = []
+    for member in range(1, members + 1, 1):
+        path = tmp_path / str(member)
+        path.mkdir(exist_ok=True)
+        for hour in hours:
+            filenames.append(f"gefs.m{member}.f{hour:03d}.grib2")
+            urls.append(f"https://nomads.ncep.noaa.gov/{filenames[-1]}")
+            paths.append(str(path))
+    return urls, paths, filenames
+
+
+def processor(calls):
+    def process(files):
+        calls.append([forecast_hour(file) for file in files])
+        return xr.Dataset({'2m_temperature':(('number',), np.array([forecast_hour(file) for file in files], dtype=np.float64))},
+                          coords={'step':forecast_hour(files[0])})
+    return process
+
+
+def test_forecast_hour_groups():
+    files = [f"m{m}.f{h:03d}" for m in range(1, 4, 1) for h in [0, 3]]
+
+    assert forecast_hour_groups(files, members=3) == [[0, 2, 4], [1, 3, 5]]
+    assert forecast_hour_groups(files[0:2]) == [[0], [1]]
+
+
+def test_forecast_hours_are_yielded_in_order(tmp_path, downloads):
+    urls, paths, filenames = model_run(tmp_path, [0, 3, 6, 9])
+    downloads['order'] = [2, 0, 3, 1]
+    calls = []
+
+    steps = [int(ds['step']) for ds in download_and_process(urls,
+                                                           paths,
+                                                           filenames,
+                                                           processor(calls))]
+
+    assert steps == [0, 3, 6, 9]
+
+    # Each forecast hour is post-processed as soon as it is saved rather than in forecast hour order
+    assert calls == [[6], [0], [9], [3]]
+    assert downloads['recorded'] == [[filenames[2]], [filenames[0]], [filenames[3]], [filenames[1]]]
+
+
+def test_ensemble_forecast_hours_wait_for_every_member(tmp_path, downloads):
+    urls, paths, filenames = model_run(tmp_path, [0, 3], members=2)
+    # f003 of member 1, f000 of member 2, f003 of member 2, f000 of member 1
+    downloads['order'] = [1, 2, 3, 0]
+    calls = []
+
+    datasets = list(download_and_process(urls,
+                                         paths,
+                                         filenames,
+                                         processor(calls),
+                                         members=2))
+
+    assert [int(ds['step']) for ds in datasets] == [0, 3]
+    assert calls == [[3, 3], [0, 0]]
+    assert downloads['recorded'] == [[filenames[1], filenames[3]], [filenames[0], filenames[2]]]
+
+
+def test_failed_forecast_hour_is_skipped_with_a_warning(tmp_path, downloads):
+    urls, paths, filenames = model_run(tmp_path, [0, 3, 6])
+    calls = []
+    process = processor(calls)
+
+    def failing_process(files):
+        if forecast_hour(files[0]) == 3:
+            raise ValueError("corrupt GRIB2 message")
+        else:
+            return process(files)
+
+    with pytest.warns(UserWarning, match=r'gefs\.m1\.f003\.grib2 could not be post-processed and will be skipped: corrupt GRIB2 message'):
+        steps = [int(ds['step']) for ds in download_and_process(urls,
+                                                               paths,
+                                                               filenames,
+                                                               failing_process)]
+
+    assert steps == [0, 6]
+
+
+def test_only_missing_files_are_downloaded(tmp_path, downloads):
+    urls, paths, filenames = model_run(tmp_path, [0, 3, 6])
+
+    # Forecast hour 0 is already up to date
+    with open(f"{paths[0]}/{filenames[0]}", 'wb') as f:
+        f.write(b"GRIB")
+
+    calls = []
+    steps = [int(ds['step']) for ds in download_and_process(urls,
+                                                           paths,
+                                                           filenames,
+                                                           processor(calls),
+                                                           missing=[1, 2])]
+
+    assert steps == [0, 3, 6]
+    assert downloads['downloaded'] == [filenames[1], filenames[2]]
+    assert downloads['recorded'] == [[filenames[1]], [filenames[2]]]
+
+
+def test_files_on_disk_are_only_post_processed(tmp_path, downloads):
+    urls, paths, filenames = model_run(tmp_path, [0, 3, 6])
+    for path, filename in zip(paths[0:2], filenames[0:2]):
+        with open(f"{path}/{filename}", 'wb') as f:
+            f.write(b"GRIB")
+
+    calls = []
+    steps = [int(ds['step']) for ds in download_and_process(urls,
+                                                           paths,
+                                                           filenames,
+                                                           processor(calls),
+                                                           download=False)]
+
+    # The forecast hour that is not on disk is skipped
+    assert steps == [0, 3]
+    assert downloads['downloaded'] == []
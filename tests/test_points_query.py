@@ -0,0 +1,135 @@
+"""
+This file hosts the tests of querying the nearest pixel to many points at once (points_query()).
+
+Each grid is checked against a brute force search of the great circle distance to every grid point.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import numpy as np
+import xarray as xr
+import pytest
+
+from wxdata.utils.tools import points_query
+
+latitudes = np.array([40.2, 33.7, 47.9, 36.05])
+longitudes = np.array([-100.3, -108.6, -92.2, -97.51])
+
+def great_circle(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = [np.radians(v) for v in (lat1, lon1, lat2, lon2)]
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * 6371.0 * np.arcsin(np.sqrt(a))
+
+
+def brute_force(lat_2d, lon_2d, lat, lon):
+    distance = great_circle(lat, lon, lat_2d, lon_2d)
+    return np.unravel_index(np.argmin(distance), lat_2d.shape), np.min(distance)
+
+
+def test_regular_grid():
+    # A 0 to 360 degree longitude grid queried with -180 to 180 degree points
+    lat = np.arange(30, 51, 1.0)
+    lon = np.arange(250, 271, 1.0)
+    lon_2d, lat_2d = np.meshgrid(lon, lat)
+    ds = xr.Dataset({'2m_temperature':(('step', 'latitude', 'longitude'), np.stack([lat_2d * 1000 + lon_2d, -(lat_2d * 1000 + lon_2d)]))},
+                    coords={'step':[0, 3],
+                            'latitude':lat,
+                            'longitude':lon})
+
+    result = points_query(ds,
+                          latitudes=latitudes,
+                          longitudes=longitudes)
+
+    assert result['2m_temperature'].dims == ('station', 'step')
+    for i in range(0, len(latitudes), 1):
+        (y, x), distance = brute_force(lat_2d, lon_2d, latitudes[i], longitudes[i])
+        assert result['2m_temperature'].values[i, 0] == lat[y] * 1000 + lon[x]
+        assert result['2m_temperature'].values[i, 1] == -(lat[y] * 1000 + lon[x])
+        np.testing.assert_allclose(result['distance'].values[i], distance, rtol=1e-6)
+
+    np.testing.assert_array_equal(result['station_latitude'].values, latitudes)
+    np.testing.assert_array_equal(result['station_longitude'].values, longitudes)
+
+
+def test_curvilinear_grid():
+    # A rotated grid with 2-D latitude and longitude on y/x (i.e. RTMA Lambert)
+    y, x = np.meshgrid(np.arange(0, 40, 1), np.arange(0, 50, 1), indexing='ij')
+    lat_2d = 30 + 0.5 * y + 0.1 * x
+    lon_2d = -112 + 0.5 * x - 0.1 * y
+    ds = xr.Dataset({'index':(('y', 'x'), y * 1000 + x)},
+                    coords={'latitude':(('y', 'x'), lat_2d),
+                            'longitude':(('y', 'x'), lon_2d)})
+
+    result = points_query(ds,
+                          latitudes=latitudes,
+                          longitudes=longitudes,
+                          station_ids=['KA', 'KB', 'KC', 'KD'])
+
+    assert list(result['station'].values) == ['KA', 'KB', 'KC', 'KD']
+    for i in range(0, len(latitudes), 1):
+        (j, k), distance = brute_force(lat_2d, lon_2d, latitudes[i], longitudes[i])
+        assert result['index'].values[i] == j * 1000 + k
+        np.testing.assert_allclose(result['distance'].values[i], distance, rtol=1e-6)
+
+
+def test_island_grid():
+    # An unstructured grid with latitude and longitude on a single points dimension
+    rng = np.random.default_rng(3)
+    lat = rng.uniform(30, 50, 500)
+    lon = rng.uniform(-115, -85, 500)
+    ds = xr.Dataset({'index':(('values',), np.arange(0, 500, 1))},
+                    coords={'lat':(('values',), lat),
+                            'lon':(('values',), lon)})
+
+    result = points_query(ds,
+                          latitudes=latitudes,
+                          longitudes=longitudes,
+                          coord_names=['lat', 'lon'])
+
+    for i in range(0, len(latitudes), 1):
+        (j,), distance = brute_force(lat, lon, latitudes[i], longitudes[i])
+        assert result['index'].values[i] == j
+        np.testing.assert_allclose(result['distance'].values[i], distance, rtol=1e-6)
+
+
+def test_max_distance_masks_points_outside_the_grid():
+    lat = np.arange(30, 51, 1.0)
+    lon = np.arange(-110, -89, 1.0)
+    ds = xr.Dataset({'2m_temperature':(('latitude', 'longitude'), np.ones((len(lat), len(lon))))},
+                    coords={'latitude':lat,
+                            'longitude':lon})
+
+    # The second point is in the Atlantic, far outside of the grid
+    result = points_query(ds,
+                          latitudes=[40.2, 35.0],
+                          longitudes=[-100.3, -40.0],
+                          max_distance=100)
+
+    assert result['2m_temperature'].values[0] == 1
+    assert np.isnan(result['2m_temperature'].values[1])
+    assert result['distance'].values[0] < 100
+    assert result['distance'].values[1] > 100
+
+    df = points_query(ds,
+                      latitudes=[40.2, 35.0],
+                      longitudes=[-100.3, -40.0],
+                      max_distance=100,
+                      to_dataframe=True)
+
+    assert len(df) == 2
+    assert np.isnan(df['2m_temperature'].values[1])
+
+
+def test_points_are_required():
+    ds = xr.Dataset({'2m_temperature':(('latitude', 'longitude'), np.ones((2, 2)))},
+                    coords={'latitude':[40, 41],
+                            'longitude':[-100, -99]})
+
+    with pytest.raises(ValueError, match='station_ids'):
+        points_query(ds)
+
+    with pytest.raises(ValueError, match='station_ids'):
+        points_query(ds, latitudes=[40.2])
+
+    with pytest.raises(ValueError, match='same length'):
+        points_query(ds, latitudes=[40.2, 40.5], longitudes=[-100.3])
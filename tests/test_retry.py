@@ -0,0 +1,151 @@
+"""
+This file hosts the tests of the retry policy (call_with_retries()).
+
+(C) Eric J. Drewitz 2025
+"""
+
+import io
+import time
+import socket
+import pytest
+import requests
+
+import wxdata.client.retry as retry
+import wxdata.client.session as session
+
+from wxdata.client.retry import(
+    DownloadError,
+    DeadlineExceededError,
+    call_with_retries,
+    configure_retry,
+    request_timeout,
+    reset_circuits
+)
+
+url = 'https://nomads.ncep.noaa.gov/test.grib2'
+
+def response(status_code):
+    r = requests.Response()
+    r.status_code = status_code
+    r.url = url
+    r.raw = io.BytesIO(b"")
+    return r
+
+
+@pytest.fixture(autouse=True)
+def circuits(monkeypatch):
+    monkeypatch.setattr('wxdata.client.retry.time.sleep', lambda delay: None)
+    policy = dict(retry.policy)
+    reset_circuits()
+    yield
+    reset_circuits()
+    retry.policy.clear()
+    retry.policy.update(policy)
+
+
+class FakeSession:
+
+    """
+    A session that records the keyword arguments of each request.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(kwargs)
+        return response(200)
+
+    head = get
+    post = get
+
+
+def test_retried_status_is_retried():
+    responses = [response(503), response(200)]
+
+    result = call_with_retries(lambda: responses.pop(0), url, notifications=False)
+
+    assert result.status_code == 200
+    assert len(responses) == 0
+
+
+def test_exhausted_retried_status_raises():
+    calls = []
+
+    def request():
+        calls.append(1)
+        return response(503)
+
+    with pytest.raises(DownloadError, match='503') as e:
+        call_with_retries(request, url, max_attempts=3, notifications=False)
+
+    assert len(calls) == 3
+    assert url in str(e.value)
+    assert e.value.response.status_code == 503
+
+
+@pytest.mark.parametrize('method', ['get', 'head', 'post'])
+@pytest.mark.parametrize('retried', [True, False])
+def test_session_requests_have_a_default_timeout(monkeypatch, method, retried):
+    fake = FakeSession()
+    monkeypatch.setattr(session, 'get_session', lambda: fake)
+    configure_retry(timeout=15)
+
+    getattr(session, method)(url, retry=retried)
+    getattr(session, method)(url, retry=retried, timeout=2)
+
+    assert [call['timeout'] for call in fake.calls] == [15, 2]
+
+
+def test_timeout_is_capped_by_the_deadline(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr('wxdata.client.retry.time.monotonic', lambda: clock[0])
+    configure_retry(timeout=60)
+
+    assert request_timeout() == 60
+    assert request_timeout(start=100.0, deadline=30) == 30
+
+    clock[0] = 125.0
+    assert request_timeout(start=100.0, deadline=30) == 5
+
+    clock[0] = 131.0
+    with pytest.raises(DeadlineExceededError):
+        request_timeout(start=100.0, deadline=30)
+
+
+def test_each_attempt_gets_the_time_left_before_the_deadline(monkeypatch):
+    clock = [0.0]
+    timeouts = []
+
+    def request(timeout=None):
+        timeouts.append(timeout)
+        clock[0] = clock[0] + 4
+        return response(503)
+
+    monkeypatch.setattr('wxdata.client.retry.time.monotonic', lambda: clock[0])
+    monkeypatch.setattr('wxdata.client.retry.backoff_delay', lambda attempt, retry_after=None: 1)
+    monkeypatch.setattr('wxdata.client.retry.time.sleep', lambda delay: clock.__setitem__(0, clock[0] + delay))
+    configure_retry(timeout=60)
+
+    with pytest.raises(DeadlineExceededError):
+        call_with_retries(request, url, deadline=12, notifications=False, set_timeout=True)
+
+    assert timeouts == [12, 7, 2]
+
+
+def test_hung_connection_times_out():
+    # A server that accepts the connection but never answers
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    configure_retry(timeout=0.5,
+                    max_attempts=2)
+
+    start = time.monotonic()
+    try:
+        with pytest.raises(DownloadError):
+            session.get(f"http://127.0.0.1:{server.getsockname()[1]}/test.grib2")
+    finally:
+        server.close()
+
+    assert time.monotonic() - start < 10
@@ -0,0 +1,129 @@
+"""
+This file hosts the tests of the single pass RTMA post-processing.
+
+The post-processing is checked against the previous post-processing that opened the same GRIB2 file six times
+(once for every variable and once more for each of the 10 m wind variables).
+
+(C) Eric J. Drewitz 2025
+"""
+
+import sys
+import numpy as np
+import xarray as xr
+import pytest
+
+import wxdata.post_processors.rtma_post_processing
+import wxdata.rtma.process
+
+from wxdata.calc.thermodynamics import relative_humidity
+from wxdata.utils.index_cache import open_dataset
+
+# The messages of an RTMA GRIB2 file (typeOfLevel, level, shortName)
+rtma_messages = [
+    ('surface', 0, 'orog'),
+    ('surface', 0, 'sp'),
+    ('heightAboveGround', 2, '2t'),
+    ('heightAboveGround', 2, '2d'),
+    ('heightAboveGround', 2, '2sh'),
+    ('surface', 0, 'vis'),
+    ('cloudBase', 0, 'ceil'),
+    ('entireAtmosphere', 0, 'tcc'),
+    ('heightAboveGround', 10, '10u'),
+    ('heightAboveGround', 10, '10v'),
+    ('heightAboveGround', 10, '10wdir'),
+    ('heightAboveGround', 10, '10si'),
+    ('heightAboveGround', 10, 'i10fg')
+]
+
+def write_rtma_file(file):
+
+    import eccodes
+
+    with open(file, 'wb') as f:
+        for i, (type_of_level, level, short_name) in enumerate(rtma_messages):
+            gid = eccodes.codes_grib_new_from_samples('regular_ll_sfc_grib2')
+            try:
+                eccodes.codes_set(gid, 'dataDate', 20261018)
+                eccodes.codes_set(gid, 'dataTime', 600)
+                eccodes.codes_set(gid, 'typeOfLevel', type_of_level)
+                eccodes.codes_set(gid, 'level', level)
+                eccodes.codes_set(gid, 'shortName', short_name)
+                eccodes.codes_set_values(gid, np.arange(16 * 31, dtype=np.float64) / 10 + 250 + 3 * i)
+                eccodes.codes_write(gid, f)
+            finally:
+                eccodes.codes_release(gid)
+
+    return file
+
+
+def previous_processing(file):
+    # The CONUS post-processing before the GRIB2 file was read in a single pass
+    ds = open_dataset(file)
+
+    ds['orography'] = ds['orog']
+    ds['surface_pressure'] = ds['sp']
+    ds['2m_temperature'] = ds['t2m']
+    ds['2m_dew_point'] = ds['d2m']
+    ds['2m_relative_humidity'] = relative_humidity(ds['2m_temperature'], ds['2m_dew_point'])
+    ds['2m_specific_humidity'] = ds['sh2']
+    ds['surface_visibility'] = ds['vis']
+    ds['cloud_ceiling_height'] = ds['ceil']
+    ds['total_cloud_cover'] = ds['tcc']
+
+    ds = ds.drop_vars(['orog', 'sp', 't2m', 'd2m', 'sh2', 'vis', 'ceil', 'tcc'])
+
+    for short_name, var, name in [('10u', 'u10', '10m_u_wind_component'),
+                                  ('10v', 'v10', '10m_v_wind_component'),
+                                  ('10wdir', 'wdir10', '10m_wind_direction'),
+                                  ('10si', 'si10', '10m_wind_speed'),
+                                  ('i10fg', 'i10fg', '10m_wind_gust')]:
+        ds1 = open_dataset(file,
+                           decode_timedelta=False,
+                           filter_by_keys={'typeOfLevel': 'heightAboveGround','shortName':short_name})
+        ds[name] = ds1[var]
+
+    return ds
+
+
+@pytest.fixture
+def rtma_file(tmp_path, index_cache):
+    directory = tmp_path / 'RTMA'
+    directory.mkdir()
+    write_rtma_file(str(directory / 'rtma2p5.t06z.2dvaranl_ndfd.grb2'))
+    return directory, 'rtma2p5.t06z.2dvaranl_ndfd.grb2'
+
+
+def assert_same_output(ds, expected):
+    assert sorted(ds.data_vars) == sorted(expected.data_vars)
+    for var in expected.data_vars:
+        np.testing.assert_array_equal(ds[var].values, expected[var].values)
+        assert ds[var].dims == expected[var].dims
+    for coord in ['time', 'latitude', 'longitude', 'heightAboveGround', 'valid_time']:
+        np.testing.assert_array_equal(ds[coord].values, expected[coord].values)
+
+
+def test_post_processor_matches_the_previous_output(rtma_file):
+    directory, filename = rtma_file
+    module = sys.modules['wxdata.post_processors.rtma_post_processing']
+
+    expected = previous_processing(f"{directory}/{filename}").load()
+    ds = module.process_rtma_data(filename,
+                                  'rtma',
+                                  str(directory)).load()
+
+    assert_same_output(ds, expected)
+
+    # The 2 m variables keep the 2 m heightAboveGround coordinate
+    assert float(ds['heightAboveGround']) == 2
+
+
+def test_rtma_client_processing_matches_the_previous_output(rtma_file):
+    directory, filename = rtma_file
+    module = sys.modules['wxdata.rtma.process']
+
+    expected = previous_processing(f"{directory}/{filename}").load()
+    ds = module.process_rtma_data(str(directory),
+                                  filename,
+                                  'rtma').load()
+
+    assert_same_output(ds, expected)
@@ -0,0 +1,78 @@
+"""
+This file hosts the tests of the single pass Gaussian smoothing (smooth_gaussian_fields()).
+
+The smoothing is checked against metpy.calc.smooth_gaussian() one variable at a time.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import numpy as np
+import xarray as xr
+import pytest
+
+from metpy.calc import smooth_gaussian
+from wxdata.calc.smoothing import smooth_gaussian_fields
+
+def fields():
+    rng = np.random.default_rng(0)
+    coords = {'time':np.arange(3),
+              'latitude':np.linspace(30, 40, 40),
+              'longitude':np.linspace(-120, -105, 50)}
+    return xr.Dataset({'2m_temperature':(('latitude', 'longitude'), rng.normal(280, 5, size=(40, 50))),
+                       '2m_dew_point':(('latitude', 'longitude'), rng.normal(270, 5, size=(40, 50))),
+                       'surface_pressure':(('time', 'latitude', 'longitude'), rng.normal(1e5, 500, size=(3, 40, 50))),
+                       'wind_speed':(('latitude', 'longitude'), rng.uniform(0, 20, size=(40, 50)).astype(np.float32)),
+                       'station_count':(('time',), np.arange(3))},
+                      coords=coords)
+
+
+def reference(ds, var, n):
+    return smooth_gaussian(ds[var], n).values
+
+
+@pytest.mark.parametrize('n', [1, 4, 8])
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_matches_metpy(n, max_workers):
+    ds = fields()
+
+    smoothed = smooth_gaussian_fields(ds, n=n, max_workers=max_workers)
+
+    for var in ['2m_temperature', '2m_dew_point', 'surface_pressure', 'wind_speed']:
+        np.testing.assert_allclose(smoothed[var].values, reference(ds, var, n), rtol=1e-6)
+        assert smoothed[var].dtype == ds[var].dtype
+    np.testing.assert_array_equal(smoothed['station_count'].values, ds['station_count'].values)
+
+
+@pytest.mark.parametrize('chunks', [{'latitude':5, 'longitude':7},
+                                    {'time':1, 'latitude':13, 'longitude':50}])
+def test_dask_chunks_match_metpy(chunks):
+    ds = fields()
+
+    smoothed = smooth_gaussian_fields(ds.chunk(chunks), n=8)
+
+    assert smoothed['2m_temperature'].chunks is not None
+    for var in ['2m_temperature', '2m_dew_point', 'surface_pressure', 'wind_speed']:
+        np.testing.assert_allclose(smoothed[var].values, reference(ds, var, 8), rtol=1e-6)
+
+
+def test_selected_variables_only():
+    ds = fields()
+    ds['2m_temperature'].attrs['units'] = 'K'
+
+    smoothed = smooth_gaussian_fields(ds, variables=['2m_temperature'])
+
+    np.testing.assert_allclose(smoothed['2m_temperature'].values, reference(ds, '2m_temperature', 8), rtol=1e-6)
+    np.testing.assert_array_equal(smoothed['2m_dew_point'].values, ds['2m_dew_point'].values)
+    assert smoothed['2m_temperature'].attrs['units'] == 'K'
+
+    # The original dataset is left as is
+    np.testing.assert_array_equal(ds['2m_temperature'].values, fields()['2m_temperature'].values)
+
+
+def test_float32():
+    ds = fields()
+
+    smoothed = smooth_gaussian_fields(ds, variables=['2m_temperature'], float32=True)
+
+    assert smoothed['2m_temperature'].dtype == np.float32
+    np.testing.assert_allclose(smoothed['2m_temperature'].values, reference(ds, '2m_temperature', 8), rtol=1e-5)
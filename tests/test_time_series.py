@@ -0,0 +1,93 @@
+"""
+This file hosts the tests of the time series statistics (time_series_statistics()).
+
+(C) Eric J. Drewitz 2025
+"""
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+import pytest
+
+from wxdata.calc.time_series import time_series_statistics
+
+def analyses(nans=False):
+    rng = np.random.default_rng(0)
+    temperature = rng.normal(280, 5, size=(6, 3, 4))
+    humidity = rng.uniform(5, 100, size=(6, 3, 4))
+    if nans == True:
+        temperature[2, 1, 1] = np.nan
+    else:
+        pass
+    return xr.Dataset({'2m_temperature':(('time', 'latitude', 'longitude'), temperature),
+                       '2m_relative_humidity':(('time', 'latitude', 'longitude'), humidity),
+                       'orography':(('latitude', 'longitude'), rng.uniform(0, 3000, size=(3, 4)))},
+                      coords={'time':pd.date_range('2026-10-18', periods=6, freq='h'),
+                              'latitude':np.linspace(30, 32, 3),
+                              'longitude':np.linspace(-120, -117, 4)})
+
+
+def reference(values, window):
+    # The statistics one analysis at a time
+    change = np.full(values.shape, np.nan)
+    change[1:] = values[1:] - values[:-1]
+    total_change = values - values[0]
+    running_max = np.stack([np.nanmax(values[max(0, i - window + 1):i + 1], axis=0) for i in range(len(values))])
+    running_min = np.stack([np.nanmin(values[max(0, i - window + 1):i + 1], axis=0) for i in range(len(values))])
+    return change, total_change, running_max, running_min
+
+
+@pytest.mark.parametrize('window', [None, 1, 3])
+def test_statistics_match_numpy(window):
+    ds = analyses()
+
+    stats = time_series_statistics(ds, window=window)
+
+    for var in ['2m_temperature', '2m_relative_humidity']:
+        change, total_change, running_max, running_min = reference(ds[var].values, window or ds.sizes['time'])
+        np.testing.assert_allclose(stats[f"{var}_change"].values, change)
+        np.testing.assert_allclose(stats[f"{var}_total_change"].values, total_change)
+        np.testing.assert_allclose(stats[f"{var}_running_max"].values, running_max)
+        np.testing.assert_allclose(stats[f"{var}_running_min"].values, running_min)
+
+
+def test_variables_without_a_time_dimension_are_skipped():
+    stats = time_series_statistics(analyses())
+
+    assert not any(var.startswith('orography') for var in stats.data_vars)
+    assert len(stats.data_vars) == 8
+    np.testing.assert_array_equal(stats['time'].values, analyses()['time'].values)
+
+
+def test_selected_variables():
+    stats = time_series_statistics(analyses(), variables=['2m_temperature'])
+
+    assert sorted(stats.data_vars) == ['2m_temperature_change',
+                                       '2m_temperature_running_max',
+                                       '2m_temperature_running_min',
+                                       '2m_temperature_total_change']
+
+
+def test_missing_analyses_are_skipped_in_the_extremes():
+    ds = analyses(nans=True)
+
+    stats = time_series_statistics(ds, window=3)
+
+    change, total_change, running_max, running_min = reference(ds['2m_temperature'].values, 3)
+    np.testing.assert_allclose(stats['2m_temperature_change'].values, change)
+    np.testing.assert_allclose(stats['2m_temperature_running_max'].values, running_max)
+    np.testing.assert_allclose(stats['2m_temperature_running_min'].values, running_min)
+
+
+def test_lazy_analyses_stay_lazy():
+    ds = analyses()
+
+    stats = time_series_statistics(ds.chunk({'time':2}), window=3)
+
+    assert stats['2m_temperature_running_max'].chunks is not None
+    xr.testing.assert_allclose(stats.compute(), time_series_statistics(ds, window=3))
+
+
+def test_missing_time_dimension_raises():
+    with pytest.raises(ValueError, match='step'):
+        time_series_statistics(analyses(), dim='step')
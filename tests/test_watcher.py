@@ -0,0 +1,137 @@
+"""
+This file hosts the tests of the watcher that ingests the forecast hours as NOMADS publishes them.
+
+The URL scanner, the probes, the download client and the post-processor are stubbed so no request leaves the machine.
+
+(C) Eric J. Drewitz 2025
+"""
+
+import re
+import numpy as np
+import xarray as xr
+import pytest
+
+import wxdata.utils.watcher as watcher
+
+from wxdata.client.retry import DownloadError
+
+url = "https://nomads.ncep.noaa.gov/cgi-bin/filter_gfs_0p25.pl?dir=%2Fgfs.20261018%2F06%2Fatmos&file=gfs.t06z.pgrb2.0p25.f000&var_TMP=on"
+filename = "gfs.t06z.pgrb2.0p25.f000"
+
+def forecast_hours(files):
+    return [int(re.search(r'\.f(\d{3})', file).group(1)) for file in files]
+
+
+@pytest.fixture
+def nomads(monkeypatch):
+    # The forecast hours published at each poll and the downloads that fail
+    state = {
+        'poll':0,
+        'published':[[0], [0, 3, 6], [0, 3, 6]],
+        'failed_downloads':[2],
+        'downloads':[],
+        'recorded':[],
+        'processed':[]
+    }
+
+    def scan_model(model, final_forecast_hour, *args, **kwargs):
+        if final_forecast_hour == 0:
+            state['poll'] = state['poll'] + 1
+            return [url], [filename], 6
+        else:
+            return ([watcher.forecast_hour_url(url, hour) for hour in [0, 3, 6]],
+                    [watcher.forecast_hour_url(filename, hour) for hour in [0, 3, 6]],
+                    6)
+
+    def probe_url(data_url, **kwargs):
+        hour = forecast_hours([data_url])[0]
+        return 200 if hour in state['published'][state['poll'] - 1] else 404
+
+    def get_gridded_data_batch(urls, paths, filenames, **kwargs):
+        state['downloads'].append(forecast_hours(filenames))
+        if len(state['downloads']) in state['failed_downloads']:
+            raise DownloadError("500 Server Error")
+        else:
+            pass
+
+    def record_files(paths, urls, filenames):
+        state['recorded'].append(forecast_hours(filenames))
+
+    def primary_gfs_post_processing(path, files=None):
+        hours = forecast_hours(files)
+        state['processed'].append(hours)
+        return xr.Dataset({'2m_temperature':(('step', 'latitude'), np.array([[hour, hour + 0.5] for hour in hours]))},
+                          coords={'step':hours, 'latitude':[40, 41]})
+
+    monkeypatch.setattr(watcher, 'scan_model', scan_model)
+    monkeypatch.setattr(watcher, 'probe_url', probe_url)
+    monkeypatch.setattr(watcher.client, 'get_gridded_data_batch', get_gridded_data_batch)
+    monkeypatch.setattr(watcher, 'record_files', record_files)
+    monkeypatch.setattr(watcher, 'remove_stale_files', lambda paths, filenames: None)
+    monkeypatch.setattr(watcher, 'primary_gfs_post_processing', primary_gfs_post_processing)
+    monkeypatch.setattr(watcher.time, 'sleep', lambda seconds: None)
+
+    return state
+
+
+def test_watcher_ingests_new_hours_and_survives_a_failed_download(nomads, tmp_path):
+    events = list(watcher.iter_watch(model='gfs0p25',
+                                     final_forecast_hour=6,
+                                     variables=['temperature'],
+                                     convert_temperature=False,
+                                     custom_directory=str(tmp_path),
+                                     max_cycles=1))
+
+    assert [e['event'] for e in events] == ['cycle',
+                                            'forecast_hour',
+                                            'error',
+                                            'forecast_hour',
+                                            'forecast_hour',
+                                            'complete']
+
+    # The failed download is reported and downloaded again on the next poll
+    error = events[2]
+    assert isinstance(error['error'], DownloadError)
+    assert error['forecast_hours'] == [0]
+    assert nomads['downloads'] == [[0], [3, 6], [3, 6]]
+    assert nomads['recorded'] == [[0], [3, 6]]
+
+    # Only the new forecast hours are post-processed at each poll
+    assert nomads['processed'] == [[0], [3, 6]]
+
+    assert [e['forecast_hour'] for e in events if e['event'] == 'forecast_hour'] == [0, 3, 6]
+    assert events[4]['ds']['step'].values == 6
+    np.testing.assert_array_equal(events[4]['ds']['2m_temperature'].values, [6, 6.5])
+    assert events[4]['files'] == [f"{tmp_path}/gfs.t06z.pgrb2.0p25.f006.grib2"]
+
+    dataset = events[-1]['dataset']
+    assert list(dataset['step'].values) == [0, 3, 6]
+    np.testing.assert_array_equal(dataset['2m_temperature'].values[:, 0], [0, 3, 6])
+    assert events[-1]['forecast_hours'] == [0, 3, 6]
+
+
+def test_watcher_reports_a_failed_manifest_write(nomads, tmp_path, monkeypatch):
+    nomads['failed_downloads'] = []
+
+    def record_files(paths, urls, filenames):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(watcher, 'record_files', record_files)
+
+    events = watcher.iter_watch(model='gfs0p25',
+                                final_forecast_hour=6,
+                                variables=['temperature'],
+                                process_data=False,
+                                custom_directory=str(tmp_path),
+                                timeout=3600,
+                                poll_interval=1)
+
+    assert next(events)['event'] == 'cycle'
+    event = next(events)
+    assert event['event'] == 'error'
+    assert isinstance(event['error'], OSError)
+
+    # The watcher keeps polling
+    assert next(events)['event'] == 'error'
+    assert nomads['poll'] == 2
+    events.close()